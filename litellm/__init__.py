@@ -249,6 +249,9 @@ ssl_ecdh_curve: Optional[str] = (
     None  # Set to 'X25519' to disable PQC and improve performance
 )
 disable_streaming_logging: bool = False
+enable_sse_passthrough: bool = (
+    False  # proxy - forward OpenAI-compatible streams' raw SSE bytes to the client
+)
 disable_token_counter: bool = False
 disable_add_transform_inline_image_block: bool = False
 disable_add_user_agent_to_request_tags: bool = False
@@ -305,6 +308,9 @@ cache: Optional["Cache"] = (
 default_in_memory_ttl: Optional[float] = None
 default_redis_ttl: Optional[float] = None
 default_redis_batch_cache_expiry: Optional[float] = None
+in_memory_cache_max_size_in_bytes: Optional[int] = (
+    None  # global memory ceiling shared by all in-memory caches (e.g. 256MB = 268435456)
+)
 model_alias_map: Dict[str, str] = {}
 model_group_settings: Optional["ModelGroupSettings"] = None
 max_budget: float = 0.0  # set the max budget across all providers
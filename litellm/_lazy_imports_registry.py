@@ -38,6 +38,9 @@ UTILS_NAMES = (
 # Token counter names that support lazy loading via _lazy_import_token_counter
 TOKEN_COUNTER_NAMES = (
     "get_modified_max_tokens",
+    "token_counter_many",
+    "atoken_counter",
+    "atoken_counter_many",
 )
 
 # LLM client cache names that support lazy loading via _lazy_import_llm_client_cache
@@ -436,6 +439,9 @@ _TYPES_UTILS_IMPORT_MAP = {
 
 _TOKEN_COUNTER_IMPORT_MAP = {
     "get_modified_max_tokens": ("litellm.litellm_core_utils.token_counter", "get_modified_max_tokens"),
+    "token_counter_many": ("litellm.litellm_core_utils.token_counter", "token_counter_many"),
+    "atoken_counter": ("litellm.litellm_core_utils.token_counter", "atoken_counter"),
+    "atoken_counter_many": ("litellm.litellm_core_utils.token_counter", "atoken_counter_many"),
 }
 
 _BEDROCK_TYPES_IMPORT_MAP = {
@@ -0,0 +1,119 @@
+"""
+Streaming cache-key hasher for `Cache.get_cache_key`
+
+The legacy key builder concatenates `str(param_value)` of every param (including whole message lists)
+into one string and then hashes it. For long prompts that is several MB of string building per lookup.
+
+CacheKeyHasher instead feeds each param into an incremental hash:
+    - params are hashed in sorted order
+    - each message / list item is serialized separately as canonical JSON (sorted keys) and fed straight in
+    - the hash can be sha256 (default), blake2b or xxhash (xxh3_128, requires `pip install xxhash`)
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+
+from litellm.types.caching import CacheKeyHashAlgorithm
+
+try:
+    import orjson
+except ImportError:  # orjson ships with litellm[proxy]
+    orjson = None  # type: ignore
+
+# field separators fed between params / list items, so ("ab", "c") and ("a", "bc") hash differently
+_PARAM_NAME_SEPARATOR = b"\x00"
+_PARAM_SEPARATOR = b"\x1f"
+_ITEM_SEPARATOR = b"\x1e"
+# blake2b keys have the same length as sha256 keys
+_BLAKE2B_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return sorted(str(v) for v in value)
+    return str(value)
+
+
+def _canonical_json_bytes(value: Any) -> bytes:
+    """
+    Serialize a value as canonical JSON (sorted keys, no whitespace)
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value,
+                default=_json_default,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:  # e.g. ints > 64 bit
+            pass
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_json_default,
+    ).encode("utf-8")
+
+
+def get_hash_object(algorithm: CacheKeyHashAlgorithm) -> Any:
+    """
+    Returns a new incremental hash object with `update()` and `hexdigest()`
+    """
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    elif algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=_BLAKE2B_DIGEST_SIZE)
+    elif algorithm == "xxhash":
+        try:
+            import xxhash
+        except ImportError:
+            raise ImportError(
+                "Missing dependency xxhash. Run `pip install xxhash` to use cache_key_hash_algorithm='xxhash'"
+            )
+        return xxhash.xxh3_128()
+    raise ValueError(
+        f"Invalid cache_key_hash_algorithm={algorithm}. Must be one of 'sha256', 'blake2b', 'xxhash'"
+    )
+
+
+class CacheKeyHasher:
+    def __init__(self, algorithm: CacheKeyHashAlgorithm = "sha256"):
+        self._hash_object = get_hash_object(algorithm)
+        self._update: Callable[[bytes], None] = self._hash_object.update
+
+    def update_param(self, param: str, value: Any) -> None:
+        """
+        Feed one `param=value` pair into the hash. List values are fed item by item.
+        """
+        update = self._update
+        update(param.encode("utf-8"))
+        update(_PARAM_NAME_SEPARATOR)
+        if isinstance(value, (list, tuple)):
+            update(b"[")
+            for item in value:
+                update(_canonical_json_bytes(item))
+                update(_ITEM_SEPARATOR)
+            update(b"]")
+        else:
+            update(_canonical_json_bytes(value))
+        update(_PARAM_SEPARATOR)
+
+    def hexdigest(self) -> str:
+        return self._hash_object.hexdigest()
+
+
+def hash_cache_key_string(
+    cache_key: str, algorithm: Optional[CacheKeyHashAlgorithm] = "sha256"
+) -> str:
+    """
+    Hash a pre-built cache key string with the given algorithm
+    """
+    hash_object = get_hash_object(algorithm or "sha256")
+    hash_object.update(cache_key.encode())
+    return hash_object.hexdigest()
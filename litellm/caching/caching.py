@@ -8,33 +8,38 @@
 #  Thank you users! We ❤️ you! - Krrish & Ishaan
 
 import ast
-import hashlib
 import json
 import time
 import traceback
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
 import litellm
 from litellm._logging import verbose_logger
-from litellm.constants import CACHED_STREAMING_CHUNK_DELAY
+from litellm.constants import (
+    CACHED_STREAMING_CHUNK_DELAY,
+    LOCAL_SEMANTIC_CACHE_MAX_ENTRIES,
+)
 from litellm.litellm_core_utils.model_param_helper import ModelParamHelper
 from litellm.types.caching import *
 from litellm.types.utils import EmbeddingResponse, all_litellm_params
 
 from .azure_blob_cache import AzureBlobCache
 from .base_cache import BaseCache
+from .cache_key_hasher import CacheKeyHasher, hash_cache_key_string
 from .disk_cache import DiskCache
 from .dual_cache import DualCache  # noqa
 from .gcs_cache import GCSCache
 from .in_memory_cache import InMemoryCache
+from .local_semantic_cache import LocalSemanticCache
 from .qdrant_semantic_cache import QdrantSemanticCache
 from .redis_cache import RedisCache
 from .redis_cluster_cache import RedisClusterCache
 from .redis_semantic_cache import RedisSemanticCache
 from .s3_cache import S3Cache
+from .segment_disk_cache import SegmentDiskCache
 
 
 def print_verbose(print_statement):
@@ -106,16 +111,25 @@ class Cache:
         qdrant_collection_name: Optional[str] = None,
         qdrant_quantization_config: Optional[str] = None,
         qdrant_semantic_cache_embedding_model: str = "text-embedding-ada-002",
+        local_semantic_cache_embedding_model: str = "text-embedding-ada-002",
+        local_semantic_cache_max_entries: Optional[int] = None,
+        local_semantic_cache_dtype: LocalSemanticCacheDtype = "float32",
+        local_semantic_cache_index_type: Optional[LocalSemanticCacheIndexType] = None,
+        local_semantic_cache_snapshot_path: Optional[str] = None,
         # GCP IAM authentication parameters
         gcp_service_account: Optional[str] = None,
         gcp_ssl_ca_certs: Optional[str] = None,
+        # cache key generation
+        canonical_cache_key: bool = False,
+        cache_key_hash_algorithm: CacheKeyHashAlgorithm = "sha256",
+        coalesce_cache_misses: bool = False,
         **kwargs,
     ):
         """
         Initializes the cache based on the given type.
 
         Args:
-            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "s3" or "disk". Defaults to "local".
+            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "local-semantic", "s3", "disk" or "segment-disk". Defaults to "local".
 
             # Redis Cache Args
             host (str, optional): The host address for the Redis cache. Required if type is "redis".
@@ -130,10 +144,17 @@ class Cache:
             qdrant_api_base (str, optional): The url for your qdrant cluster. Required if type is "qdrant-semantic".
             qdrant_api_key (str, optional): The api_key for the local or cloud qdrant cluster.
             qdrant_collection_name (str, optional): The name for your qdrant collection. Required if type is "qdrant-semantic".
-            similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic" or "qdrant-semantic".
+            similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic", "qdrant-semantic" or "local-semantic".
+
+            # Local Semantic Cache Args
+            local_semantic_cache_embedding_model (str, optional): The embedding model used to embed prompts. Defaults to "text-embedding-ada-002".
+            local_semantic_cache_max_entries (int, optional): Max cached prompts, least recently used entries are evicted beyond this. Defaults to 1,000,000.
+            local_semantic_cache_dtype (str, optional): "float32" (default) or "float16" storage for the embedding matrix.
+            local_semantic_cache_index_type (str, optional): None (brute force), "ivf" or "hnsw" (requires `pip install hnswlib`). Only used above 100k entries.
+            local_semantic_cache_snapshot_path (str, optional): .npz file the cache is loaded from on startup and saved to on disconnect.
 
             # Disk Cache Args
-            disk_cache_dir (str, optional): The directory for the disk cache. Defaults to None.
+            disk_cache_dir (str, optional): The directory for the disk / segment-disk cache. Defaults to None.
 
             # S3 Cache Args
             s3_bucket_name (str, optional): The bucket name for the s3 cache. Defaults to None.
@@ -154,6 +175,9 @@ class Cache:
 
             # Common Cache Args
             supported_call_types (list, optional): List of call types to cache for. Defaults to cache == on for all call types.
+            canonical_cache_key (bool, optional): Stream params (sorted, canonical JSON) straight into the hash instead of building one large string. Changes the generated keys. Defaults to False.
+            cache_key_hash_algorithm (str, optional): "sha256" (default), "blake2b" or "xxhash" (requires `pip install xxhash`).
+            coalesce_cache_misses (bool, optional): Concurrent async requests that miss the cache for the same key wait for the first one's response instead of each calling the LLM. Defaults to False.
             **kwargs: Additional keyword arguments for redis.Redis() cache
 
         Raises:
@@ -206,6 +230,16 @@ class Cache:
                 quantization_config=qdrant_quantization_config,
                 embedding_model=qdrant_semantic_cache_embedding_model,
             )
+        elif type == LiteLLMCacheType.LOCAL_SEMANTIC:
+            self.cache = LocalSemanticCache(
+                similarity_threshold=similarity_threshold,
+                embedding_model=local_semantic_cache_embedding_model,
+                max_entries=local_semantic_cache_max_entries
+                or LOCAL_SEMANTIC_CACHE_MAX_ENTRIES,
+                dtype=local_semantic_cache_dtype,
+                index_type=local_semantic_cache_index_type,
+                snapshot_path=local_semantic_cache_snapshot_path,
+            )
         elif type == LiteLLMCacheType.LOCAL:
             self.cache = InMemoryCache()
         elif type == LiteLLMCacheType.S3:
@@ -236,6 +270,8 @@ class Cache:
             )
         elif type == LiteLLMCacheType.DISK:
             self.cache = DiskCache(disk_cache_dir=disk_cache_dir)
+        elif type == LiteLLMCacheType.SEGMENT_DISK:
+            self.cache = SegmentDiskCache(disk_cache_dir=disk_cache_dir)
         if "cache" not in litellm.input_callback:
             litellm.input_callback.append("cache")
         if "cache" not in litellm.success_callback:
@@ -248,6 +284,9 @@ class Cache:
         self.redis_flush_size = redis_flush_size
         self.ttl = ttl
         self.mode: CacheMode = mode or CacheMode.default_on
+        self.canonical_cache_key = canonical_cache_key
+        self.cache_key_hash_algorithm: CacheKeyHashAlgorithm = cache_key_hash_algorithm
+        self.coalesce_cache_misses = coalesce_cache_misses
 
         if self.type == LiteLLMCacheType.LOCAL and default_in_memory_ttl is not None:
             self.ttl = default_in_memory_ttl
@@ -279,13 +318,38 @@ class Cache:
             verbose_logger.debug("\nReturning preset cache key: %s", preset_cache_key)
             return preset_cache_key
 
-        combined_kwargs = ModelParamHelper._get_all_llm_api_params()
+        if self.canonical_cache_key is True:
+            cache_key_hasher = CacheKeyHasher(algorithm=self.cache_key_hash_algorithm)
+            for param, param_value in sorted(
+                self._iter_cache_key_params(kwargs), key=lambda item: item[0]
+            ):
+                cache_key_hasher.update_param(param, param_value)
+            hashed_cache_key = cache_key_hasher.hexdigest()
+        else:
+            for param, param_value in self._iter_cache_key_params(kwargs):
+                cache_key += f"{str(param)}: {str(param_value)}"
+
+            verbose_logger.debug("\nCreated cache key: %s", cache_key)
+            hashed_cache_key = Cache._get_hashed_cache_key(
+                cache_key, algorithm=self.cache_key_hash_algorithm
+            )
+        hashed_cache_key = self._add_namespace_to_cache_key(hashed_cache_key, **kwargs)
+        self._set_preset_cache_key_in_kwargs(
+            preset_cache_key=hashed_cache_key, **kwargs
+        )
+        return hashed_cache_key
+
+    def _iter_cache_key_params(self, kwargs: dict) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields the (param, value) pairs that make up the cache key, in kwargs order
+        """
+        combined_kwargs = ModelParamHelper._get_all_llm_api_params_cached()
         litellm_param_kwargs = all_litellm_params
         for param in kwargs:
             if param in combined_kwargs:
                 param_value: Optional[str] = self._get_param_value(param, kwargs)
                 if param_value is not None:
-                    cache_key += f"{str(param)}: {str(param_value)}"
+                    yield param, param_value
             elif (
                 param not in litellm_param_kwargs
             ):  # check if user passed in optional param - e.g. top_k
@@ -294,16 +358,7 @@ class Cache:
                 ):  # feature flagged for now
                     if kwargs[param] is None:
                         continue  # ignore None params
-                    param_value = kwargs[param]
-                    cache_key += f"{str(param)}: {str(param_value)}"
-
-        verbose_logger.debug("\nCreated cache key: %s", cache_key)
-        hashed_cache_key = Cache._get_hashed_cache_key(cache_key)
-        hashed_cache_key = self._add_namespace_to_cache_key(hashed_cache_key, **kwargs)
-        self._set_preset_cache_key_in_kwargs(
-            preset_cache_key=hashed_cache_key, **kwargs
-        )
-        return hashed_cache_key
+                    yield param, kwargs[param]
 
     def _get_param_value(
         self,
@@ -387,7 +442,9 @@ class Cache:
                 kwargs["litellm_params"]["preset_cache_key"] = preset_cache_key
 
     @staticmethod
-    def _get_hashed_cache_key(cache_key: str) -> str:
+    def _get_hashed_cache_key(
+        cache_key: str, algorithm: CacheKeyHashAlgorithm = "sha256"
+    ) -> str:
         """
         Get the hashed cache key for the given cache key.
 
@@ -395,14 +452,13 @@ class Cache:
 
         Args:
             cache_key (str): The cache key to hash.
+            algorithm (str): The hash algorithm to use. Defaults to sha256.
 
         Returns:
             str: The hashed cache key.
         """
-        hash_object = hashlib.sha256(cache_key.encode())
-        # Hexadecimal representation of the hash
-        hash_hex = hash_object.hexdigest()
-        verbose_logger.debug("Hashed cache key (SHA-256): %s", hash_hex)
+        hash_hex = hash_cache_key_string(cache_key, algorithm=algorithm)
+        verbose_logger.debug("Hashed cache key (%s): %s", algorithm, hash_hex)
         return hash_hex
 
     def _add_namespace_to_cache_key(self, hash_hex: str, **kwargs) -> str:
@@ -15,8 +15,10 @@ In each method it will call the appropriate method from caching.py
 """
 
 import asyncio
+import copy
 import datetime
 import inspect
+import json
 import time
 from typing import (
     TYPE_CHECKING,
@@ -37,6 +39,7 @@ import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.caching import InMemoryCache
 from litellm.caching.caching import S3Cache
+from litellm.caching.single_flight import CacheMissCoalescer, SingleFlight
 from litellm.litellm_core_utils.llm_response_utils.response_metadata import (
     update_response_metadata,
 )
@@ -83,6 +86,12 @@ class CachingHandlerResponse(BaseModel):
 
 
 in_memory_cache_obj = InMemoryCache()
+# concurrent identical lookups share one cache read
+cache_lookup_single_flight = SingleFlight(
+    namespace="llm_cache_lookup", copy_result=copy.deepcopy
+)
+# with `Cache(coalesce_cache_misses=True)`, concurrent identical misses share one LLM call
+llm_cache_miss_coalescer = CacheMissCoalescer(namespace="llm_cache_miss")
 
 
 class LLMCachingHandler:
@@ -99,6 +108,8 @@ class LLMCachingHandler:
         self.request_kwargs = request_kwargs
         self.original_function = original_function
         self.start_time = start_time
+        # (cache key, future) while this request is the leader for a coalesced cache miss
+        self._in_flight_cache_miss: Optional[Tuple[str, asyncio.Future]] = None
         if litellm.cache is not None and isinstance(litellm.cache.cache, RedisCache):
             self.dual_cache: Optional[DualCache] = DualCache(
                 redis_cache=litellm.cache.cache,
@@ -168,6 +179,14 @@ class LLMCachingHandler:
                     kwargs=kwargs,
                     args=args,
                 )
+                if cached_result is None and self._should_coalesce_cache_miss(
+                    original_function=original_function,
+                    call_type=call_type,
+                    kwargs=kwargs,
+                ):
+                    cached_result = await self._async_coalesce_cache_miss(
+                        kwargs=kwargs, args=args
+                    )
                 cache_check_end_time = time.perf_counter()
 
                 if cached_result is not None and not isinstance(cached_result, list):
@@ -617,8 +636,14 @@ class LLMCachingHandler:
         else:
             if litellm.cache._supports_async() is True:
                 ## check if dual cache is supported ##
-                cached_result = await litellm.cache.async_get_cache(
-                    dynamic_cache_object=self.dual_cache, **new_kwargs
+                cache_key = litellm.cache.get_cache_key(**new_kwargs)
+                cached_result = await cache_lookup_single_flight.do(
+                    self._get_single_flight_key(cache_key=cache_key, kwargs=new_kwargs),
+                    lambda: litellm.cache.async_get_cache(  # type: ignore
+                        dynamic_cache_object=self.dual_cache,
+                        cache_key=cache_key,
+                        **new_kwargs,
+                    ),
                 )
             else:  # fallback for caches that don't support async
                 cached_result = litellm.cache.get_cache(
@@ -626,6 +651,70 @@ class LLMCachingHandler:
                 )
         return cached_result
 
+    @staticmethod
+    def _get_single_flight_key(cache_key: str, kwargs: Dict[str, Any]) -> str:
+        # cache-controls (e.g. s-maxage) change what a lookup returns
+        cache_control = kwargs.get("cache")
+        if cache_control:
+            return f"{cache_key}:{cache_control}"
+        return cache_key
+
+    def _should_coalesce_cache_miss(
+        self, original_function: Callable, call_type: str, kwargs: Dict[str, Any]
+    ) -> bool:
+        """
+        Coalesce misses only for non-streaming, non-embedding calls whose result is stored in the cache
+        """
+        return (
+            litellm.cache is not None
+            and litellm.cache.coalesce_cache_misses is True
+            and call_type != CallTypes.aembedding.value
+            and kwargs.get("stream", False) is not True
+            and self._should_store_result_in_cache(
+                original_function=original_function, kwargs=kwargs
+            )
+        )
+
+    async def _async_coalesce_cache_miss(
+        self, kwargs: Dict[str, Any], args: Optional[Tuple[Any, ...]]
+    ) -> Optional[Any]:
+        """
+        On a cache miss, either become the leader for this cache key (returns None, the caller makes the LLM call),
+        or wait for the leader's response and return it as if it was read from the cache.
+        """
+        if litellm.cache is None:
+            return None
+        new_kwargs = kwargs.copy()
+        new_kwargs.update(convert_args_to_kwargs(self.original_function, args))
+        cache_key = litellm.cache.get_cache_key(**new_kwargs)
+        is_leader, future = llm_cache_miss_coalescer.acquire(cache_key)
+        if future is None:
+            return None
+        if is_leader:
+            self._in_flight_cache_miss = (cache_key, future)
+            return None
+        value = await llm_cache_miss_coalescer.wait(key=cache_key, future=future)
+        if value is None:
+            return None
+        return json.loads(value)
+
+    def release_in_flight_cache_miss(self, result: Optional[Any] = None) -> None:
+        """
+        If this request is the leader for a coalesced cache miss, hand its result to the waiting requests.
+
+        Called with no result when the request failed - waiters then make their own LLM call.
+        """
+        if self._in_flight_cache_miss is None:
+            return
+        cache_key, future = self._in_flight_cache_miss
+        self._in_flight_cache_miss = None
+        value: Optional[str] = None
+        if isinstance(result, BaseModel) and llm_cache_miss_coalescer.has_waiters(
+            cache_key
+        ):
+            value = result.model_dump_json()
+        llm_cache_miss_coalescer.release(key=cache_key, future=future, value=value)
+
     def _convert_cached_result_to_model_response(
         self,
         cached_result: Any,
@@ -805,6 +894,7 @@ class LLMCachingHandler:
             _get_parent_otel_span_from_kwargs,
         )
 
+        self.release_in_flight_cache_miss(result=result)
         if litellm.cache is None:
             return
 
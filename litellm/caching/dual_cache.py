@@ -19,11 +19,14 @@ if TYPE_CHECKING:
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
-from litellm.constants import DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE
+from litellm.constants import DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE, DEFAULT_NEAR_CACHE_TTL
 
 from .base_cache import BaseCache
+from .get_batcher import GetBatcher
 from .in_memory_cache import InMemoryCache
+from .near_cache import NearCacheInvalidator
 from .redis_cache import RedisCache
+from .single_flight import SingleFlight
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -52,6 +55,14 @@ class DualCache(BaseCache):
     DualCache is a cache implementation that updates both Redis and an in-memory cache simultaneously.
     When data is updated or inserted, it is written to both the in-memory cache + Redis.
     This ensures that even if Redis hasn't been updated yet, the in-memory cache reflects the most recent data.
+
+    With `near_cache=True`, values stay in memory until another instance invalidates them over Redis pub/sub
+    (see near_cache.py), instead of expiring after `default_in_memory_ttl`.
+
+    With `coalesce_requests=True` (default), concurrent async gets that miss the in-memory cache for the same key
+    share one Redis call.
+
+    With `batch_redis_gets=True`, single-key Redis gets issued in the same event-loop tick are merged into one MGET.
     """
 
     def __init__(
@@ -62,6 +73,11 @@ class DualCache(BaseCache):
         default_redis_ttl: Optional[float] = None,
         default_redis_batch_cache_expiry: Optional[float] = None,
         default_max_redis_batch_cache_size: int = DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE,
+        near_cache: bool = False,
+        near_cache_ttl: Optional[float] = None,
+        near_cache_invalidation_channel: Optional[str] = None,
+        coalesce_requests: bool = True,
+        batch_redis_gets: bool = False,
     ) -> None:
         super().__init__()
         # If in_memory_cache is not provided, use the default InMemoryCache
@@ -81,6 +97,28 @@ class DualCache(BaseCache):
         )
         self.default_redis_ttl = default_redis_ttl or litellm.default_redis_ttl
 
+        # near cache - in-memory entries live until invalidated by another instance
+        self.near_cache_ttl = near_cache_ttl or DEFAULT_NEAR_CACHE_TTL
+        self.near_cache_invalidator: Optional[NearCacheInvalidator] = None
+        if near_cache is True and self.redis_cache is not None:
+            self.near_cache_invalidator = NearCacheInvalidator(
+                redis_cache=self.redis_cache,
+                in_memory_cache=self.in_memory_cache,
+                channel=near_cache_invalidation_channel,
+            )
+
+        self.redis_get_single_flight: Optional[SingleFlight] = (
+            SingleFlight(namespace="dual_cache") if coalesce_requests else None
+        )
+        self.redis_get_batcher: Optional[GetBatcher] = (
+            GetBatcher(
+                batch_get_fn=self._async_batch_get_from_redis,
+                max_batch_size=default_max_redis_batch_cache_size,
+            )
+            if batch_redis_gets
+            else None
+        )
+
     def update_cache_ttl(
         self, default_in_memory_ttl: Optional[float], default_redis_ttl: Optional[float]
     ):
@@ -90,6 +128,43 @@ class DualCache(BaseCache):
         if default_redis_ttl is not None:
             self.default_redis_ttl = default_redis_ttl
 
+    def _is_near_cache_active(self) -> bool:
+        if self.near_cache_invalidator is None:
+            return False
+        self.near_cache_invalidator.ensure_listener_started()
+        return self.near_cache_invalidator.is_subscribed
+
+    def _get_in_memory_kwargs_for_redis_result(self, kwargs: dict) -> dict:
+        """
+        Values read from Redis are kept until invalidated when the near cache is active
+        """
+        if self._is_near_cache_active():
+            return {**kwargs, "ttl": self.near_cache_ttl}
+        return kwargs
+
+    def _start_near_cache_read(self, key: str) -> Optional[int]:
+        if self.near_cache_invalidator is None:
+            return None
+        return self.near_cache_invalidator.start_read(key)
+
+    def _finish_near_cache_read(self, key: str, read_generation: Optional[int]) -> bool:
+        """
+        Returns False if `key` was invalidated while it was read from Redis - don't keep the result in memory
+        """
+        if self.near_cache_invalidator is None or read_generation is None:
+            return True
+        return self.near_cache_invalidator.finish_read(key, read_generation)
+
+    def _invalidate_near_cache(self, keys: List[str], local_only: bool) -> None:
+        if self.near_cache_invalidator is not None and local_only is False:
+            self.near_cache_invalidator.publish_invalidation(keys)
+
+    async def _async_invalidate_near_cache(
+        self, keys: List[str], local_only: bool
+    ) -> None:
+        if self.near_cache_invalidator is not None and local_only is False:
+            await self.near_cache_invalidator.async_publish_invalidation(keys)
+
     def set_cache(self, key, value, local_only: bool = False, **kwargs):
         # Update both Redis and in-memory cache
         try:
@@ -101,6 +176,7 @@ class DualCache(BaseCache):
 
             if self.redis_cache is not None and local_only is False:
                 self.redis_cache.set_cache(key, value, **kwargs)
+                self._invalidate_near_cache([key], local_only=local_only)
         except Exception as e:
             print_verbose(e)
 
@@ -121,6 +197,7 @@ class DualCache(BaseCache):
 
             if self.redis_cache is not None and local_only is False:
                 result = self.redis_cache.increment_cache(key, value, **kwargs)
+                self._invalidate_near_cache([key], local_only=local_only)
 
             return result
         except Exception as e:
@@ -145,13 +222,21 @@ class DualCache(BaseCache):
 
             if result is None and self.redis_cache is not None and local_only is False:
                 # If not found in in-memory cache, try fetching from Redis
-                redis_result = self.redis_cache.get_cache(
-                    key, parent_otel_span=parent_otel_span
-                )
+                read_generation = self._start_near_cache_read(key)
+                try:
+                    redis_result = self.redis_cache.get_cache(
+                        key, parent_otel_span=parent_otel_span
+                    )
+                finally:
+                    is_current = self._finish_near_cache_read(key, read_generation)
 
-                if redis_result is not None:
+                if redis_result is not None and is_current:
                     # Update in-memory cache with the value from Redis
-                    self.in_memory_cache.set_cache(key, redis_result, **kwargs)
+                    self.in_memory_cache.set_cache(
+                        key,
+                        redis_result,
+                        **self._get_in_memory_kwargs_for_redis_result(kwargs),
+                    )
 
                 result = redis_result
 
@@ -219,23 +304,54 @@ class DualCache(BaseCache):
 
             if result is None and self.redis_cache is not None and local_only is False:
                 # If not found in in-memory cache, try fetching from Redis
-                redis_result = await self.redis_cache.async_get_cache(
-                    key, parent_otel_span=parent_otel_span
-                )
-
-                if redis_result is not None:
-                    # Update in-memory cache with the value from Redis
-                    await self.in_memory_cache.async_set_cache(
-                        key, redis_result, **kwargs
+                if self.redis_get_single_flight is not None:
+                    result = await self.redis_get_single_flight.do(
+                        key,
+                        lambda: self._async_get_from_redis_and_update_in_memory(
+                            key, parent_otel_span=parent_otel_span, **kwargs
+                        ),
+                    )
+                else:
+                    result = await self._async_get_from_redis_and_update_in_memory(
+                        key, parent_otel_span=parent_otel_span, **kwargs
                     )
-
-                result = redis_result
 
             print_verbose(f"get cache: cache result: {result}")
             return result
         except Exception:
             verbose_logger.error(traceback.format_exc())
 
+    async def _async_get_from_redis_and_update_in_memory(
+        self, key, parent_otel_span: Optional[Span] = None, **kwargs
+    ):
+        if self.redis_cache is None:
+            return None
+        read_generation = self._start_near_cache_read(key)
+        try:
+            if self.redis_get_batcher is not None:
+                redis_result = await self.redis_get_batcher.get(key)
+            else:
+                redis_result = await self.redis_cache.async_get_cache(
+                    key, parent_otel_span=parent_otel_span
+                )
+        finally:
+            is_current = self._finish_near_cache_read(key, read_generation)
+
+        if redis_result is not None and is_current:
+            # Update in-memory cache with the value from Redis
+            await self.in_memory_cache.async_set_cache(
+                key,
+                redis_result,
+                **self._get_in_memory_kwargs_for_redis_result(kwargs),
+            )
+        return redis_result
+
+    async def _async_batch_get_from_redis(self, keys: List[str]) -> dict:
+        # redis_cache can be attached after init (e.g. by the proxy)
+        if self.redis_cache is None:
+            return {}
+        return await self.redis_cache.async_batch_get_cache(key_list=keys)
+
     def get_redis_batch_keys(
         self,
         current_time: float,
@@ -281,9 +397,21 @@ class DualCache(BaseCache):
                 # Only hit Redis if the last access time was more than 5 seconds ago
                 if len(sublist_keys) > 0:
                     # If not found in in-memory cache, try fetching from Redis
-                    redis_result = await self.redis_cache.async_batch_get_cache(
-                        sublist_keys, parent_otel_span=parent_otel_span
-                    )
+                    read_generations = [
+                        self._start_near_cache_read(key) for key in sublist_keys
+                    ]
+                    try:
+                        redis_result = await self.redis_cache.async_batch_get_cache(
+                            sublist_keys, parent_otel_span=parent_otel_span
+                        )
+                    finally:
+                        current_keys = {
+                            key
+                            for key, read_generation in zip(
+                                sublist_keys, read_generations
+                            )
+                            if self._finish_near_cache_read(key, read_generation)
+                        }
                     
                     # Update the last access time for ALL queried keys
                     # This includes keys with None values to throttle repeated Redis queries
@@ -298,12 +426,19 @@ class DualCache(BaseCache):
                     key_to_index = {key: i for i, key in enumerate(keys)}
                     
                     # Update both result and in-memory cache in a single loop
+                    in_memory_kwargs = self._get_in_memory_kwargs_for_redis_result(
+                        kwargs
+                    )
                     for key, value in redis_result.items():
                         result[key_to_index[key]] = value
                         
-                        if value is not None and self.in_memory_cache is not None:
+                        if (
+                            value is not None
+                            and self.in_memory_cache is not None
+                            and key in current_keys
+                        ):
                             await self.in_memory_cache.async_set_cache(
-                                key, value, **kwargs
+                                key, value, **in_memory_kwargs
                             )
 
             return result
@@ -320,6 +455,7 @@ class DualCache(BaseCache):
 
             if self.redis_cache is not None and local_only is False:
                 await self.redis_cache.async_set_cache(key, value, **kwargs)
+                await self._async_invalidate_near_cache([key], local_only=local_only)
         except Exception as e:
             verbose_logger.exception(
                 f"LiteLLM Cache: Excepton async add_cache: {str(e)}"
@@ -345,6 +481,9 @@ class DualCache(BaseCache):
                 await self.redis_cache.async_set_cache_pipeline(
                     cache_list=cache_list, ttl=kwargs.pop("ttl", None), **kwargs
                 )
+                await self._async_invalidate_near_cache(
+                    [cache_key for cache_key, _ in cache_list], local_only=local_only
+                )
         except Exception as e:
             verbose_logger.exception(
                 f"LiteLLM Cache: Excepton async add_cache: {str(e)}"
@@ -379,6 +518,7 @@ class DualCache(BaseCache):
                     parent_otel_span=parent_otel_span,
                     ttl=kwargs.get("ttl", None),
                 )
+                await self._async_invalidate_near_cache([key], local_only=local_only)
 
             return result
         except Exception as e:
@@ -404,6 +544,10 @@ class DualCache(BaseCache):
                     increment_list=increment_list,
                     parent_otel_span=parent_otel_span,
                 )
+                await self._async_invalidate_near_cache(
+                    [increment["key"] for increment in increment_list],
+                    local_only=local_only,
+                )
 
             return result
         except Exception as e:
@@ -431,6 +575,7 @@ class DualCache(BaseCache):
                 _ = await self.redis_cache.async_set_cache_sadd(
                     key, value, ttl=kwargs.get("ttl", None)
                 )
+                await self._async_invalidate_near_cache([key], local_only=local_only)
 
             return None
         except Exception as e:
@@ -441,6 +586,8 @@ class DualCache(BaseCache):
             self.in_memory_cache.flush_cache()
         if self.redis_cache is not None:
             self.redis_cache.flush_cache()
+        if self.near_cache_invalidator is not None:
+            self.near_cache_invalidator.publish_invalidation(keys=None)
 
     def delete_cache(self, key):
         """
@@ -450,6 +597,7 @@ class DualCache(BaseCache):
             self.in_memory_cache.delete_cache(key)
         if self.redis_cache is not None:
             self.redis_cache.delete_cache(key)
+            self._invalidate_near_cache([key], local_only=False)
 
     async def async_delete_cache(self, key: str):
         """
@@ -459,6 +607,7 @@ class DualCache(BaseCache):
             self.in_memory_cache.delete_cache(key)
         if self.redis_cache is not None:
             await self.redis_cache.async_delete_cache(key)
+            await self._async_invalidate_near_cache([key], local_only=False)
 
     async def async_get_ttl(self, key: str) -> Optional[int]:
         """
@@ -0,0 +1,215 @@
+"""
+Eviction policies for the InMemoryCache
+
+Each policy only tracks key ordering / frequency. The cache owns the values and
+asks the policy which key to evict when it is over its item or byte budget.
+
+All operations are O(1) (amortized for the TinyLFU frequency sketch aging).
+
+Has 2 policies:
+    - LRUEvictionPolicy: evicts the least recently used key
+    - TinyLFUEvictionPolicy: W-TinyLFU - small LRU admission window + segmented LRU main area,
+      where the window candidate has to beat the main victim's estimated frequency to be admitted
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from litellm.constants import (
+    TINYLFU_PROTECTED_RATIO,
+    TINYLFU_SKETCH_DEPTH,
+    TINYLFU_SKETCH_MAX_COUNTER,
+    TINYLFU_SKETCH_MIN_WIDTH,
+    TINYLFU_SKETCH_RESET_MULTIPLIER,
+    TINYLFU_WINDOW_RATIO,
+)
+
+
+class BaseEvictionPolicy(ABC):
+    @abstractmethod
+    def on_insert(self, key: Hashable) -> None:
+        """Called when a new key is inserted into the cache"""
+        pass
+
+    @abstractmethod
+    def on_access(self, key: Hashable) -> None:
+        """Called on a cache hit, or when an existing key is overwritten"""
+        pass
+
+    @abstractmethod
+    def on_remove(self, key: Hashable) -> None:
+        """Called when a key is removed from the cache (deleted, expired or evicted)"""
+        pass
+
+    @abstractmethod
+    def select_victim(self) -> Optional[Hashable]:
+        """Return the key that should be evicted next, or None if nothing is tracked"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class LRUEvictionPolicy(BaseEvictionPolicy):
+    def __init__(self):
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def on_insert(self, key: Hashable) -> None:
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def on_access(self, key: Hashable) -> None:
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def on_remove(self, key: Hashable) -> None:
+        self._order.pop(key, None)
+
+    def select_victim(self) -> Optional[Hashable]:
+        return next(iter(self._order), None)
+
+    def clear(self) -> None:
+        self._order.clear()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+# lookup table used to halve every counter (byte) of the sketch in one C-level pass
+_HALVE_TABLE = bytes(i >> 1 for i in range(1 << 8))
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch with small saturating counters, used as the frequency estimator for TinyLFU.
+
+    Counters are periodically halved ("aging") so the sketch reflects recent popularity.
+    """
+
+    def __init__(self, capacity: int):
+        width = TINYLFU_SKETCH_MIN_WIDTH
+        while width < capacity:
+            width <<= 1
+        self._width_mask = width - 1
+        self._depth = TINYLFU_SKETCH_DEPTH
+        self._table = bytearray(width * self._depth)
+        self._sample_size = width * TINYLFU_SKETCH_RESET_MULTIPLIER
+        self._additions = 0
+
+    def _indexes(self, key: Hashable):
+        h = hash(key)
+        h2 = (h >> 16) | 1
+        width = self._width_mask + 1
+        for row in range(self._depth):
+            yield row * width + ((h + row * h2) & self._width_mask)
+
+    def increment(self, key: Hashable) -> None:
+        table = self._table
+        for idx in self._indexes(key):
+            if table[idx] < TINYLFU_SKETCH_MAX_COUNTER:
+                table[idx] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def estimate(self, key: Hashable) -> int:
+        table = self._table
+        return min(table[idx] for idx in self._indexes(key))
+
+    def _reset(self) -> None:
+        self._table = bytearray(self._table.translate(_HALVE_TABLE))
+        self._additions //= 2
+
+    def clear(self) -> None:
+        self._table = bytearray(len(self._table))
+        self._additions = 0
+
+
+class TinyLFUEvictionPolicy(BaseEvictionPolicy):
+    """
+    W-TinyLFU eviction policy.
+
+    - new keys enter a small LRU window (TINYLFU_WINDOW_RATIO of tracked keys)
+    - keys leaving the window go to the probation segment of the main area
+    - a hit on a probation key promotes it to the protected segment
+    - on eviction, the window's LRU candidate duels the probation LRU victim and the
+      one with the lower estimated frequency is evicted
+
+    This keeps one-hit wonders (e.g. a burst of unique keys) from flushing hot entries.
+    """
+
+    def __init__(self, capacity: int):
+        self._sketch = CountMinSketch(capacity=capacity)
+        self._window: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._probation: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._protected: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+    def _window_capacity(self) -> int:
+        return max(1, int(len(self) * TINYLFU_WINDOW_RATIO))
+
+    def _protected_capacity(self) -> int:
+        main_size = len(self) - len(self._window)
+        return max(1, int(main_size * TINYLFU_PROTECTED_RATIO))
+
+    def on_insert(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+        self._window[key] = None
+        self._window.move_to_end(key)
+        while len(self._window) > self._window_capacity():
+            demoted, _ = self._window.popitem(last=False)
+            self._probation[demoted] = None
+
+    def on_access(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self._protected_capacity():
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+
+    def on_remove(self, key: Hashable) -> None:
+        if self._window.pop(key, _MISSING) is not _MISSING:
+            return
+        if self._probation.pop(key, _MISSING) is not _MISSING:
+            return
+        self._protected.pop(key, None)
+
+    def _main_victim(self) -> Optional[Hashable]:
+        if self._probation:
+            return next(iter(self._probation))
+        if self._protected:
+            return next(iter(self._protected))
+        return None
+
+    def select_victim(self) -> Optional[Hashable]:
+        victim = self._main_victim()
+        if not self._window:
+            return victim
+        candidate = next(iter(self._window))
+        if victim is None:
+            return candidate
+        if self._sketch.estimate(candidate) > self._sketch.estimate(victim):
+            # candidate is admitted to the main area, the main victim is evicted
+            del self._window[candidate]
+            self._probation[candidate] = None
+            return victim
+        return candidate
+
+    def clear(self) -> None:
+        self._sketch.clear()
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+
+
+_MISSING = object()
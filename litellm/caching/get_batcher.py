@@ -0,0 +1,82 @@
+"""
+Micro-batching for single-key cache reads
+
+Gets issued in the same event-loop tick are merged into one batch read (e.g. one Redis MGET)
+and the results are fanned back out to each caller.
+
+Used by DualCache (`batch_redis_gets=True`), so hot callers that look up one key at a time
+(auth checks, rate-limit descriptors, cooldown lookups) share one round trip.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Set
+
+from litellm._logging import verbose_logger
+from litellm.constants import DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE
+
+
+class GetBatcher:
+    def __init__(
+        self,
+        batch_get_fn: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        max_batch_size: int = DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE,
+    ):
+        """
+        Args:
+            batch_get_fn: reads a list of keys, returns {key: value}. Missing keys are treated as None.
+            max_batch_size: max keys per batch read, larger batches are split
+        """
+        self.batch_get_fn = batch_get_fn
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._pending_loop: Any = None
+        # running batch reads - the event loop only keeps weak references to tasks
+        self._running_tasks: Set[asyncio.Future] = set()
+
+        # counters
+        self.num_gets: int = 0
+        self.num_batches: int = 0
+
+    async def get(self, key: str) -> Any:
+        """
+        Returns the value for `key`, read together with every other key requested in this tick
+        """
+        loop = asyncio.get_running_loop()
+        if self._pending and self._pending_loop is not loop:
+            # pending batch belongs to another event loop - don't mix futures across loops
+            return (await self.batch_get_fn([key])).get(key)
+
+        future = loop.create_future()
+        if not self._pending:
+            self._pending_loop = loop
+            loop.call_soon(self._flush)
+        self._pending.setdefault(key, []).append(future)
+        self.num_gets += 1
+        return await future
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._pending_loop = None
+        keys = list(pending.keys())
+        for i in range(0, len(keys), self.max_batch_size):
+            batch = {key: pending[key] for key in keys[i : i + self.max_batch_size]}
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._running_tasks.add(task)
+            task.add_done_callback(self._running_tasks.discard)
+
+    async def _run_batch(self, batch: Dict[str, List[asyncio.Future]]) -> None:
+        self.num_batches += 1
+        try:
+            results = await self.batch_get_fn(list(batch.keys()))
+        except Exception as e:
+            verbose_logger.debug("LiteLLM GetBatcher: batch get failed - %s", str(e))
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for key, futures in batch.items():
+            value = results.get(key) if results else None
+            for future in futures:
+                if not future.done():  # caller may have been cancelled
+                    future.set_result(value)
@@ -9,22 +9,35 @@ Has 4 methods:
 """
 
 import json
-import sys
 import time
 import heapq
+import weakref
 from typing import TYPE_CHECKING, Any, List, Optional
 
 if TYPE_CHECKING:
     from litellm.types.caching import RedisPipelineIncrementOperation
 
-from pydantic import BaseModel
-
-from litellm.constants import MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    DEFAULT_IN_MEMORY_CACHE_EVICTION_POLICY,
+    MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB,
+)
+from litellm.types.caching import InMemoryCacheEvictionPolicy, InMemoryCacheStats
 
 from .base_cache import BaseCache
+from .eviction_policy import (
+    BaseEvictionPolicy,
+    LRUEvictionPolicy,
+    TinyLFUEvictionPolicy,
+)
+from .memory_budget import estimate_size_in_bytes, in_memory_cache_memory_budget
 
 
 class InMemoryCache(BaseCache):
+    # caches of objects that are expensive to re-create (e.g. LLMClientCache) set this - their writes are never
+    # refused by the global ceiling, and other caches don't evict their entries to make room
+    _exempt_from_global_memory_ceiling: bool = False
+
     def __init__(
         self,
         max_size_in_memory: Optional[int] = 200,
@@ -32,9 +45,18 @@ class InMemoryCache(BaseCache):
             int
         ] = 600,  # default ttl is 10 minutes. At maximum litellm rate limiting logic requires objects to be in memory for 1 minute
         max_size_per_item: Optional[int] = 1024,  # 1MB = 1024KB
+        max_size_in_bytes: Optional[int] = None,
+        eviction_policy: Optional[InMemoryCacheEvictionPolicy] = None,
+        namespace: Optional[str] = None,
     ):
         """
         max_size_in_memory [int]: Maximum number of items in cache. done to prevent memory leaks. Use 200 items as a default
+        max_size_in_bytes [int]: Optional byte budget for all cached values. Evicts entries once the budget is exceeded.
+        eviction_policy [str]: "ttl" (default) evicts the entries closest to expiry, "lru" evicts the least recently used entry,
+            "tinylfu" uses W-TinyLFU so frequently used entries survive bursts of one-off keys.
+        namespace [str]: Name this cache's memory usage is reported under. Defaults to the class name.
+
+        All in-memory caches also share the global ceiling `litellm.in_memory_cache_max_size_in_bytes`.
         """
         self.max_size_in_memory = (
             max_size_in_memory if max_size_in_memory is not None else 200
@@ -49,43 +71,95 @@ class InMemoryCache(BaseCache):
         self.ttl_dict: dict = {}
         self.expiration_heap: list[tuple[float, str]] = []
 
-    def check_value_size(self, value: Any):
+        # byte budget accounting - sizes are estimated once on insertion
+        self.namespace = namespace or type(self).__name__
+        self.max_size_in_bytes = max_size_in_bytes
+        self._item_size_dict: dict = {}
+        # single-element list so the gc finalizer can release this cache's share of the global budget
+        self._size_in_bytes_cell: List[int] = [0]
+        self._memory_budget_finalizer: Optional[weakref.finalize] = None
+
+        # eviction policy - None means evict by earliest expiration (expiration_heap)
+        self.eviction_policy: InMemoryCacheEvictionPolicy = (
+            eviction_policy or DEFAULT_IN_MEMORY_CACHE_EVICTION_POLICY  # type: ignore
+        )
+        self._eviction_policy: Optional[BaseEvictionPolicy] = (
+            self._get_eviction_policy(self.eviction_policy)
+        )
+
+        # runtime counters, see get_cache_stats()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._expirations: int = 0
+
+    def _get_eviction_policy(
+        self, eviction_policy: InMemoryCacheEvictionPolicy
+    ) -> Optional[BaseEvictionPolicy]:
+        if eviction_policy == "ttl":
+            return None
+        elif eviction_policy == "lru":
+            return LRUEvictionPolicy()
+        elif eviction_policy == "tinylfu":
+            return TinyLFUEvictionPolicy(capacity=max(self.max_size_in_memory, 1))
+        raise ValueError(
+            f"Invalid eviction_policy={eviction_policy}. Must be one of 'ttl', 'lru', 'tinylfu'"
+        )
+
+    def _get_item_size_in_bytes(self, value: Any) -> int:
         """
-        Check if value size exceeds max_size_per_item (1MB)
-        Returns True if value size is acceptable, False otherwise
+        Estimated size of the value, used for the per-item limit and the byte budgets
         """
         try:
-            # Fast path for common primitive types that are typically small
-            if (
-                isinstance(value, (bool, int, float, str))
-                and len(str(value))
-                < self.max_size_per_item * MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
-            ):  # Conservative estimate
-                return True
-
-            # Direct size check for bytes objects
-            if isinstance(value, bytes):
-                return sys.getsizeof(value) / 1024 <= self.max_size_per_item
+            return estimate_size_in_bytes(value)
+        except Exception:
+            return 0
 
-            # Handle special types without full conversion when possible
-            if hasattr(value, "__sizeof__"):  # Use __sizeof__ if available
-                size = value.__sizeof__() / 1024
-                return size <= self.max_size_per_item
+    def _is_item_size_allowed(self, item_size: int) -> bool:
+        if item_size / 1024 > self.max_size_per_item:
+            return False
+        if self.max_size_in_bytes is not None and item_size > self.max_size_in_bytes:
+            return False
+        return True
 
-            # Fallback for complex types
-            if isinstance(value, BaseModel) and hasattr(
-                value, "model_dump"
-            ):  # Pydantic v2
-                value = value.model_dump()
-            elif hasattr(value, "isoformat"):  # datetime objects
-                return True  # datetime strings are always small
+    @property
+    def _current_size_in_bytes(self) -> int:
+        return self._size_in_bytes_cell[0]
 
-            # Only convert to JSON if absolutely necessary
-            if not isinstance(value, (str, bytes)):
-                value = json.dumps(value, default=str)
+    def _update_size_in_bytes(self, size_delta: int) -> None:
+        if size_delta == 0:
+            return
+        self._size_in_bytes_cell[0] += size_delta
+        in_memory_cache_memory_budget.update(self.namespace, size_delta)
+        if self._memory_budget_finalizer is None:
+            in_memory_cache_memory_budget.register_cache(self)
+            self._memory_budget_finalizer = weakref.finalize(
+                self,
+                in_memory_cache_memory_budget.release,
+                self.namespace,
+                self._size_in_bytes_cell,
+            )
 
-            return sys.getsizeof(value) / 1024 <= self.max_size_per_item
+    def get_cache_stats(self) -> InMemoryCacheStats:
+        """
+        Hit / miss / eviction counters and current usage of the cache
+        """
+        return InMemoryCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            current_size=len(self.cache_dict),
+            current_size_in_bytes=self._current_size_in_bytes,
+        )
 
+    def check_value_size(self, value: Any):
+        """
+        Check if value size exceeds max_size_per_item (1MB)
+        Returns True if value size is acceptable, False otherwise
+        """
+        try:
+            return self._is_item_size_allowed(self._get_item_size_in_bytes(value))
         except Exception:
             return False
 
@@ -101,8 +175,72 @@ class InMemoryCache(BaseCache):
         """
         self.cache_dict.pop(key, None)
         self.ttl_dict.pop(key, None)
+        item_size = self._item_size_dict.pop(key, 0)
+        self._update_size_in_bytes(-item_size)
+        if self._eviction_policy is not None:
+            self._eviction_policy.on_remove(key)
 
-    def evict_cache(self):
+    def _compact_expiration_heap(self) -> None:
+        """
+        Drop outdated heap entries left behind by ttl overrides. Amortized O(1) per set_cache.
+        """
+        self.expiration_heap = [
+            (expiration_time, key) for key, expiration_time in self.ttl_dict.items()
+        ]
+        heapq.heapify(self.expiration_heap)
+
+    def _needs_eviction(self, key: Optional[str] = None, item_size: int = 0) -> bool:
+        """
+        Returns True if writing `key` (of `item_size` bytes) would exceed the item or byte budget
+        """
+        if len(self.cache_dict) >= self.max_size_in_memory and (
+            self._eviction_policy is None or key not in self.cache_dict
+        ):
+            return True
+        size_delta = item_size - self._item_size_dict.get(key, 0)
+        if (
+            self.max_size_in_bytes is not None
+            and self._current_size_in_bytes + size_delta > self.max_size_in_bytes
+        ):
+            return True
+        if self._exempt_from_global_memory_ceiling:
+            return False
+        return in_memory_cache_memory_budget.is_over_budget(size_delta)
+
+    def _evict_with_policy(self, key: Optional[str] = None, item_size: int = 0):
+        """
+        Evict the eviction policy's victims until `key` fits in the cache. O(1) per evicted entry.
+        """
+        if self._eviction_policy is None:
+            return
+        while self._needs_eviction(key=key, item_size=item_size):
+            if not self._evict_one():
+                break
+
+    def _evict_one(self) -> bool:
+        """
+        Evict the next entry of the eviction policy (or the entry closest to expiry).
+
+        Also used by the global memory budget, to make room for a write to another cache.
+        Returns False if there is nothing left to evict.
+        """
+        if self._eviction_policy is not None:
+            victim = self._eviction_policy.select_victim()
+            if victim is None or victim not in self.cache_dict:
+                return False
+            self._remove_key(victim)
+            self._evictions += 1
+            return True
+        while self.expiration_heap:
+            expiration_time, heap_key = heapq.heappop(self.expiration_heap)
+            # Skip if key was removed or updated
+            if self.ttl_dict.get(heap_key) == expiration_time:
+                self._remove_key(heap_key)
+                self._evictions += 1
+                return True
+        return False
+
+    def evict_cache(self, key: Optional[str] = None, item_size: int = 0):
         """
         Eviction policy:
         1. First, remove expired items from ttl_dict and cache_dict
@@ -114,30 +252,38 @@ class InMemoryCache(BaseCache):
         - 2. When ttl is set: the item will remain in memory for at least that amount of time, unless cache size requires eviction
         - 3. the size of in-memory cache is bounded
 
+        If an lru / tinylfu eviction policy is set, the policy picks the entries to evict instead.
         """
+        if self._eviction_policy is not None:
+            return self._evict_with_policy(key=key, item_size=item_size)
+
         current_time = time.time()
 
         # Step 1: Remove expired or outdated items
         while self.expiration_heap:
-            expiration_time, key = self.expiration_heap[0]
+            expiration_time, heap_key = self.expiration_heap[0]
 
             # Case 1: Heap entry is outdated
-            if expiration_time != self.ttl_dict.get(key):
+            if expiration_time != self.ttl_dict.get(heap_key):
                 heapq.heappop(self.expiration_heap)
             # Case 2: Entry is valid but expired
             elif expiration_time <= current_time:
                 heapq.heappop(self.expiration_heap)
-                self._remove_key(key)
+                self._remove_key(heap_key)
+                self._expirations += 1
             else:
                 # Case 3: Entry is valid and not expired
                 break
 
         # Step 2: Evict if cache is still full
-        while len(self.cache_dict) >= self.max_size_in_memory:
-            expiration_time, key = heapq.heappop(self.expiration_heap)
+        while self.expiration_heap and self._needs_eviction(
+            key=key, item_size=item_size
+        ):
+            expiration_time, heap_key = heapq.heappop(self.expiration_heap)
             # Skip if key was removed or updated
-            if self.ttl_dict.get(key) == expiration_time:
-                self._remove_key(key)
+            if self.ttl_dict.get(heap_key) == expiration_time:
+                self._remove_key(heap_key)
+                self._evictions += 1
 
         # de-reference the removed item
         # https://www.geeksforgeeks.org/diagnosing-and-fixing-memory-leaks-in-python/
@@ -161,20 +307,48 @@ class InMemoryCache(BaseCache):
         if self.max_size_in_memory == 0:
             return  # Don't cache anything if max size is 0
 
-        if len(self.cache_dict) >= self.max_size_in_memory:
+        item_size = self._get_item_size_in_bytes(value)
+        if not self._is_item_size_allowed(item_size):
+            return
+
+        if self._needs_eviction(key=key, item_size=item_size):
             # only evict when cache is full
-            self.evict_cache()
-        if not self.check_value_size(value):
+            self.evict_cache(key=key, item_size=item_size)
+
+        size_delta = item_size - self._item_size_dict.get(key, 0)
+        if (
+            in_memory_cache_memory_budget.is_over_budget(size_delta)
+            # other caches hold the global memory budget - evict their entries to make room
+            and not in_memory_cache_memory_budget.make_room(
+                size_delta=size_delta, requesting_cache=self
+            )
+            and not self._exempt_from_global_memory_ceiling
+        ):
+            verbose_logger.warning(
+                "InMemoryCache(namespace=%s): not caching key=%s - the global in-memory cache ceiling (litellm.in_memory_cache_max_size_in_bytes=%s) is reached, and no cache has entries left to evict",
+                self.namespace,
+                key,
+                in_memory_cache_memory_budget.max_size_in_bytes,
+            )
             return
 
+        if self._eviction_policy is not None:
+            if key in self.cache_dict:
+                self._eviction_policy.on_access(key)
+            else:
+                self._eviction_policy.on_insert(key)
+        self._update_size_in_bytes(size_delta)
+        self._item_size_dict[key] = item_size
         self.cache_dict[key] = value
         if self.allow_ttl_override(key):  # if ttl is not set, set it to default ttl
             if "ttl" in kwargs and kwargs["ttl"] is not None:
                 self.ttl_dict[key] = time.time() + float(kwargs["ttl"])
-                heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
             else:
                 self.ttl_dict[key] = time.time() + self.default_ttl
+            if self._eviction_policy is None:
                 heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
+                if len(self.expiration_heap) > 2 * len(self.ttl_dict) + 1:
+                    self._compact_expiration_heap()
 
     async def async_set_cache(self, key, value, **kwargs):
         self.set_cache(key=key, value=value, **kwargs)
@@ -205,19 +379,25 @@ class InMemoryCache(BaseCache):
         """
         if self._is_key_expired(key):
             self._remove_key(key)
+            self._expirations += 1
             return True
         return False
 
     def get_cache(self, key, **kwargs):
         if key in self.cache_dict:
             if self.evict_element_if_expired(key):
+                self._misses += 1
                 return None
+            self._hits += 1
+            if self._eviction_policy is not None:
+                self._eviction_policy.on_access(key)
             original_cached_response = self.cache_dict[key]
             try:
                 cached_response = json.loads(original_cached_response)
             except Exception:
                 cached_response = original_cached_response
             return cached_response
+        self._misses += 1
         return None
 
     def batch_get_cache(self, keys: list, **kwargs):
@@ -266,12 +446,17 @@ class InMemoryCache(BaseCache):
         self.cache_dict.clear()
         self.ttl_dict.clear()
         self.expiration_heap.clear()
+        self._update_size_in_bytes(-self._current_size_in_bytes)
+        self._item_size_dict.clear()
+        if self._eviction_policy is not None:
+            self._eviction_policy.clear()
 
     async def disconnect(self):
         pass
 
     def delete_cache(self, key):
-        self._remove_key(key)
+        if key in self.cache_dict:
+            self._remove_key(key)
 
     async def async_get_ttl(self, key: str) -> Optional[int]:
         """
@@ -8,6 +8,9 @@ from .in_memory_cache import InMemoryCache
 
 
 class LLMClientCache(InMemoryCache):
+    # re-creating a client per request costs more than the memory it holds
+    _exempt_from_global_memory_ceiling = True
+
     def update_cache_key_with_event_loop(self, key):
         """
         Add the event loop to the cache key, to prevent event loop closed errors.
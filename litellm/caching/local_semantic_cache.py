@@ -0,0 +1,748 @@
+"""
+In-process semantic cache
+
+Keeps prompt embeddings in one contiguous NumPy matrix (L2-normalized rows), so a lookup is a single
+matrix-vector product instead of a network round trip to Redis / Qdrant:
+
+- similarity search: brute-force cosine similarity, scored in blocks of rows. Above
+  `index_min_entries` entries an optional ivf (built-in, k-means lists) or hnsw (`pip install hnswlib`)
+  index narrows the rows that are scored. Indexes are built on a background thread and swapped in
+  once ready - until then the previous index (or brute force) is used.
+- exact key lookups don't take the lock held by searches / writes
+- storage: float32, or float16 to halve memory. Freed rows are reused, the matrix doubles as it fills.
+- eviction: per-entry ttl, least recently used entries are evicted beyond `max_entries`
+- persistence: `save_snapshot()` / `load_snapshot()` write / read a single .npz file
+
+Requires numpy (`pip install numpy`).
+"""
+
+import asyncio
+import functools
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from litellm._logging import print_verbose, verbose_logger
+from litellm.constants import (
+    LOCAL_SEMANTIC_CACHE_EXECUTOR_MIN_ENTRIES,
+    LOCAL_SEMANTIC_CACHE_HNSW_EF_CONSTRUCTION,
+    LOCAL_SEMANTIC_CACHE_HNSW_EF_SEARCH,
+    LOCAL_SEMANTIC_CACHE_HNSW_M,
+    LOCAL_SEMANTIC_CACHE_INDEX_MIN_ENTRIES,
+    LOCAL_SEMANTIC_CACHE_INITIAL_CAPACITY,
+    LOCAL_SEMANTIC_CACHE_IVF_NUM_PROBES,
+    LOCAL_SEMANTIC_CACHE_MAX_ENTRIES,
+    LOCAL_SEMANTIC_CACHE_SEARCH_BLOCK_ROWS,
+)
+from litellm.litellm_core_utils.prompt_templates.common_utils import (
+    get_str_from_messages,
+)
+from litellm.types.caching import (
+    LocalSemanticCacheDtype,
+    LocalSemanticCacheIndexType,
+)
+
+from .base_cache import BaseCache
+from .semantic_cache_embedder import SemanticCacheEmbedder
+
+SNAPSHOT_VERSION = 1
+_IVF_KMEANS_ITERATIONS = 10
+_IVF_TRAINING_POINTS_PER_LIST = 50
+# IVF centroids are retrained once the cache has grown this much since the last build
+_IVF_REBUILD_GROWTH_FACTOR = 2
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "Missing dependency numpy. Run `pip install numpy` to use the local-semantic cache"
+        )
+    return np
+
+
+def _normalize(np: Any, vectors: Any) -> Any:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class _IVFIndex:
+    """
+    Inverted-file index - rows are bucketed by their nearest k-means centroid, a lookup only scores
+    the rows in the `num_probes` buckets closest to the query.
+    """
+
+    def __init__(self, num_probes: int):
+        self.np = _import_numpy()
+        self.num_probes = num_probes
+        self.centroids: Any = None
+        self.lists: List[Set[int]] = []
+        self.row_lists: Dict[int, int] = {}  # row -> id of the list holding it
+        self.num_rows_at_build = 0
+
+    def build(self, vectors: Any, rows: Any) -> None:
+        np = self.np
+        num_lists = max(1, int(math.sqrt(len(rows))))
+        rng = np.random.default_rng(0)
+        sample_size = min(len(rows), num_lists * _IVF_TRAINING_POINTS_PER_LIST)
+        sample = vectors[rng.choice(len(rows), size=sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, size=num_lists, replace=False)]
+        for _ in range(_IVF_KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for list_id in range(num_lists):
+                members = sample[assignment == list_id]
+                if len(members):
+                    centroids[list_id] = members.mean(axis=0)
+            centroids = _normalize(np, centroids)
+        self.centroids = centroids
+        self.lists = [set() for _ in range(num_lists)]
+        self.row_lists = {}
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        for row, list_id in zip(rows.tolist(), assignment.tolist()):
+            self.lists[list_id].add(row)
+            self.row_lists[row] = list_id
+        self.num_rows_at_build = len(rows)
+
+    def add(self, row: int, vector: Any) -> None:
+        self.remove(row)
+        list_id = int(self.np.argmax(self.centroids @ vector))
+        self.lists[list_id].add(row)
+        self.row_lists[row] = list_id
+
+    def remove(self, row: int) -> None:
+        list_id = self.row_lists.pop(row, None)
+        if list_id is not None:
+            self.lists[list_id].discard(row)
+
+    def candidates(self, query: Any) -> Any:
+        np = self.np
+        num_probes = min(self.num_probes, len(self.lists))
+        probe_ids = np.argpartition(-(self.centroids @ query), num_probes - 1)[
+            :num_probes
+        ]
+        rows = [row for list_id in probe_ids for row in self.lists[list_id]]
+        return np.unique(np.asarray(rows, dtype=np.int64))
+
+
+class _HNSWIndex:
+    """
+    hnswlib graph index, labelled by matrix row.
+
+    A freed row is marked deleted, and un-marked when the row is reused - the vector stored under the
+    label is then updated in place.
+    """
+
+    def __init__(self, dim: int, max_elements: int):
+        try:
+            import hnswlib
+        except ImportError:
+            raise ImportError(
+                "Missing dependency hnswlib. Run `pip install hnswlib` to use index_type='hnsw'"
+            )
+        self.np = _import_numpy()
+        self.index = hnswlib.Index(space="ip", dim=dim)
+        self.index.init_index(
+            max_elements=max_elements,
+            M=LOCAL_SEMANTIC_CACHE_HNSW_M,
+            ef_construction=LOCAL_SEMANTIC_CACHE_HNSW_EF_CONSTRUCTION,
+        )
+        self.index.set_ef(LOCAL_SEMANTIC_CACHE_HNSW_EF_SEARCH)
+        self.deleted_rows: Set[int] = set()
+        self.num_rows_at_build = 0
+
+    def build(self, vectors: Any, rows: Any) -> None:
+        self.index.add_items(vectors, rows)
+        self.num_rows_at_build = len(rows)
+
+    def add(self, row: int, vector: Any) -> None:
+        if row in self.deleted_rows:
+            self.index.unmark_deleted(row)
+            self.deleted_rows.discard(row)
+        # updates the stored vector if the label already exists
+        self.index.add_items(vector[None, :], [row])
+
+    def remove(self, row: int) -> None:
+        if row in self.deleted_rows:
+            return
+        try:
+            self.index.mark_deleted(row)
+        except RuntimeError:  # row was never added
+            return
+        self.deleted_rows.add(row)
+
+    def candidates(self, query: Any) -> Any:
+        k = min(
+            LOCAL_SEMANTIC_CACHE_HNSW_EF_SEARCH,
+            self.index.get_current_count() - len(self.deleted_rows),
+        )
+        if k <= 0:
+            return self.np.empty(0, dtype=self.np.int64)
+        labels, _ = self.index.knn_query(query, k=k)
+        return labels[0].astype(self.np.int64)
+
+
+class LocalSemanticCache(BaseCache):
+    def __init__(
+        self,
+        similarity_threshold: Optional[float] = None,
+        embedding_model: str = "text-embedding-ada-002",
+        max_entries: int = LOCAL_SEMANTIC_CACHE_MAX_ENTRIES,
+        dtype: LocalSemanticCacheDtype = "float32",
+        index_type: Optional[LocalSemanticCacheIndexType] = None,
+        index_min_entries: int = LOCAL_SEMANTIC_CACHE_INDEX_MIN_ENTRIES,
+        snapshot_path: Optional[str] = None,
+        default_ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            similarity_threshold: min cosine similarity (0-1) for a cache hit
+            embedding_model: model used to embed prompts
+            max_entries: max cached prompts, least recently used entries are evicted beyond this
+            dtype: "float32" or "float16" storage for the embedding matrix
+            index_type: None (always brute force), "ivf" or "hnsw"
+            index_min_entries: the index is only built / used once the cache holds this many entries
+            snapshot_path: .npz file loaded on startup (if it exists) and written on `disconnect()`
+            default_ttl: ttl in seconds for entries set without a `ttl`, None = no expiry
+        """
+        if similarity_threshold is None:
+            raise Exception("similarity_threshold must be provided, passed None")
+        if dtype not in ("float32", "float16"):
+            raise ValueError(
+                f"Invalid dtype={dtype}. Must be one of ['float32', 'float16']"
+            )
+        if index_type not in (None, "ivf", "hnsw"):
+            raise ValueError(
+                f"Invalid index_type={index_type}. Must be one of ['ivf', 'hnsw']"
+            )
+        self.np = _import_numpy()
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self.embedder = SemanticCacheEmbedder(embedding_model=embedding_model)
+        self.max_entries = max_entries
+        self.dtype: LocalSemanticCacheDtype = dtype
+        self.index_type = index_type
+        self.index_min_entries = index_min_entries
+        self.snapshot_path = snapshot_path
+        self.default_ttl = default_ttl  # type: ignore[assignment]
+
+        self._lock = threading.RLock()
+        self._vectors: Any = None  # (capacity, dim) matrix, allocated on first set
+        # per-row expiry, -inf = free row, +inf = no expiry
+        self._expires_at: Any = self.np.empty(0, dtype=self.np.float64)
+        self._num_rows = 0  # high-water mark of used rows
+        self._free_rows: List[int] = []
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self._row_keys: Dict[int, str] = {}
+        self._row_prompts: Dict[int, str] = {}
+        self._row_values: Dict[int, str] = {}
+        # key -> (row, value, expires at) - immutable entries, read without the lock
+        self._key_entries: Dict[str, Tuple[int, str, float]] = {}
+        self._index: Optional[Any] = None
+        self._index_builder: Optional[threading.Thread] = None
+        # (op, row) changes made while an index is built, replayed on it before it's swapped in
+        self._index_changes: Optional[List[Tuple[str, int]]] = None
+
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            self.load_snapshot(snapshot_path)
+
+    @property
+    def dim(self) -> Optional[int]:
+        return None if self._vectors is None else self._vectors.shape[1]
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    ### STORAGE ###
+
+    def _allocate(self, dim: int) -> None:
+        np = self.np
+        capacity = min(self.max_entries, LOCAL_SEMANTIC_CACHE_INITIAL_CAPACITY)
+        self._vectors = np.zeros((capacity, dim), dtype=self.dtype)
+        self._expires_at = np.full(capacity, -np.inf, dtype=np.float64)
+
+    def _grow(self) -> None:
+        np = self.np
+        capacity = len(self._expires_at)
+        new_capacity = min(self.max_entries, capacity * 2)
+        vectors = np.zeros((new_capacity, self._vectors.shape[1]), dtype=self.dtype)
+        vectors[:capacity] = self._vectors
+        expires_at = np.full(new_capacity, -np.inf, dtype=np.float64)
+        expires_at[:capacity] = self._expires_at
+        self._vectors, self._expires_at = vectors, expires_at
+
+    def _free_row(self, row: int) -> None:
+        self._lru.pop(row, None)
+        key = self._row_keys.pop(row, None)
+        entry = self._key_entries.get(key) if key is not None else None
+        if entry is not None and entry[0] == row:
+            del self._key_entries[key]  # type: ignore[arg-type]
+        self._row_prompts.pop(row, None)
+        self._row_values.pop(row, None)
+        self._expires_at[row] = -self.np.inf
+        self._vectors[row] = 0
+        if self._index is not None:
+            self._index.remove(row)
+        if self._index_changes is not None:
+            self._index_changes.append(("remove", row))
+        self._free_rows.append(row)
+
+    def _evict_expired(self, now: float) -> None:
+        np = self.np
+        expires_at = self._expires_at[: self._num_rows]
+        for row in np.nonzero((expires_at <= now) & (expires_at > -np.inf))[0]:
+            self._free_row(int(row))
+
+    def _get_free_row(self) -> int:
+        if not self._free_rows and len(self._lru) >= self.max_entries:
+            self._evict_expired(time.time())
+        if not self._free_rows and len(self._lru) >= self.max_entries:
+            self._free_row(next(iter(self._lru)))  # least recently used
+        if self._free_rows:
+            return self._free_rows.pop()
+        if self._num_rows >= len(self._expires_at):
+            self._grow()
+        self._num_rows += 1
+        return self._num_rows - 1
+
+    def add(
+        self,
+        key: str,
+        prompt: str,
+        embedding: Any,
+        value: str,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Store `value` for `prompt`, `embedding` is the prompt's (not necessarily normalized) embedding
+        """
+        np = self.np
+        vector = _normalize(np, embedding)
+        with self._lock:
+            if self._vectors is None:
+                self._allocate(dim=len(vector))
+            elif len(vector) != self._vectors.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension {len(vector)} does not match cache dimension {self._vectors.shape[1]}"
+                )
+            entry = self._key_entries.get(key)
+            if entry is not None:
+                self._free_row(entry[0])
+            row = self._get_free_row()
+            expires_at = time.time() + ttl if ttl is not None else np.inf
+            self._vectors[row] = vector
+            self._expires_at[row] = expires_at
+            self._lru[row] = None
+            self._row_keys[row] = key
+            self._row_prompts[row] = prompt
+            self._row_values[row] = value
+            self._key_entries[key] = (row, value, expires_at)
+            self._update_index(row=row, vector=vector)
+
+    ### SEARCH ###
+
+    def _start_index_build(self) -> None:
+        """
+        Build a new index over the live rows on a background thread - called with the lock held
+        """
+        np = self.np
+        rows = np.asarray(list(self._lru.keys()), dtype=np.int64)
+        vectors = self._vectors[rows].astype(np.float32)
+        changes: List[Tuple[str, int]] = []
+        self._index_changes = changes
+        self._index_builder = threading.Thread(
+            target=self._build_index,
+            args=(rows, vectors, changes),
+            name="LocalSemanticCacheIndexBuilder",
+            daemon=True,
+        )
+        self._index_builder.start()
+
+    def _build_index(
+        self, rows: Any, vectors: Any, changes: List[Tuple[str, int]]
+    ) -> None:
+        np = self.np
+        index: Any = None
+        try:
+            if self.index_type == "hnsw":
+                index = _HNSWIndex(dim=vectors.shape[1], max_elements=self.max_entries)
+            else:
+                index = _IVFIndex(num_probes=LOCAL_SEMANTIC_CACHE_IVF_NUM_PROBES)
+            index.build(vectors, rows)
+        except Exception as e:
+            verbose_logger.warning(
+                "LocalSemanticCache: failed to build %s index - %s",
+                self.index_type,
+                str(e),
+            )
+            index = None
+        with self._lock:
+            if self._index_changes is not changes:  # cache was flushed meanwhile
+                return
+            self._index_changes = None
+            self._index_builder = None
+            if index is None:
+                return
+            for op, row in changes:
+                if op == "remove":
+                    index.remove(row)
+                elif row in self._lru:
+                    index.add(row, self._vectors[row].astype(np.float32))
+            self._index = index
+        verbose_logger.debug(
+            "LocalSemanticCache: built %s index over %d entries",
+            self.index_type,
+            len(rows),
+        )
+
+    def _wait_for_index_build(self, timeout: Optional[float] = None) -> None:
+        builder = self._index_builder
+        if builder is not None:
+            builder.join(timeout)
+
+    def _update_index(self, row: int, vector: Any) -> None:
+        if self.index_type is None or len(self._lru) < self.index_min_entries:
+            return
+        if self._index is not None:
+            self._index.add(row, vector)
+        if self._index_changes is not None:  # a build is running
+            self._index_changes.append(("add", row))
+        elif self._index is None or (
+            self.index_type == "ivf"
+            and len(self._lru)
+            >= self._index.num_rows_at_build * _IVF_REBUILD_GROWTH_FACTOR
+        ):
+            self._start_index_build()
+
+    def _score_all(self, queries: Any, dead_rows: Any) -> Tuple[Any, Any]:
+        """
+        Brute-force search - returns (best row, similarity) per query
+        """
+        np = self.np
+        best_rows = np.full(len(queries), -1, dtype=np.int64)
+        best_similarities = np.full(len(queries), -np.inf, dtype=np.float32)
+        for start in range(0, self._num_rows, LOCAL_SEMANTIC_CACHE_SEARCH_BLOCK_ROWS):
+            end = min(start + LOCAL_SEMANTIC_CACHE_SEARCH_BLOCK_ROWS, self._num_rows)
+            # float16 has no BLAS kernels - score each block in float32
+            block = self._vectors[start:end].astype(np.float32, copy=False)
+            similarities = block @ queries.T  # (rows, queries)
+            similarities[dead_rows[start:end]] = -np.inf
+            block_best = np.argmax(similarities, axis=0)
+            block_best_similarities = similarities[block_best, np.arange(len(queries))]
+            improved = block_best_similarities > best_similarities
+            best_rows[improved] = block_best[improved] + start
+            best_similarities[improved] = block_best_similarities[improved]
+        return best_rows, best_similarities
+
+    def _score_candidates(self, query: Any, dead_rows: Any) -> Tuple[int, float]:
+        np = self.np
+        assert self._index is not None
+        rows = self._index.candidates(query)
+        rows = rows[(rows >= 0) & (rows < self._num_rows)]
+        rows = rows[~dead_rows[rows]]
+        if len(rows) == 0:
+            return -1, -np.inf
+        similarities = self._vectors[rows].astype(np.float32) @ query
+        best = int(np.argmax(similarities))
+        return int(rows[best]), float(similarities[best])
+
+    def search(self, embeddings: Any) -> List[Tuple[Optional[str], Optional[str], float]]:
+        """
+        Batched nearest-neighbour lookup.
+
+        Args:
+            embeddings: (n, dim) query embeddings
+
+        Returns:
+            per query: (cached prompt, cached value, similarity) - prompt / value are None on a miss
+        """
+        np = self.np
+        queries = _normalize(np, np.atleast_2d(embeddings))
+        misses: List[Tuple[Optional[str], Optional[str], float]] = [
+            (None, None, 0.0) for _ in range(len(queries))
+        ]
+        with self._lock:
+            if self._vectors is None or not self._lru:
+                return misses
+            if queries.shape[1] != self._vectors.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension {queries.shape[1]} does not match cache dimension {self._vectors.shape[1]}"
+                )
+            # True = row is free or expired
+            dead_rows = self._expires_at[: self._num_rows] <= time.time()
+            if self._index is not None and len(self._lru) >= self.index_min_entries:
+                results = [
+                    self._score_candidates(query, dead_rows) for query in queries
+                ]
+                best_rows = [row for row, _ in results]
+                best_similarities = [similarity for _, similarity in results]
+            else:
+                best_rows, best_similarities = self._score_all(queries, dead_rows)
+
+            for i, (row, similarity) in enumerate(zip(best_rows, best_similarities)):
+                row, similarity = int(row), float(similarity)
+                if row < 0:
+                    continue
+                if similarity < self.similarity_threshold:
+                    misses[i] = (None, None, similarity)
+                    continue
+                self._lru.move_to_end(row)
+                misses[i] = (self._row_prompts[row], self._row_values[row], similarity)
+            return misses
+
+    def _get_by_key(self, key: str) -> Optional[str]:
+        # no blocking on the lock - a search or write may hold it for a while
+        entry = self._key_entries.get(key)
+        if entry is None or entry[2] <= time.time():
+            return None
+        row, value, _ = entry
+        if self._lock.acquire(blocking=False):
+            try:
+                if self._key_entries.get(key) is entry:
+                    self._lru.move_to_end(row)
+            finally:
+                self._lock.release()
+        return value
+
+    ### SNAPSHOTS ###
+
+    def save_snapshot(self, path: Optional[str] = None) -> None:
+        """
+        Write every live entry to a .npz file (atomically - written to a temp file, then renamed)
+        """
+        np = self.np
+        path = path or self.snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path - pass `path` or set `snapshot_path`")
+        with self._lock:
+            now = time.time()
+            rows = [row for row in self._lru if self._expires_at[row] > now]
+            entries = [
+                [self._row_keys[row], self._row_prompts[row], self._row_values[row]]
+                for row in rows
+            ]
+            meta = {
+                "version": SNAPSHOT_VERSION,
+                "dtype": self.dtype,
+                "embedding_model": self.embedding_model,
+                "entries": entries,
+            }
+            vectors = (
+                self._vectors[rows]
+                if self._vectors is not None
+                else np.zeros((0, 0), dtype=self.dtype)
+            )
+            expires_at = self._expires_at[rows]
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                vectors=vectors,
+                expires_at=expires_at,
+                meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+            )
+        os.replace(tmp_path, path)
+
+    def load_snapshot(self, path: str) -> None:
+        """
+        Replace the cache contents with a snapshot written by `save_snapshot()`. Expired entries are skipped.
+        """
+        np = self.np
+        with np.load(path, allow_pickle=False) as snapshot:
+            meta = json.loads(snapshot["meta"].tobytes().decode("utf-8"))
+            vectors = snapshot["vectors"]
+            expires_at = snapshot["expires_at"]
+        if meta.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported LocalSemanticCache snapshot version={meta.get('version')}"
+            )
+        if meta.get("embedding_model") != self.embedding_model:
+            verbose_logger.warning(
+                "LocalSemanticCache: snapshot %s was built with embedding_model=%s, cache uses %s",
+                path,
+                meta.get("embedding_model"),
+                self.embedding_model,
+            )
+        with self._lock:
+            self.flush_cache()
+            now = time.time()
+            for (key, prompt, value), vector, entry_expires_at in zip(
+                meta["entries"], vectors, expires_at
+            ):
+                if entry_expires_at <= now:
+                    continue
+                ttl = None if entry_expires_at == np.inf else entry_expires_at - now
+                self.add(key=key, prompt=prompt, embedding=vector, value=value, ttl=ttl)
+
+    ### EMBEDDINGS ###
+
+    def _get_embedding(self, prompt: str) -> List[float]:
+        return self.embedder.embed(prompt)
+
+    async def _get_async_embedding(self, prompt: str, **kwargs) -> List[float]:
+        return await self.embedder.aembed(prompt, **kwargs)
+
+    ### BaseCache ###
+
+    def _get_ttl_from_kwargs(self, **kwargs) -> Optional[float]:
+        ttl = kwargs.get("ttl")
+        if ttl is not None:
+            return float(ttl)
+        return self.default_ttl
+
+    def _get_cache_logic(self, cached_response: Optional[str]) -> Any:
+        if cached_response is None:
+            return None
+        try:
+            return json.loads(cached_response)
+        except json.JSONDecodeError:
+            import ast
+
+            try:
+                return ast.literal_eval(cached_response)
+            except (ValueError, SyntaxError) as e:
+                print_verbose(f"Error parsing cached response: {str(e)}")
+                return None
+
+    def _handle_search_result(
+        self,
+        prompt: str,
+        result: Tuple[Optional[str], Optional[str], float],
+        **kwargs,
+    ) -> Any:
+        cached_prompt, cached_value, similarity = result
+        kwargs.setdefault("metadata", {})["semantic-similarity"] = similarity
+        print_verbose(
+            f"local semantic-cache: similarity threshold: {self.similarity_threshold}, "
+            f"similarity: {similarity}, prompt: {prompt}, closest_cached_prompt: {cached_prompt}"
+        )
+        return self._get_cache_logic(cached_response=cached_value)
+
+    def set_cache(self, key, value, **kwargs):
+        print_verbose(f"local semantic-cache set_cache, kwargs: {kwargs}")
+        messages = kwargs.get("messages", [])
+        if not messages:
+            print_verbose("No messages provided for semantic caching")
+            return
+        prompt = get_str_from_messages(messages)
+        try:
+            self.add(
+                key=key,
+                prompt=prompt,
+                embedding=self._get_embedding(prompt),
+                value=str(value),
+                ttl=self._get_ttl_from_kwargs(**kwargs),
+            )
+        except Exception as e:
+            print_verbose(f"Error setting value in the local semantic cache: {str(e)}")
+
+    async def async_set_cache(self, key, value, **kwargs):
+        print_verbose(f"async local semantic-cache set_cache, kwargs: {kwargs}")
+        messages = kwargs.get("messages", [])
+        if not messages:
+            print_verbose("No messages provided for semantic caching")
+            return
+        prompt = get_str_from_messages(messages)
+        try:
+            embedding = await self._get_async_embedding(prompt, **kwargs)
+            add = functools.partial(
+                self.add,
+                key=key,
+                prompt=prompt,
+                embedding=embedding,
+                value=str(value),
+                ttl=self._get_ttl_from_kwargs(**kwargs),
+            )
+            if len(self) >= LOCAL_SEMANTIC_CACHE_EXECUTOR_MIN_ENTRIES:
+                # waits on the lock held by large searches
+                await asyncio.get_running_loop().run_in_executor(None, add)
+            else:
+                add()
+        except Exception as e:
+            print_verbose(f"Error in async_set_cache: {str(e)}")
+
+    async def async_set_cache_pipeline(self, cache_list, **kwargs):
+        for key, value in cache_list:
+            await self.async_set_cache(key, value, **kwargs)
+
+    def get_cache(self, key, **kwargs):
+        print_verbose(f"local semantic-cache get_cache, kwargs: {kwargs}")
+        exact_match = self._get_by_key(key)
+        if exact_match is not None:
+            kwargs.setdefault("metadata", {})["semantic-similarity"] = 1.0
+            return self._get_cache_logic(cached_response=exact_match)
+        messages = kwargs.get("messages", [])
+        if not messages or not len(self):
+            kwargs.setdefault("metadata", {})["semantic-similarity"] = 0.0
+            return None
+        prompt = get_str_from_messages(messages)
+        try:
+            result = self.search([self._get_embedding(prompt)])[0]
+        except Exception as e:
+            print_verbose(f"Error retrieving from the local semantic cache: {str(e)}")
+            kwargs.setdefault("metadata", {})["semantic-similarity"] = 0.0
+            return None
+        return self._handle_search_result(prompt, result, **kwargs)
+
+    async def async_get_cache(self, key, **kwargs):
+        print_verbose(f"async local semantic-cache get_cache, kwargs: {kwargs}")
+        exact_match = self._get_by_key(key)
+        if exact_match is not None:
+            kwargs.setdefault("metadata", {})["semantic-similarity"] = 1.0
+            return self._get_cache_logic(cached_response=exact_match)
+        messages = kwargs.get("messages", [])
+        if not messages or not len(self):
+            kwargs.setdefault("metadata", {})["semantic-similarity"] = 0.0
+            return None
+        prompt = get_str_from_messages(messages)
+        try:
+            embedding = await self._get_async_embedding(prompt, **kwargs)
+            if len(self) >= LOCAL_SEMANTIC_CACHE_EXECUTOR_MIN_ENTRIES:
+                # a large brute-force search would block the event loop
+                results = await asyncio.get_running_loop().run_in_executor(
+                    None, self.search, [embedding]
+                )
+            else:
+                results = self.search([embedding])
+            result = results[0]
+        except Exception as e:
+            print_verbose(f"Error in async_get_cache: {str(e)}")
+            kwargs.setdefault("metadata", {})["semantic-similarity"] = 0.0
+            return None
+        return self._handle_search_result(prompt, result, **kwargs)
+
+    def flush_cache(self):
+        with self._lock:
+            self._vectors = None
+            self._expires_at = self.np.empty(0, dtype=self.np.float64)
+            self._num_rows = 0
+            self._free_rows = []
+            self._lru.clear()
+            self._row_keys.clear()
+            self._row_prompts.clear()
+            self._row_values.clear()
+            self._key_entries.clear()
+            self._index = None
+            self._index_builder = None
+            self._index_changes = None
+
+    async def disconnect(self):
+        if self.snapshot_path is not None:
+            self.save_snapshot()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._lru),
+                "capacity": len(self._expires_at),
+                "dim": self.dim,
+                "dtype": self.dtype,
+                "index_type": self.index_type if self._index is not None else None,
+                "matrix_bytes": 0 if self._vectors is None else self._vectors.nbytes,
+            }
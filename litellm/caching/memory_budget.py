@@ -0,0 +1,166 @@
+"""
+Memory accounting for in-memory caches
+
+- estimate_size_in_bytes: cheap recursive size estimate, computed once when a value is cached
+- InMemoryCacheMemoryBudget: process-wide usage per cache namespace + optional global ceiling,
+  shared by every InMemoryCache (incl. the in-memory layer of DualCache and LLMClientCache)
+  A write over the ceiling evicts entries of the largest other caches. LLMClientCache is exempt - its clients
+  are never evicted for other caches, and its writes are never refused.
+
+Set a global ceiling with `litellm.in_memory_cache_max_size_in_bytes = 256 * 1024 * 1024`
+"""
+
+import sys
+import weakref
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from pydantic import BaseModel
+
+import litellm
+from litellm.constants import (
+    IN_MEMORY_CACHE_SIZE_ESTIMATE_MAX_DEPTH,
+    IN_MEMORY_CACHE_SIZE_ESTIMATE_SAMPLE_SIZE,
+)
+
+if TYPE_CHECKING:
+    from .in_memory_cache import InMemoryCache
+
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+
+
+def _safe_getsizeof(value: Any) -> int:
+    try:
+        return sys.getsizeof(value)
+    except Exception:
+        return 0
+
+
+def _estimate_iterable_size(items: Any, length: int, depth: int, seen: Set[int]) -> int:
+    """
+    Sum the size of the first IN_MEMORY_CACHE_SIZE_ESTIMATE_SAMPLE_SIZE items, scaled up to the full length
+    """
+    sampled_size = 0
+    sampled_count = 0
+    for item in islice(items, IN_MEMORY_CACHE_SIZE_ESTIMATE_SAMPLE_SIZE):
+        sampled_size += _estimate_size(item, depth, seen)
+        sampled_count += 1
+    if sampled_count == 0:
+        return 0
+    return sampled_size * length // sampled_count
+
+
+def _estimate_size(value: Any, depth: int, seen: Set[int]) -> int:
+    if isinstance(value, _ATOMIC_TYPES):
+        return _safe_getsizeof(value)
+
+    value_id = id(value)
+    if value_id in seen:
+        return 0
+    size = _safe_getsizeof(value)
+    if depth >= IN_MEMORY_CACHE_SIZE_ESTIMATE_MAX_DEPTH:
+        return size
+    seen.add(value_id)
+
+    if isinstance(value, dict):
+        size += _estimate_iterable_size(
+            (k for kv in value.items() for k in kv), 2 * len(value), depth + 1, seen
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += _estimate_iterable_size(iter(value), len(value), depth + 1, seen)
+    elif isinstance(value, BaseModel):
+        # read the field storage directly - avoids a full model_dump() per write
+        size += _estimate_size(value.__dict__, depth + 1, seen)
+        extra = getattr(value, "__pydantic_extra__", None)
+        if extra:
+            size += _estimate_size(extra, depth + 1, seen)
+    # other objects (clients, loggers, etc.) are counted shallowly
+    return size
+
+
+def estimate_size_in_bytes(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value.
+
+    Recurses into builtin containers and pydantic models (bounded depth, sampled for long containers).
+    Arbitrary objects are measured shallowly with sys.getsizeof.
+    """
+    return _estimate_size(value, 0, set())
+
+
+class InMemoryCacheMemoryBudget:
+    """
+    Tracks estimated bytes held per in-memory cache namespace, across all InMemoryCache instances.
+    """
+
+    def __init__(self):
+        self._usage_by_namespace: Dict[str, int] = {}
+        self._total_size_in_bytes: int = 0
+        # caches holding bytes - evicted from when another cache's write needs room under the ceiling
+        self._caches: "weakref.WeakSet[InMemoryCache]" = weakref.WeakSet()
+
+    @property
+    def max_size_in_bytes(self) -> Optional[int]:
+        return getattr(litellm, "in_memory_cache_max_size_in_bytes", None)
+
+    @property
+    def total_size_in_bytes(self) -> int:
+        return self._total_size_in_bytes
+
+    def update(self, namespace: str, size_delta: int) -> None:
+        if size_delta == 0:
+            return
+        self._usage_by_namespace[namespace] = (
+            self._usage_by_namespace.get(namespace, 0) + size_delta
+        )
+        self._total_size_in_bytes += size_delta
+
+    def release(self, namespace: str, size_in_bytes_cell: List[int]) -> None:
+        """
+        Release everything a garbage-collected cache still held
+        """
+        self.update(namespace, -size_in_bytes_cell[0])
+        size_in_bytes_cell[0] = 0
+
+    def is_over_budget(self, size_delta: int = 0) -> bool:
+        """
+        Returns True if adding `size_delta` bytes would exceed the global ceiling
+        """
+        max_size_in_bytes = self.max_size_in_bytes
+        if max_size_in_bytes is None:
+            return False
+        return self._total_size_in_bytes + size_delta > max_size_in_bytes
+
+    def register_cache(self, cache: "InMemoryCache") -> None:
+        self._caches.add(cache)
+
+    def make_room(self, size_delta: int, requesting_cache: "InMemoryCache") -> bool:
+        """
+        Evict entries of the other caches, largest cache first, until `size_delta` more bytes fit under the ceiling.
+
+        Returns False if they don't fit and no cache has entries left to evict.
+        """
+        exhausted_caches: Set[int] = set()
+        while self.is_over_budget(size_delta):
+            candidates = [
+                cache
+                for cache in list(self._caches)
+                if cache is not requesting_cache
+                and not cache._exempt_from_global_memory_ceiling
+                and id(cache) not in exhausted_caches
+                and cache._current_size_in_bytes > 0
+            ]
+            if not candidates:
+                return False
+            largest_cache = max(
+                candidates, key=lambda cache: cache._current_size_in_bytes
+            )
+            if not largest_cache._evict_one():
+                exhausted_caches.add(id(largest_cache))
+        return True
+
+    def get_memory_usage_by_namespace(self) -> Dict[str, int]:
+        return dict(self._usage_by_namespace)
+
+
+in_memory_cache_memory_budget = InMemoryCacheMemoryBudget()
@@ -0,0 +1,215 @@
+"""
+Near cache invalidation for DualCache
+
+With a near cache, DualCache keeps values read from Redis in memory until another instance
+changes them, instead of for a short fixed TTL. Every write publishes the changed keys on a
+Redis pub/sub channel; every instance subscribes and drops those keys from its in-memory cache.
+
+If the subscription is down, invalidations may be missed - the local cache is flushed and
+DualCache falls back to its regular in-memory TTL until the subscription is re-established.
+
+An invalidation can arrive while a Redis read of the same key is in flight. The invalidator counts
+invalidations (generations), and DualCache doesn't keep a read's result in memory if its key was
+invalidated during the read - it may be the value from before the change.
+
+The near cache suits read-mostly values. It is not enabled for the proxy's usage / rate limit caches -
+their counters change on every request, so every increment would publish an invalidation.
+"""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from litellm._logging import verbose_logger
+from litellm._uuid import uuid
+from litellm.constants import (
+    NEAR_CACHE_INVALIDATION_CHANNEL,
+    NEAR_CACHE_RECONNECT_DELAY_SECONDS,
+    NEAR_CACHE_SUBSCRIBER_POLL_TIMEOUT_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from .in_memory_cache import InMemoryCache
+    from .redis_cache import RedisCache
+
+
+class NearCacheInvalidator:
+    def __init__(
+        self,
+        redis_cache: "RedisCache",
+        in_memory_cache: "InMemoryCache",
+        channel: Optional[str] = None,
+    ):
+        self.redis_cache = redis_cache
+        self.in_memory_cache = in_memory_cache
+        self.channel = channel or NEAR_CACHE_INVALIDATION_CHANNEL
+        # identifies this instance, so it ignores its own invalidation messages
+        self.origin_id = str(uuid.uuid4())
+        self.is_subscribed: bool = False
+        self._listener_task: Optional[asyncio.Task] = None
+
+        # invalidation generations - incremented on every invalidation. Per-key generations are only tracked
+        # for keys with a Redis read in flight (see start_read / finish_read), so this stays bounded
+        self._generation: int = 0
+        self._flush_generation: int = 0
+        self._reads_in_flight: Dict[str, int] = {}
+        self._key_invalidation_generations: Dict[str, int] = {}
+
+        # counters, see get_stats()
+        self.invalidations_received: int = 0
+        self.invalidations_published: int = 0
+
+    def _build_message(self, keys: Optional[List[str]] = None) -> str:
+        if keys is None:
+            return json.dumps({"origin": self.origin_id, "flush": True})
+        return json.dumps({"origin": self.origin_id, "keys": keys})
+
+    def ensure_listener_started(self) -> None:
+        """
+        Start the subscriber task on the running event loop, if it isn't running already.
+        """
+        if self._listener_task is not None and not self._listener_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._listener_task = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub: Any = None
+            try:
+                pubsub = self.redis_cache.get_async_pubsub()
+                await pubsub.subscribe(self.channel)
+                # anything written while we were not subscribed may be stale
+                self._invalidate(keys=None)
+                self.is_subscribed = True
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=NEAR_CACHE_SUBSCRIBER_POLL_TIMEOUT_SECONDS,
+                    )
+                    if message is not None:
+                        self.handle_message(message.get("data"))
+            except asyncio.CancelledError:
+                self.is_subscribed = False
+                raise
+            except Exception as e:
+                self.is_subscribed = False
+                verbose_logger.warning(
+                    "LiteLLM near cache: invalidation subscriber disconnected, retrying - %s",
+                    str(e),
+                )
+            finally:
+                if pubsub is not None:
+                    try:
+                        await (getattr(pubsub, "aclose", None) or pubsub.close)()
+                    except Exception:
+                        pass
+            await asyncio.sleep(NEAR_CACHE_RECONNECT_DELAY_SECONDS)
+
+    def handle_message(self, data: Any) -> None:
+        """
+        Drop the invalidated keys from the in-memory cache
+        """
+        try:
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            message = json.loads(data)
+        except Exception:
+            verbose_logger.debug("LiteLLM near cache: ignoring message %s", data)
+            return
+        if not isinstance(message, dict) or message.get("origin") == self.origin_id:
+            return
+        self.invalidations_received += 1
+        if message.get("flush") is True:
+            self._invalidate(keys=None)
+        else:
+            self._invalidate(keys=message.get("keys") or [])
+
+    def _invalidate(self, keys: Optional[List[str]]) -> None:
+        """
+        Drop `keys` (or everything, if keys is None) from the in-memory cache
+        """
+        self._generation += 1
+        if keys is None:
+            self._flush_generation = self._generation
+            self.in_memory_cache.flush_cache()
+            return
+        for key in keys:
+            if key in self._reads_in_flight:
+                self._key_invalidation_generations[key] = self._generation
+            self.in_memory_cache.delete_cache(key)
+
+    def start_read(self, key: str) -> int:
+        """
+        Call before reading `key` from Redis. Returns the generation to pass to `finish_read`.
+        """
+        self._reads_in_flight[key] = self._reads_in_flight.get(key, 0) + 1
+        return self._generation
+
+    def finish_read(self, key: str, generation: int) -> bool:
+        """
+        Call once the Redis read of `key` is done.
+
+        Returns False if `key` was invalidated while the read was in flight - the result must not be kept
+        in memory, it may be the value from before the change.
+        """
+        is_current = (
+            self._flush_generation <= generation
+            and self._key_invalidation_generations.get(key, 0) <= generation
+        )
+        reads_in_flight = self._reads_in_flight.get(key, 1) - 1
+        if reads_in_flight <= 0:
+            self._reads_in_flight.pop(key, None)
+            self._key_invalidation_generations.pop(key, None)
+        else:
+            self._reads_in_flight[key] = reads_in_flight
+        return is_current
+
+    def publish_invalidation(self, keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Tell other instances to drop `keys` (or everything, if keys is None)
+        """
+        message = self._build_message(list(keys) if keys is not None else None)
+        try:
+            self.redis_cache.publish(self.channel, message)
+            self.invalidations_published += 1
+        except Exception as e:
+            verbose_logger.warning(
+                "LiteLLM near cache: failed to publish invalidation - %s", str(e)
+            )
+
+    async def async_publish_invalidation(
+        self, keys: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Tell other instances to drop `keys` (or everything, if keys is None)
+        """
+        self.ensure_listener_started()
+        message = self._build_message(list(keys) if keys is not None else None)
+        try:
+            await self.redis_cache.async_publish(self.channel, message)
+            self.invalidations_published += 1
+        except Exception as e:
+            verbose_logger.warning(
+                "LiteLLM near cache: failed to publish invalidation - %s", str(e)
+            )
+
+    async def stop(self) -> None:
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener_task = None
+        self.is_subscribed = False
+
+    def get_stats(self) -> dict:
+        return {
+            "is_subscribed": self.is_subscribed,
+            "invalidations_received": self.invalidations_received,
+            "invalidations_published": self.invalidations_published,
+        }
@@ -11,14 +11,13 @@ Has 4 methods:
 import ast
 import asyncio
 import json
-from typing import Any, cast
+from typing import Any
 
-import litellm
 from litellm._logging import print_verbose
 from litellm.constants import QDRANT_SCALAR_QUANTILE, QDRANT_VECTOR_SIZE
-from litellm.types.utils import EmbeddingResponse
 
 from .base_cache import BaseCache
+from .semantic_cache_embedder import SemanticCacheEmbedder
 
 
 class QdrantSemanticCache(BaseCache):
@@ -53,6 +52,7 @@ class QdrantSemanticCache(BaseCache):
             raise Exception("similarity_threshold must be provided, passed None")
         self.similarity_threshold = similarity_threshold
         self.embedding_model = embedding_model
+        self.embedder = SemanticCacheEmbedder(embedding_model=embedding_model)
         headers = {}
 
         # check if defined as os.environ/ variable
@@ -176,18 +176,8 @@ class QdrantSemanticCache(BaseCache):
         for message in messages:
             prompt += message["content"]
 
-        # create an embedding for prompt
-        embedding_response = cast(
-            EmbeddingResponse,
-            litellm.embedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            ),
-        )
-
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        # get the embedding - memoized, repeated prompts are not re-embedded
+        embedding = self.embedder.embed(prompt)
 
         value = str(value)
         assert isinstance(value, str)
@@ -220,18 +210,8 @@ class QdrantSemanticCache(BaseCache):
         for message in messages:
             prompt += message["content"]
 
-        # convert to embedding
-        embedding_response = cast(
-            EmbeddingResponse,
-            litellm.embedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            ),
-        )
-
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        # get the embedding - memoized, repeated prompts are not re-embedded
+        embedding = self.embedder.embed(prompt)
 
         data = {
             "vector": embedding,
@@ -281,8 +261,6 @@ class QdrantSemanticCache(BaseCache):
     async def async_set_cache(self, key, value, **kwargs):
         from litellm._uuid import uuid
 
-        from litellm.proxy.proxy_server import llm_model_list, llm_router
-
         print_verbose(f"async qdrant semantic-cache set_cache, kwargs: {kwargs}")
 
         # get the prompt
@@ -290,34 +268,8 @@ class QdrantSemanticCache(BaseCache):
         prompt = ""
         for message in messages:
             prompt += message["content"]
-        # create an embedding for prompt
-        router_model_names = (
-            [m["model_name"] for m in llm_model_list]
-            if llm_model_list is not None
-            else []
-        )
-        if llm_router is not None and self.embedding_model in router_model_names:
-            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
-            embedding_response = await llm_router.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-                metadata={
-                    "user_api_key": user_api_key,
-                    "semantic-cache-embedding": True,
-                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
-                },
-            )
-        else:
-            # convert to embedding
-            embedding_response = await litellm.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            )
-
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        # get the embedding - memoized, and batched with concurrent lookups
+        embedding = await self.embedder.aembed(prompt, **kwargs)
 
         value = str(value)
         assert isinstance(value, str)
@@ -344,41 +296,14 @@ class QdrantSemanticCache(BaseCache):
 
     async def async_get_cache(self, key, **kwargs):
         print_verbose(f"async qdrant semantic-cache get_cache, kwargs: {kwargs}")
-        from litellm.proxy.proxy_server import llm_model_list, llm_router
-
         # get the messages
         messages = kwargs["messages"]
         prompt = ""
         for message in messages:
             prompt += message["content"]
 
-        router_model_names = (
-            [m["model_name"] for m in llm_model_list]
-            if llm_model_list is not None
-            else []
-        )
-        if llm_router is not None and self.embedding_model in router_model_names:
-            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
-            embedding_response = await llm_router.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-                metadata={
-                    "user_api_key": user_api_key,
-                    "semantic-cache-embedding": True,
-                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
-                },
-            )
-        else:
-            # convert to embedding
-            embedding_response = await litellm.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            )
-
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        # get the embedding - memoized, and batched with concurrent lookups
+        embedding = await self.embedder.aembed(prompt, **kwargs)
 
         data = {
             "vector": embedding,
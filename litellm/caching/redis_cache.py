@@ -15,17 +15,21 @@ import inspect
 import json
 import time
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.constants import DEFAULT_REDIS_MAJOR_VERSION
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
 from litellm.litellm_core_utils.coroutine_checker import coroutine_checker
-from litellm.types.caching import RedisPipelineIncrementOperation
+from litellm.types.caching import (
+    RedisCacheCodecParams,
+    RedisPipelineIncrementOperation,
+)
 from litellm.types.services import ServiceTypes
 
 from .base_cache import BaseCache
+from .redis_codec import RedisCacheCodec
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -97,6 +101,9 @@ class RedisCache(BaseCache):
         namespace: Optional[str] = None,
         startup_nodes: Optional[List] = None,  # for redis-cluster
         socket_timeout: Optional[float] = 5.0,  # default 5 second timeout
+        redis_cache_codec: Optional[
+            Union[RedisCacheCodec, RedisCacheCodecParams]
+        ] = None,
         **kwargs,
     ):
         from litellm._service_logger import ServiceLogging
@@ -133,6 +140,10 @@ class RedisCache(BaseCache):
 
         # redis namespaces
         self.namespace = namespace
+        # binary codec for cached values, see redis_codec.py. None = legacy json strings
+        if isinstance(redis_cache_codec, dict):
+            redis_cache_codec = RedisCacheCodec(**redis_cache_codec)
+        self.redis_cache_codec: Optional[RedisCacheCodec] = redis_cache_codec
         # for high traffic, we store the redis results in memory and then batch write to redis
         self.redis_batch_writing_buffer: list = []
         if redis_flush_size is None:
@@ -298,7 +309,9 @@ class RedisCache(BaseCache):
         key = self.check_and_fix_namespace(key=key)
         try:
             start_time = time.time()
-            self.redis_client.set(name=key, value=str(value), ex=ttl)
+            self.redis_client.set(
+                name=key, value=self._serialize_value(value, legacy=str), ex=ttl
+            )
             end_time = time.time()
             _duration = end_time - start_time
             self.service_logger_obj.service_success_hook(
@@ -484,7 +497,7 @@ class RedisCache(BaseCache):
                 raise Exception("Redis client cannot set cache. Attribute not found.")
             result = await _redis_client.set(
                 name=key,
-                value=json.dumps(value),
+                value=self._serialize_value(value),
                 nx=nx,
                 ex=ttl,
             )
@@ -542,7 +555,7 @@ class RedisCache(BaseCache):
             print_verbose(
                 f"Set ASYNC Redis Cache PIPELINE: key: {cache_key}\nValue {cache_value}\nttl={ttl}"
             )
-            json_cache_value = json.dumps(cache_value)
+            json_cache_value = self._serialize_value(cache_value)
             # Set the value with a TTL if it's provided.
             _td: Optional[timedelta] = None
             if ttl is not None:
@@ -779,12 +792,34 @@ class RedisCache(BaseCache):
         await self.async_set_cache_pipeline(self.redis_batch_writing_buffer)
         self.redis_batch_writing_buffer = []
 
+    def _serialize_value(
+        self, value: Any, legacy: Callable[[Any], str] = json.dumps
+    ) -> Union[str, bytes]:
+        """
+        Containers (dicts / lists) are written with the codec, if one is set.
+
+        Scalars and strings always use the legacy format, so INCR / Lua scripts on those keys keep working.
+        """
+        if self.redis_cache_codec is not None and isinstance(
+            value, (dict, list, tuple)
+        ):
+            return self.redis_cache_codec.encode(value)
+        return legacy(value)
+
     def _get_cache_logic(self, cached_response: Any):
         """
         Common 'get_cache_logic' across sync + async redis client implementations
         """
         if cached_response is None:
             return cached_response
+        if RedisCacheCodec.is_encoded(cached_response):
+            try:
+                return RedisCacheCodec.decode(cached_response)
+            except Exception as e:
+                verbose_logger.error(
+                    "LiteLLM Redis Caching: failed to decode cached value - %s", str(e)
+                )
+                return None
         # cached_response is in `b{} convert it to ModelResponse
         cached_response = cached_response.decode("utf-8")  # Convert bytes to string
         try:
@@ -1146,6 +1181,30 @@ class RedisCache(BaseCache):
                 "error": str(e)
             }
 
+    def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message on a Redis pub/sub channel
+        """
+        return self.redis_client.publish(channel, message)  # type: ignore
+
+    async def async_publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message on a Redis pub/sub channel
+        """
+        _redis_client: Any = self.init_async_client()
+        return await _redis_client.publish(channel, message)
+
+    def get_async_pubsub(self) -> Any:
+        """
+        Returns a new redis.asyncio PubSub object. Each PubSub holds its own connection.
+
+        Raises if the client does not support pub/sub (e.g. RedisCluster).
+        """
+        _redis_client: Any = self.init_async_client()
+        if not hasattr(_redis_client, "pubsub"):
+            raise Exception("Redis client does not support pub/sub")
+        return _redis_client.pubsub()
+
     async def async_delete_cache(self, key: str):
         # typed as Any, redis python lib has incomplete type stubs for RedisCluster and does not include `delete`
         _redis_client: Any = self.init_async_client()
@@ -1179,6 +1238,30 @@ class RedisCache(BaseCache):
         )
         return [r for r in results if isinstance(r, float)]
 
+    async def async_set_hash_field_and_get_all(
+        self, key: str, field: str, value: Any, ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Set 1 field of a hash and return all of its fields, in 1 round trip
+
+        For per-instance entries under a shared key - each instance only overwrites its own field
+        """
+        from redis.asyncio import Redis
+
+        _redis_client: Redis = self.init_async_client()  # type: ignore
+        key = self.check_and_fix_namespace(key=key)
+        ttl = self.get_ttl(ttl=ttl)
+        async with _redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, field, self._serialize_value(value))
+            if ttl is not None:
+                pipe.expire(key, timedelta(seconds=ttl))
+            pipe.hgetall(key)
+            results = await pipe.execute()
+        return {
+            (k.decode("utf-8") if isinstance(k, bytes) else k): self._get_cache_logic(v)
+            for k, v in (results[-1] or {}).items()
+        }
+
     async def async_increment_pipeline(
         self, increment_list: List[RedisPipelineIncrementOperation], **kwargs
     ) -> Optional[List[float]]:
@@ -0,0 +1,296 @@
+"""
+Binary codec for RedisCache values
+
+RedisCache stores `json.dumps(value)` by default. With a codec, values are stored as:
+
+    header (7 bytes) | payload
+
+    header = b"\\x00LC" | version | serializer id | compression id | flags
+
+- serializer: json, orjson (default) or msgpack (`pip install msgpack`)
+- compression: zstd (`pip install zstandard`), lz4 (`pip install lz4`) or zlib, only for payloads
+  larger than `compression_threshold_bytes`
+- float lists (e.g. embedding vectors) are stored as packed little-endian float64 arrays - lossless,
+  ~8 bytes per float instead of ~20 as JSON text
+
+Values without the header (written before the codec was enabled, or by instances without it) are
+still read with the legacy JSON path, and every instance can read codec values - see `RedisCacheCodec.decode`.
+"""
+
+import base64
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, Callable, Optional, Tuple
+
+from litellm.constants import (
+    REDIS_CACHE_CODEC_COMPRESSION_THRESHOLD_BYTES,
+    REDIS_CACHE_CODEC_MIN_PACKED_FLOATS,
+)
+from litellm.types.caching import (
+    RedisCacheCodecCompression,
+    RedisCacheCodecSerializer,
+)
+
+# a leading NUL byte never starts a legacy (JSON / str()) value
+CODEC_MAGIC = b"\x00LC"
+CODEC_VERSION = 1
+_HEADER = struct.Struct("!3sBBBB")
+
+_SERIALIZER_IDS = {"json": 1, "orjson": 2, "msgpack": 3}
+_COMPRESSION_IDS = {None: 0, "zstd": 1, "lz4": 2, "zlib": 3}
+_FLAG_PACKED_FLOATS = 1
+
+# packed float arrays - msgpack ext type code / JSON marker key
+_MSGPACK_EXT_FLOAT64_ARRAY = 1
+_JSON_FLOAT64_ARRAY_KEY = "__litellm_f64__"
+
+
+def _floats_to_bytes(values: list) -> bytes:
+    packed = array("d", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _bytes_to_floats(data: bytes) -> list:
+    packed = array("d")
+    packed.frombytes(data)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def _is_float_array(value: list) -> bool:
+    return len(value) >= REDIS_CACHE_CODEC_MIN_PACKED_FLOATS and all(
+        type(item) is float for item in value
+    )
+
+
+def _replace_float_arrays(value: Any, pack: Callable[[list], Any]) -> Any:
+    """
+    Returns `value` with every float list replaced by `pack(list)`. Unchanged containers are not copied.
+    """
+    if isinstance(value, dict):
+        new_dict: Optional[dict] = None
+        for k, v in value.items():
+            packed = _replace_float_arrays(v, pack)
+            if packed is not v:
+                if new_dict is None:
+                    new_dict = dict(value)
+                new_dict[k] = packed
+        return new_dict if new_dict is not None else value
+    if isinstance(value, (list, tuple)):
+        if isinstance(value, list) and _is_float_array(value):
+            return pack(value)
+        new_list: Optional[list] = None
+        for i, v in enumerate(value):
+            packed = _replace_float_arrays(v, pack)
+            if packed is not v:
+                if new_list is None:
+                    new_list = list(value)
+                new_list[i] = packed
+        return new_list if new_list is not None else value
+    return value
+
+
+def _json_float_array_hook(obj: dict) -> Any:
+    if len(obj) == 1 and _JSON_FLOAT64_ARRAY_KEY in obj:
+        return _bytes_to_floats(base64.b64decode(obj[_JSON_FLOAT64_ARRAY_KEY]))
+    return obj
+
+
+def _restore_json_float_arrays(value: Any) -> Any:
+    if isinstance(value, dict):
+        if len(value) == 1 and _JSON_FLOAT64_ARRAY_KEY in value:
+            return _json_float_array_hook(value)
+        for k, v in value.items():
+            value[k] = _restore_json_float_arrays(v)
+    elif isinstance(value, list):
+        for i, v in enumerate(value):
+            value[i] = _restore_json_float_arrays(v)
+    return value
+
+
+def _import_msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "Missing dependency msgpack. Run `pip install msgpack` to use serializer='msgpack'"
+        )
+    return msgpack
+
+
+def _compress(data: bytes, compression: RedisCacheCodecCompression) -> bytes:
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "Missing dependency zstandard. Run `pip install zstandard` to use compression='zstd'"
+            )
+        return zstandard.ZstdCompressor().compress(data)
+    elif compression == "lz4":
+        try:
+            import lz4.frame
+        except ImportError:
+            raise ImportError(
+                "Missing dependency lz4. Run `pip install lz4` to use compression='lz4'"
+            )
+        return lz4.frame.compress(data)
+    return zlib.compress(data)
+
+
+def _decompress(data: bytes, compression_id: int) -> bytes:
+    if compression_id == _COMPRESSION_IDS["zstd"]:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    elif compression_id == _COMPRESSION_IDS["lz4"]:
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+    elif compression_id == _COMPRESSION_IDS["zlib"]:
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown RedisCacheCodec compression id={compression_id}")
+
+
+class RedisCacheCodec:
+    def __init__(
+        self,
+        serializer: RedisCacheCodecSerializer = "orjson",
+        compression: Optional[RedisCacheCodecCompression] = None,
+        compression_threshold_bytes: int = REDIS_CACHE_CODEC_COMPRESSION_THRESHOLD_BYTES,
+        pack_float_arrays: bool = True,
+    ):
+        if serializer not in _SERIALIZER_IDS:
+            raise ValueError(
+                f"Invalid serializer={serializer}. Must be one of {list(_SERIALIZER_IDS.keys())}"
+            )
+        if compression not in _COMPRESSION_IDS:
+            raise ValueError(
+                f"Invalid compression={compression}. Must be one of {[c for c in _COMPRESSION_IDS if c is not None]}"
+            )
+        if serializer == "msgpack":
+            _import_msgpack()
+        if serializer == "orjson":
+            try:
+                import orjson  # noqa: F401
+            except ImportError:
+                serializer = "json"
+        self.serializer: RedisCacheCodecSerializer = serializer
+        self.compression = compression
+        self.compression_threshold_bytes = compression_threshold_bytes
+        self.pack_float_arrays = pack_float_arrays
+
+    def _serialize(self, value: Any) -> Tuple[int, bytes, bool]:
+        """
+        Returns (serializer id, payload, has packed floats)
+        """
+        has_packed_floats = False
+        if self.serializer == "msgpack":
+            msgpack = _import_msgpack()
+            if self.pack_float_arrays:
+                packed_value = _replace_float_arrays(
+                    value,
+                    lambda floats: msgpack.ExtType(
+                        _MSGPACK_EXT_FLOAT64_ARRAY, _floats_to_bytes(floats)
+                    ),
+                )
+                has_packed_floats = packed_value is not value
+                value = packed_value
+            return (
+                _SERIALIZER_IDS["msgpack"],
+                msgpack.packb(value, use_bin_type=True),
+                has_packed_floats,
+            )
+
+        if self.pack_float_arrays:
+            packed_value = _replace_float_arrays(
+                value,
+                lambda floats: {
+                    _JSON_FLOAT64_ARRAY_KEY: base64.b64encode(
+                        _floats_to_bytes(floats)
+                    ).decode("ascii")
+                },
+            )
+            has_packed_floats = packed_value is not value
+            value = packed_value
+        if self.serializer == "orjson":
+            import orjson
+
+            try:
+                return (
+                    _SERIALIZER_IDS["orjson"],
+                    orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS),
+                    has_packed_floats,
+                )
+            except TypeError:  # e.g. ints > 64 bit - fall back to json
+                pass
+        return (
+            _SERIALIZER_IDS["json"],
+            json.dumps(value, separators=(",", ":")).encode("utf-8"),
+            has_packed_floats,
+        )
+
+    def encode(self, value: Any) -> bytes:
+        serializer_id, payload, has_packed_floats = self._serialize(value)
+        compression_id = _COMPRESSION_IDS[None]
+        if (
+            self.compression is not None
+            and len(payload) > self.compression_threshold_bytes
+        ):
+            compressed = _compress(payload, self.compression)
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression_id = _COMPRESSION_IDS[self.compression]
+        flags = _FLAG_PACKED_FLOATS if has_packed_floats else 0
+        header = _HEADER.pack(
+            CODEC_MAGIC, CODEC_VERSION, serializer_id, compression_id, flags
+        )
+        return header + payload
+
+    @staticmethod
+    def is_encoded(data: Any) -> bool:
+        return isinstance(data, (bytes, bytearray)) and data[:3] == CODEC_MAGIC
+
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        """
+        Decode a value written by any RedisCacheCodec, regardless of its serializer / compression settings
+        """
+        _, version, serializer_id, compression_id, flags = _HEADER.unpack_from(data)
+        if version != CODEC_VERSION:
+            raise ValueError(f"Unsupported RedisCacheCodec version={version}")
+        payload = memoryview(data)[_HEADER.size :]
+        if compression_id != _COMPRESSION_IDS[None]:
+            payload = memoryview(_decompress(bytes(payload), compression_id))
+        has_packed_floats = bool(flags & _FLAG_PACKED_FLOATS)
+
+        if serializer_id == _SERIALIZER_IDS["msgpack"]:
+            msgpack = _import_msgpack()
+
+            def ext_hook(code: int, ext_data: bytes) -> Any:
+                if code == _MSGPACK_EXT_FLOAT64_ARRAY:
+                    return _bytes_to_floats(ext_data)
+                return msgpack.ExtType(code, ext_data)
+
+            return msgpack.unpackb(
+                payload, raw=False, strict_map_key=False, ext_hook=ext_hook
+            )
+        elif serializer_id == _SERIALIZER_IDS["orjson"]:
+            import orjson
+
+            value = orjson.loads(payload)
+            if has_packed_floats:
+                value = _restore_json_float_arrays(value)
+            return value
+        elif serializer_id == _SERIALIZER_IDS["json"]:
+            return json.loads(
+                bytes(payload),
+                object_hook=_json_float_array_hook if has_packed_floats else None,
+            )
+        raise ValueError(f"Unknown RedisCacheCodec serializer id={serializer_id}")
@@ -13,16 +13,15 @@ import ast
 import asyncio
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple
 
-import litellm
 from litellm._logging import print_verbose
 from litellm.litellm_core_utils.prompt_templates.common_utils import (
     get_str_from_messages,
 )
-from litellm.types.utils import EmbeddingResponse
 
 from .base_cache import BaseCache
+from .semantic_cache_embedder import SemanticCacheEmbedder
 
 
 class RedisSemanticCache(BaseCache):
@@ -86,6 +85,7 @@ class RedisSemanticCache(BaseCache):
         # While similarity: 1 = most similar, 0 = least similar
         self.distance_threshold = 1 - similarity_threshold
         self.embedding_model = embedding_model
+        self.embedder = SemanticCacheEmbedder(embedding_model=embedding_model)
 
         # Set up Redis connection
         if redis_url is None:
@@ -142,17 +142,8 @@ class RedisSemanticCache(BaseCache):
         Returns:
             List[float]: The embedding vector
         """
-        # Create an embedding from prompt
-        embedding_response = cast(
-            EmbeddingResponse,
-            litellm.embedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            ),
-        )
-        embedding = embedding_response["data"][0]["embedding"]
-        return embedding
+        # memoized - repeated prompts are not re-embedded
+        return self.embedder.embed(prompt)
 
     def _get_cache_logic(self, cached_response: Any) -> Any:
         """
@@ -272,6 +263,8 @@ class RedisSemanticCache(BaseCache):
         """
         Asynchronously generate an embedding for the given prompt.
 
+        Memoized per prompt, and batched with concurrent lookups into one embedding request.
+
         Args:
             prompt: The text to generate an embedding for
             **kwargs: Additional arguments that may contain metadata
@@ -279,39 +272,8 @@ class RedisSemanticCache(BaseCache):
         Returns:
             List[float]: The embedding vector
         """
-        from litellm.proxy.proxy_server import llm_model_list, llm_router
-
-        # Route the embedding request through the proxy if appropriate
-        router_model_names = (
-            [m["model_name"] for m in llm_model_list]
-            if llm_model_list is not None
-            else []
-        )
-
         try:
-            if llm_router is not None and self.embedding_model in router_model_names:
-                # Use the router for embedding generation
-                user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
-                embedding_response = await llm_router.aembedding(
-                    model=self.embedding_model,
-                    input=prompt,
-                    cache={"no-store": True, "no-cache": True},
-                    metadata={
-                        "user_api_key": user_api_key,
-                        "semantic-cache-embedding": True,
-                        "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
-                    },
-                )
-            else:
-                # Generate embedding directly
-                embedding_response = await litellm.aembedding(
-                    model=self.embedding_model,
-                    input=prompt,
-                    cache={"no-store": True, "no-cache": True},
-                )
-
-            # Extract and return the embedding vector
-            return embedding_response["data"][0]["embedding"]
+            return await self.embedder.aembed(prompt, **kwargs)
         except Exception as e:
             print_verbose(f"Error generating async embedding: {str(e)}")
             raise ValueError(f"Failed to generate embedding: {str(e)}") from e
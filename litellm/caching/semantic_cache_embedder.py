@@ -0,0 +1,234 @@
+"""
+Prompt embeddings for the semantic caches (redis-semantic, qdrant-semantic, local-semantic)
+
+Every semantic cache lookup needs the prompt's embedding. SemanticCacheEmbedder:
+
+- memoizes prompt -> embedding in an exact-match LRU (keyed by the prompt's sha256), so a prompt that was
+  already looked up - e.g. the store that follows a cache miss - is never embedded twice
+- batches async lookups: prompts requested within `batch_window_ms` of each other are sent as one
+  embedding request (one batch per `user_api_key`, so spend is still attributed to the right key)
+"""
+
+import asyncio
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    SEMANTIC_CACHE_EMBEDDING_BATCH_WINDOW_MS,
+    SEMANTIC_CACHE_EMBEDDING_CACHE_SIZE,
+    SEMANTIC_CACHE_EMBEDDING_MAX_BATCH_SIZE,
+)
+from litellm.types.utils import EmbeddingResponse
+
+# prompt digest -> (prompt, trace_id of the first caller, futures waiting for its embedding)
+_PendingGroup = Dict[bytes, Tuple[str, Optional[str], List[asyncio.Future]]]
+
+
+def _prompt_digest(prompt: str) -> bytes:
+    return hashlib.sha256(prompt.encode("utf-8")).digest()
+
+
+class SemanticCacheEmbedder:
+    def __init__(
+        self,
+        embedding_model: str,
+        batch_window_ms: float = SEMANTIC_CACHE_EMBEDDING_BATCH_WINDOW_MS,
+        max_batch_size: int = SEMANTIC_CACHE_EMBEDDING_MAX_BATCH_SIZE,
+        cache_size: int = SEMANTIC_CACHE_EMBEDDING_CACHE_SIZE,
+    ):
+        """
+        Args:
+            embedding_model: model passed to litellm.(a)embedding / router.aembedding
+            batch_window_ms: how long an async lookup waits for others to share its embedding request, 0 = no batching
+            max_batch_size: max prompts per embedding request, a full batch is sent immediately
+            cache_size: max memoized prompt embeddings, 0 = no memoization
+        """
+        self.embedding_model = embedding_model
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+        self.cache_size = cache_size
+        # embeddings are kept as packed float64 arrays - ~8 bytes per float instead of ~32 in a list
+        self._cache: "OrderedDict[bytes, array]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # user_api_key -> pending prompts
+        self._pending: Dict[str, _PendingGroup] = {}
+        self._pending_loop: Any = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # running embedding requests - the event loop only keeps weak references to tasks
+        self._running_tasks: Set[asyncio.Future] = set()
+
+        # counters
+        self.num_cache_hits: int = 0
+        self.num_embedding_requests: int = 0
+        self.num_embedded_prompts: int = 0
+
+    ### MEMOIZATION ###
+
+    def _get_cached(self, digest: bytes) -> Optional[List[float]]:
+        with self._cache_lock:
+            embedding = self._cache.get(digest)
+            if embedding is None:
+                return None
+            self._cache.move_to_end(digest)
+            self.num_cache_hits += 1
+        return embedding.tolist()
+
+    def _set_cached(self, digest: bytes, embedding: List[float]) -> None:
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[digest] = array("d", embedding)
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    ### EMBEDDING REQUESTS ###
+
+    def embed(self, prompt: str) -> List[float]:
+        """
+        Sync embedding for `prompt` - memoized, not batched
+        """
+        digest = _prompt_digest(prompt)
+        cached = self._get_cached(digest)
+        if cached is not None:
+            return cached
+        embedding_response = cast(
+            EmbeddingResponse,
+            litellm.embedding(
+                model=self.embedding_model,
+                input=prompt,
+                cache={"no-store": True, "no-cache": True},
+            ),
+        )
+        self.num_embedding_requests += 1
+        self.num_embedded_prompts += 1
+        embedding = embedding_response["data"][0]["embedding"]
+        self._set_cached(digest, embedding)
+        return embedding
+
+    async def _aembedding(
+        self, prompts: List[str], user_api_key: str, trace_id: Optional[str]
+    ) -> List[List[float]]:
+        from litellm.proxy.proxy_server import llm_model_list, llm_router
+
+        router_model_names = (
+            [m["model_name"] for m in llm_model_list]
+            if llm_model_list is not None
+            else []
+        )
+        embedding_input: Any = prompts[0] if len(prompts) == 1 else prompts
+        if llm_router is not None and self.embedding_model in router_model_names:
+            embedding_response = await llm_router.aembedding(
+                model=self.embedding_model,
+                input=embedding_input,
+                cache={"no-store": True, "no-cache": True},
+                metadata={
+                    "user_api_key": user_api_key,
+                    "semantic-cache-embedding": True,
+                    "trace_id": trace_id,
+                },
+            )
+        else:
+            embedding_response = await litellm.aembedding(
+                model=self.embedding_model,
+                input=embedding_input,
+                cache={"no-store": True, "no-cache": True},
+            )
+        self.num_embedding_requests += 1
+        self.num_embedded_prompts += len(prompts)
+        data = embedding_response["data"]
+        if len(data) != len(prompts):
+            raise ValueError(
+                f"Embedding response has {len(data)} embeddings for {len(prompts)} prompts"
+            )
+        return [item["embedding"] for item in data]
+
+    async def aembed(self, prompt: str, **kwargs) -> List[float]:
+        """
+        Async embedding for `prompt` - memoized, and batched with concurrent lookups
+
+        Args:
+            prompt: text to embed
+            **kwargs: the cache call's kwargs - `metadata.user_api_key` / `metadata.trace_id` are
+                forwarded when the embedding goes through the proxy router
+        """
+        digest = _prompt_digest(prompt)
+        cached = self._get_cached(digest)
+        if cached is not None:
+            return cached
+
+        metadata = kwargs.get("metadata") or {}
+        user_api_key = metadata.get("user_api_key", "")
+        loop = asyncio.get_running_loop()
+        if self.batch_window_ms <= 0 or (
+            self._pending and self._pending_loop is not loop
+        ):
+            embedding = (
+                await self._aembedding(
+                    [prompt],
+                    user_api_key=user_api_key,
+                    trace_id=metadata.get("trace_id", None),
+                )
+            )[0]
+            self._set_cached(digest, embedding)
+            return embedding
+
+        future = loop.create_future()
+        group = self._pending.setdefault(user_api_key, {})
+        if digest in group:
+            group[digest][2].append(future)
+        else:
+            group[digest] = (prompt, metadata.get("trace_id", None), [future])
+        if self._flush_handle is None:
+            self._pending_loop = loop
+            self._flush_handle = loop.call_later(
+                self.batch_window_ms / 1000, self._flush
+            )
+        if len(group) >= self.max_batch_size:
+            self._flush()
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        self._pending_loop = None
+        for user_api_key, group in pending.items():
+            items = list(group.items())
+            for i in range(0, len(items), self.max_batch_size):
+                task = asyncio.ensure_future(
+                    self._run_batch(
+                        user_api_key, dict(items[i : i + self.max_batch_size])
+                    )
+                )
+                self._running_tasks.add(task)
+                task.add_done_callback(self._running_tasks.discard)
+
+    async def _run_batch(self, user_api_key: str, batch: _PendingGroup) -> None:
+        prompts = [prompt for prompt, _, _ in batch.values()]
+        # a batched request serves several traces, only forward the trace_id of a single-prompt batch
+        trace_id = next(iter(batch.values()))[1] if len(batch) == 1 else None
+        try:
+            embeddings = await self._aembedding(
+                prompts, user_api_key=user_api_key, trace_id=trace_id
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "LiteLLM SemanticCacheEmbedder: embedding request failed - %s", str(e)
+            )
+            for _, _, futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for (digest, (_, _, futures)), embedding in zip(batch.items(), embeddings):
+            self._set_cached(digest, embedding)
+            for future in futures:
+                if not future.done():  # caller may have been cancelled
+                    future.set_result(embedding)
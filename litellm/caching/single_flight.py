@@ -0,0 +1,155 @@
+"""
+Request coalescing ("single-flight") for cache misses
+
+- SingleFlight: concurrent calls for the same key share one in-flight coroutine (e.g. one Redis GET)
+- CacheMissCoalescer: the first request that misses the cache for a key becomes the leader and calls the LLM,
+  concurrent misses for the same key wait for the leader's result instead of calling the LLM themselves
+
+Both track how many requests were coalesced, per namespace - see `get_coalesced_requests_by_namespace()`
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from litellm._logging import verbose_logger
+from litellm.constants import CACHE_MISS_COALESCE_TIMEOUT_SECONDS
+
+T = TypeVar("T")
+
+_coalesced_requests_by_namespace: Dict[str, int] = {}
+
+
+def _record_coalesced_request(namespace: str) -> None:
+    _coalesced_requests_by_namespace[namespace] = (
+        _coalesced_requests_by_namespace.get(namespace, 0) + 1
+    )
+
+
+def get_coalesced_requests_by_namespace() -> Dict[str, int]:
+    """
+    Total number of requests served by another request's in-flight call, per namespace
+    """
+    return dict(_coalesced_requests_by_namespace)
+
+
+def _consume_task_exception(task: "asyncio.Task") -> None:
+    # avoid 'Task exception was never retrieved' when every caller was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight:
+    def __init__(
+        self,
+        namespace: str,
+        copy_result: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Args:
+            namespace: label used for the coalesced-request counters
+            copy_result: applied to the shared result before it's handed to a coalesced caller,
+                use it when callers may mutate the result
+        """
+        self.namespace = namespace
+        self.copy_result = copy_result
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn()`, unless a call for `key` is already in flight on this event loop - then wait for its result.
+
+        Cancelling one caller does not cancel the shared call for the others.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            _record_coalesced_request(self.namespace)
+            result = await asyncio.shield(task)
+            if self.copy_result is not None:
+                return self.copy_result(result)
+            return result
+
+        task = loop.create_task(fn())  # type: ignore[arg-type]
+        self._in_flight[key] = task
+        task.add_done_callback(
+            lambda finished_task: self._release(key=key, task=finished_task)
+        )
+        return await asyncio.shield(task)
+
+    def _release(self, key: str, task: "asyncio.Task") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        _consume_task_exception(task)
+
+
+class CacheMissCoalescer:
+    def __init__(
+        self,
+        namespace: str,
+        timeout: float = CACHE_MISS_COALESCE_TIMEOUT_SECONDS,
+    ):
+        self.namespace = namespace
+        self.timeout = timeout
+        # key -> (leader future, time the leader started)
+        self._in_flight: Dict[str, Tuple[asyncio.Future, float]] = {}
+        self._num_waiters: Dict[str, int] = {}
+
+    def acquire(self, key: str) -> Tuple[bool, Optional[asyncio.Future]]:
+        """
+        Returns (is_leader, future).
+
+        - (True, future): caller is the leader, it must call `release(key, future, value)` when done
+        - (False, future): another request is computing the value, `await wait(key, future)` for it
+        - (False, None): coalescing is not possible (in-flight call on another event loop)
+        """
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            future, started_at = in_flight
+            is_stale = future.done() or time.time() - started_at > self.timeout
+            if not is_stale:
+                if future.get_loop() is not loop:
+                    return False, None
+                return False, future
+        future = loop.create_future()
+        self._in_flight[key] = (future, time.time())
+        return True, future
+
+    def has_waiters(self, key: str) -> bool:
+        return self._num_waiters.get(key, 0) > 0
+
+    async def wait(self, key: str, future: asyncio.Future) -> Optional[Any]:
+        """
+        Wait for the leader's value. Returns None if the leader failed, produced nothing or timed out.
+        """
+        self._num_waiters[key] = self._num_waiters.get(key, 0) + 1
+        try:
+            value = await asyncio.wait_for(asyncio.shield(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            verbose_logger.debug(
+                "LiteLLM cache coalescing: timed out waiting for in-flight request, key=%s",
+                key,
+            )
+            self._remove(key=key, future=future)
+            return None
+        finally:
+            self._num_waiters[key] -= 1
+            if self._num_waiters[key] <= 0:
+                self._num_waiters.pop(key, None)
+        if value is not None:
+            _record_coalesced_request(self.namespace)
+        return value
+
+    def release(self, key: str, future: asyncio.Future, value: Optional[Any] = None):
+        """
+        Called by the leader - hands `value` to every waiter and frees the key
+        """
+        self._remove(key=key, future=future)
+        if not future.done():
+            future.set_result(value)
+
+    def _remove(self, key: str, future: asyncio.Future) -> None:
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None and in_flight[0] is future:
+            del self._in_flight[key]
@@ -46,8 +46,26 @@ DEFAULT_REPLICATE_POLLING_DELAY_SECONDS = int(
     os.getenv("DEFAULT_REPLICATE_POLLING_DELAY_SECONDS", 1)
 )
 DEFAULT_IMAGE_TOKEN_COUNT = int(os.getenv("DEFAULT_IMAGE_TOKEN_COUNT", 250))
+TOKEN_COUNTER_MESSAGE_CACHE_SIZE = int(
+    os.getenv("TOKEN_COUNTER_MESSAGE_CACHE_SIZE", 4096)
+)  # max per-message token counts memoized by token_counter, 0 = disabled
+TOKEN_COUNTER_BATCH_NUM_THREADS = int(
+    os.getenv("TOKEN_COUNTER_BATCH_NUM_THREADS", 8)
+)  # threads tiktoken's encode_batch uses in token_counter_many
+TOKEN_COUNTER_MAX_WORKERS = int(
+    os.getenv("TOKEN_COUNTER_MAX_WORKERS", 4)
+)  # threads atoken_counter / atoken_counter_many count tokens on, off the event loop
 DEFAULT_IMAGE_WIDTH = int(os.getenv("DEFAULT_IMAGE_WIDTH", 300))
 DEFAULT_IMAGE_HEIGHT = int(os.getenv("DEFAULT_IMAGE_HEIGHT", 300))
+IMAGE_DIMENSION_PROBE_BYTES = int(
+    os.getenv("IMAGE_DIMENSION_PROBE_BYTES", 4096)
+)  # image header bytes read before the first attempt to parse its dimensions, doubled until they're found
+IMAGE_DIMENSION_PROBE_MAX_BYTES = int(
+    os.getenv("IMAGE_DIMENSION_PROBE_MAX_BYTES", 1024 * 1024)
+)  # most bytes of an image url fetched to find its dimensions (http range request)
+IMAGE_DIMENSIONS_CACHE_SIZE = int(
+    os.getenv("IMAGE_DIMENSIONS_CACHE_SIZE", 1024)
+)  # max image url dimensions memoized by url, 0 = disabled
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 1024)
 )  # 1MB = 1024KB
@@ -231,9 +249,161 @@ DEFAULT_IN_MEMORY_TTL = int(
 DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE = int(
     os.getenv("DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE", 1000)
 )  # default max size for redis batch cache
+DEFAULT_IN_MEMORY_CACHE_EVICTION_POLICY = os.getenv(
+    "DEFAULT_IN_MEMORY_CACHE_EVICTION_POLICY", "ttl"
+)  # one of "ttl", "lru", "tinylfu"
+NEAR_CACHE_INVALIDATION_CHANNEL = os.getenv(
+    "NEAR_CACHE_INVALIDATION_CHANNEL", "litellm:near_cache:invalidate"
+)  # redis pub/sub channel used to invalidate DualCache near cache entries across instances
+DEFAULT_NEAR_CACHE_TTL = int(
+    os.getenv("DEFAULT_NEAR_CACHE_TTL", 3600)
+)  # in-memory ttl for near cache entries, they are normally dropped by invalidation first
+NEAR_CACHE_RECONNECT_DELAY_SECONDS = float(
+    os.getenv("NEAR_CACHE_RECONNECT_DELAY_SECONDS", 1.0)
+)
+NEAR_CACHE_SUBSCRIBER_POLL_TIMEOUT_SECONDS = float(
+    os.getenv("NEAR_CACHE_SUBSCRIBER_POLL_TIMEOUT_SECONDS", 1.0)
+)
+# RedisCacheCodec - values larger than this (serialized bytes) are compressed
+REDIS_CACHE_CODEC_COMPRESSION_THRESHOLD_BYTES = int(
+    os.getenv("REDIS_CACHE_CODEC_COMPRESSION_THRESHOLD_BYTES", 1024)
+)
+# RedisCacheCodec - float lists at least this long are stored as packed float64 arrays
+REDIS_CACHE_CODEC_MIN_PACKED_FLOATS = int(
+    os.getenv("REDIS_CACHE_CODEC_MIN_PACKED_FLOATS", 16)
+)
+# SegmentDiskCache - size at which the active segment file is sealed
+SEGMENT_DISK_CACHE_MAX_SEGMENT_BYTES = int(
+    os.getenv("SEGMENT_DISK_CACHE_MAX_SEGMENT_BYTES", 64 * 1024 * 1024)
+)
+# SegmentDiskCache - compact a sealed segment once this fraction of its bytes is dead records
+SEGMENT_DISK_CACHE_COMPACTION_GARBAGE_RATIO = float(
+    os.getenv("SEGMENT_DISK_CACHE_COMPACTION_GARBAGE_RATIO", 0.5)
+)
+# LocalSemanticCache - max cached prompts, least recently used entries are evicted beyond this
+LOCAL_SEMANTIC_CACHE_MAX_ENTRIES = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_MAX_ENTRIES", 1_000_000)
+)
+# LocalSemanticCache - rows allocated up front, the embedding matrix doubles as it fills
+LOCAL_SEMANTIC_CACHE_INITIAL_CAPACITY = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_INITIAL_CAPACITY", 1024)
+)
+# LocalSemanticCache - rows scored per matmul block in a brute-force search
+LOCAL_SEMANTIC_CACHE_SEARCH_BLOCK_ROWS = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_SEARCH_BLOCK_ROWS", 8192)
+)
+# LocalSemanticCache - async lookups over this many entries are scored on a worker thread, not the event loop
+LOCAL_SEMANTIC_CACHE_EXECUTOR_MIN_ENTRIES = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_EXECUTOR_MIN_ENTRIES", 10_000)
+)
+# LocalSemanticCache - build the ivf / hnsw index once the cache holds this many entries
+LOCAL_SEMANTIC_CACHE_INDEX_MIN_ENTRIES = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_INDEX_MIN_ENTRIES", 100_000)
+)
+# LocalSemanticCache - number of ivf lists searched per lookup
+LOCAL_SEMANTIC_CACHE_IVF_NUM_PROBES = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_IVF_NUM_PROBES", 8)
+)
+LOCAL_SEMANTIC_CACHE_HNSW_M = int(os.getenv("LOCAL_SEMANTIC_CACHE_HNSW_M", 16))
+LOCAL_SEMANTIC_CACHE_HNSW_EF_CONSTRUCTION = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_HNSW_EF_CONSTRUCTION", 200)
+)
+LOCAL_SEMANTIC_CACHE_HNSW_EF_SEARCH = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_HNSW_EF_SEARCH", 64)
+)
+# semantic caches - concurrent lookups within this window share one embedding request, 0 disables batching
+SEMANTIC_CACHE_EMBEDDING_BATCH_WINDOW_MS = float(
+    os.getenv("SEMANTIC_CACHE_EMBEDDING_BATCH_WINDOW_MS", 5.0)
+)
+SEMANTIC_CACHE_EMBEDDING_MAX_BATCH_SIZE = int(
+    os.getenv("SEMANTIC_CACHE_EMBEDDING_MAX_BATCH_SIZE", 64)
+)
+# semantic caches - max memoized prompt embeddings (exact prompt match), 0 disables memoization
+SEMANTIC_CACHE_EMBEDDING_CACHE_SIZE = int(
+    os.getenv("SEMANTIC_CACHE_EMBEDDING_CACHE_SIZE", 2048)
+)
+# max time a request that missed the cache waits for an identical in-flight request
+CACHE_MISS_COALESCE_TIMEOUT_SECONDS = float(
+    os.getenv("CACHE_MISS_COALESCE_TIMEOUT_SECONDS", 60.0)
+)
+TINYLFU_WINDOW_RATIO = float(
+    os.getenv("TINYLFU_WINDOW_RATIO", 0.01)
+)  # share of tracked keys kept in the W-TinyLFU admission window
+TINYLFU_PROTECTED_RATIO = float(
+    os.getenv("TINYLFU_PROTECTED_RATIO", 0.8)
+)  # share of the W-TinyLFU main area reserved for the protected segment
+TINYLFU_SKETCH_DEPTH = int(os.getenv("TINYLFU_SKETCH_DEPTH", 4))
+TINYLFU_SKETCH_MIN_WIDTH = int(os.getenv("TINYLFU_SKETCH_MIN_WIDTH", 1024))
+TINYLFU_SKETCH_MAX_COUNTER = int(os.getenv("TINYLFU_SKETCH_MAX_COUNTER", 15))
+TINYLFU_SKETCH_RESET_MULTIPLIER = int(
+    os.getenv("TINYLFU_SKETCH_RESET_MULTIPLIER", 10)
+)  # halve the frequency sketch after width * multiplier increments
 DEFAULT_POLLING_INTERVAL = float(
     os.getenv("DEFAULT_POLLING_INTERVAL", 0.03)
 )  # default polling interval for the scheduler
+SCHEDULER_MAX_WAKE_INTERVAL_SECONDS = float(
+    os.getenv("SCHEDULER_MAX_WAKE_INTERVAL_SECONDS", 1.0)
+)  # queued requests re-check for capacity at least this often, in case a wake-up event was missed
+SCHEDULER_REDIS_BLOCKING_POP_TIMEOUT_SECONDS = int(
+    os.getenv("SCHEDULER_REDIS_BLOCKING_POP_TIMEOUT_SECONDS", 1)
+)  # BLPOP timeout of the redis scheduler queue's wake-up listener
+SCHEDULER_REDIS_WAKE_KEY_TTL_SECONDS = int(
+    os.getenv("SCHEDULER_REDIS_WAKE_KEY_TTL_SECONDS", 60)
+)  # wake-up lists of instances that went away expire after this
+SCHEDULER_RELEASE_INTERVAL_EWMA_ALPHA = float(
+    os.getenv("SCHEDULER_RELEASE_INTERVAL_EWMA_ALPHA", 0.2)
+)  # smoothing of the queue release rate used by the "wfq" scheduler policy to reject requests that would miss their deadline
+SCHEDULER_RELEASE_INTERVAL_MAX_AGE_SECONDS = float(
+    os.getenv("SCHEDULER_RELEASE_INTERVAL_MAX_AGE_SECONDS", 60)
+)  # the measured queue release rate is dropped once nothing was released for this long
+LOWEST_LATENCY_EWMA_ALPHA = float(
+    os.getenv("LOWEST_LATENCY_EWMA_ALPHA", 0.3)
+)  # weight of the newest sample in latency-based routing's moving averages (latency_stats="ewma")
+LOWEST_LATENCY_SUMMARY_SYNC_INTERVAL_SECONDS = float(
+    os.getenv("LOWEST_LATENCY_SUMMARY_SYNC_INTERVAL_SECONDS", 5)
+)  # how often latency-based routing merges its latency summary with other instances through redis
+LEAST_OUTSTANDING_REQUESTS_LATENCY_EWMA_ALPHA = float(
+    os.getenv("LEAST_OUTSTANDING_REQUESTS_LATENCY_EWMA_ALPHA", 0.3)
+)  # weight of the newest sample in least-outstanding-requests routing's latency moving average
+LEAST_OUTSTANDING_REQUESTS_SYNC_INTERVAL_SECONDS = float(
+    os.getenv("LEAST_OUTSTANDING_REQUESTS_SYNC_INTERVAL_SECONDS", 1)
+)  # how often least-outstanding-requests routing reads the in-flight counts of other instances from redis
+LEAST_OUTSTANDING_REQUESTS_STALE_SECONDS = int(
+    os.getenv("LEAST_OUTSTANDING_REQUESTS_STALE_SECONDS", 600)
+)  # in-flight requests without a success / failure event for this long are no longer counted
+COOLDOWN_HALF_OPEN_SUCCESS_THRESHOLD = int(
+    os.getenv("COOLDOWN_HALF_OPEN_SUCCESS_THRESHOLD", 1)
+)  # successful probe requests that take a half-open deployment out of cooldown
+COOLDOWN_PUBSUB_CHANNEL = os.getenv(
+    "COOLDOWN_PUBSUB_CHANNEL", "litellm_deployment_cooldowns"
+)  # redis channel cooldown enter / exit events are published on
+COOLDOWN_PUBSUB_RECONNECT_SECONDS = float(
+    os.getenv("COOLDOWN_PUBSUB_RECONNECT_SECONDS", 5)
+)  # wait before re-subscribing after the cooldown event subscription fails
+DEFAULT_RETRY_BUDGET_RATIO = float(
+    os.getenv("DEFAULT_RETRY_BUDGET_RATIO", 0.1)
+)  # retries (+ hedged requests) allowed per request of a model group
+DEFAULT_RETRY_BUDGET_MIN_RETRIES_PER_SECOND = float(
+    os.getenv("DEFAULT_RETRY_BUDGET_MIN_RETRIES_PER_SECOND", 1)
+)  # retries allowed per second regardless of traffic - so low traffic model groups can retry
+DEFAULT_RETRY_BUDGET_MAX_BURST_RETRIES = float(
+    os.getenv("DEFAULT_RETRY_BUDGET_MAX_BURST_RETRIES", 100)
+)  # most retries a model group can save up
+DEFAULT_HEDGING_PERCENTILE = float(
+    os.getenv("DEFAULT_HEDGING_PERCENTILE", 0.95)
+)  # a request is hedged when it has no first token after this percentile of the model group's time to first token
+DEFAULT_HEDGING_MIN_SAMPLES = int(
+    os.getenv("DEFAULT_HEDGING_MIN_SAMPLES", 20)
+)  # requests a model group needs before it is hedged
+HEDGING_TTFT_WINDOW_SIZE = int(
+    os.getenv("HEDGING_TTFT_WINDOW_SIZE", 200)
+)  # recent times to first token the hedging percentile is computed over
+HEDGING_DELAY_REFRESH_SAMPLES = int(
+    os.getenv("HEDGING_DELAY_REFRESH_SAMPLES", 10)
+)  # new samples before the hedging percentile is recomputed
+PATTERN_MATCH_ROUTER_CACHE_SIZE = int(
+    os.getenv("PATTERN_MATCH_ROUTER_CACHE_SIZE", 1024)
+)  # requested model names whose wildcard route resolution is memoized, 0 = disabled
 AZURE_OPERATION_POLLING_TIMEOUT = int(os.getenv("AZURE_OPERATION_POLLING_TIMEOUT", 120))
 AZURE_DOCUMENT_INTELLIGENCE_API_VERSION = str(
     os.getenv("AZURE_DOCUMENT_INTELLIGENCE_API_VERSION", "2024-11-30")
@@ -275,6 +445,12 @@ AUDIO_SPEECH_CHUNK_SIZE = int(
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 512)
 )
+IN_MEMORY_CACHE_SIZE_ESTIMATE_MAX_DEPTH = int(
+    os.getenv("IN_MEMORY_CACHE_SIZE_ESTIMATE_MAX_DEPTH", 8)
+)  # max nesting depth the in-memory cache size estimator recurses into
+IN_MEMORY_CACHE_SIZE_ESTIMATE_SAMPLE_SIZE = int(
+    os.getenv("IN_MEMORY_CACHE_SIZE_ESTIMATE_SAMPLE_SIZE", 64)
+)  # items sampled per container, larger containers are extrapolated
 DEFAULT_MAX_TOKENS_FOR_TRITON = int(os.getenv("DEFAULT_MAX_TOKENS_FOR_TRITON", 2000))
 #### Networking settings ####
 request_timeout: float = float(os.getenv("REQUEST_TIMEOUT", 6000))  # time in seconds
@@ -244,6 +244,40 @@ class PrometheusLogger(CustomLogger):
                 labelnames=["api_provider"],
             )
 
+            # in-memory cache memory usage
+            self.litellm_in_memory_cache_size_bytes = self._gauge_factory(
+                "litellm_in_memory_cache_size_bytes",
+                "Estimated bytes held by LiteLLM in-memory caches, per cache namespace",
+                labelnames=["cache_namespace"],
+            )
+            self.litellm_cache_coalesced_requests = self._counter_factory(
+                "litellm_cache_coalesced_requests",
+                "Total requests served by another in-flight request for the same cache key, per cache namespace",
+                labelnames=["cache_namespace"],
+            )
+            # totals already exported, per cache namespace - the counter is incremented by the difference
+            self._exported_coalesced_requests_by_namespace: Dict[str, int] = {}
+
+            # router request prioritization
+            self.litellm_request_queue_wait_seconds = self._histogram_factory(
+                "litellm_request_queue_wait_seconds",
+                "Time (seconds) a prioritized request waited in the router scheduler queue. outcome is released, timed_out or rejected (would have missed its deadline)",
+                labelnames=["model_group", "priority", "outcome"],
+                buckets=LATENCY_BUCKETS,
+            )
+
+            # router retry budget + hedged requests
+            self.litellm_retry_budget_exhausted = self._counter_factory(
+                "litellm_retry_budget_exhausted",
+                "Retries / hedged requests not sent because the model group's retry budget was exhausted. request_type is retry or hedge",
+                labelnames=["model_group", "request_type"],
+            )
+            self.litellm_hedged_requests = self._counter_factory(
+                "litellm_hedged_requests",
+                "Hedged requests sent by the router. winner is primary (the first request returned its first token first) or hedge",
+                labelnames=["model_group", "winner"],
+            )
+
             # Metric for deployment state
             self.litellm_deployment_state = self._gauge_factory(
                 "litellm_deployment_state",
@@ -945,6 +979,9 @@ class PrometheusLogger(CustomLogger):
             kwargs, start_time, end_time, enum_values, output_tokens
         )
 
+        self._set_in_memory_cache_size_metrics()
+        self._set_cache_coalescing_metrics()
+
         if (
             standard_logging_payload["stream"] is True
         ):  # log successful streaming requests from logging event hook.
@@ -956,6 +993,43 @@ class PrometheusLogger(CustomLogger):
             )
             self.litellm_proxy_total_requests_metric.labels(**_labels).inc()
 
+    def _set_in_memory_cache_size_metrics(self):
+        """
+        Export the estimated memory held by each in-memory cache namespace
+        """
+        from litellm.caching.memory_budget import in_memory_cache_memory_budget
+
+        for (
+            namespace,
+            size_in_bytes,
+        ) in in_memory_cache_memory_budget.get_memory_usage_by_namespace().items():
+            self.litellm_in_memory_cache_size_bytes.labels(
+                cache_namespace=namespace
+            ).set(size_in_bytes)
+
+    def _set_cache_coalescing_metrics(self):
+        """
+        Export how many cache lookups / LLM calls were coalesced, per cache namespace
+        """
+        from litellm.caching.single_flight import get_coalesced_requests_by_namespace
+
+        for (
+            namespace,
+            coalesced_requests,
+        ) in get_coalesced_requests_by_namespace().items():
+            new_coalesced_requests = (
+                coalesced_requests
+                - self._exported_coalesced_requests_by_namespace.get(namespace, 0)
+            )
+            if new_coalesced_requests <= 0:
+                continue
+            self.litellm_cache_coalesced_requests.labels(
+                cache_namespace=namespace
+            ).inc(new_coalesced_requests)
+            self._exported_coalesced_requests_by_namespace[namespace] = (
+                coalesced_requests
+            )
+
     def _increment_token_metrics(
         self,
         standard_logging_payload: StandardLoggingPayload,
@@ -1751,6 +1825,36 @@ class PrometheusLogger(CustomLogger):
             litellm_model_name, model_id, api_base, api_provider, exception_status
         ).inc()
 
+    def observe_request_queue_wait(
+        self,
+        model_group: str,
+        priority: int,
+        outcome: str,
+        wait_seconds: float,
+    ):
+        """
+        observe how long a request waited in the litellm.Router scheduler queue
+        """
+        self.litellm_request_queue_wait_seconds.labels(
+            model_group=model_group, priority=str(priority), outcome=outcome
+        ).observe(wait_seconds)
+
+    def increment_retry_budget_exhausted(self, model_group: str, request_type: str):
+        """
+        increment metric when litellm.Router skips a retry / hedged request because the model group's retry budget is exhausted
+        """
+        self.litellm_retry_budget_exhausted.labels(
+            model_group=model_group, request_type=request_type
+        ).inc()
+
+    def increment_hedged_request(self, model_group: str, winner: str):
+        """
+        increment metric when litellm.Router hedges a request
+        """
+        self.litellm_hedged_requests.labels(
+            model_group=model_group, winner=winner
+        ).inc()
+
     def increment_callback_logging_failure(
         self,
         callback_name: str,
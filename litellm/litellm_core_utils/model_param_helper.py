@@ -1,4 +1,5 @@
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet, Set
 
 from openai.types.chat.completion_create_params import (
     CompletionCreateParamsNonStreaming,
@@ -75,6 +76,14 @@ class ModelParamHelper:
         combined_kwargs = combined_kwargs.difference(exclude_kwargs)
         return combined_kwargs
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_all_llm_api_params_cached() -> FrozenSet[str]:
+        """
+        Same as _get_all_llm_api_params, but only computed once. Use this on hot paths (e.g. cache key generation)
+        """
+        return frozenset(ModelParamHelper._get_all_llm_api_params())
+
     @staticmethod
     def get_litellm_provider_specific_params_for_chat_params() -> Set[str]:
         return set(["thinking"])
@@ -0,0 +1,171 @@
+"""
+Raw SSE passthrough for OpenAI-compatible streams
+
+When `litellm.enable_sse_passthrough` is set, the proxy forwards the upstream's SSE bytes to the client as is,
+instead of parsing every chunk into a `ModelResponseStream` and serializing it again.
+
+`IncrementalSSEParser` is fed the same bytes, and only keeps what logging and cost tracking need - the content,
+tool calls, finish reason and usage. At the end of the stream it builds the complete `ModelResponse` for the
+success callbacks.
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.core_helpers import map_finish_reason
+from litellm.types.utils import (
+    ChatCompletionMessageToolCall,
+    Choices,
+    Function,
+    Message,
+    ModelResponse,
+    Usage,
+)
+
+# providers whose `CustomStreamWrapper` reads an `openai.AsyncStream` - their SSE is already in the OpenAI format
+SSE_PASSTHROUGH_PROVIDERS = ("openai", "azure")
+
+
+class IncrementalSSEParser:
+    """
+    Parses the `data:` lines of an OpenAI chat completion stream as the bytes come in
+
+    Lines may be split across network chunks - the incomplete tail is kept until its newline arrives.
+    """
+
+    def __init__(self):
+        self._buffer = b""
+        self.id: Optional[str] = None
+        self.model: Optional[str] = None
+        self.created: Optional[int] = None
+        self.system_fingerprint: Optional[str] = None
+        self.content_parts: List[str] = []
+        self.finish_reason: Optional[str] = None
+        self.usage: Optional[dict] = None
+        # tool call index -> {"id", "type", "name", "arguments" parts}
+        self.tool_calls: Dict[int, Dict[str, Any]] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        if self._buffer:
+            chunk = self._buffer + chunk
+        lines = chunk.split(b"\n")
+        self._buffer = lines.pop()
+        for line in lines:
+            self._parse_line(line)
+
+    def close(self) -> None:
+        """Parse the last line, if the stream didn't end with a newline"""
+        if self._buffer:
+            self._parse_line(self._buffer)
+            self._buffer = b""
+
+    def _parse_line(self, line: bytes) -> None:
+        if not line.startswith(b"data:"):
+            return  # blank separator lines, comments, `event:` lines
+        payload = line[5:].strip()
+        if not payload or payload == b"[DONE]":
+            return
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            verbose_logger.debug("IncrementalSSEParser: skipping non-json line")
+            return
+        if not isinstance(data, dict):
+            return
+        if self.id is None:
+            self.id = data.get("id")
+            self.model = data.get("model")
+            self.created = data.get("created")
+        if data.get("system_fingerprint") is not None:
+            self.system_fingerprint = data["system_fingerprint"]
+        if data.get("usage"):
+            self.usage = data["usage"]
+        for choice in data.get("choices") or []:
+            if choice.get("index", 0) != 0:
+                continue  # n > 1 - only the first choice is logged
+            if choice.get("finish_reason") is not None:
+                self.finish_reason = choice["finish_reason"]
+            delta = choice.get("delta") or {}
+            content = delta.get("content")
+            if content:
+                self.content_parts.append(content)
+            for tool_call in delta.get("tool_calls") or []:
+                self._add_tool_call_delta(tool_call)
+
+    def _add_tool_call_delta(self, tool_call: dict) -> None:
+        index = tool_call.get("index", 0)
+        tracked = self.tool_calls.get(index)
+        if tracked is None:
+            tracked = self.tool_calls[index] = {
+                "id": None,
+                "type": "function",
+                "name": None,
+                "arguments": [],
+            }
+        if tool_call.get("id"):
+            tracked["id"] = tool_call["id"]
+        function = tool_call.get("function") or {}
+        if function.get("name"):
+            tracked["name"] = function["name"]
+        if function.get("arguments"):
+            tracked["arguments"].append(function["arguments"])
+
+    def build_model_response(
+        self, model: Optional[str], messages: Optional[list]
+    ) -> ModelResponse:
+        """
+        The complete response - usage is counted from the messages and content if the upstream didn't send it
+        """
+        content = "".join(self.content_parts)
+        tool_calls = None
+        if self.tool_calls:
+            tool_calls = [
+                ChatCompletionMessageToolCall(
+                    id=tool_call["id"],
+                    type=tool_call["type"],
+                    function=Function(
+                        name=tool_call["name"],
+                        arguments="".join(tool_call["arguments"]),
+                    ),
+                )
+                for _, tool_call in sorted(self.tool_calls.items())
+            ]
+        model_response = ModelResponse(
+            id=self.id,
+            created=self.created or int(time.time()),
+            model=self.model or model,
+            system_fingerprint=self.system_fingerprint,
+            choices=[
+                Choices(
+                    index=0,
+                    finish_reason=map_finish_reason(self.finish_reason or "stop"),
+                    message=Message(
+                        content=content or None,
+                        role="assistant",
+                        tool_calls=tool_calls,
+                    ),
+                )
+            ],
+        )
+        if self.usage is not None:
+            usage = Usage(**self.usage)
+        else:
+            from litellm.utils import token_counter
+
+            prompt_tokens = token_counter(model=model or "", messages=messages or [])
+            completion_text = content + "".join(
+                "".join(tool_call["arguments"])
+                for tool_call in self.tool_calls.values()
+            )
+            completion_tokens = token_counter(
+                model=model or "", text=completion_text, count_response_tokens=True
+            )
+            usage = Usage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            )
+        setattr(model_response, "usage", usage)
+        return model_response
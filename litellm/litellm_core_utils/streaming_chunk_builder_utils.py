@@ -6,6 +6,7 @@ from litellm.types.llms.openai import (
     ChatCompletionAssistantContentValue,
     ChatCompletionAudioDelta,
 )
+from litellm._logging import verbose_logger
 from litellm.types.utils import (
     ChatCompletionAudioResponse,
     ChatCompletionMessageToolCall,
@@ -18,7 +19,9 @@ from litellm.types.utils import (
     ModelResponseStream,
     PromptTokensDetailsWrapper,
     Usage,
-    ServerToolUse
+    ServerToolUse,
+    TextChoices,
+    TextCompletionResponse,
 )
 from litellm.utils import print_verbose, token_counter
 
@@ -116,65 +119,75 @@ class ChunkProcessor:
     def get_combined_tool_content(
         self, tool_call_chunks: List[Dict[str, Any]]
     ) -> List[ChatCompletionMessageToolCall]:
-        tool_calls_list: List[ChatCompletionMessageToolCall] = []
         tool_call_map: Dict[int, Dict[str, Any]] = (
             {}
         )  # Map to store tool calls by index
 
         for chunk in tool_call_chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                tool_calls = delta.get("tool_calls", [])
-
-                for tool_call in tool_calls:
-                    if not tool_call or not hasattr(tool_call, "function"):
-                        continue
-
-                    index = getattr(tool_call, "index", 0)
-                    if index not in tool_call_map:
-                        tool_call_map[index] = {
-                            "id": None,
-                            "name": None,
-                            "type": None,
-                            "arguments": [],
-                            "provider_specific_fields": None,
-                        }
-
-                    if hasattr(tool_call, "id") and tool_call.id:
-                        tool_call_map[index]["id"] = tool_call.id
-                    if hasattr(tool_call, "type") and tool_call.type:
-                        tool_call_map[index]["type"] = tool_call.type
-                    if hasattr(tool_call, "function"):
-                        if (
-                            hasattr(tool_call.function, "name")
-                            and tool_call.function.name
-                        ):
-                            tool_call_map[index]["name"] = tool_call.function.name
-                        if (
-                            hasattr(tool_call.function, "arguments")
-                            and tool_call.function.arguments
-                        ):
-                            tool_call_map[index]["arguments"].append(
-                                tool_call.function.arguments
-                            )
-                    
-                    # Preserve provider_specific_fields from streaming chunks
-                    provider_fields = None
-                    if hasattr(tool_call, "provider_specific_fields") and tool_call.provider_specific_fields:
-                        provider_fields = tool_call.provider_specific_fields
-                    elif hasattr(tool_call, "function") and hasattr(tool_call.function, "provider_specific_fields") and tool_call.function.provider_specific_fields:
-                        provider_fields = tool_call.function.provider_specific_fields
-                    
-                    if provider_fields:
-                        # Merge provider_specific_fields if multiple chunks have them
-                        if tool_call_map[index]["provider_specific_fields"] is None:
-                            tool_call_map[index]["provider_specific_fields"] = {}
-                        if isinstance(provider_fields, dict):
-                            tool_call_map[index]["provider_specific_fields"].update(
-                                provider_fields
-                            )
+            self._add_tool_call_chunk(tool_call_map=tool_call_map, chunk=chunk)
+
+        return self._build_tool_calls(tool_call_map=tool_call_map)
 
+    @staticmethod
+    def _add_tool_call_chunk(
+        tool_call_map: Dict[int, Dict[str, Any]], chunk: Dict[str, Any]
+    ) -> None:
+        """Merge the tool call deltas of a chunk into `tool_call_map` - tool calls by index"""
+        choices = chunk["choices"]
+        for choice in choices:
+            delta = choice.get("delta", {})
+            tool_calls = delta.get("tool_calls", [])
+
+            for tool_call in tool_calls:
+                if not tool_call or not hasattr(tool_call, "function"):
+                    continue
+
+                index = getattr(tool_call, "index", 0)
+                if index not in tool_call_map:
+                    tool_call_map[index] = {
+                        "id": None,
+                        "name": None,
+                        "type": None,
+                        "arguments": [],
+                        "provider_specific_fields": None,
+                    }
+
+                if hasattr(tool_call, "id") and tool_call.id:
+                    tool_call_map[index]["id"] = tool_call.id
+                if hasattr(tool_call, "type") and tool_call.type:
+                    tool_call_map[index]["type"] = tool_call.type
+                if hasattr(tool_call, "function"):
+                    if hasattr(tool_call.function, "name") and tool_call.function.name:
+                        tool_call_map[index]["name"] = tool_call.function.name
+                    if (
+                        hasattr(tool_call.function, "arguments")
+                        and tool_call.function.arguments
+                    ):
+                        tool_call_map[index]["arguments"].append(
+                            tool_call.function.arguments
+                        )
+                
+                # Preserve provider_specific_fields from streaming chunks
+                provider_fields = None
+                if hasattr(tool_call, "provider_specific_fields") and tool_call.provider_specific_fields:
+                    provider_fields = tool_call.provider_specific_fields
+                elif hasattr(tool_call, "function") and hasattr(tool_call.function, "provider_specific_fields") and tool_call.function.provider_specific_fields:
+                    provider_fields = tool_call.function.provider_specific_fields
+                
+                if provider_fields:
+                    # Merge provider_specific_fields if multiple chunks have them
+                    if tool_call_map[index]["provider_specific_fields"] is None:
+                        tool_call_map[index]["provider_specific_fields"] = {}
+                    if isinstance(provider_fields, dict):
+                        tool_call_map[index]["provider_specific_fields"].update(
+                            provider_fields
+                        )
+
+    @staticmethod
+    def _build_tool_calls(
+        tool_call_map: Dict[int, Dict[str, Any]]
+    ) -> List[ChatCompletionMessageToolCall]:
+        tool_calls_list: List[ChatCompletionMessageToolCall] = []
         # Convert the map to a list of tool calls
         for index in sorted(tool_call_map.keys()):
             tool_call_data = tool_call_map[index]
@@ -212,16 +225,7 @@ class ChunkProcessor:
         function_call_name = function_call.name
 
         for chunk in function_call_chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                function_call = delta.get("function_call", "")
-
-                # Check if a function call is present
-                if function_call:
-                    # Now, function_call is expected to be a dictionary
-                    arguments = function_call.arguments
-                    argument_list.append(arguments)
+            self._add_function_call_chunk(argument_list=argument_list, chunk=chunk)
 
         combined_arguments = "".join(argument_list)
 
@@ -230,18 +234,29 @@ class ChunkProcessor:
             arguments=combined_arguments,
         )
 
+    @staticmethod
+    def _add_function_call_chunk(
+        argument_list: List[str], chunk: Dict[str, Any]
+    ) -> None:
+        choices = chunk["choices"]
+        for choice in choices:
+            delta = choice.get("delta", {})
+            function_call = delta.get("function_call", "")
+
+            # Check if a function call is present
+            if function_call:
+                # Now, function_call is expected to be a dictionary
+                arguments = function_call.arguments
+                argument_list.append(arguments)
+
     def get_combined_content(
         self, chunks: List[Dict[str, Any]], delta_key: str = "content"
     ) -> ChatCompletionAssistantContentValue:
         content_list: List[str] = []
         for chunk in chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                content = delta.get(delta_key, "")
-                if content is None:
-                    continue  # openai v1.0.0 sets content = None for chunks
-                content_list.append(content)
+            self._add_content_chunk(
+                content_list=content_list, chunk=chunk, delta_key=delta_key
+            )
 
         # Combine the "content" strings into a single string || combine the 'function' strings into a single string
         combined_content = "".join(content_list)
@@ -249,12 +264,72 @@ class ChunkProcessor:
         # Update the "content" field within the response dictionary
         return combined_content
 
+    @staticmethod
+    def _add_content_chunk(
+        content_list: List[str], chunk: Dict[str, Any], delta_key: str = "content"
+    ) -> None:
+        choices = chunk["choices"]
+        for choice in choices:
+            delta = choice.get("delta", {})
+            content = delta.get(delta_key, "")
+            if content is None:
+                continue  # openai v1.0.0 sets content = None for chunks
+            content_list.append(content)
+
     def get_combined_thinking_content(
         self, chunks: List[Dict[str, Any]]
     ) -> Optional[
         List[
             Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
         ]
+    ]:
+        thinking_state = self._new_thinking_state()
+        for chunk in chunks:
+            self._add_thinking_chunk(thinking_state=thinking_state, chunk=chunk)
+        return self._build_thinking_blocks(thinking_state=thinking_state)
+
+    @staticmethod
+    def _new_thinking_state() -> Dict[str, Any]:
+        return {
+            "combined_thinking_text": None,
+            "data": None,
+            "signature": None,
+            "type": "thinking",
+        }
+
+    @staticmethod
+    def _add_thinking_chunk(
+        thinking_state: Dict[str, Any], chunk: Dict[str, Any]
+    ) -> None:
+        choices = chunk["choices"]
+        for choice in choices:
+            delta = choice.get("delta", {})
+            thinking = delta.get("thinking_blocks", None)
+            if thinking and isinstance(thinking, list):
+                for thinking_block in thinking:
+                    thinking_type = thinking_block.get("type", None)
+                    if thinking_type and thinking_type == "redacted_thinking":
+                        thinking_state["type"] = "redacted_thinking"
+                        thinking_state["data"] = thinking_block.get("data", None)
+                    else:
+                        thinking_state["type"] = "thinking"
+                        thinking_text = thinking_block.get("thinking", None)
+                        if thinking_text:
+                            if thinking_state["combined_thinking_text"] is None:
+                                thinking_state["combined_thinking_text"] = ""
+
+                            thinking_state["combined_thinking_text"] += thinking_text
+                        thinking_state["signature"] = thinking_block.get(
+                            "signature", None
+                        )
+
+    @staticmethod
+    def _build_thinking_blocks(
+        thinking_state: Dict[str, Any]
+    ) -> Optional[
+        List[
+            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
+        ]
     ]:
         from litellm.types.llms.openai import (
             ChatCompletionRedactedThinkingBlock,
@@ -264,30 +339,10 @@ class ChunkProcessor:
         thinking_blocks: List[
             Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
         ] = []
-        combined_thinking_text: Optional[str] = None
-        data: Optional[str] = None
-        signature: Optional[str] = None
-        type: Literal["thinking", "redacted_thinking"] = "thinking"
-        for chunk in chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                thinking = delta.get("thinking_blocks", None)
-                if thinking and isinstance(thinking, list):
-                    for thinking_block in thinking:
-                        thinking_type = thinking_block.get("type", None)
-                        if thinking_type and thinking_type == "redacted_thinking":
-                            type = "redacted_thinking"
-                            data = thinking_block.get("data", None)
-                        else:
-                            type = "thinking"
-                            thinking_text = thinking_block.get("thinking", None)
-                            if thinking_text:
-                                if combined_thinking_text is None:
-                                    combined_thinking_text = ""
-
-                                combined_thinking_text += thinking_text
-                            signature = thinking_block.get("signature", None)
+        combined_thinking_text: Optional[str] = thinking_state["combined_thinking_text"]
+        data: Optional[str] = thinking_state["data"]
+        signature: Optional[str] = thinking_state["signature"]
+        type: Literal["thinking", "redacted_thinking"] = thinking_state["type"]
 
         if combined_thinking_text and type == "thinking" and signature:
             thinking_blocks.append(
@@ -409,90 +464,97 @@ class ChunkProcessor:
         self,
         chunks: List[Union[Dict[str, Any], ModelResponse]],
     ) -> "UsagePerChunk":
+        usage_per_chunk = self._new_usage_per_chunk()
+        for chunk in chunks:
+            self._add_usage_chunk(usage_per_chunk=usage_per_chunk, chunk=chunk)
+        return usage_per_chunk
+
+    @staticmethod
+    def _new_usage_per_chunk() -> "UsagePerChunk":
         from litellm.types.litellm_core_utils.streaming_chunk_builder_utils import (
             UsagePerChunk,
         )
 
-        # # Update usage information if needed
-        prompt_tokens = 0
-        completion_tokens = 0
-        ## anthropic prompt caching information ##
-        cache_creation_input_tokens: Optional[int] = None
-        cache_read_input_tokens: Optional[int] = None
-        
-        server_tool_use: Optional[ServerToolUse] = None
-        web_search_requests: Optional[int] = None
-        completion_tokens_details: Optional[CompletionTokensDetails] = None
-        prompt_tokens_details: Optional[PromptTokensDetailsWrapper] = None
-        for chunk in chunks:
-            usage_chunk: Optional[Usage] = None
-            if "usage" in chunk:
-                usage_chunk = chunk["usage"]
-            elif (
-                isinstance(chunk, ModelResponse)
-                or isinstance(chunk, ModelResponseStream)
-            ) and hasattr(chunk, "_hidden_params"):
-                usage_chunk = chunk._hidden_params.get("usage", None)
-
-            if usage_chunk is not None:
-                usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
-                if (
-                    usage_chunk_dict["prompt_tokens"] is not None
-                    and usage_chunk_dict["prompt_tokens"] > 0
-                ):
-                    prompt_tokens = usage_chunk_dict["prompt_tokens"]
-                if (
-                    usage_chunk_dict["completion_tokens"] is not None
-                    and usage_chunk_dict["completion_tokens"] > 0
-                ):
-                    completion_tokens = usage_chunk_dict["completion_tokens"]
-                if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_creation_input_tokens"] > 0
-                    or cache_creation_input_tokens is None
-                ):
-                    cache_creation_input_tokens = usage_chunk_dict[
-                        "cache_creation_input_tokens"
-                    ]
-                if usage_chunk_dict["cache_read_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_read_input_tokens"] > 0
-                    or cache_read_input_tokens is None
-                ):
-                    cache_read_input_tokens = usage_chunk_dict[
-                        "cache_read_input_tokens"
-                    ]
-                if usage_chunk_dict["completion_tokens_details"] is not None:
-                    completion_tokens_details = usage_chunk_dict[
-                        "completion_tokens_details"
-                    ]
-                if hasattr(usage_chunk, 'server_tool_use') and usage_chunk.server_tool_use is not None:
-                    server_tool_use = usage_chunk.server_tool_use
-                if (
-                    usage_chunk_dict["prompt_tokens_details"] is not None
-                    and getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                        None,
-                    )
-                    is not None
-                ):
-                    web_search_requests = getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                    )
-
-                prompt_tokens_details = usage_chunk_dict["prompt_tokens_details"]
-
         return UsagePerChunk(
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            cache_creation_input_tokens=cache_creation_input_tokens,
-            cache_read_input_tokens=cache_read_input_tokens,
-            server_tool_use=server_tool_use,
-            web_search_requests=web_search_requests,
-            completion_tokens_details=completion_tokens_details,
-            prompt_tokens_details=prompt_tokens_details,
+            prompt_tokens=0,
+            completion_tokens=0,
+            ## anthropic prompt caching information ##
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=None,
+            server_tool_use=None,
+            web_search_requests=None,
+            completion_tokens_details=None,
+            prompt_tokens_details=None,
         )
 
+    def _add_usage_chunk(
+        self,
+        usage_per_chunk: "UsagePerChunk",
+        chunk: Union[Dict[str, Any], ModelResponse],
+    ) -> None:
+        """Update `usage_per_chunk` with the usage of a chunk - the latest non-zero values win"""
+        usage_chunk: Optional[Usage] = None
+        if "usage" in chunk:
+            usage_chunk = chunk["usage"]
+        elif (
+            isinstance(chunk, ModelResponse) or isinstance(chunk, ModelResponseStream)
+        ) and hasattr(chunk, "_hidden_params"):
+            usage_chunk = chunk._hidden_params.get("usage", None)
+
+        if usage_chunk is None:
+            return
+        usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
+        if (
+            usage_chunk_dict["prompt_tokens"] is not None
+            and usage_chunk_dict["prompt_tokens"] > 0
+        ):
+            usage_per_chunk["prompt_tokens"] = usage_chunk_dict["prompt_tokens"]
+        if (
+            usage_chunk_dict["completion_tokens"] is not None
+            and usage_chunk_dict["completion_tokens"] > 0
+        ):
+            usage_per_chunk["completion_tokens"] = usage_chunk_dict["completion_tokens"]
+        if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
+            usage_chunk_dict["cache_creation_input_tokens"] > 0
+            or usage_per_chunk["cache_creation_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_creation_input_tokens"] = usage_chunk_dict[
+                "cache_creation_input_tokens"
+            ]
+        if usage_chunk_dict["cache_read_input_tokens"] is not None and (
+            usage_chunk_dict["cache_read_input_tokens"] > 0
+            or usage_per_chunk["cache_read_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_read_input_tokens"] = usage_chunk_dict[
+                "cache_read_input_tokens"
+            ]
+        if usage_chunk_dict["completion_tokens_details"] is not None:
+            usage_per_chunk["completion_tokens_details"] = usage_chunk_dict[
+                "completion_tokens_details"
+            ]
+        if (
+            hasattr(usage_chunk, "server_tool_use")
+            and usage_chunk.server_tool_use is not None
+        ):
+            usage_per_chunk["server_tool_use"] = usage_chunk.server_tool_use
+        if (
+            usage_chunk_dict["prompt_tokens_details"] is not None
+            and getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+                None,
+            )
+            is not None
+        ):
+            usage_per_chunk["web_search_requests"] = getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+            )
+
+        usage_per_chunk["prompt_tokens_details"] = usage_chunk_dict[
+            "prompt_tokens_details"
+        ]
+
     def calculate_usage(
         self,
         chunks: List[Union[Dict[str, Any], ModelResponse]],
@@ -504,10 +566,25 @@ class ChunkProcessor:
         """
         Calculate usage for the given chunks.
         """
+        return self._calculate_usage_from_usage_per_chunk(
+            calculated_usage_per_chunk=self._calculate_usage_per_chunk(chunks=chunks),
+            model=model,
+            completion_output=completion_output,
+            messages=messages,
+            reasoning_tokens=reasoning_tokens,
+        )
+
+    def _calculate_usage_from_usage_per_chunk(
+        self,
+        calculated_usage_per_chunk: "UsagePerChunk",
+        model: str,
+        completion_output: str,
+        messages: Optional[List] = None,
+        reasoning_tokens: Optional[int] = None,
+    ) -> Usage:
         returned_usage = Usage()
         # # Update usage information if needed
 
-        calculated_usage_per_chunk = self._calculate_usage_per_chunk(chunks=chunks)
         prompt_tokens = calculated_usage_per_chunk["prompt_tokens"]
         completion_tokens = calculated_usage_per_chunk["completion_tokens"]
         ## anthropic prompt caching information ##
@@ -603,6 +680,243 @@ class ChunkProcessor:
         return returned_usage
 
 
+class StreamingResponseAssembler(ChunkProcessor):
+    """
+    Builds the complete response of a stream as its chunks arrive - what `stream_chunk_builder` returns for
+    the same chunks, without keeping every chunk alive until the end of the stream.
+
+    Each chunk is folded into running builders (content parts, tool call argument buffers, usage) when the
+    next one is added - the latest chunk is held back, as the stream wrapper still updates it after adding it
+    (e.g. its hidden usage). Chunks must be added in order - `ChunkProcessor` sorts by `created_at`, which the
+    stream wrapper sets on arrival.
+
+    Audio chunks are kept (their data is needed in full anyway), and so are text completion chunks - those
+    are built by `stream_chunk_builder_text_completion`.
+    """
+
+    def __init__(self, messages: Optional[list] = None):
+        self.messages = messages
+        self.first_chunk: Optional[Any] = None
+        self.last_chunk: Optional[Any] = None
+        self.num_chunks = 0
+        self._pending_chunk: Optional[Any] = None
+        self._text_completion_chunks: Optional[List[Any]] = None
+
+        self._id = ""
+        self._finish_reason: Optional[str] = "stop"
+        self._tool_call_map: Optional[Dict[int, Dict[str, Any]]] = None
+        self._function_call_name: Optional[str] = None
+        self._function_call_arguments: Optional[List[str]] = None
+        self._content_parts: Optional[List[str]] = None
+        self._thinking_state: Optional[Dict[str, Any]] = None
+        self._reasoning_parts: Optional[List[str]] = None
+        self._annotations: Optional[Any] = None
+        self._audio_chunks: List[Any] = []
+        self._provider_specific_fields: Optional[Dict[str, Any]] = None
+        self._usage_per_chunk: "UsagePerChunk" = self._new_usage_per_chunk()
+
+    def add_chunk(self, chunk: Any) -> None:
+        if self.first_chunk is None:
+            self.first_chunk = chunk
+            if len(chunk["choices"]) > 0 and isinstance(
+                chunk["choices"][0], TextChoices
+            ):
+                self._text_completion_chunks = []
+        self.num_chunks += 1
+        if self._text_completion_chunks is not None:
+            self._text_completion_chunks.append(chunk)
+        if self._pending_chunk is not None:
+            self._fold_chunk(self._pending_chunk)
+        self._pending_chunk = chunk
+        self.last_chunk = chunk
+
+    @staticmethod
+    def _delta_has(chunk: Any, key: str) -> bool:
+        """The chunk's first choice has `key` set in its delta - how `stream_chunk_builder` picks chunks"""
+        return (
+            len(chunk["choices"]) > 0
+            and key in chunk["choices"][0]["delta"]
+            and chunk["choices"][0]["delta"][key] is not None
+        )
+
+    def _fold_chunk(self, chunk: Any) -> None:
+        if self._text_completion_chunks is not None:
+            return
+        if not self._id and chunk.get("id"):
+            self._id = chunk["id"]
+        if "choices" in chunk and len(chunk["choices"]) > 0:
+            if hasattr(chunk["choices"][0], "finish_reason"):
+                self._finish_reason = chunk["choices"][0].finish_reason
+            elif "finish_reason" in chunk["choices"][0]:
+                self._finish_reason = chunk["choices"][0]["finish_reason"]
+
+            if self._delta_has(chunk, "tool_calls"):
+                if self._tool_call_map is None:
+                    self._tool_call_map = {}
+                self._add_tool_call_chunk(tool_call_map=self._tool_call_map, chunk=chunk)
+            if self._delta_has(chunk, "function_call"):
+                if self._function_call_arguments is None:
+                    self._function_call_name = chunk["choices"][0]["delta"][
+                        "function_call"
+                    ].name
+                    self._function_call_arguments = []
+                self._add_function_call_chunk(
+                    argument_list=self._function_call_arguments, chunk=chunk
+                )
+            if self._delta_has(chunk, "content"):
+                if self._content_parts is None:
+                    self._content_parts = []
+                self._add_content_chunk(content_list=self._content_parts, chunk=chunk)
+            if self._delta_has(chunk, "thinking_blocks"):
+                if self._thinking_state is None:
+                    self._thinking_state = self._new_thinking_state()
+                self._add_thinking_chunk(
+                    thinking_state=self._thinking_state, chunk=chunk
+                )
+            if self._delta_has(chunk, "reasoning_content"):
+                if self._reasoning_parts is None:
+                    self._reasoning_parts = []
+                self._add_content_chunk(
+                    content_list=self._reasoning_parts,
+                    chunk=chunk,
+                    delta_key="reasoning_content",
+                )
+            if self._annotations is None and self._delta_has(chunk, "annotations"):
+                self._annotations = chunk["choices"][0]["delta"]["annotations"]
+            if self._delta_has(chunk, "audio"):
+                self._audio_chunks.append(chunk)
+            if self._delta_has(chunk, "provider_specific_fields"):
+                fields = chunk["choices"][0]["delta"]["provider_specific_fields"]
+                if isinstance(fields, dict):
+                    if self._provider_specific_fields is None:
+                        self._provider_specific_fields = {}
+                    # later chunks win - e.g. the last (most complete) web_search_results
+                    self._provider_specific_fields.update(fields)
+        self._add_usage_chunk(usage_per_chunk=self._usage_per_chunk, chunk=chunk)
+
+    def _build_base_response(self) -> ModelResponse:
+        chunk = cast(Any, self.first_chunk)
+        response = ModelResponse(
+            **{
+                "id": self._id,
+                "object": chunk["object"],
+                "created": chunk["created"],
+                "model": chunk["model"],
+                "system_fingerprint": chunk.get("system_fingerprint", None),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": chunk["choices"][0]["delta"]["role"],
+                            "content": "",
+                        },
+                        "finish_reason": self._finish_reason,
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                },
+            }
+        )
+        # hidden params come from the last chunk - like `ChunkProcessor.build_base_response`
+        return self.update_model_response_with_hidden_params(
+            model_response=response, chunk=self.last_chunk
+        )
+
+    def build_response(
+        self, logging_obj: Optional[Any] = None
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        The complete response - None if no chunk was added
+
+        Raises the same `APIError` as `stream_chunk_builder` if it can't be built.
+        """
+        import litellm
+        from litellm.litellm_core_utils.prompt_templates.common_utils import (
+            get_content_from_model_response,
+        )
+
+        if self.first_chunk is None:
+            return None
+        if self._text_completion_chunks is not None:
+            return litellm.stream_chunk_builder(
+                chunks=self._text_completion_chunks,
+                messages=self.messages,
+                logging_obj=logging_obj,
+            )
+        if self._pending_chunk is not None:
+            self._fold_chunk(self._pending_chunk)
+            self._pending_chunk = None
+        try:
+            model = self.first_chunk["model"]
+            response = self._build_base_response()
+            _choice = cast(Choices, response.choices[0])
+
+            if self._tool_call_map is not None:
+                _choice.message.content = None
+                _choice.message.tool_calls = self._build_tool_calls(
+                    tool_call_map=self._tool_call_map
+                )
+            if self._function_call_arguments is not None:
+                _choice.message.content = None
+                _choice.message.function_call = FunctionCall(
+                    name=self._function_call_name,
+                    arguments="".join(self._function_call_arguments),
+                )
+            if self._content_parts is not None:
+                response["choices"][0]["message"]["content"] = "".join(
+                    self._content_parts
+                )
+            if self._thinking_state is not None:
+                response["choices"][0]["message"][
+                    "thinking_blocks"
+                ] = self._build_thinking_blocks(thinking_state=self._thinking_state)
+            if self._reasoning_parts is not None:
+                response["choices"][0]["message"]["reasoning_content"] = "".join(
+                    self._reasoning_parts
+                )
+            if self._annotations is not None:
+                response["choices"][0]["message"]["annotations"] = self._annotations
+            if len(self._audio_chunks) > 0:
+                _choice.message.audio = self.get_combined_audio_content(
+                    self._audio_chunks
+                )
+            if self._provider_specific_fields:
+                _choice.message.provider_specific_fields = self._provider_specific_fields
+
+            usage = self._calculate_usage_from_usage_per_chunk(
+                calculated_usage_per_chunk=self._usage_per_chunk,
+                model=model,
+                completion_output=get_content_from_model_response(response),
+                messages=self.messages,
+                reasoning_tokens=self.count_reasoning_tokens(response),
+            )
+            setattr(response, "usage", usage)
+
+            # Add cost to usage object if include_cost_in_streaming_usage is True
+            if litellm.include_cost_in_streaming_usage and logging_obj is not None:
+                setattr(
+                    usage,
+                    "cost",
+                    logging_obj._response_cost_calculator(result=response),
+                )
+            return response
+        except Exception as e:
+            verbose_logger.exception(
+                "StreamingResponseAssembler.build_response() - Exception occurred - {}".format(
+                    str(e)
+                )
+            )
+            raise litellm.APIError(
+                status_code=500,
+                message="Error building chunks for logging/streaming usage calculation",
+                llm_provider="",
+                model="",
+            )
+
+
 def concatenate_base64_list(base64_strings: List[str]) -> str:
     """
     Concatenates a list of base64-encoded strings.
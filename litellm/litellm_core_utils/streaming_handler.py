@@ -1,13 +1,25 @@
 import asyncio
 import collections.abc
 import datetime
+import itertools
 import json
 import threading
 import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 
 import httpx
+from openai import AsyncStream
 from pydantic import BaseModel
 
 import litellm
@@ -17,6 +29,13 @@ from litellm.litellm_core_utils.model_response_utils import (
     is_model_response_stream_empty,
 )
 from litellm.litellm_core_utils.redact_messages import LiteLLMLoggingObject
+from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+    StreamingResponseAssembler,
+)
+from litellm.litellm_core_utils.sse_passthrough import (
+    SSE_PASSTHROUGH_PROVIDERS,
+    IncrementalSSEParser,
+)
 from litellm.litellm_core_utils.thread_pool_executor import executor
 from litellm.types.llms.openai import ChatCompletionChunk
 from litellm.types.router import GenericLiteLLMParams
@@ -57,10 +76,13 @@ def is_async_iterable(obj: Any) -> bool:
     return isinstance(obj, collections.abc.AsyncIterable)
 
 
-def print_verbose(print_statement):
+def print_verbose(print_statement, *args):
+    """
+    Print when `litellm.set_verbose` is set - `args` are %-formatted into the statement only then
+    """
     try:
         if litellm.set_verbose:
-            print(print_statement)  # noqa
+            print(print_statement % args if args else print_statement)  # noqa
     except Exception:
         pass
 
@@ -110,7 +132,8 @@ class CustomStreamWrapper:
         ]
         self.holding_chunk = ""
         self.complete_response = ""
-        self.response_uptil_now = ""
+        # content so far - joined into `response_uptil_now` only when it's read
+        self._response_parts: List[str] = []
         _model_info: Dict = litellm_params.model_info or {}
 
         _api_base = get_api_base(
@@ -142,9 +165,14 @@ class CustomStreamWrapper:
             True if self.check_send_stream_usage(self.stream_options) else False
         )
         self.tool_call = False
-        self.chunks: List = (
-            []
-        )  # keep track of the returned chunks - used for calculating the input/output tokens for stream options
+        # the latest chunks - for the safety checker. The complete response is folded together as they arrive
+        self.chunks: Deque = collections.deque(
+            maxlen=litellm.REPEATED_STREAMING_CHUNK_LIMIT
+        )
+        self.stream_assembler = StreamingResponseAssembler(messages=self.messages)
+        # token counts of the latest usage chunk - see `calculate_total_usage`
+        self._total_prompt_tokens = 0
+        self._total_completion_tokens = 0
         self.is_function_call = self.check_is_function_call(logging_obj=logging_obj)
         self.created: Optional[int] = None
 
@@ -154,6 +182,58 @@ class CustomStreamWrapper:
     def __aiter__(self):
         return self
 
+    @property
+    def response_uptil_now(self) -> str:
+        if len(self._response_parts) > 1:
+            self._response_parts = ["".join(self._response_parts)]
+        return self._response_parts[0] if self._response_parts else ""
+
+    @response_uptil_now.setter
+    def response_uptil_now(self, value: str) -> None:
+        self._response_parts = [value] if value else []
+
+    def _add_chunk(self, chunk: ModelResponseStream) -> None:
+        """Add a chunk to the complete response - it's not kept beyond the last `REPEATED_STREAMING_CHUNK_LIMIT`"""
+        if self.chunks:
+            # the previous chunk is final now - the latest one can still get its usage set after it's added
+            self._add_usage_chunk(self.chunks[-1])
+        self.chunks.append(chunk)
+        self.stream_assembler.add_chunk(chunk)
+
+    def _add_usage_chunk(self, chunk: ModelResponseStream) -> None:
+        if "usage" in chunk:
+            if "prompt_tokens" in chunk["usage"]:
+                self._total_prompt_tokens = chunk["usage"].get("prompt_tokens", 0) or 0
+            if "completion_tokens" in chunk["usage"]:
+                self._total_completion_tokens = (
+                    chunk["usage"].get("completion_tokens", 0) or 0
+                )
+
+    def _calculate_total_usage(self) -> Usage:
+        """`calculate_total_usage` of all the chunks added so far"""
+        if self.chunks:
+            self._add_usage_chunk(self.chunks[-1])
+        return Usage(
+            prompt_tokens=self._total_prompt_tokens,
+            completion_tokens=self._total_completion_tokens,
+            total_tokens=self._total_prompt_tokens + self._total_completion_tokens,
+        )
+
+    def _track_response_uptil_now(self, processed_chunk: ModelResponseStream) -> None:
+        """
+        Add the chunk's content to the response so far, and run the post-call rules on it
+
+        The response so far is only joined if post-call rules are set - appending to a string on
+        every chunk is quadratic in the length of the response.
+        """
+        choice = processed_chunk.choices[0]
+        if isinstance(choice, StreamingChoices):
+            content = choice.delta.get("content", "")
+            if content:
+                self._response_parts.append(content)
+        if litellm.post_call_rules:
+            self.rules.post_call_rules(input=self.response_uptil_now, model=self.model)
+
     def check_send_stream_usage(self, stream_options: Optional[dict]):
         return (
             stream_options is not None
@@ -199,27 +279,29 @@ class CustomStreamWrapper:
         Raises - InternalServerError, if LLM enters infinite loop while streaming
         """
         if len(self.chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
-            # Get the last n chunks
-            last_chunks = self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
+            last_content = self.chunks[-1].choices[0].delta.content
+            if (
+                last_content is None
+                or not isinstance(last_content, str)
+                or len(last_content) <= 2
+            ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
+                return
 
-            # Extract the relevant content from the chunks
-            last_contents = [chunk.choices[0].delta.content for chunk in last_chunks]
+            # Check if the last n chunks are identical - newest first, so this stops at the 1st different chunk
+            for chunk in itertools.islice(
+                reversed(self.chunks), 1, litellm.REPEATED_STREAMING_CHUNK_LIMIT
+            ):
+                if chunk.choices[0].delta.content != last_content:
+                    return
 
-            # Check if all extracted contents are identical
-            if all(content == last_contents[0] for content in last_contents):
-                if (
-                    last_contents[0] is not None
-                    and isinstance(last_contents[0], str)
-                    and len(last_contents[0]) > 2
-                ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
-                    # All last n chunks are identical
-                    raise litellm.InternalServerError(
-                        message="The model is repeating the same chunk = {}.".format(
-                            last_contents[0]
-                        ),
-                        model="",
-                        llm_provider="",
-                    )
+            # All last n chunks are identical
+            raise litellm.InternalServerError(
+                message="The model is repeating the same chunk = {}.".format(
+                    last_content
+                ),
+                model="",
+                llm_provider="",
+            )
 
     def check_special_tokens(self, chunk: str, finish_reason: Optional[str]):
         """
@@ -265,10 +347,10 @@ class CustomStreamWrapper:
             text = ""
             is_finished = False
             finish_reason = ""
-            print_verbose(f"chunk: {chunk}")
+            print_verbose("chunk: %s", chunk)
             if chunk.startswith("data:"):
                 data_json = json.loads(chunk[5:])
-                print_verbose(f"data json: {data_json}")
+                print_verbose("data json: %s", data_json)
                 if "token" in data_json and "text" in data_json["token"]:
                     text = data_json["token"]["text"]
                 if data_json.get("details", False) and data_json["details"].get(
@@ -371,7 +453,7 @@ class CustomStreamWrapper:
         is_finished = False
         finish_reason = ""
         text = ""
-        print_verbose(f"chunk: {chunk}")
+        print_verbose("chunk: %s", chunk)
         if "data: [DONE]" in chunk:
             text = ""
             is_finished = True
@@ -391,7 +473,10 @@ class CustomStreamWrapper:
                         is_finished = True
                         finish_reason = data_json["choices"][0]["finish_reason"]
                 print_verbose(
-                    f"text: {text}; is_finished: {is_finished}; finish_reason: {finish_reason}"
+                    "text: %s; is_finished: %s; finish_reason: %s",
+                    text,
+                    is_finished,
+                    finish_reason,
                 )
                 return {
                     "text": text,
@@ -434,7 +519,7 @@ class CustomStreamWrapper:
 
     def handle_openai_chat_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             str_line = chunk
             text = ""
             is_finished = False
@@ -484,7 +569,7 @@ class CustomStreamWrapper:
 
     def handle_azure_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -505,7 +590,7 @@ class CustomStreamWrapper:
 
     def handle_openai_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -773,8 +858,9 @@ class CustomStreamWrapper:
         if self.sent_first_chunk is False:
             model_response.choices[0].delta["role"] = "assistant"
             self.sent_first_chunk = True
-        elif self.sent_first_chunk is True and hasattr(
-            model_response.choices[0].delta, "role"
+        elif (
+            self.sent_first_chunk is True
+            and getattr(model_response.choices[0].delta, "role", None) is not None
         ):
             _initial_delta = model_response.choices[0].delta.model_dump()
 
@@ -870,7 +956,10 @@ class CustomStreamWrapper:
         )
 
         print_verbose(
-            f"completion_obj: {completion_obj}, model_response.choices[0]: {model_response.choices[0]}, response_obj: {response_obj}"
+            "completion_obj: %s, model_response.choices[0]: %s, response_obj: %s",
+            completion_obj,
+            model_response.choices[0],
+            response_obj,
         )
         is_chunk_non_empty = self.is_chunk_non_empty(
             completion_obj, model_response, response_obj
@@ -898,11 +987,11 @@ class CustomStreamWrapper:
                                     choice_json.pop(
                                         "finish_reason", None
                                     )  # for mistral etc. which return a value in their last chunk (not-openai compatible).
-                                    print_verbose(f"choice_json: {choice_json}")
+                                    print_verbose("choice_json: %s", choice_json)
                                     choices.append(StreamingChoices(**choice_json))
                             except Exception:
                                 choices.append(StreamingChoices())
-                        print_verbose(f"choices in streaming: {choices}")
+                        print_verbose("choices in streaming: %s", choices)
                         setattr(model_response, "choices", choices)
                     else:
                         return
@@ -921,7 +1010,8 @@ class CustomStreamWrapper:
 
                     model_response = self.strip_role_from_delta(model_response)
                     verbose_logger.debug(
-                        f"model_response.choices[0].delta inside is_chunk_non_empty: {model_response.choices[0].delta}"
+                        "model_response.choices[0].delta inside is_chunk_non_empty: %s",
+                        model_response.choices[0].delta,
                     )
                 else:
                     ## else
@@ -953,7 +1043,7 @@ class CustomStreamWrapper:
 
                 # Default - return StopIteration
                 if hasattr(model_response, "usage"):
-                    self.chunks.append(model_response)
+                    self._add_chunk(model_response)
                 raise StopIteration
             # flush any remaining holding chunk
             if len(self.holding_chunk) > 0:
@@ -983,7 +1073,7 @@ class CustomStreamWrapper:
             return self._handle_special_delta_content(model_response)
         else:
             if hasattr(model_response, "usage"):
-                self.chunks.append(model_response)
+                self._add_chunk(model_response)
             return
 
     def _optional_combine_thinking_block_in_choices(
@@ -1229,13 +1319,13 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "triton":
                 response_obj = self.handle_triton_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "text-completion-openai":
                 response_obj = self.handle_openai_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if response_obj["usage"] is not None:
@@ -1256,7 +1346,7 @@ class CustomStreamWrapper:
                     litellm.CodestralTextCompletionConfig()._chunk_parser(chunk),
                 )
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if "usage" in response_obj is not None:
@@ -1272,7 +1362,7 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "azure_text":
                 response_obj = self.handle_azure_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "cached_response":
@@ -1292,7 +1382,7 @@ class CustomStreamWrapper:
                 completion_obj["content"] = response_obj["text"]
                 if response_obj["tool_calls"] is not None:
                     completion_obj["tool_calls"] = response_obj["tool_calls"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if hasattr(chunk, "id"):
                     model_response.id = chunk.id
                     self.response_id = chunk.id
@@ -1370,7 +1460,9 @@ class CustomStreamWrapper:
 
             model_response.model = self.model
             print_verbose(
-                f"model_response finish reason 3: {self.received_finish_reason}; response_obj={response_obj}"
+                "model_response finish reason 3: %s; response_obj=%s",
+                self.received_finish_reason,
+                response_obj,
             )
             ## FUNCTION CALL PARSING
             original_chunk = (
@@ -1431,7 +1523,7 @@ class CustomStreamWrapper:
                                             ):
                                                 t.function.arguments = ""
                             _json_delta = delta.model_dump()
-                            print_verbose(f"_json_delta: {_json_delta}")
+                            print_verbose("_json_delta: %s", _json_delta)
                             if "role" not in _json_delta or _json_delta["role"] is None:
                                 _json_delta[
                                     "role"
@@ -1465,10 +1557,10 @@ class CustomStreamWrapper:
                                 if original_chunk.choices[0].delta is None
                                 else dict(original_chunk.choices[0].delta)
                             )
-                            print_verbose(f"original delta: {delta}")
+                            print_verbose("original delta: %s", delta)
                             model_response.choices[0].delta = Delta(**delta)
                             print_verbose(
-                                f"new delta: {model_response.choices[0].delta}"
+                                "new delta: %s", model_response.choices[0].delta
                             )
                         except Exception:
                             model_response.choices[0].delta = Delta()
@@ -1480,9 +1572,11 @@ class CustomStreamWrapper:
                         return model_response
                     return
             print_verbose(
-                f"model_response.choices[0].delta: {model_response.choices[0].delta}; completion_obj: {completion_obj}"
+                "model_response.choices[0].delta: %s; completion_obj: %s",
+                model_response.choices[0].delta,
+                completion_obj,
             )
-            print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
+            print_verbose("self.sent_first_chunk: %s", self.sent_first_chunk)
 
             ## CHECK FOR TOOL USE
 
@@ -1656,12 +1750,14 @@ class CustomStreamWrapper:
                     chunk = next(self.completion_stream)
                 if chunk is not None and chunk != b"":
                     print_verbose(
-                        f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
+                        "PROCESSED CHUNK PRE CHUNK CREATOR: %s; custom_llm_provider: %s",
+                        chunk,
+                        self.custom_llm_provider,
                     )
                     response: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
-                    print_verbose(f"PROCESSED CHUNK POST CHUNK CREATOR: {response}")
+                    print_verbose("PROCESSED CHUNK POST CHUNK CREATOR: %s", response)
 
                     if response is None:
                         continue
@@ -1676,16 +1772,9 @@ class CustomStreamWrapper:
                             response,
                             cache_hit,
                         )  # log response
-                    choice = response.choices[0]
-                    if isinstance(choice, StreamingChoices):
-                        self.response_uptil_now += choice.delta.get("content", "") or ""
-                    else:
-                        self.response_uptil_now += ""
-                    self.rules.post_call_rules(
-                        input=self.response_uptil_now, model=self.model
-                    )
+                    self._track_response_uptil_now(response)
                     # HANDLE STREAM OPTIONS
-                    self.chunks.append(response)
+                    self._add_chunk(response)
                     if hasattr(
                         response, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1709,17 +1798,15 @@ class CustomStreamWrapper:
                             continue
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self._calculate_total_usage()
                         response._hidden_params["usage"] = usage
                     # RETURN RESULT
                     return response
 
         except StopIteration:
             if self.sent_last_chunk is True:
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
+                complete_streaming_response = self.stream_assembler.build_response(
+                    logging_obj=self.logging_obj
                 )
 
                 response = self.model_response_creator()
@@ -1758,7 +1845,7 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 if self.stream_options is None:  # add usage as hidden param
-                    usage = calculate_total_usage(chunks=self.chunks)
+                    usage = self._calculate_total_usage()
                     processed_chunk._hidden_params["usage"] = usage
                 ## LOGGING
                 executor.submit(
@@ -1825,14 +1912,14 @@ class CustomStreamWrapper:
                     # chunk_creator() does logging/stream chunk building. We need to let it know its being called in_async_func, so we don't double add chunks.
                     # __anext__ also calls async_success_handler, which does logging
                     verbose_logger.debug(
-                        f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}"
+                        "PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: %s", chunk
                     )
 
                     processed_chunk: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
                     verbose_logger.debug(
-                        f"PROCESSED ASYNC CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                        "PROCESSED ASYNC CHUNK POST CHUNK CREATOR: %s", processed_chunk
                     )
                     if processed_chunk is None:
                         continue
@@ -1842,15 +1929,8 @@ class CustomStreamWrapper:
                             completion_start_time=datetime.datetime.now()
                         )
 
-                    choice = processed_chunk.choices[0]
-                    if isinstance(choice, StreamingChoices):
-                        self.response_uptil_now += choice.delta.get("content", "") or ""
-                    else:
-                        self.response_uptil_now += ""
-                    self.rules.post_call_rules(
-                        input=self.response_uptil_now, model=self.model
-                    )
-                    self.chunks.append(processed_chunk)
+                    self._track_response_uptil_now(processed_chunk)
+                    self._add_chunk(processed_chunk)
                     if hasattr(
                         processed_chunk, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1869,11 +1949,11 @@ class CustomStreamWrapper:
 
                         if is_empty:
                             continue
-                    print_verbose(f"final returned processed chunk: {processed_chunk}")
+                    print_verbose("final returned processed chunk: %s", processed_chunk)
 
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self._calculate_total_usage()
                         processed_chunk._hidden_params["usage"] = usage
 
                     # Call post-call streaming deployment hook for final chunk
@@ -1896,36 +1976,25 @@ class CustomStreamWrapper:
                     else:
                         chunk = next(self.completion_stream)
                     if chunk is not None and chunk != b"":
-                        print_verbose(f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}")
+                        print_verbose("PROCESSED CHUNK PRE CHUNK CREATOR: %s", chunk)
                         processed_chunk: Optional[
                             ModelResponseStream
                         ] = self.chunk_creator(chunk=chunk)
                         print_verbose(
-                            f"PROCESSED CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                            "PROCESSED CHUNK POST CHUNK CREATOR: %s", processed_chunk
                         )
                         if processed_chunk is None:
                             continue
 
-                        choice = processed_chunk.choices[0]
-                        if isinstance(choice, StreamingChoices):
-                            self.response_uptil_now += (
-                                choice.delta.get("content", "") or ""
-                            )
-                        else:
-                            self.response_uptil_now += ""
-                        self.rules.post_call_rules(
-                            input=self.response_uptil_now, model=self.model
-                        )
+                        self._track_response_uptil_now(processed_chunk)
                         # RETURN RESULT
-                        self.chunks.append(processed_chunk)
+                        self._add_chunk(processed_chunk)
                         return processed_chunk
         except (StopAsyncIteration, StopIteration):
             if self.sent_last_chunk is True:
                 # log the final chunk with accurate streaming values
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
+                complete_streaming_response = self.stream_assembler.build_response(
+                    logging_obj=self.logging_obj
                 )
 
                 response = self.model_response_creator()
@@ -2019,6 +2088,81 @@ class CustomStreamWrapper:
                     is_pre_first_chunk=not self.sent_first_chunk,
                 )
 
+    def supports_raw_sse_passthrough(self) -> bool:
+        """
+        True if the upstream's SSE bytes can be forwarded as is - an OpenAI-format stream nothing was read from yet
+        """
+        return (
+            self.custom_llm_provider in SSE_PASSTHROUGH_PROVIDERS
+            and isinstance(self.completion_stream, AsyncStream)
+            and self.sent_first_chunk is False
+            and self.stream_assembler.num_chunks == 0
+        )
+
+    async def aiter_raw_sse(self) -> AsyncIterator[bytes]:
+        """
+        Yields the upstream's raw SSE bytes, without building a `ModelResponseStream` per chunk.
+
+        The bytes are teed into an `IncrementalSSEParser` - its complete response is logged at the end of
+        the stream, like `__anext__` does. Only call this if `supports_raw_sse_passthrough()`.
+        """
+        http_response = cast(AsyncStream, self.completion_stream).response
+        sse_parser = IncrementalSSEParser()
+        try:
+            async for chunk in http_response.aiter_bytes():
+                if self.logging_obj.completion_start_time is None:
+                    self.logging_obj._update_completion_start_time(
+                        completion_start_time=datetime.datetime.now()
+                    )
+                sse_parser.feed(chunk)
+                yield chunk
+        except Exception as e:
+            traceback_exception = traceback.format_exc()
+            threading.Thread(
+                target=self.logging_obj.failure_handler,
+                args=(e, traceback_exception),
+            ).start()
+            asyncio.create_task(
+                self.logging_obj.async_failure_handler(e, traceback_exception)  # type: ignore
+            )
+            raise exception_type(
+                model=self.model,
+                custom_llm_provider=self.custom_llm_provider,
+                original_exception=e,
+                completion_kwargs={},
+                extra_kwargs={},
+            )
+        finally:
+            await http_response.aclose()
+
+        sse_parser.close()
+        self.sent_first_chunk = True
+        self.sent_last_chunk = True
+        complete_streaming_response = sse_parser.build_model_response(
+            model=self.model, messages=self.messages
+        )
+        asyncio.create_task(
+            self.async_cache_streaming_response(
+                processed_chunk=complete_streaming_response.model_copy(deep=True),
+                cache_hit=False,
+            )
+        )
+        asyncio.create_task(
+            self.logging_obj.async_success_handler(
+                complete_streaming_response,
+                cache_hit=False,
+                start_time=None,
+                end_time=None,
+            )
+        )
+        executor.submit(
+            self.logging_obj.success_handler,
+            complete_streaming_response,
+            cache_hit=False,
+            start_time=None,
+            end_time=None,
+        )
+
     @staticmethod
     def _strip_sse_data_from_chunk(chunk: Optional[str]) -> Optional[str]:
         """
@@ -1,8 +1,17 @@
 # What is this?
 ## Helper utilities for token counting
+import asyncio
 import base64
+import binascii
+import hashlib
 import io
+import json
+import os
 import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import (
     Any,
     Callable,
@@ -23,13 +32,23 @@ from litellm.constants import (
     DEFAULT_IMAGE_HEIGHT,
     DEFAULT_IMAGE_TOKEN_COUNT,
     DEFAULT_IMAGE_WIDTH,
+    DEFAULT_MAX_LRU_CACHE_SIZE,
+    IMAGE_DIMENSION_PROBE_BYTES,
+    IMAGE_DIMENSION_PROBE_MAX_BYTES,
+    IMAGE_DIMENSIONS_CACHE_SIZE,
     MAX_LONG_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_SHORT_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_TILE_HEIGHT,
     MAX_TILE_WIDTH,
+    TOKEN_COUNTER_BATCH_NUM_THREADS,
+    TOKEN_COUNTER_MAX_WORKERS,
+    TOKEN_COUNTER_MESSAGE_CACHE_SIZE,
 )
 from litellm.litellm_core_utils.default_encoding import encoding as default_encoding
-from litellm.llms.custom_httpx.http_handler import _get_httpx_client
+from litellm.llms.custom_httpx.http_handler import (
+    _get_httpx_client,
+    get_async_httpx_client,
+)
 from litellm.types.llms.anthropic import (
     AnthropicMessagesToolResultParam,
     AnthropicMessagesToolUseParam,
@@ -40,6 +59,7 @@ from litellm.types.llms.openai import (
     ChatCompletionToolParam,
     OpenAIMessageContent,
 )
+from litellm.types.llms.custom_http import httpxSpecialProvider
 from litellm.types.utils import Message, SelectTokenizerResponse
 
 
@@ -197,11 +217,206 @@ def get_image_type(image_data: bytes) -> Union[str, None]:
     return None
 
 
+class _LRUCache:
+    """
+    Thread-safe LRU of computed values - token counting runs on the request path and on worker threads.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._values: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+image_dimensions_cache = _LRUCache(max_size=IMAGE_DIMENSIONS_CACHE_SIZE)
+
+
+def _is_image_url(data: str) -> bool:
+    return data.startswith(("http://", "https://"))
+
+
+def _parse_image_dimensions(img_data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Parse the width and height from the start of an image.
+
+    Returns None if they're not in `img_data` - it's too short, or the format is not supported.
+    """
+    img_type = get_image_type(img_data)
+    try:
+        if img_type == "png":
+            w, h = struct.unpack(">LL", img_data[16:24])
+            return w, h
+        elif img_type == "gif":
+            w, h = struct.unpack("<HH", img_data[6:10])
+            return w, h
+        elif img_type == "jpeg":
+            with io.BytesIO(img_data) as fhandle:
+                fhandle.seek(0)
+                size = 2
+                ftype = 0
+                while not 0xC0 <= ftype <= 0xCF or ftype in (0xC4, 0xC8, 0xCC):
+                    fhandle.seek(size, 1)
+                    byte = fhandle.read(1)
+                    while ord(byte) == 0xFF:
+                        byte = fhandle.read(1)
+                    ftype = ord(byte)
+                    size = struct.unpack(">H", fhandle.read(2))[0] - 2
+                fhandle.seek(1, 1)
+                h, w = struct.unpack(">HH", fhandle.read(4))
+            return w, h
+        elif img_type == "webp":
+            # For WebP, the dimensions are stored at different offsets depending on the format
+            # Check for VP8X (extended format)
+            if img_data[12:16] == b"VP8X":
+                w = struct.unpack("<I", img_data[24:27] + b"\x00")[0] + 1
+                h = struct.unpack("<I", img_data[27:30] + b"\x00")[0] + 1
+                return w, h
+            # Check for VP8 (lossy format)
+            elif img_data[12:16] == b"VP8 ":
+                w = struct.unpack("<H", img_data[26:28])[0] & 0x3FFF
+                h = struct.unpack("<H", img_data[28:30])[0] & 0x3FFF
+                return w, h
+            # Check for VP8L (lossless format)
+            elif img_data[12:16] == b"VP8L":
+                bits = struct.unpack("<I", img_data[21:25])[0]
+                w = (bits & 0x3FFF) + 1
+                h = ((bits >> 14) & 0x3FFF) + 1
+                return w, h
+    except (struct.error, TypeError):
+        # header is cut off - e.g. a jpeg whose frame header is past the bytes read so far
+        return None
+    return None
+
+
+class _ImageHeaderReader:
+    """
+    Reads the start of an image until its dimensions are known - not the whole image.
+
+    Parsing is retried each time the bytes read double, starting at `IMAGE_DIMENSION_PROBE_BYTES`.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.dimensions: Optional[Tuple[int, int]] = None
+        self.done = False
+        self._data = bytearray()
+        self._next_parse_size = IMAGE_DIMENSION_PROBE_BYTES
+
+    def feed(self, chunk: bytes) -> None:
+        if self.done:
+            return
+        self._data += chunk
+        if self.max_bytes is not None and len(self._data) >= self.max_bytes:
+            self._parse()
+            self.done = True
+        elif len(self._data) >= self._next_parse_size:
+            self._parse()
+
+    def close(self) -> None:
+        """No more bytes - parse what was read"""
+        if not self.done:
+            self._parse()
+            self.done = True
+
+    def _parse(self) -> None:
+        img_data = bytes(self._data)
+        self.dimensions = _parse_image_dimensions(img_data)
+        img_type = get_image_type(img_data)
+        if self.dimensions is not None or (
+            img_type not in ("png", "gif", "jpeg", "webp")
+            and len(img_data) >= IMAGE_DIMENSION_PROBE_BYTES
+        ):
+            # found them, or an unsupported format - reading more won't help
+            self.done = True
+        self._next_parse_size = max(len(img_data) * 2, self._next_parse_size)
+
+
+def _get_image_url_range_headers() -> dict:
+    return {"Range": f"bytes=0-{IMAGE_DIMENSION_PROBE_MAX_BYTES - 1}"}
+
+
+def _read_base64_image_dimensions(data: str) -> Optional[Tuple[int, int]]:
+    """Decode only as much of a base64 image as its dimensions need"""
+    # raises ValueError if `data` is not a data url, like `data.split(",", 1)` - without copying the image
+    position = data.index(",") + 1
+    image_header_reader = _ImageHeaderReader()
+    # base64 decodes in groups of 4 characters -> 3 bytes
+    chars_per_read = -(-IMAGE_DIMENSION_PROBE_BYTES // 3) * 4
+    try:
+        while not image_header_reader.done and position < len(data):
+            image_header_reader.feed(
+                base64.b64decode(data[position : position + chars_per_read])
+            )
+            position += chars_per_read
+            chars_per_read *= 2
+    except binascii.Error:
+        # e.g. line breaks in the base64 - decode it all at once
+        _header, encoded = data.split(",", 1)
+        image_header_reader = _ImageHeaderReader()
+        image_header_reader.feed(base64.b64decode(encoded))
+    image_header_reader.close()
+    return image_header_reader.dimensions
+
+
+def _read_image_url_dimensions(url: str) -> Optional[Tuple[int, int]]:
+    """Stream the start of an image url until its dimensions are known"""
+    client = _get_httpx_client()
+    image_header_reader = _ImageHeaderReader(max_bytes=IMAGE_DIMENSION_PROBE_MAX_BYTES)
+    with client.client.stream(
+        "GET", url, headers=_get_image_url_range_headers(), follow_redirects=True
+    ) as response:
+        for chunk in response.iter_bytes():
+            image_header_reader.feed(chunk)
+            if image_header_reader.done:
+                break
+    image_header_reader.close()
+    return image_header_reader.dimensions
+
+
+async def _aread_image_url_dimensions(url: str) -> Optional[Tuple[int, int]]:
+    """`_read_image_url_dimensions`, with the async httpx client"""
+    client = get_async_httpx_client(llm_provider=httpxSpecialProvider.PromptFactory)
+    image_header_reader = _ImageHeaderReader(max_bytes=IMAGE_DIMENSION_PROBE_MAX_BYTES)
+    async with client.client.stream(
+        "GET", url, headers=_get_image_url_range_headers(), follow_redirects=True
+    ) as response:
+        async for chunk in response.aiter_bytes():
+            image_header_reader.feed(chunk)
+            if image_header_reader.done:
+                break
+    image_header_reader.close()
+    return image_header_reader.dimensions
+
+
 def get_image_dimensions(
     data: str,
 ) -> Tuple[int, int]:
     """
-    Async Function to get the dimensions of an image from a URL or base64 encoded string.
+    Get the dimensions of an image from a URL or base64 encoded string.
+
+    Only the image header is read - image urls are fetched with a bounded range request, and only the start of
+    a base64 string is decoded. The dimensions of image urls are cached by url - a base64 image's header is
+    cheaper to decode than its content is to hash.
 
     Args:
         data (str): The URL or base64 encoded string of the image.
@@ -209,61 +424,70 @@ def get_image_dimensions(
     Returns:
         Tuple[int, int]: The width and height of the image.
     """
-    img_data = None
-    try:
-        # Try to open as URL
-        client = _get_httpx_client()
-        response = client.get(data)
-        img_data = response.read()
-    except Exception:
-        # If not URL, assume it's base64
-        _header, encoded = data.split(",", 1)
-        img_data = base64.b64decode(encoded)
+    if not _is_image_url(data):
+        dimensions = _read_base64_image_dimensions(data)
+    else:
+        dimensions = image_dimensions_cache.get(data)
+        if dimensions is not None:
+            return dimensions
+        dimensions = _read_image_url_dimensions(data)
+        if dimensions is not None:
+            image_dimensions_cache.set(data, dimensions)
 
-    img_type = get_image_type(img_data)
+    if dimensions is None:
+        # return sensible default image dimensions if unable to get dimensions
+        return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+    return dimensions
 
-    if img_type == "png":
-        w, h = struct.unpack(">LL", img_data[16:24])
-        return w, h
-    elif img_type == "gif":
-        w, h = struct.unpack("<HH", img_data[6:10])
-        return w, h
-    elif img_type == "jpeg":
-        with io.BytesIO(img_data) as fhandle:
-            fhandle.seek(0)
-            size = 2
-            ftype = 0
-            while not 0xC0 <= ftype <= 0xCF or ftype in (0xC4, 0xC8, 0xCC):
-                fhandle.seek(size, 1)
-                byte = fhandle.read(1)
-                while ord(byte) == 0xFF:
-                    byte = fhandle.read(1)
-                ftype = ord(byte)
-                size = struct.unpack(">H", fhandle.read(2))[0] - 2
-            fhandle.seek(1, 1)
-            h, w = struct.unpack(">HH", fhandle.read(4))
-        return w, h
-    elif img_type == "webp":
-        # For WebP, the dimensions are stored at different offsets depending on the format
-        # Check for VP8X (extended format)
-        if img_data[12:16] == b"VP8X":
-            w = struct.unpack("<I", img_data[24:27] + b"\x00")[0] + 1
-            h = struct.unpack("<I", img_data[27:30] + b"\x00")[0] + 1
-            return w, h
-        # Check for VP8 (lossy format)
-        elif img_data[12:16] == b"VP8 ":
-            w = struct.unpack("<H", img_data[26:28])[0] & 0x3FFF
-            h = struct.unpack("<H", img_data[28:30])[0] & 0x3FFF
-            return w, h
-        # Check for VP8L (lossless format)
-        elif img_data[12:16] == b"VP8L":
-            bits = struct.unpack("<I", img_data[21:25])[0]
-            w = (bits & 0x3FFF) + 1
-            h = ((bits >> 14) & 0x3FFF) + 1
-            return w, h
 
-    # return sensible default image dimensions if unable to get dimensions
-    return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+async def aget_image_dimensions(
+    data: str,
+) -> Tuple[int, int]:
+    """
+    `get_image_dimensions`, without blocking the event loop on the image url request.
+    """
+    if not _is_image_url(data):
+        return get_image_dimensions(data)
+
+    dimensions = image_dimensions_cache.get(data)
+    if dimensions is not None:
+        return dimensions
+    dimensions = await _aread_image_url_dimensions(data)
+    if dimensions is None:
+        return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+    image_dimensions_cache.set(data, dimensions)
+    return dimensions
+
+
+async def _aprefetch_image_dimensions(
+    messages: Optional[List[Union[AllMessageValues, Message]]],
+) -> None:
+    """
+    Fetch the dimensions of the high detail image urls in the messages concurrently - counting the messages
+    then finds them in `image_dimensions_cache`, instead of fetching each image in turn.
+    """
+    image_urls = set()
+    for message in messages or []:
+        content = message.get("content") if isinstance(message, dict) else None
+        if not isinstance(content, list):
+            continue
+        for c in content:
+            if not isinstance(c, dict) or c.get("type") != "image_url":
+                continue
+            image_url = c.get("image_url")
+            if (
+                isinstance(image_url, dict)
+                and image_url.get("detail") == "high"
+                and isinstance(image_url.get("url"), str)
+                and _is_image_url(image_url["url"])
+            ):
+                image_urls.add(image_url["url"])
+    if image_urls:
+        # errors are raised again when the messages are counted
+        await asyncio.gather(
+            *(aget_image_dimensions(url) for url in image_urls),
+            return_exceptions=True,
+        )
 
 
 def calculate_img_tokens(
@@ -312,6 +536,11 @@ TokenCounterFunction = Callable[[str], int]
 Type for a function that counts tokens in a string.
 """
 
+BatchTokenCounterFunction = Callable[[List[str]], List[int]]
+"""
+Type for a function that counts tokens in each string of a list.
+"""
+
 
 class _MessageCountParams:
     """
@@ -322,6 +551,7 @@ class _MessageCountParams:
         self,
         model: str,
         custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]],
+        count_function: Optional[TokenCounterFunction] = None,
     ):
         from litellm.utils import print_verbose
 
@@ -343,7 +573,45 @@ class _MessageCountParams:
             )
             self.tokens_per_message = 3
             self.tokens_per_name = 1
-        self.count_function = _get_count_function(model, custom_tokenizer)
+        self.count_function = count_function or _get_count_function(
+            model, custom_tokenizer
+        )
+        # custom tokenizers have no stable identity - their counts are not cached
+        self.cache_namespace: Optional[str] = (
+            model if custom_tokenizer is None else None
+        )
+
+
+class _MessageTokenCountCache(_LRUCache):
+    """
+    Content-addressed LRU of per-message token counts.
+
+    A conversation that grows by one message only tokenizes the new message, and retries / fallbacks
+    of a request don't re-tokenize its prompt (or re-fetch its images).
+    """
+
+    @staticmethod
+    def get_key(
+        namespace: str,
+        message: AllMessageValues,
+        use_default_image_token_count: bool,
+        default_token_count: Optional[int],
+    ) -> Optional[bytes]:
+        try:
+            serialized_message = json.dumps(message, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        key = hashlib.blake2b(digest_size=16)
+        key.update(
+            f"{namespace}\0{use_default_image_token_count}\0{default_token_count}\0".encode()
+        )
+        key.update(serialized_message.encode("utf-8", errors="surrogatepass"))
+        return key.digest()
+
+
+message_token_count_cache = _MessageTokenCountCache(
+    max_size=TOKEN_COUNTER_MESSAGE_CACHE_SIZE
+)
 
 
 def token_counter(
@@ -425,6 +693,150 @@ def token_counter(
     return num_tokens
 
 
+def token_counter_many(
+    model="",
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+    texts: Optional[List[str]] = None,
+    messages_list: Optional[List[List[Union[AllMessageValues, Message]]]] = None,
+    count_response_tokens: Optional[bool] = False,
+    tools: Optional[List[ChatCompletionToolParam]] = None,
+    tool_choice: Optional[ChatCompletionNamedToolChoiceParam] = None,
+    use_default_image_token_count: Optional[bool] = False,
+    default_token_count: Optional[int] = None,
+) -> List[int]:
+    """
+    Count the tokens of many texts, or many message lists, with the same model.
+
+    Returns the same counts as calling `token_counter` for each one, but the strings are encoded in one batch -
+    tiktoken's `encode_batch` spreads them over `TOKEN_COUNTER_BATCH_NUM_THREADS` threads, HuggingFace
+    tokenizers' `encode_batch` over its own thread pool.
+
+    Args:
+    texts (Optional[List[str]]): The texts to count, each is counted like `token_counter(text=...)`.
+    messages_list (Optional[List[List[AllMessageValues]]]): Alternative to texts. Each message list is counted like `token_counter(messages=...)`, with the same tools / tool_choice.
+
+    See `token_counter` for the other args.
+
+    Returns:
+    List[int]: The number of tokens of each text / message list, in order.
+    """
+    from litellm.utils import convert_list_message_to_dict
+
+    if litellm.disable_token_counter is True:
+        return [0] * len(texts if texts is not None else messages_list or [])
+    if texts is not None and messages_list is not None:
+        raise ValueError("texts and messages_list cannot both be set")
+    if use_default_image_token_count is None:
+        use_default_image_token_count = False
+
+    batch_count_function = _get_batch_count_function(model, custom_tokenizer)
+    if texts is not None:
+        if tools or tool_choice:
+            raise ValueError("tools or tool_choice cannot be set if using texts")
+        return batch_count_function(texts)
+    elif messages_list is None:
+        raise ValueError("Either texts or messages_list must be provided")
+
+    new_messages_list = [
+        cast(List[AllMessageValues], convert_list_message_to_dict(messages))
+        for messages in messages_list
+    ]
+    # encode every string of every message in one batch, then count the messages as `token_counter` does
+    strings: List[str] = []
+    for new_messages in new_messages_list:
+        for message in new_messages:
+            _collect_message_strings(message, strings)
+    unique_strings = list(dict.fromkeys(strings))
+    batch_counts = dict(zip(unique_strings, batch_count_function(unique_strings)))
+    count_function = _get_count_function(model, custom_tokenizer)
+
+    def count_tokens(text: str) -> int:
+        num_tokens = batch_counts.get(text)
+        if num_tokens is None:
+            num_tokens = count_function(text)
+        return num_tokens
+
+    params = _MessageCountParams(model, custom_tokenizer, count_function=count_tokens)
+    results: List[int] = []
+    for new_messages in new_messages_list:
+        num_tokens = _count_messages(
+            params, new_messages, use_default_image_token_count, default_token_count
+        )
+        if count_response_tokens is False:
+            includes_system_message = any(
+                [message.get("role", None) == "system" for message in new_messages]
+            )
+            num_tokens += _count_extra(
+                params.count_function, tools, tool_choice, includes_system_message
+            )
+        results.append(num_tokens)
+    return results
+
+
+_token_counter_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_token_counter_executor() -> ThreadPoolExecutor:
+    global _token_counter_executor
+    if _token_counter_executor is None:
+        _token_counter_executor = ThreadPoolExecutor(
+            max_workers=TOKEN_COUNTER_MAX_WORKERS,
+            thread_name_prefix="litellm_token_counter",
+        )
+    return _token_counter_executor
+
+
+async def atoken_counter(**kwargs) -> int:
+    """
+    `token_counter`, run on a worker thread - counting a large prompt doesn't block the event loop.
+
+    Takes the same (keyword) args as `token_counter`.
+    """
+    if litellm.disable_token_counter is True:
+        return 0
+    if not kwargs.get("use_default_image_token_count"):
+        await _aprefetch_image_dimensions(kwargs.get("messages"))
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_token_counter_executor(), partial(token_counter, **kwargs)
+    )
+
+
+async def atoken_counter_many(**kwargs) -> List[int]:
+    """
+    `token_counter_many`, run on a worker thread - counting large prompts doesn't block the event loop.
+
+    Takes the same (keyword) args as `token_counter_many`.
+    """
+    if not kwargs.get("use_default_image_token_count"):
+        await asyncio.gather(
+            *(
+                _aprefetch_image_dimensions(messages)
+                for messages in kwargs.get("messages_list") or []
+            )
+        )
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_token_counter_executor(), partial(token_counter_many, **kwargs)
+    )
+
+
+def _collect_message_strings(message: AllMessageValues, strings: List[str]) -> None:
+    """
+    Add the strings of a message that `_count_message` counts - the plain text ones, anything else is counted
+    when the message is.
+    """
+    for key, value in message.items():
+        if isinstance(value, str):
+            strings.append(value)
+        elif key == "content" and isinstance(value, List):
+            for c in value:
+                if isinstance(c, str):
+                    strings.append(c)
+                elif isinstance(c, dict) and c.get("type") == "text":
+                    text = c.get("text")
+                    if isinstance(text, str):
+                        strings.append(text)
+
+
 def _count_messages(
     params: _MessageCountParams,
     messages: List[AllMessageValues],
@@ -443,41 +855,78 @@ def _count_messages(
     num_tokens = 0
     if len(messages) == 0:
         return num_tokens
+    use_cache = (
+        params.cache_namespace is not None and message_token_count_cache.max_size > 0
+    )
     for message in messages:
-        num_tokens += params.tokens_per_message
-        for key, value in message.items():
-            if value is None:
-                pass
-            elif key == "tool_calls":
-                if isinstance(value, List):
-                    for tool_call in value:
-                        if "function" in tool_call:
-                            function_arguments = tool_call["function"].get(
-                                "arguments", []
-                            )
-                            num_tokens += params.count_function(str(function_arguments))
-                        else:
-                            raise ValueError(
-                                f"Unsupported tool call {tool_call} must contain a function key"
-                            )
-                else:
-                    raise ValueError(
-                        f"Unsupported type {type(value)} for key tool_calls in message {message}"
-                    )
-            elif isinstance(value, str):
-                num_tokens += params.count_function(value)
-                if key == "name":
-                    num_tokens += params.tokens_per_name
-            elif key == "content" and isinstance(value, List):
-                num_tokens += _count_content_list(
-                    params.count_function,
-                    value,
-                    use_default_image_token_count,
-                    default_token_count,
-                )
+        cache_key = (
+            message_token_count_cache.get_key(
+                cast(str, params.cache_namespace),
+                message,
+                use_default_image_token_count,
+                default_token_count,
+            )
+            if use_cache
+            else None
+        )
+        if cache_key is None:
+            num_tokens += _count_message(
+                params, message, use_default_image_token_count, default_token_count
+            )
+            continue
+        message_tokens = message_token_count_cache.get(cache_key)
+        if message_tokens is None:
+            message_tokens = _count_message(
+                params, message, use_default_image_token_count, default_token_count
+            )
+            message_token_count_cache.set(cache_key, message_tokens)
+        num_tokens += message_tokens
+    return num_tokens
+
+
+def _count_message(
+    params: _MessageCountParams,
+    message: AllMessageValues,
+    use_default_image_token_count: bool,
+    default_token_count: Optional[int],
+) -> int:
+    """
+    Count the number of tokens in a single message.
+    """
+    num_tokens = params.tokens_per_message
+    for key, value in message.items():
+        if value is None:
+            pass
+        elif key == "tool_calls":
+            if isinstance(value, List):
+                for tool_call in value:
+                    if "function" in tool_call:
+                        function_arguments = tool_call["function"].get(
+                            "arguments", []
+                        )
+                        num_tokens += params.count_function(str(function_arguments))
+                    else:
+                        raise ValueError(
+                            f"Unsupported tool call {tool_call} must contain a function key"
+                        )
             else:
-                # Skip unsupported keys instead of raising an error
-                continue
+                raise ValueError(
+                    f"Unsupported type {type(value)} for key tool_calls in message {message}"
+                )
+        elif isinstance(value, str):
+            num_tokens += params.count_function(value)
+            if key == "name":
+                num_tokens += params.tokens_per_name
+        elif key == "content" and isinstance(value, List):
+            num_tokens += _count_content_list(
+                params.count_function,
+                value,
+                use_default_image_token_count,
+                default_token_count,
+            )
+        else:
+            # Skip unsupported keys instead of raising an error
+            continue
     return num_tokens
 
 
@@ -521,40 +970,91 @@ def _get_count_function(
 ) -> TokenCounterFunction:
     """
     Get the function to count tokens based on the model and custom tokenizer."""
-    from litellm.utils import _select_tokenizer, print_verbose
-
-    if model is not None or custom_tokenizer is not None:
-        tokenizer_json = custom_tokenizer or _select_tokenizer(model)  # type: ignore
-        if tokenizer_json["type"] == "huggingface_tokenizer":
-
-            def count_tokens(text: str) -> int:
-                enc = tokenizer_json["tokenizer"].encode(text)
-                return len(enc.ids)
-
-        elif tokenizer_json["type"] == "openai_tokenizer":
-            model_to_use = _fix_model_name(model)  # type: ignore
-            try:
-                if "gpt-4o" in model_to_use:
-                    encoding = tiktoken.get_encoding("o200k_base")
-                else:
-                    encoding = tiktoken.encoding_for_model(model_to_use)
-            except KeyError:
-                print_verbose("Warning: model not found. Using cl100k_base encoding.")
-                encoding = tiktoken.get_encoding("cl100k_base")
-
-            def count_tokens(text: str) -> int:
-                return len(encoding.encode(text, disallowed_special=()))
+    tokenizer_type, tokenizer = _get_tokenizer(model, custom_tokenizer)
+    if tokenizer_type == "huggingface_tokenizer":
+
+        def count_tokens(text: str) -> int:
+            enc = tokenizer.encode(text)
+            return len(enc.ids)
 
-        else:
-            raise ValueError("Unsupported tokenizer type")
     else:
 
         def count_tokens(text: str) -> int:
-            return len(default_encoding.encode(text, disallowed_special=()))
+            return len(tokenizer.encode(text, disallowed_special=()))
+
+    return count_tokens
+
+
+def _get_batch_count_function(
+    model: Optional[str],
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+) -> BatchTokenCounterFunction:
+    """
+    Get the function to count tokens in a batch of strings, based on the model and custom tokenizer.
+    """
+    tokenizer_type, tokenizer = _get_tokenizer(model, custom_tokenizer)
+    if tokenizer_type == "huggingface_tokenizer":
+
+        def count_tokens(texts: List[str]) -> List[int]:
+            if len(texts) == 0:
+                return []
+            return [len(enc.ids) for enc in tokenizer.encode_batch(texts)]
+
+    else:
+
+        # encode_batch starts a thread pool per call - only worth it with more than 1 cpu and string
+        num_threads = min(TOKEN_COUNTER_BATCH_NUM_THREADS, os.cpu_count() or 1)
+
+        def count_tokens(texts: List[str]) -> List[int]:
+            if num_threads <= 1 or len(texts) <= 1:
+                return [
+                    len(tokenizer.encode(text, disallowed_special=())) for text in texts
+                ]
+            return [
+                len(tokens)
+                for tokens in tokenizer.encode_batch(
+                    texts, num_threads=num_threads, disallowed_special=()
+                )
+            ]
 
     return count_tokens
 
 
+def _get_tokenizer(
+    model: Optional[str],
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+) -> Tuple[str, Any]:
+    """
+    Get the tokenizer type and the warmed tokenizer / encoding for the model and custom tokenizer.
+    """
+    from litellm.utils import _select_tokenizer
+
+    if model is None and custom_tokenizer is None:
+        return "openai_tokenizer", default_encoding
+
+    tokenizer_json = custom_tokenizer or _select_tokenizer(model)  # type: ignore
+    if tokenizer_json["type"] == "huggingface_tokenizer":
+        return "huggingface_tokenizer", tokenizer_json["tokenizer"]
+    elif tokenizer_json["type"] == "openai_tokenizer":
+        return "openai_tokenizer", _get_openai_encoding(_fix_model_name(model))  # type: ignore
+    else:
+        raise ValueError("Unsupported tokenizer type")
+
+
+@lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)
+def _get_openai_encoding(model_to_use: str) -> tiktoken.Encoding:
+    """The tiktoken encoding of an (openai) model - looked up once per model"""
+    from litellm.utils import print_verbose
+
+    try:
+        if "gpt-4o" in model_to_use:
+            return tiktoken.get_encoding("o200k_base")
+        return tiktoken.encoding_for_model(model_to_use)
+    except KeyError:
+        print_verbose("Warning: model not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def _fix_model_name(model: str) -> str:
     """We normalize some model names to others"""
     if model in litellm.azure_llms:
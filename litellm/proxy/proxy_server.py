@@ -152,7 +152,7 @@ from functools import lru_cache
 import litellm
 from litellm import Router
 from litellm._logging import verbose_proxy_logger, verbose_router_logger
-from litellm.caching.caching import DualCache, RedisCache
+from litellm.caching.caching import DualCache, InMemoryCache, RedisCache
 from litellm.caching.redis_cluster_cache import RedisClusterCache
 from litellm.constants import (
     _REALTIME_BODY_CACHE_SIZE,
@@ -1175,7 +1175,8 @@ shared_aiohttp_session: Optional["ClientSession"] = (
     None  # Global shared session for connection reuse
 )
 user_api_key_cache = DualCache(
-    default_in_memory_ttl=UserAPIKeyCacheTTLEnum.in_memory_cache_ttl.value
+    in_memory_cache=InMemoryCache(namespace="user_api_key_cache"),
+    default_in_memory_ttl=UserAPIKeyCacheTTLEnum.in_memory_cache_ttl.value,
 )
 model_max_budget_limiter = _PROXY_VirtualKeyModelMaxBudgetLimiter(
     dual_cache=user_api_key_cache
@@ -4227,11 +4228,32 @@ async def async_assistants_data_generator(
         yield f"data: {error_returned}\n\n"
 
 
+def _should_passthrough_raw_sse(response) -> bool:
+    """
+    True if the stream's raw SSE bytes can be forwarded to the client as is - `litellm.enable_sse_passthrough`
+
+    Not used if the chunks are modified on the way - streaming hooks, guardrails, cost injection.
+    """
+    return (
+        litellm.enable_sse_passthrough is True
+        and isinstance(response, litellm.CustomStreamWrapper)
+        and response.supports_raw_sse_passthrough()
+        and litellm.include_cost_in_streaming_usage is not True
+        and not proxy_logging_obj.has_streaming_hooks()
+    )
+
+
 async def async_data_generator(
     response, user_api_key_dict: UserAPIKeyAuth, request_data: dict
 ):
     verbose_proxy_logger.debug("inside generator")
     try:
+        if _should_passthrough_raw_sse(response):
+            # the upstream's bytes already end with `data: [DONE]`
+            async for raw_chunk in response.aiter_raw_sse():
+                yield raw_chunk
+            return
+
         # Use a list to accumulate response segments to avoid O(n^2) string concatenation
         str_so_far_parts: list[str] = []
         error_message: Optional[str] = None
@@ -6883,7 +6905,7 @@ async def token_counter(request: TokenCountRequest, call_endpoint: bool = False)
     Returns:
         TokenCountResponse
     """
-    from litellm import token_counter
+    from litellm import atoken_counter
 
     global llm_router
 
@@ -6969,7 +6991,8 @@ async def token_counter(request: TokenCountRequest, call_endpoint: bool = False)
     )
 
     tokenizer_used = str(_tokenizer_used["type"])
-    total_tokens = token_counter(
+    # off the event loop - counting a large prompt would block other requests
+    total_tokens = await atoken_counter(
         model=model_to_use,
         text=prompt,
         messages=messages,
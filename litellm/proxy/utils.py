@@ -296,7 +296,9 @@ class ProxyLogging:
         self.call_details: dict = {}
         self.call_details["user_api_key_cache"] = user_api_key_cache
         self.internal_usage_cache: InternalUsageCache = InternalUsageCache(
-            dual_cache=DualCache(default_in_memory_ttl=1)  # ping redis cache every 1s
+            dual_cache=DualCache(
+                default_in_memory_ttl=1, batch_redis_gets=True
+            )  # ping redis cache every 1s
         )
         self.max_parallel_request_limiter = _PROXY_MaxParallelRequestsHandler(
             self.internal_usage_cache
@@ -1884,6 +1886,39 @@ class ProxyLogging:
         async for chunk in current_response:
             yield chunk
 
+    def has_streaming_hooks(self) -> bool:
+        """
+        True if a callback reads or modifies the chunks of /chat/completions streams
+
+        Raw SSE passthrough is only used when there is none - it doesn't build the chunk objects these hooks get.
+        """
+        from litellm.proxy.hooks.responses_id_security import ResponsesIDSecurity
+
+        for callback in litellm.callbacks:
+            _callback: Optional[CustomLogger] = None
+            if isinstance(callback, str):
+                _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
+                    cast(_custom_logger_compatible_callbacks_literal, callback)
+                )
+            else:
+                _callback = callback  # type: ignore
+            if _callback is None or not isinstance(_callback, CustomLogger):
+                continue
+            if isinstance(_callback, CustomGuardrail):
+                return True
+            if isinstance(_callback, ResponsesIDSecurity):
+                continue  # only rewrites /v1/responses chunks
+            for hook_name in (
+                "async_post_call_streaming_hook",
+                "async_post_call_streaming_iterator_hook",
+                "async_post_call_streaming_deployment_hook",
+            ):
+                if getattr(type(_callback), hook_name, None) is not getattr(
+                    CustomLogger, hook_name
+                ):
+                    return True
+        return False
+
     def _init_response_taking_too_long_task(self, data: Optional[dict] = None):
         """
         Initialize the response taking too long task if user is using slack alerting
@@ -65,12 +65,18 @@ from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
 from litellm.router_strategy.budget_limiter import RouterBudgetLimiting
 from litellm.router_strategy.least_busy import LeastBusyLoggingHandler
+from litellm.router_strategy.least_outstanding_requests import (
+    LeastOutstandingRequestsLoggingHandler,
+)
 from litellm.router_strategy.lowest_cost import LowestCostLoggingHandler
 from litellm.router_strategy.lowest_latency import LowestLatencyLoggingHandler
 from litellm.router_strategy.lowest_tpm_rpm import LowestTPMLoggingHandler
 from litellm.router_strategy.lowest_tpm_rpm_v2 import LowestTPMLoggingHandler_v2
 from litellm.router_strategy.simple_shuffle import simple_shuffle
-from litellm.router_strategy.tag_based_routing import get_deployments_for_tag
+from litellm.router_strategy.tag_based_routing import (
+    get_deployment_mask_for_tag,
+    get_deployments_for_tag,
+)
 from litellm.router_utils.add_retry_fallback_headers import (
     add_fallback_headers_to_response,
     add_retry_headers_to_response,
@@ -88,8 +94,11 @@ from litellm.router_utils.clientside_credential_handler import (
 from litellm.router_utils.common_utils import (
     filter_team_based_models,
     filter_web_search_deployments,
+    get_request_input_tokens,
+    is_web_search_request,
 )
 from litellm.router_utils.cooldown_cache import CooldownCache
+from litellm.router_utils.cooldown_manager import CooldownManager
 from litellm.router_utils.cooldown_handlers import (
     DEFAULT_COOLDOWN_TIME_SECONDS,
     _async_get_cooldown_deployments,
@@ -97,6 +106,10 @@ from litellm.router_utils.cooldown_handlers import (
     _get_cooldown_deployments,
     _set_cooldown_deployments,
 )
+from litellm.router_utils.deployment_snapshot import (
+    DeploymentSnapshotStore,
+    ModelGroupSnapshot,
+)
 from litellm.router_utils.fallback_event_handlers import (
     _check_non_standard_fallback_format,
     get_fallback_model_group,
@@ -105,6 +118,7 @@ from litellm.router_utils.fallback_event_handlers import (
 from litellm.router_utils.get_retry_from_policy import (
     get_num_retries_from_retry_policy as _get_num_retries_from_retry_policy,
 )
+from litellm.router_utils.hedged_requests import HedgedRequests
 from litellm.router_utils.handle_error import (
     async_raise_no_deployment_exception,
     send_llm_exception_alert,
@@ -115,11 +129,12 @@ from litellm.router_utils.pre_call_checks.prompt_caching_deployment_check import
 from litellm.router_utils.pre_call_checks.responses_api_deployment_check import (
     ResponsesApiDeploymentCheck,
 )
+from litellm.router_utils.retry_budget import RetryBudget
 from litellm.router_utils.router_callbacks.track_deployment_metrics import (
     increment_deployment_failures_for_current_minute,
     increment_deployment_successes_for_current_minute,
 )
-from litellm.scheduler import FlowItem, Scheduler
+from litellm.scheduler import FlowItem, Scheduler, SchedulerPolicy
 from litellm.types.llms.openai import (
     AllMessageValues,
     FileTypes,
@@ -137,10 +152,12 @@ from litellm.types.router import (
     Deployment,
     DeploymentTypedDict,
     GuardrailTypedDict,
+    HedgingPolicy,
     LiteLLM_Params,
     MockRouterTestingParams,
     ModelGroupInfo,
     OptionalPreCallChecks,
+    RetryBudgetPolicy,
     RetryPolicy,
     RouterCacheEnum,
     RouterGeneralSettings,
@@ -203,6 +220,7 @@ class Router:
     default_cache_time_seconds: int = 1 * 60 * 60  # 1 hour
     tenacity = None
     leastbusy_logger: Optional[LeastBusyLoggingHandler] = None
+    leastoutstanding_logger: Optional[LeastOutstandingRequestsLoggingHandler] = None
     lowesttpm_logger: Optional[LowestTPMLoggingHandler] = None
     optional_callbacks: Optional[List[Union[CustomLogger, Callable, str]]] = None
 
@@ -231,6 +249,9 @@ class Router:
         ## SCHEDULER ##
         polling_interval: Optional[float] = None,
         default_priority: Optional[int] = None,
+        scheduler_use_redis_queue: bool = False,
+        scheduler_policy: SchedulerPolicy = "priority",
+        scheduler_priority_weights: Optional[Dict[int, float]] = None,
         ## RELIABILITY ##
         num_retries: Optional[int] = None,
         max_fallbacks: Optional[
@@ -262,6 +283,12 @@ class Router:
         model_group_retry_policy: Dict[
             str, RetryPolicy
         ] = {},  # set custom retry policies based on model group
+        retry_budget_policy: Optional[
+            Union[RetryBudgetPolicy, dict]
+        ] = None,  # cap retries per model group to a share of its requests
+        hedging_policy: Optional[
+            Union[HedgingPolicy, dict]
+        ] = None,  # send a 2nd request to another deployment when the first is slow to its first token
         allowed_fails: Optional[
             int
         ] = None,  # Number of times a deployment can failbefore being added to cooldown
@@ -272,6 +299,10 @@ class Router:
             float
         ] = None,  # (seconds) time to cooldown a deployment after failure
         disable_cooldowns: Optional[bool] = None,
+        cooldown_half_open_probe_interval: Optional[
+            float
+        ] = None,  # (seconds) after a cooldown, send 1 request per interval to the deployment until it succeeds
+        enable_cooldown_pubsub: bool = False,  # share cooldown enter / exit events across instances over redis pub/sub
         routing_strategy: Literal[
             "simple-shuffle",
             "least-busy",
@@ -279,6 +310,7 @@ class Router:
             "latency-based-routing",
             "cost-based-routing",
             "usage-based-routing-v2",
+            "least-outstanding-requests",
         ] = "simple-shuffle",
         optional_pre_call_checks: Optional[OptionalPreCallChecks] = None,
         routing_strategy_args: dict = {},  # just for latency-based
@@ -304,6 +336,9 @@ class Router:
             client_ttl (int): Time-to-live for cached clients in seconds. Defaults to 3600.
             polling_interval: (Optional[float]): frequency of polling queue. Only for '.scheduler_acompletion()'. Default is 3ms.
             default_priority: (Optional[int]): the default priority for a request. Only for '.scheduler_acompletion()'. Default is None.
+            scheduler_use_redis_queue (bool): share the request prioritization queue across instances through redis. Requires redis. Defaults to False.
+            scheduler_policy (str): order of the request prioritization queue - "priority" (strict priority) or "wfq" (weighted fair queueing between priorities / teams, earliest deadline first within one, early rejection of requests that would miss their deadline). Defaults to "priority".
+            scheduler_priority_weights (Optional[Dict[int, float]]): "wfq" weight per priority. Defaults to 1 / (1 + priority).
             num_retries (Optional[int]): Number of retries for failed requests. Defaults to 2.
             timeout (Optional[float]): Timeout for requests. Defaults to None.
             default_litellm_params (dict): Default parameters for Router.chat.completion.create. Defaults to {}.
@@ -314,9 +349,13 @@ class Router:
             enable_pre_call_checks (boolean): Filter out deployments which are outside context window limits for a given prompt
             model_group_alias (Optional[dict]): Alias for model groups. Defaults to {}.
             retry_after (int): Minimum time to wait before retrying a failed request. Defaults to 0.
+            retry_budget_policy (Optional[RetryBudgetPolicy]): Cap the retries + hedged requests of each model group to `retry_ratio` of its requests. Defaults to None (no cap).
+            hedging_policy (Optional[HedgingPolicy]): Send a 2nd `acompletion` request to another deployment when the first has no first token after the model group's `percentile` time to first token. Defaults to None (no hedging).
             allowed_fails (Optional[int]): Number of allowed fails before adding to cooldown. Defaults to None.
             cooldown_time (float): Time to cooldown a deployment after failure in seconds. Defaults to 1.
-            routing_strategy (Literal["simple-shuffle", "least-busy", "usage-based-routing", "latency-based-routing", "cost-based-routing"]): Routing strategy. Defaults to "simple-shuffle".
+            cooldown_half_open_probe_interval (Optional[float]): After its cooldown ends, a deployment only gets 1 request per interval (seconds) until one succeeds - a failure puts it back in cooldown. Defaults to None (all traffic resumes when the cooldown ends).
+            enable_cooldown_pubsub (bool): Publish cooldown enter / exit events over redis pub/sub, so other instances apply them without reading cooldowns from redis. Requires redis. Defaults to False.
+            routing_strategy (Literal["simple-shuffle", "least-busy", "usage-based-routing", "latency-based-routing", "cost-based-routing", "least-outstanding-requests"]): Routing strategy. Defaults to "simple-shuffle".
             routing_strategy_args (dict): Additional args for latency-based routing. Defaults to {}.
             alerting_config (AlertingConfig): Slack alerting configuration. Defaults to None.
             provider_budget_config (ProviderBudgetConfig): Provider budget configuration. Use this to set llm_provider budget limits. example $100/day to OpenAI, $100/day to Azure, etc. Defaults to None.
@@ -416,12 +455,18 @@ class Router:
                 litellm.cache = litellm.Cache(type=cache_type, **cache_config)  # type: ignore
             self.cache_responses = cache_responses
         self.cache = DualCache(
-            redis_cache=redis_cache, in_memory_cache=InMemoryCache()
+            redis_cache=redis_cache,
+            in_memory_cache=InMemoryCache(namespace="router"),
+            batch_redis_gets=True,
         )  # use a dual cache (Redis+In-Memory) for tracking cooldowns, usage, etc.
 
         ### SCHEDULER ###
         self.scheduler = Scheduler(
-            polling_interval=polling_interval, redis_cache=redis_cache
+            polling_interval=polling_interval,
+            redis_cache=redis_cache,
+            use_redis_queue=scheduler_use_redis_queue,
+            policy=scheduler_policy,
+            priority_weights=scheduler_priority_weights,
         )
         self.default_priority = default_priority
         self.default_deployment = None  # use this to track the users default deployment, when they want to use model = *
@@ -438,6 +483,8 @@ class Router:
             model_group_alias or {}
         )  # dict to store aliases for router, ex. {"gpt-4": "gpt-3.5-turbo"}, all requests with gpt-4 -> get routed to gpt-3.5-turbo group
 
+        # per-model-group deployment snapshots for async_get_healthy_deployments, rebuilt when deployments change
+        self.deployment_snapshots = DeploymentSnapshotStore()
         # Initialize model ID to deployment index mapping for O(1) lookups
         self.model_id_to_deployment_index_map: Dict[str, int] = {}
         # Initialize model name to deployment indices mapping for O(1) lookups
@@ -464,6 +511,13 @@ class Router:
         self.cooldown_cache = CooldownCache(
             cache=self.cache, default_cooldown_time=self.cooldown_time
         )
+        # in-memory cooldown state, fed by the cooldown cache's enter events
+        self.cooldown_manager = CooldownManager(
+            cooldown_cache=self.cooldown_cache,
+            half_open_probe_interval=cooldown_half_open_probe_interval,
+            enable_pubsub=enable_cooldown_pubsub,
+            get_model_ids=self.get_model_ids,
+        )
         self.disable_cooldowns = disable_cooldowns
         self.failed_calls = (
             InMemoryCache()
@@ -615,6 +669,18 @@ class Router:
             model_group_retry_policy
         )
 
+        self.retry_budget: Optional[RetryBudget] = None
+        if retry_budget_policy is not None:
+            if isinstance(retry_budget_policy, dict):
+                retry_budget_policy = RetryBudgetPolicy(**retry_budget_policy)
+            self.retry_budget = RetryBudget(policy=retry_budget_policy)
+
+        self.hedged_requests: Optional[HedgedRequests] = None
+        if hedging_policy is not None:
+            if isinstance(hedging_policy, dict):
+                hedging_policy = HedgingPolicy(**hedging_policy)
+            self.hedged_requests = HedgedRequests(policy=hedging_policy)
+
         self.allowed_fails_policy: Optional[AllowedFailsPolicy] = None
         if allowed_fails_policy is not None:
             if isinstance(allowed_fails_policy, dict):
@@ -765,6 +831,21 @@ class Router:
             )
             if isinstance(litellm.callbacks, list):
                 litellm.logging_callback_manager.add_litellm_callback(self.lowestcost_logger)  # type: ignore
+        elif (
+            routing_strategy == RoutingStrategy.LEAST_OUTSTANDING_REQUESTS.value
+            or routing_strategy == RoutingStrategy.LEAST_OUTSTANDING_REQUESTS
+        ):
+            self.leastoutstanding_logger = LeastOutstandingRequestsLoggingHandler(
+                router_cache=self.cache,
+                routing_args=routing_strategy_args,
+            )
+            ## add callback - log_pre_api_call marks a request as in-flight
+            if isinstance(litellm.input_callback, list):
+                litellm.input_callback.append(self.leastoutstanding_logger)  # type: ignore
+            else:
+                litellm.input_callback = [self.leastoutstanding_logger]  # type: ignore
+            if isinstance(litellm.callbacks, list):
+                litellm.logging_callback_manager.add_litellm_callback(self.leastoutstanding_logger)  # type: ignore
         else:
             pass
 
@@ -1374,16 +1455,27 @@ class Router:
             async def __anext__(self):
                 return await self._async_generator.__anext__()
 
+            def supports_raw_sse_passthrough(self) -> bool:
+                return model_response.supports_raw_sse_passthrough()
+
+            def aiter_raw_sse(self):
+                # raw bytes are forwarded as is - no mid-stream fallbacks
+                return model_response.aiter_raw_sse()
+
         async def stream_with_fallbacks():
             try:
                 async for item in model_response:
                     yield item
             except MidStreamFallbackError as e:
-                from litellm.main import stream_chunk_builder
+                stream_assembler = getattr(model_response, "stream_assembler", None)
+                if stream_assembler is not None:
+                    complete_response_object = stream_assembler.build_response()
+                else:
+                    from litellm.main import stream_chunk_builder
 
-                complete_response_object = stream_chunk_builder(
-                    chunks=model_response.chunks
-                )
+                    complete_response_object = stream_chunk_builder(
+                        chunks=model_response.chunks
+                    )
                 complete_response_object_usage = cast(
                     Optional[Usage],
                     getattr(complete_response_object, "usage", None),
@@ -1643,9 +1735,9 @@ class Router:
         model_group_alias: Optional[str] = None
         if self._get_model_from_alias(model=model):
             model_group_alias = model
-        kwargs.setdefault(metadata_variable_name, {}).update(
-            {"model_group": model, "model_group_alias": model_group_alias}
-        )
+        _metadata = kwargs.setdefault(metadata_variable_name, {})
+        _metadata["model_group"] = model
+        _metadata["model_group_alias"] = model_group_alias
 
     def _update_kwargs_with_default_litellm_params(
         self, kwargs: dict, metadata_variable_name: Optional[str] = "metadata"
@@ -1655,18 +1747,19 @@ class Router:
 
         Handles inserting this as either "metadata" or "litellm_metadata" depending on the metadata_variable_name
         """
-        # 1) copy your defaults and pull out metadata
-        defaults = self.default_litellm_params.copy()
-        metadata_defaults = defaults.pop("metadata", {}) or {}
+        # runs on every request - read the defaults in place, instead of copying them
+        metadata_defaults = None
+        # 1) add any non-metadata defaults that aren't already in kwargs
+        for key, value in self.default_litellm_params.items():
+            if key == "metadata":
+                metadata_defaults = value
+            elif value is not None:
+                kwargs.setdefault(key, value)
 
-        # 2) add any non-metadata defaults that aren't already in kwargs
-        for key, value in defaults.items():
-            if value is None:
-                continue
-            kwargs.setdefault(key, value)
-
-        # 3) merge in metadata, this handles inserting this as either "metadata" or "litellm_metadata"
-        kwargs.setdefault(metadata_variable_name, {}).update(metadata_defaults)
+        # 2) merge in metadata, this handles inserting this as either "metadata" or "litellm_metadata"
+        _metadata = kwargs.setdefault(metadata_variable_name, {})
+        if metadata_defaults:
+            _metadata.update(metadata_defaults)
 
     def _handle_clientside_credential(
         self, deployment: dict, kwargs: dict, function_name: Optional[str] = None
@@ -2079,33 +2172,19 @@ class Router:
         item = FlowItem(
             priority=priority,  # 👈 SET PRIORITY FOR REQUEST
             request_id=_request_id,  # 👈 SET REQUEST ID
-            model_name="gpt-3.5-turbo",  # 👈 SAME as 'Router'
+            model_name=model,  # 👈 SAME as 'Router'
+            **self._get_scheduler_flow_params(kwargs),
         )
         ### [fin] ###
 
-        ## ADDS REQUEST TO QUEUE ##
-        await self.scheduler.add_request(request=item)
-
-        ## POLL QUEUE
-        end_time = time.monotonic() + self.timeout
-        curr_time = time.monotonic()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
-        make_request = False
-
-        while curr_time < end_time:
-            _healthy_deployments, _ = await self._async_get_healthy_deployments(
+        ## WAIT IN QUEUE ## - returns 'True' once there's a healthy deployment and no higher priority request is queued
+        make_request = await self.scheduler.acquire(
+            request=item,
+            check_capacity=lambda: self._async_get_scheduler_capacity(
                 model=model, parent_otel_span=parent_otel_span
-            )
-            make_request = await self.scheduler.poll(  ## POLL QUEUE ## - returns 'True' if there's healthy deployments OR if request is at top of queue
-                id=item.request_id,
-                model_name=item.model_name,
-                health_deployments=_healthy_deployments,
-            )
-            if make_request:  ## IF TRUE -> MAKE REQUEST
-                break
-            else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
-                curr_time = time.monotonic()
+            ),
+            timeout=self.timeout,
+        )
 
         if make_request:
             try:
@@ -2120,6 +2199,8 @@ class Router:
             except Exception as e:
                 setattr(e, "priority", priority)
                 raise e
+            finally:
+                self.scheduler.notify(model_name=model)  # wake the queue
         else:
             raise litellm.Timeout(
                 message="Request timed out while polling queue",
@@ -2142,32 +2223,18 @@ class Router:
             priority=priority,  # 👈 SET PRIORITY FOR REQUEST
             request_id=_request_id,  # 👈 SET REQUEST ID
             model_name=model,  # 👈 SAME as 'Router'
+            **self._get_scheduler_flow_params(kwargs),
         )
         ### [fin] ###
 
-        ## ADDS REQUEST TO QUEUE ##
-        await self.scheduler.add_request(request=item)
-
-        ## POLL QUEUE
-        end_time = time.monotonic() + self.timeout
-        curr_time = time.monotonic()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
-        make_request = False
-
-        while curr_time < end_time:
-            _healthy_deployments, _ = await self._async_get_healthy_deployments(
+        ## WAIT IN QUEUE ## - returns 'True' once there's a healthy deployment and no higher priority request is queued
+        make_request = await self.scheduler.acquire(
+            request=item,
+            check_capacity=lambda: self._async_get_scheduler_capacity(
                 model=model, parent_otel_span=parent_otel_span
-            )
-            make_request = await self.scheduler.poll(  ## POLL QUEUE ## - returns 'True' if there's healthy deployments OR if request is at top of queue
-                id=item.request_id,
-                model_name=item.model_name,
-                health_deployments=_healthy_deployments,
-            )
-            if make_request:  ## IF TRUE -> MAKE REQUEST
-                break
-            else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
-                curr_time = time.monotonic()
+            ),
+            timeout=self.timeout,
+        )
 
         if make_request:
             try:
@@ -2181,6 +2248,8 @@ class Router:
             except Exception as e:
                 setattr(e, "priority", priority)
                 raise e
+            finally:
+                self.scheduler.notify(model_name=model)  # wake the queue
         else:
             raise litellm.Timeout(
                 message="Request timed out while polling queue",
@@ -2188,6 +2257,45 @@ class Router:
                 llm_provider="openai",
             )
 
+    def _get_scheduler_flow_params(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Flow (team) and deadline of a prioritized request - used by scheduler_policy="wfq"
+        """
+        metadata = kwargs.get("metadata") or kwargs.get("litellm_metadata") or {}
+        request_timeout = kwargs.get("timeout")
+        return {
+            "flow_id": metadata.get("user_api_key_team_id"),
+            "deadline": (
+                time.monotonic() + float(request_timeout)
+                if isinstance(request_timeout, (int, float))
+                else None
+            ),
+        }
+
+    async def _async_get_scheduler_capacity(
+        self, model: str, parent_otel_span: Optional[Span]
+    ) -> Tuple[bool, Optional[float]]:
+        """
+        Capacity check for the scheduler queue.
+
+        Returns (has healthy deployments, seconds until the next cooldown in the model group ends)
+        """
+        _healthy_deployments, _ = await self._async_get_healthy_deployments(
+            model=model, parent_otel_span=parent_otel_span
+        )
+        if len(_healthy_deployments) > 0:
+            return True, None
+        active_cooldowns = await self.cooldown_cache.async_get_active_cooldowns(
+            model_ids=self.get_model_ids(model_name=model),
+            parent_otel_span=parent_otel_span,
+        )
+        current_time = time.time()
+        cooldown_ends_in = [
+            cooldown["timestamp"] + cooldown["cooldown_time"] - current_time
+            for _, cooldown in active_cooldowns
+        ]
+        return False, min(cooldown_ends_in) if cooldown_ends_in else None
+
     def _is_prompt_management_model(self, model: str) -> bool:
         model_list = self.get_model_list(model_name=model)
         if model_list is None or len(model_list) != 1:
@@ -2226,7 +2334,7 @@ class Router:
         self._update_kwargs_with_deployment(
             deployment=prompt_management_deployment, kwargs=kwargs
         )
-        data = prompt_management_deployment["litellm_params"].copy()
+        data = prompt_management_deployment["litellm_params"]
 
         litellm_model = data.get("model", None)
 
@@ -2317,7 +2425,7 @@ class Router:
                 specific_deployment=kwargs.pop("specific_deployment", None),
             )
             self._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
 
             model_client = self._get_async_openai_model_client(
                 deployment=deployment,
@@ -2387,7 +2495,7 @@ class Router:
             )
             self._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
 
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_name = data["model"]
 
             model_client = self._get_async_openai_model_client(
@@ -2501,7 +2609,7 @@ class Router:
             )
 
             self._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_client = self._get_async_openai_model_client(
                 deployment=deployment,
                 kwargs=kwargs,
@@ -2599,7 +2707,7 @@ class Router:
                 request_kwargs=kwargs,
             )
             self._update_kwargs_before_fallbacks(model=model, kwargs=kwargs)
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             data["model"]
             for k, v in self.default_litellm_params.items():
                 if (
@@ -2675,7 +2783,7 @@ class Router:
                 request_kwargs=kwargs,
             )
             self._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_name = data["model"]
 
             model_client = self._get_async_openai_model_client(
@@ -2729,7 +2837,7 @@ class Router:
                 specific_deployment=kwargs.pop("specific_deployment", None),
             )
 
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             for k, v in self.default_litellm_params.items():
                 if (
                     k not in kwargs
@@ -2794,7 +2902,7 @@ class Router:
             )
             self._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
 
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_name = data["model"]
 
             model_client = self._get_async_openai_model_client(
@@ -2893,7 +3001,7 @@ class Router:
             )
             self._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
 
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_name = data["model"]
 
             model_client = self._get_async_openai_model_client(
@@ -3160,7 +3268,7 @@ class Router:
                 deployment=deployment, kwargs=kwargs, function_name=function_name
             )
 
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_name = data["model"]
             self.total_calls[model_name] += 1
 
@@ -3240,7 +3348,7 @@ class Router:
                 deployment=deployment, kwargs=kwargs, function_name="generic_api_call"
             )
 
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_name = data["model"]
 
             self.total_calls[model_name] += 1
@@ -3311,7 +3419,7 @@ class Router:
                 specific_deployment=kwargs.pop("specific_deployment", None),
             )
             self._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_name = data["model"]
 
             potential_model_client = self._get_client(
@@ -3394,7 +3502,7 @@ class Router:
                 request_kwargs=kwargs,
             )
             self._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_name = data["model"]
             model_client = self._get_async_openai_model_client(
                 deployment=deployment,
@@ -3504,7 +3612,7 @@ class Router:
                     kwargs=kwargs_copy,
                     function_name="acreate_file",
                 )
-                data = deployment["litellm_params"].copy()
+                data = deployment["litellm_params"]
                 model_name = data["model"]
 
                 model_client = self._get_async_openai_model_client(
@@ -3655,7 +3763,7 @@ class Router:
                 request_kwargs=kwargs,
             )
 
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             model_name = data["model"]
             self._update_kwargs_with_deployment(
                 deployment=deployment, kwargs=kwargs, function_name="_acreate_batch"
@@ -3906,7 +4014,7 @@ class Router:
                 request_kwargs=kwargs,
             )
             kwargs["model"] = deployment["litellm_params"]["model"]
-            data = deployment["litellm_params"].copy()
+            data = deployment["litellm_params"]
             self._update_kwargs_with_deployment(
                 deployment=deployment,
                 kwargs=kwargs,
@@ -4583,6 +4691,8 @@ class Router:
         )
         model_group: Optional[str] = kwargs.get("model")
         num_retries = kwargs.pop("num_retries")
+        if self.retry_budget is not None and model_group is not None:
+            self.retry_budget.record_request(model_group)
 
         ## ADD MODEL GROUP SIZE TO METADATA - used for model_group_rate_limit_error tracking
         _metadata: dict = kwargs.get("litellm_metadata", kwargs.get("metadata")) or {}
@@ -4599,7 +4709,9 @@ class Router:
                 model_group=model_group, kwargs=kwargs
             )
             # if the function call is successful, no exception will be raised and we'll break out of the loop
-            response = await self.make_call(original_function, *args, **kwargs)
+            response = await self._make_call_with_hedging(
+                original_function, *args, **kwargs
+            )
             response = add_retry_headers_to_response(
                 response=response, attempted_retries=0, max_retries=None
             )
@@ -4645,7 +4757,7 @@ class Router:
                 if _retry_policy_retries is not None:
                     num_retries = _retry_policy_retries
             ## LOGGING
-            if num_retries > 0:
+            if num_retries > 0 and self._acquire_retry_budget(model_group):
                 kwargs = self.log_retry(kwargs=kwargs, e=original_exception)
             else:
                 raise
@@ -4702,6 +4814,10 @@ class Router:
                         healthy_deployments=_healthy_deployments,
                         all_deployments=_all_deployments,
                     )
+                    if current_attempt + 1 < num_retries and not self._acquire_retry_budget(
+                        _model
+                    ):
+                        break  # retry budget exhausted
                     await asyncio.sleep(_timeout)
 
             if type(original_exception) in litellm.LITELLM_EXCEPTION_TYPES:
@@ -4710,6 +4826,32 @@ class Router:
 
             raise original_exception
 
+    def _acquire_retry_budget(self, model_group: Optional[str]) -> bool:
+        """
+        Whether a retry may be sent - False if the model group's retry budget is exhausted
+        """
+        if self.retry_budget is None or model_group is None:
+            return True
+        return self.retry_budget.try_acquire(model_group)
+
+    async def _make_call_with_hedging(self, original_function: Any, *args, **kwargs):
+        """
+        `make_call`, with a hedged request to another deployment if `hedging_policy` is set for the model group
+        """
+        if (
+            self.hedged_requests is None
+            or original_function != self._acompletion
+            or not self.hedged_requests.is_enabled(kwargs.get("model"))
+        ):
+            return await self.make_call(original_function, *args, **kwargs)
+        return await self.hedged_requests.async_call(
+            litellm_router_instance=self,
+            make_call=lambda call_kwargs: self.make_call(
+                original_function, *args, **call_kwargs
+            ),
+            kwargs=kwargs,
+        )
+
     async def make_call(self, original_function: Any, *args, **kwargs):
         """
         Handler for making a call to the .completion()/.embeddings()/etc. functions.
@@ -5082,6 +5224,8 @@ class Router:
                 id = str(id)
 
         if id is not None:
+            # a successful probe request takes a half-open deployment out of cooldown
+            self.cooldown_manager.record_success(id)
             key = increment_deployment_successes_for_current_minute(
                 litellm_router_instance=self,
                 deployment_id=id,
@@ -5339,7 +5483,9 @@ class Router:
             pass
 
         unhealthy_deployments = _get_cooldown_deployments(
-            litellm_router_instance=self, parent_otel_span=parent_otel_span
+            litellm_router_instance=self,
+            parent_otel_span=parent_otel_span,
+            model_ids=[d["model_info"]["id"] for d in _all_deployments],
         )
         healthy_deployments: list = []
         for deployment in _all_deployments:
@@ -5370,7 +5516,9 @@ class Router:
             pass
 
         unhealthy_deployments = await _async_get_cooldown_deployments(
-            litellm_router_instance=self, parent_otel_span=parent_otel_span
+            litellm_router_instance=self,
+            parent_otel_span=parent_otel_span,
+            model_ids=[d["model_info"]["id"] for d in _all_deployments],
         )
         # Convert to set for O(1) lookup instead of O(n)
         unhealthy_deployments_set = set(unhealthy_deployments)
@@ -5715,6 +5863,7 @@ class Router:
 
     def set_model_list(self, model_list: list):
         original_model_list = copy.deepcopy(model_list)
+        self.deployment_snapshots.invalidate()
         self.model_list = []
         self.model_id_to_deployment_index_map = {}  # Reset the index
         self.model_name_to_deployment_indices = {}  # Reset the model_name index
@@ -5977,6 +6126,7 @@ class Router:
         - model_id: str - the id of the deployment that was removed
         - removal_idx: int - the index where the deployment was removed from model_list
         """
+        self.deployment_snapshots.invalidate()
         # Update indices for all models after the removed one
         for deployment_id, idx in self.model_id_to_deployment_index_map.items():
             if idx > removal_idx:
@@ -6017,6 +6167,7 @@ class Router:
         """
         idx = len(self.model_list)
         self.model_list.append(model)
+        self.deployment_snapshots.invalidate()
 
         # Update model_id index for O(1) lookup
         if model_id is not None:
@@ -6814,6 +6965,7 @@ class Router:
         instead of O(n) linear scan through the entire model_list.
         """
         self.model_name_to_deployment_indices.clear()
+        self.deployment_snapshots.invalidate()
 
         for idx, model in enumerate(model_list):
             model_name = model.get("model_name")
@@ -7386,7 +7538,9 @@ class Router:
         invalid_model_indices = set()  # Use set for O(1) membership checks
 
         try:
-            input_tokens = litellm.token_counter(messages=messages)
+            input_tokens = get_request_input_tokens(
+                messages=messages, request_kwargs=request_kwargs
+            )
         except Exception as e:
             verbose_router_logger.error(
                 "litellm.router.py::_pre_call_checks: failed to count tokens. Returning initial list of deployments. Got - {}".format(
@@ -7709,15 +7863,21 @@ class Router:
         input: Optional[Union[str, List]] = None,
         specific_deployment: Optional[bool] = False,
         parent_otel_span: Optional[Span] = None,
+        acquire_probes: bool = False,
     ) -> Union[List[Dict], Dict]:
         """
-        Get the healthy deployments for a model.
+        Get the healthy deployments for a model. With `acquire_probes` (routing a request), half-open ones use up their due probe request.
 
         Returns:
         - List[Dict], if multiple models chosen
         *OR*
         - Dict, if specific model chosen
         """
+        snapshot_deployments = await self._async_get_healthy_deployments_from_snapshot(
+            model, request_kwargs, messages, specific_deployment, parent_otel_span, acquire_probes
+        )
+        if snapshot_deployments is not None:
+            return snapshot_deployments
 
         model, healthy_deployments = self._common_checks_available_deployment(
             model=model,
@@ -7747,12 +7907,12 @@ class Router:
             return healthy_deployments
 
         cooldown_deployments = await _async_get_cooldown_deployments(
-            litellm_router_instance=self, parent_otel_span=parent_otel_span
-        )
-        verbose_router_logger.debug(
-            f"async cooldown deployments: {cooldown_deployments}"
+            litellm_router_instance=self,
+            parent_otel_span=parent_otel_span,
+            model_ids=[d["model_info"]["id"] for d in healthy_deployments],
+            acquire_probes=acquire_probes,
         )
-        verbose_router_logger.debug(f"cooldown_deployments: {cooldown_deployments}")
+        verbose_router_logger.debug(f"async cooldown deployments: {cooldown_deployments}")
         healthy_deployments = self._filter_cooldown_deployments(
             healthy_deployments=healthy_deployments,
             cooldown_deployments=cooldown_deployments,
@@ -7796,6 +7956,139 @@ class Router:
 
         return healthy_deployments
 
+    async def _async_get_healthy_deployments_from_snapshot(
+        self,
+        model: str,
+        request_kwargs: Optional[Dict],
+        messages: Optional[List[Dict[str, str]]] = None,
+        specific_deployment: Optional[bool] = False,
+        parent_otel_span: Optional[Span] = None,
+        acquire_probes: bool = False,
+    ) -> Optional[List[Dict]]:
+        """
+        Fast path of 'async_get_healthy_deployments' for a model group name.
+
+        Team, web search, cooldown, region and tag filters are bitmask operations on the model group's
+        precomputed snapshot, instead of a list rebuild per filter.
+
+        Returns:
+        - List[Dict], the healthy deployments
+        - None, if the request needs the full filter chain (specific deployment, model id, alias, wildcard route)
+        """
+        if (
+            specific_deployment is True
+            or model not in self.model_names
+            or model in self.model_group_alias
+            or self.has_model_id(model)
+        ):
+            return None
+        snapshot = self.deployment_snapshots.get(
+            model_group=model,
+            build_deployments=lambda: cast(
+                List[Dict], self._get_all_deployments(model_name=model)
+            ),
+        )
+        if snapshot is None:
+            return None
+        if litellm.model_alias_map and model in litellm.model_alias_map:
+            model = litellm.model_alias_map[model]
+
+        run_pre_call_checks = self.enable_pre_call_checks and messages is not None
+        mask = await self._async_get_snapshot_request_mask(
+            model=model,
+            snapshot=snapshot,
+            request_kwargs=request_kwargs,
+            run_pre_call_checks=run_pre_call_checks,
+            parent_otel_span=parent_otel_span,
+            acquire_probes=acquire_probes,
+        )
+        selected_deployments = snapshot.select(mask)
+        healthy_deployments = await self.async_callback_filter_deployments(
+            model=model,
+            healthy_deployments=selected_deployments,
+            messages=(
+                cast(List[AllMessageValues], messages) if messages is not None else None
+            ),
+            request_kwargs=request_kwargs,
+            parent_otel_span=parent_otel_span,
+        )
+        metadata_variable_name = self._get_metadata_variable_name_from_kwargs(
+            request_kwargs or {}
+        )
+        if healthy_deployments is selected_deployments and not run_pre_call_checks:
+            # unchanged by callbacks - tag filter on the mask too
+            mask = get_deployment_mask_for_tag(
+                llm_router_instance=self,
+                model=model,
+                snapshot=snapshot,
+                mask=mask,
+                request_kwargs=request_kwargs,
+                metadata_variable_name=metadata_variable_name,
+            )
+            healthy_deployments = snapshot.select(mask)
+        else:
+            if run_pre_call_checks:
+                healthy_deployments = self._pre_call_checks(
+                    model=model,
+                    healthy_deployments=cast(List[Dict], healthy_deployments),
+                    messages=cast(List[Dict[str, str]], messages),
+                    request_kwargs=request_kwargs,
+                )
+            healthy_deployments = await get_deployments_for_tag(  # type: ignore
+                llm_router_instance=self,
+                model=model,
+                request_kwargs=request_kwargs,
+                healthy_deployments=healthy_deployments,
+                metadata_variable_name=metadata_variable_name,
+            )
+
+        if len(healthy_deployments) == 0:
+            exception = await async_raise_no_deployment_exception(
+                litellm_router_instance=self,
+                model=model,
+                parent_otel_span=parent_otel_span,
+            )
+            raise exception
+        return healthy_deployments
+
+    async def _async_get_snapshot_request_mask(
+        self,
+        model: str,
+        snapshot: ModelGroupSnapshot,
+        request_kwargs: Optional[Dict],
+        run_pre_call_checks: bool,
+        parent_otel_span: Optional[Span] = None,
+        acquire_probes: bool = False,
+    ) -> int:
+        """
+        Bitmask of the snapshot's deployments that pass the team, web search, cooldown and region filters
+        """
+        mask = snapshot.all_mask
+        if request_kwargs is not None:
+            metadata = request_kwargs.get("metadata") or {}
+            litellm_metadata = request_kwargs.get("litellm_metadata") or {}
+            mask &= snapshot.get_team_mask(
+                metadata.get("user_api_key_team_id")
+                or litellm_metadata.get("user_api_key_team_id")
+            )
+            if is_web_search_request(request_kwargs):
+                if mask and not mask & snapshot.web_search_mask:
+                    verbose_router_logger.warning(
+                        "No deployments support web search for request"
+                    )
+                mask &= snapshot.web_search_mask
+            allowed_model_region = request_kwargs.get("allowed_model_region")
+            if run_pre_call_checks and allowed_model_region is not None:
+                mask &= snapshot.get_region_mask(allowed_model_region)
+        mask &= ~await self.deployment_snapshots.async_get_cooldown_mask(
+            model_group=model,
+            snapshot=snapshot,
+            cooldown_manager=self.cooldown_manager,
+            parent_otel_span=parent_otel_span,
+            acquire_probes=acquire_probes,
+        )
+        return mask
+
     async def async_get_available_deployment(
         self,
         model: str,
@@ -7815,6 +8108,7 @@ class Router:
             and self.routing_strategy != "cost-based-routing"
             and self.routing_strategy != "latency-based-routing"
             and self.routing_strategy != "least-busy"
+            and self.routing_strategy != "least-outstanding-requests"
         ):  # prevent regressions for other routing strategies, that don't have async get available deployments implemented.
             return self.get_available_deployment(
                 model=model,
@@ -7849,6 +8143,7 @@ class Router:
                 input=input,
                 specific_deployment=specific_deployment,
                 parent_otel_span=parent_otel_span,
+                acquire_probes=True,
             )
             if isinstance(healthy_deployments, dict):
                 return healthy_deployments
@@ -7907,6 +8202,16 @@ class Router:
                         healthy_deployments=healthy_deployments,  # type: ignore
                     )
                 )
+            elif (
+                self.routing_strategy == "least-outstanding-requests"
+                and self.leastoutstanding_logger is not None
+            ):
+                deployment = (
+                    await self.leastoutstanding_logger.async_get_available_deployments(
+                        model_group=model,
+                        healthy_deployments=healthy_deployments,  # type: ignore
+                    )
+                )
             else:
                 deployment = None
             if deployment is None:
@@ -8007,7 +8312,10 @@ class Router:
             request_kwargs
         )
         cooldown_deployments = _get_cooldown_deployments(
-            litellm_router_instance=self, parent_otel_span=parent_otel_span
+            litellm_router_instance=self,
+            parent_otel_span=parent_otel_span,
+            model_ids=[d["model_info"]["id"] for d in healthy_deployments],
+            acquire_probes=True,
         )
         healthy_deployments = self._filter_cooldown_deployments(
             healthy_deployments=healthy_deployments,
@@ -8042,6 +8350,13 @@ class Router:
             deployment = self.leastbusy_logger.get_available_deployments(
                 model_group=model, healthy_deployments=healthy_deployments  # type: ignore
             )
+        elif (
+            self.routing_strategy == "least-outstanding-requests"
+            and self.leastoutstanding_logger is not None
+        ):
+            deployment = self.leastoutstanding_logger.get_available_deployments(
+                model_group=model, healthy_deployments=healthy_deployments  # type: ignore
+            )
         elif self.routing_strategy == "simple-shuffle":
             # if users pass rpm or tpm, we do a random weighted pick - based on rpm/tpm
             ############## Check 'weight' param set for weighted pick #################
@@ -8243,6 +8558,8 @@ class Router:
     def flush_cache(self):
         litellm.cache = None
         self.cache.flush_cache()
+        self.cooldown_manager.clear()
+        self.deployment_snapshots.clear_cooldowns()
 
     def reset(self):
         ## clean up on close
@@ -0,0 +1,183 @@
+"""
+Compact per-deployment latency statistics for latency-based routing (`routing_strategy_args={"latency_stats": "ewma"}`)
+
+Instead of lists of recent latencies per deployment in a cache dict, each model group keeps
+column arrays indexed by a deployment slot:
+
+- exponentially weighted moving average (EWMA) of latency, and - separately - of time to first token
+- sample counts and last update time (stats older than the routing `ttl` are ignored)
+- tpm / rpm of the current minute
+
+Only these summary stats are synced between instances through redis, never raw samples. Each instance publishes
+its own summary - other instances' summaries are combined with the local stats at selection time, never merged into them.
+"""
+
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+# deployment id -> [latency EWMA, ttft EWMA, num latency samples, num ttft samples, updated at]
+LatencySummary = Dict[str, List[float]]
+
+
+class ModelGroupLatencyStats:
+    def __init__(self, alpha: float, max_samples: int):
+        """
+        Args:
+            alpha: EWMA smoothing - weight of the newest sample
+            max_samples: cap on the sample counts, so combining with other instances' summaries is weighted by recent samples only
+        """
+        self.alpha = alpha
+        self.max_samples = max_samples
+        self.slots: Dict[str, int] = {}
+        self.latency = array("d")
+        self.ttft = array("d")
+        self.num_samples = array("q")
+        self.num_ttft_samples = array("q")
+        self.updated_at = array("d")
+        self.minute: Optional[str] = None
+        self.tpm = array("q")
+        self.rpm = array("q")
+        # other instances' summaries, summed per slot: sample-weighted latency / ttft sums, sample counts, latest update
+        self.remote_latency_sum = array("d")
+        self.remote_ttft_sum = array("d")
+        self.remote_num_samples = array("d")
+        self.remote_num_ttft_samples = array("d")
+        self.remote_updated_at = array("d")
+
+    def get_slot(self, deployment_id: str) -> int:
+        slot = self.slots.get(deployment_id)
+        if slot is None:
+            slot = self.slots[deployment_id] = len(self.latency)
+            for column in (
+                self.latency,
+                self.ttft,
+                self.updated_at,
+                *self._remote_columns(),
+            ):
+                column.append(0.0)
+            for counter in (self.num_samples, self.num_ttft_samples, self.tpm, self.rpm):
+                counter.append(0)
+        return slot
+
+    def _remote_columns(self) -> Tuple[array, ...]:
+        return (
+            self.remote_latency_sum,
+            self.remote_ttft_sum,
+            self.remote_num_samples,
+            self.remote_num_ttft_samples,
+            self.remote_updated_at,
+        )
+
+    def _ewma(self, previous: float, num_samples: int, value: float) -> float:
+        if num_samples == 0:
+            return value
+        return previous + self.alpha * (value - previous)
+
+    def roll_minute(self, minute: str) -> None:
+        """Reset tpm / rpm when a new minute starts"""
+        if minute != self.minute:
+            self.minute = minute
+            for counter in (self.tpm, self.rpm):
+                for slot in range(len(counter)):
+                    counter[slot] = 0
+
+    def record(
+        self,
+        deployment_id: str,
+        latency: float,
+        time_to_first_token: Optional[float],
+        total_tokens: int,
+        minute: str,
+    ) -> None:
+        slot = self.get_slot(deployment_id)
+        self.latency[slot] = self._ewma(
+            self.latency[slot], self.num_samples[slot], latency
+        )
+        self.num_samples[slot] = min(self.num_samples[slot] + 1, self.max_samples)
+        if time_to_first_token is not None:
+            self.ttft[slot] = self._ewma(
+                self.ttft[slot], self.num_ttft_samples[slot], time_to_first_token
+            )
+            self.num_ttft_samples[slot] = min(
+                self.num_ttft_samples[slot] + 1, self.max_samples
+            )
+        self.updated_at[slot] = time.time()
+        self.roll_minute(minute)
+        self.tpm[slot] += total_tokens
+        self.rpm[slot] += 1
+
+    def record_failure(self, deployment_id: str, penalty: float) -> None:
+        slot = self.get_slot(deployment_id)
+        self.latency[slot] = self._ewma(
+            self.latency[slot], self.num_samples[slot], penalty
+        )
+        self.num_samples[slot] = min(self.num_samples[slot] + 1, self.max_samples)
+        self.updated_at[slot] = time.time()
+
+    def get(
+        self, deployment_id: str, stream: bool, ttl: float, now: float
+    ) -> Tuple[float, int, int]:
+        """
+        Returns (latency - ttft for streaming requests if known, tpm, rpm) of the deployment.
+
+        Latencies are the local ones combined with other instances' summaries, weighted by (capped) sample counts.
+        Deployments without recent stats have latency 0, so they're tried.
+        """
+        slot = self.slots.get(deployment_id)
+        if slot is None:
+            return 0.0, 0, 0
+        local_n = self.num_samples[slot] if now - self.updated_at[slot] <= ttl else 0
+        fresh_remote = now - self.remote_updated_at[slot] <= ttl
+        remote_n = self.remote_num_samples[slot] if fresh_remote else 0.0
+        local_ttft_n = self.num_ttft_samples[slot] if local_n > 0 else 0
+        remote_ttft_n = self.remote_num_ttft_samples[slot] if fresh_remote else 0.0
+        if local_n + remote_n == 0:
+            latency = 0.0
+        elif stream and local_ttft_n + remote_ttft_n > 0:
+            latency = (
+                self.ttft[slot] * local_ttft_n
+                + (self.remote_ttft_sum[slot] if fresh_remote else 0.0)
+            ) / (local_ttft_n + remote_ttft_n)
+        else:
+            latency = (
+                self.latency[slot] * local_n
+                + (self.remote_latency_sum[slot] if fresh_remote else 0.0)
+            ) / (local_n + remote_n)
+        return latency, self.tpm[slot], self.rpm[slot]
+
+    def to_summary(self) -> LatencySummary:
+        return {
+            deployment_id: [
+                self.latency[slot],
+                self.ttft[slot],
+                self.num_samples[slot],
+                self.num_ttft_samples[slot],
+                self.updated_at[slot],
+            ]
+            for deployment_id, slot in self.slots.items()
+            if self.num_samples[slot] > 0
+        }
+
+    def set_remote_summaries(self, summaries: List[LatencySummary], ttl: float) -> None:
+        """
+        Replace the other instances' summaries - stale entries ignored. The local stats are left as they are.
+        """
+        for column in self._remote_columns():
+            for slot in range(len(column)):
+                column[slot] = 0.0
+        now = time.time()
+        for summary in summaries:
+            for deployment_id, entry in summary.items():
+                remote_latency, remote_ttft, remote_n, remote_ttft_n, remote_at = entry
+                if now - remote_at > ttl or remote_n <= 0:
+                    continue
+                slot = self.get_slot(deployment_id)
+                self.remote_latency_sum[slot] += remote_latency * remote_n
+                self.remote_num_samples[slot] += remote_n
+                if remote_ttft_n > 0:
+                    self.remote_ttft_sum[slot] += remote_ttft * remote_ttft_n
+                    self.remote_num_ttft_samples[slot] += remote_ttft_n
+                self.remote_updated_at[slot] = max(
+                    self.remote_updated_at[slot], remote_at
+                )
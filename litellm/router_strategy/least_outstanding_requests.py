@@ -0,0 +1,323 @@
+#### What this does ####
+#   picks the better of two random deployments by outstanding (in-flight) requests, weighted by recent latency
+#   How is this achieved?
+#   - use litellm.input_callbacks to log when a request is just about to be made to a deployment - tracked per litellm_call_id
+#   - use litellm.success + failure callbacks to log when it completed, and update the deployment's latency moving average
+#   - in get_available_deployment, sample 2 healthy deployments -> pick the one with the lower (outstanding + 1) * latency
+#   - with redis, in-flight counts are incremented / decremented in redis too, and other instances' counts are read every `sync_interval`
+
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from litellm._logging import verbose_router_logger
+from litellm.caching.caching import DualCache
+from litellm.constants import (
+    LEAST_OUTSTANDING_REQUESTS_LATENCY_EWMA_ALPHA,
+    LEAST_OUTSTANDING_REQUESTS_STALE_SECONDS,
+    LEAST_OUTSTANDING_REQUESTS_SYNC_INTERVAL_SECONDS,
+)
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.types.caching import RedisPipelineIncrementOperation
+from litellm.types.utils import LiteLLMPydanticObjectBase
+
+
+class RoutingArgs(LiteLLMPydanticObjectBase):
+    ewma_alpha: float = LEAST_OUTSTANDING_REQUESTS_LATENCY_EWMA_ALPHA
+    # share in-flight counts with other instances through the router's redis cache
+    use_redis: bool = True
+    sync_interval: float = LEAST_OUTSTANDING_REQUESTS_SYNC_INTERVAL_SECONDS
+    stale_request_seconds: int = LEAST_OUTSTANDING_REQUESTS_STALE_SECONDS
+
+
+class LeastOutstandingRequestsLoggingHandler(CustomLogger):
+    test_flag: bool = False
+    logged_success: int = 0
+    logged_failure: int = 0
+
+    def __init__(self, router_cache: DualCache, routing_args: dict = {}):
+        self.router_cache = router_cache
+        self.routing_args = RoutingArgs(**routing_args)
+        # deployment id -> {litellm_call_id: (start time, counted in redis)}
+        self.in_flight: Dict[str, Dict[str, Tuple[float, bool]]] = {}
+        # deployment id -> latency moving average (seconds)
+        self.latency: Dict[str, float] = {}
+        # deployment id -> (in-flight count of all instances, local in-flight count) at the last redis sync
+        self.remote_in_flight: Dict[str, Tuple[int, int]] = {}
+        self._last_sync: Dict[str, float] = {}
+        self._last_stale_sweep = time.time()
+        # running redis updates - the event loop only keeps weak references to tasks
+        self._running_tasks: Set[asyncio.Task] = set()
+
+    ### IN-FLIGHT TRACKING ###
+
+    def _get_request_ids(self, kwargs: dict) -> Tuple[Optional[str], Optional[str]]:
+        """Returns (deployment id, litellm_call_id) of a logged request"""
+        litellm_params = kwargs.get("litellm_params") or {}
+        metadata = litellm_params.get(self._select_metadata_field(kwargs)) or {}
+        deployment_id = (litellm_params.get("model_info") or {}).get("id", None)
+        if metadata.get("model_group", None) is None or deployment_id is None:
+            return None, None
+        return str(deployment_id), kwargs.get("litellm_call_id", None)
+
+    def _get_redis_key(self, deployment_id: str) -> str:
+        return f"{deployment_id}_outstanding_requests"
+
+    def _use_redis(self) -> bool:
+        return self.routing_args.use_redis and self.router_cache.redis_cache is not None
+
+    def _schedule_redis_increment(self, deployment_id: str, value: int) -> bool:
+        """Increment the deployment's redis in-flight count in the background - only possible inside an event loop"""
+        if not self._use_redis():
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        task = loop.create_task(self._async_redis_increment(deployment_id, value))
+        self._running_tasks.add(task)
+        task.add_done_callback(self._running_tasks.discard)
+        return True
+
+    async def _async_redis_increment(self, deployment_id: str, value: int) -> None:
+        redis_cache = self.router_cache.redis_cache
+        if redis_cache is None:
+            return
+        try:
+            # ttl bounds how long a crashed instance's in-flight requests are counted - refreshed on every
+            # update, so the count of a deployment that is busy for longer than the ttl isn't reset
+            await redis_cache.async_increment_pipeline(
+                increment_list=[
+                    RedisPipelineIncrementOperation(
+                        key=self._get_redis_key(deployment_id),
+                        increment_value=value,
+                        ttl=self.routing_args.stale_request_seconds,
+                    )
+                ]
+            )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "LeastOutstandingRequests: failed to update in-flight count in redis - %s",
+                str(e),
+            )
+
+    def _request_started(self, kwargs: dict) -> None:
+        deployment_id, call_id = self._get_request_ids(kwargs)
+        if deployment_id is None or call_id is None:
+            return
+        requests = self.in_flight.setdefault(deployment_id, {})
+        if call_id in requests:  # pre-call logged twice for the same attempt
+            return
+        counted_in_redis = self._schedule_redis_increment(deployment_id, 1)
+        requests[call_id] = (time.time(), counted_in_redis)
+        self._sweep_stale_requests()
+
+    def _request_finished(
+        self, kwargs: dict, latency: Optional[float]
+    ) -> Optional[Tuple[str, bool]]:
+        """
+        Stop counting the request as in-flight, and record its latency
+
+        Returns (deployment id, whether the redis count has to be decremented) - None if the request was not counted
+        """
+        deployment_id, call_id = self._get_request_ids(kwargs)
+        if deployment_id is None:
+            return None
+        if latency is not None:
+            previous = self.latency.get(deployment_id)
+            self.latency[deployment_id] = (
+                latency
+                if previous is None
+                else previous + self.routing_args.ewma_alpha * (latency - previous)
+            )
+        # sync + async events can both fire for a request, popping by call id counts it once
+        entry = self.in_flight.get(deployment_id, {}).pop(call_id, None)  # type: ignore
+        if entry is None:
+            return None
+        return deployment_id, entry[1]
+
+    def release_request(self, litellm_call_id: str) -> None:
+        """
+        Stop counting a cancelled request as in-flight - e.g. the losing request of a hedge. Cancelled calls
+        never fire their success / failure events.
+        """
+        for deployment_id, requests in self.in_flight.items():
+            entry = requests.pop(litellm_call_id, None)
+            if entry is not None:
+                if entry[1]:
+                    self._schedule_redis_increment(deployment_id, -1)
+                return
+
+    def _sweep_stale_requests(self) -> None:
+        """Drop requests whose success / failure event never arrived (e.g. cancelled calls)"""
+        now = time.time()
+        stale_request_seconds = self.routing_args.stale_request_seconds
+        if now - self._last_stale_sweep < stale_request_seconds:
+            return
+        self._last_stale_sweep = now
+        for deployment_id, requests in self.in_flight.items():
+            num_counted_in_redis = 0
+            for call_id, (started_at, counted_in_redis) in list(requests.items()):
+                if now - started_at > stale_request_seconds:
+                    requests.pop(call_id, None)
+                    num_counted_in_redis += counted_in_redis
+            if num_counted_in_redis:
+                self._schedule_redis_increment(deployment_id, -num_counted_in_redis)
+
+    def get_outstanding_requests(self, deployment_id: str) -> int:
+        """In-flight requests of the deployment - across instances if redis counts were read"""
+        local = len(self.in_flight.get(deployment_id, ()))
+        remote = self.remote_in_flight.get(deployment_id)
+        if remote is None:
+            return local
+        total_at_sync, local_at_sync = remote
+        return max(local, total_at_sync + local - local_at_sync)
+
+    async def _async_sync_outstanding_requests(
+        self, model_group: str, healthy_deployments: List[dict]
+    ) -> None:
+        """Read the in-flight counts of all instances from redis, at most every `sync_interval`"""
+        redis_cache = self.router_cache.redis_cache
+        if not self._use_redis() or redis_cache is None:
+            return
+        now = time.time()
+        if now - self._last_sync.get(model_group, 0.0) < self.routing_args.sync_interval:
+            return
+        self._last_sync[model_group] = now
+        deployment_ids = [d["model_info"]["id"] for d in healthy_deployments]
+        local_at_sync = {
+            deployment_id: len(self.in_flight.get(deployment_id, ()))
+            for deployment_id in deployment_ids
+        }
+        try:
+            counts = await redis_cache.async_batch_get_cache(
+                key_list=[self._get_redis_key(d) for d in deployment_ids]
+            )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "LeastOutstandingRequests: failed to read in-flight counts from redis - %s",
+                str(e),
+            )
+            return
+        for deployment_id in deployment_ids:
+            count = counts.get(self._get_redis_key(deployment_id))
+            if count is None:
+                self.remote_in_flight.pop(deployment_id, None)
+                continue
+            self.remote_in_flight[deployment_id] = (
+                max(int(float(count)), 0),
+                local_at_sync[deployment_id],
+            )
+
+    ### CALLBACKS ###
+
+    def log_pre_api_call(self, model, messages, kwargs):
+        try:
+            self._request_started(kwargs)
+        except Exception as e:
+            verbose_router_logger.debug(
+                "LeastOutstandingRequests: log_pre_api_call failed - %s", str(e)
+            )
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        try:
+            finished = self._request_finished(
+                kwargs, latency=(end_time - start_time).total_seconds()
+            )
+            if finished is not None and finished[1]:
+                self._schedule_redis_increment(finished[0], -1)
+            if self.test_flag:
+                self.logged_success += 1
+        except Exception as e:
+            verbose_router_logger.debug(
+                "LeastOutstandingRequests: log_success_event failed - %s", str(e)
+            )
+
+    def log_failure_event(self, kwargs, response_obj, start_time, end_time):
+        try:
+            # failures don't update the latency - cooldowns handle failing deployments
+            finished = self._request_finished(kwargs, latency=None)
+            if finished is not None and finished[1]:
+                self._schedule_redis_increment(finished[0], -1)
+            if self.test_flag:
+                self.logged_failure += 1
+        except Exception as e:
+            verbose_router_logger.debug(
+                "LeastOutstandingRequests: log_failure_event failed - %s", str(e)
+            )
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        try:
+            finished = self._request_finished(
+                kwargs, latency=(end_time - start_time).total_seconds()
+            )
+            if finished is not None and finished[1]:
+                await self._async_redis_increment(finished[0], -1)
+            if self.test_flag:
+                self.logged_success += 1
+        except Exception as e:
+            verbose_router_logger.debug(
+                "LeastOutstandingRequests: async_log_success_event failed - %s", str(e)
+            )
+
+    async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
+        try:
+            finished = self._request_finished(kwargs, latency=None)
+            if finished is not None and finished[1]:
+                await self._async_redis_increment(finished[0], -1)
+            if self.test_flag:
+                self.logged_failure += 1
+        except Exception as e:
+            verbose_router_logger.debug(
+                "LeastOutstandingRequests: async_log_failure_event failed - %s", str(e)
+            )
+
+    ### ROUTING ###
+
+    def _get_score(self, deployment_id: str) -> Optional[float]:
+        """(outstanding requests + 1) * latency moving average - None if the deployment has no latency yet"""
+        latency = self.latency.get(deployment_id)
+        if latency is None:
+            return None
+        return (self.get_outstanding_requests(deployment_id) + 1) * latency
+
+    def _get_available_deployments(self, healthy_deployments: list) -> Optional[dict]:
+        """
+        Power of two choices - O(1) in the number of deployments
+        """
+        if len(healthy_deployments) == 0:
+            return None
+        if len(healthy_deployments) == 1:
+            return healthy_deployments[0]
+        first, second = random.sample(healthy_deployments, 2)
+        first_id, second_id = first["model_info"]["id"], second["model_info"]["id"]
+        first_score, second_score = self._get_score(first_id), self._get_score(
+            second_id
+        )
+        if first_score is None or second_score is None:
+            # no latency to weight by yet - fewest outstanding requests wins
+            first_score = self.get_outstanding_requests(first_id)
+            second_score = self.get_outstanding_requests(second_id)
+        return second if second_score < first_score else first
+
+    def get_available_deployments(
+        self,
+        model_group: str,
+        healthy_deployments: list,
+    ) -> Optional[dict]:
+        """
+        Sync helper to get deployments using least outstanding requests strategy
+        """
+        return self._get_available_deployments(healthy_deployments=healthy_deployments)
+
+    async def async_get_available_deployments(
+        self, model_group: str, healthy_deployments: list
+    ) -> Optional[dict]:
+        """
+        Async helper to get deployments using least outstanding requests strategy
+        """
+        await self._async_sync_outstanding_requests(
+            model_group=model_group, healthy_deployments=healthy_deployments
+        )
+        return self._get_available_deployments(healthy_deployments=healthy_deployments)
@@ -1,15 +1,23 @@
 #### What this does ####
 #   picks based on response time (for streaming, this is time to first token)
 import random
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 
 import litellm
-from litellm import ModelResponse, token_counter, verbose_logger
+from litellm import ModelResponse, verbose_logger
 from litellm.caching.caching import DualCache
+from litellm.constants import (
+    LOWEST_LATENCY_EWMA_ALPHA,
+    LOWEST_LATENCY_SUMMARY_SYNC_INTERVAL_SECONDS,
+)
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.core_helpers import safe_divide_seconds
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
+from litellm.router_strategy.latency_stats import ModelGroupLatencyStats
+from litellm.router_utils.common_utils import get_request_input_tokens
 from litellm.types.utils import LiteLLMPydanticObjectBase
 
 if TYPE_CHECKING:
@@ -24,6 +32,14 @@ class RoutingArgs(LiteLLMPydanticObjectBase):
     ttl: float = 1 * 60 * 60  # 1 hour
     lowest_latency_buffer: float = 0
     max_latency_list_size: int = 10
+    # "list" - last `max_latency_list_size` latencies per deployment in the router cache
+    # "ewma" - in-process moving averages (ttft tracked separately), only summaries synced through redis
+    latency_stats: Literal["list", "ewma"] = "list"
+    ewma_alpha: float = LOWEST_LATENCY_EWMA_ALPHA
+    # "lowest" - random pick within `lowest_latency_buffer` of the lowest latency
+    # "power_of_two" - lower latency of two randomly sampled deployments
+    selection: Literal["lowest", "power_of_two"] = "lowest"
+    summary_sync_interval: float = LOWEST_LATENCY_SUMMARY_SYNC_INTERVAL_SECONDS
 
 
 class LowestLatencyLoggingHandler(CustomLogger):
@@ -36,6 +52,11 @@ class LowestLatencyLoggingHandler(CustomLogger):
     ):
         self.router_cache = router_cache
         self.routing_args = RoutingArgs(**routing_args)
+        # model group -> latency stats, used with latency_stats="ewma"
+        self.latency_stats: Dict[str, ModelGroupLatencyStats] = {}
+        self._last_summary_sync: Dict[str, float] = {}
+        # field of this instance in the shared latency summary hashes
+        self.instance_id = str(uuid.uuid4())
 
     def log_success_event(  # noqa: PLR0915
         self, kwargs, response_obj, start_time, end_time
@@ -118,6 +139,19 @@ class LowestLatencyLoggingHandler(CustomLogger):
                                 ttft_seconds, completion_tokens
                             )
 
+                if self.routing_args.latency_stats == "ewma":
+                    self._record_latency_stats(
+                        model_group=model_group,
+                        deployment_id=id,
+                        latency=final_value,
+                        time_to_first_token=time_to_first_token,
+                        total_tokens=total_tokens,
+                        minute=precise_minute,
+                    )
+                    if self.test_flag:
+                        self.logged_success += 1
+                    return
+
                 # ------------
                 # Update usage
                 # ------------
@@ -210,6 +244,13 @@ class LowestLatencyLoggingHandler(CustomLogger):
                     elif isinstance(id, int):
                         id = str(id)
 
+                    if self.routing_args.latency_stats == "ewma":
+                        ## Latency - give 1000s penalty for failing
+                        self._get_latency_stats(model_group).record_failure(
+                            deployment_id=id, penalty=1000.0
+                        )
+                        return
+
                     # ------------
                     # Setup values
                     # ------------
@@ -338,6 +379,20 @@ class LowestLatencyLoggingHandler(CustomLogger):
                             time_to_first_token = safe_divide_seconds(
                                 ttft_seconds, completion_tokens
                             )
+                if self.routing_args.latency_stats == "ewma":
+                    self._record_latency_stats(
+                        model_group=model_group,
+                        deployment_id=id,
+                        latency=final_value,
+                        time_to_first_token=time_to_first_token,
+                        total_tokens=total_tokens,
+                        minute=precise_minute,
+                    )
+                    await self._async_sync_latency_summary(model_group=model_group)
+                    if self.test_flag:
+                        self.logged_success += 1
+                    return
+
                 # ------------
                 # Update usage
                 # ------------
@@ -439,7 +494,9 @@ class LowestLatencyLoggingHandler(CustomLogger):
             return
 
         all_deployments = request_count_dict
+        deployments_by_id: Dict[str, Dict] = {}
         for d in healthy_deployments:
+            deployments_by_id[d["model_info"]["id"]] = d
             ## if healthy deployment not yet used
             if d["model_info"]["id"] not in all_deployments:
                 all_deployments[d["model_info"]["id"]] = {
@@ -448,40 +505,24 @@ class LowestLatencyLoggingHandler(CustomLogger):
                 }
 
         try:
-            input_tokens = token_counter(messages=messages, text=input)
+            input_tokens = get_request_input_tokens(
+                messages=messages, input=input, request_kwargs=request_kwargs
+            )
         except Exception:
             input_tokens = 0
 
-        # randomly sample from all_deployments, incase all deployments have latency=0.0
-        _items = all_deployments.items()
-
-        _all_deployments = random.sample(list(_items), len(_items))
-        all_deployments = dict(_all_deployments)
         ### GET AVAILABLE DEPLOYMENTS ### filter out any deployments > tpm/rpm limits
 
         potential_deployments = []
         for item, item_map in all_deployments.items():
             ## get the item from model list
-            _deployment = None
-            for m in healthy_deployments:
-                if item == m["model_info"]["id"]:
-                    _deployment = m
+            _deployment = deployments_by_id.get(item)
 
             if _deployment is None:
                 continue  # skip to next one
 
-            _deployment_tpm = (
-                _deployment.get("tpm", None)
-                or _deployment.get("litellm_params", {}).get("tpm", None)
-                or _deployment.get("model_info", {}).get("tpm", None)
-                or float("inf")
-            )
-
-            _deployment_rpm = (
-                _deployment.get("rpm", None)
-                or _deployment.get("litellm_params", {}).get("rpm", None)
-                or _deployment.get("model_info", {}).get("rpm", None)
-                or float("inf")
+            _deployment_tpm, _deployment_rpm = self._get_deployment_limits(
+                _deployment
             )
             item_latency = item_map.get("latency", [])
             item_ttft_latency = item_map.get("time_to_first_token", [])
@@ -527,25 +568,176 @@ class LowestLatencyLoggingHandler(CustomLogger):
             else:
                 potential_deployments.append((_deployment, item_latency))
 
+        deployment = self._pick_deployment(potential_deployments)
+        metadata_field = self._select_metadata_field(request_kwargs)
+        if request_kwargs is not None and metadata_field in request_kwargs:
+            request_kwargs[metadata_field][
+                "_latency_per_deployment"
+            ] = _latency_per_deployment
+        return deployment
+
+    def _get_deployment_limits(self, deployment: Dict) -> Tuple[float, float]:
+        """(tpm, rpm) limits of a deployment - inf if not set"""
+        _deployment_tpm = (
+            deployment.get("tpm", None)
+            or deployment.get("litellm_params", {}).get("tpm", None)
+            or deployment.get("model_info", {}).get("tpm", None)
+            or float("inf")
+        )
+        _deployment_rpm = (
+            deployment.get("rpm", None)
+            or deployment.get("litellm_params", {}).get("rpm", None)
+            or deployment.get("model_info", {}).get("rpm", None)
+            or float("inf")
+        )
+        return _deployment_tpm, _deployment_rpm
+
+    def _pick_deployment(
+        self, potential_deployments: List[Tuple[Dict, float]]
+    ) -> Optional[Dict]:
+        """
+        Pick from (deployment, latency) candidates - O(n), no sorting
+        """
         if len(potential_deployments) == 0:
             return None
 
-        # Sort potential deployments by latency
-        sorted_deployments = sorted(potential_deployments, key=lambda x: x[1])
+        if (
+            self.routing_args.selection == "power_of_two"
+            and len(potential_deployments) > 2
+        ):
+            first, second = random.sample(potential_deployments, 2)
+            return first[0] if first[1] <= second[1] else second[0]
 
         # Find lowest latency deployment
-        lowest_latency = sorted_deployments[0][1]
+        lowest_latency = min(latency for _, latency in potential_deployments)
 
         # Find deployments within buffer of lowest latency
         buffer = self.routing_args.lowest_latency_buffer * lowest_latency
 
         valid_deployments = [
-            x for x in sorted_deployments if x[1] <= lowest_latency + buffer
+            x for x in potential_deployments if x[1] <= lowest_latency + buffer
         ]
 
         # Pick a random deployment from valid deployments
-        random_valid_deployment = random.choice(valid_deployments)
-        deployment = random_valid_deployment[0]
+        return random.choice(valid_deployments)[0]
+
+    ### LATENCY STATS (latency_stats="ewma") ###
+
+    def _get_latency_stats(self, model_group: str) -> ModelGroupLatencyStats:
+        stats = self.latency_stats.get(model_group)
+        if stats is None:
+            stats = self.latency_stats[model_group] = ModelGroupLatencyStats(
+                alpha=self.routing_args.ewma_alpha,
+                max_samples=self.routing_args.max_latency_list_size,
+            )
+        return stats
+
+    def _record_latency_stats(
+        self,
+        model_group: str,
+        deployment_id: str,
+        latency: Union[float, timedelta],
+        time_to_first_token: Optional[float],
+        total_tokens: int,
+        minute: str,
+    ) -> None:
+        if isinstance(latency, timedelta):
+            latency = latency.total_seconds()
+        self._get_latency_stats(model_group).record(
+            deployment_id=deployment_id,
+            latency=float(latency),
+            time_to_first_token=time_to_first_token,
+            total_tokens=total_tokens or 0,
+            minute=minute,
+        )
+
+    async def _async_sync_latency_summary(self, model_group: str) -> None:
+        """
+        Publish this instance's latency summary and read the other instances' from redis, at most every `summary_sync_interval`
+
+        Each instance writes its own field of the model group's summary hash, so no instance overwrites another's.
+        """
+        redis_cache = self.router_cache.redis_cache
+        if redis_cache is None:
+            return
+        now = time.time()
+        if (
+            now - self._last_summary_sync.get(model_group, 0.0)
+            < self.routing_args.summary_sync_interval
+        ):
+            return
+        self._last_summary_sync[model_group] = now
+        summary_key = f"{model_group}_latency_summary"
+        stats = self._get_latency_stats(model_group)
+        try:
+            summaries = await redis_cache.async_set_hash_field_and_get_all(
+                key=summary_key,
+                field=self.instance_id,
+                value=stats.to_summary(),
+                ttl=self.routing_args.ttl,
+            )
+            stats.set_remote_summaries(
+                [
+                    summary
+                    for instance_id, summary in summaries.items()
+                    if instance_id != self.instance_id and isinstance(summary, dict)
+                ],
+                ttl=self.routing_args.ttl,
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "litellm.router_strategy.lowest_latency.py::_async_sync_latency_summary(): Exception occured - {}".format(
+                    str(e)
+                )
+            )
+
+    def _get_available_deployments_from_latency_stats(
+        self,
+        model_group: str,
+        healthy_deployments: list,
+        messages: Optional[List[Dict[str, str]]] = None,
+        input: Optional[Union[str, List]] = None,
+        request_kwargs: Optional[Dict] = None,
+    ):
+        stats = self._get_latency_stats(model_group)
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        current_hour = datetime.now().strftime("%H")
+        current_minute = datetime.now().strftime("%M")
+        stats.roll_minute(f"{current_date}-{current_hour}-{current_minute}")
+        try:
+            input_tokens = get_request_input_tokens(
+                messages=messages, input=input, request_kwargs=request_kwargs
+            )
+        except Exception:
+            input_tokens = 0
+        stream = request_kwargs is not None and request_kwargs.get("stream") is True
+        now = time.time()
+
+        _latency_per_deployment = {}
+        potential_deployments = []
+        for _deployment in healthy_deployments:
+            item_latency, item_tpm, item_rpm = stats.get(
+                deployment_id=_deployment["model_info"]["id"],
+                stream=stream,
+                ttl=self.routing_args.ttl,
+                now=now,
+            )
+            _deployment_api_base = _deployment.get("litellm_params", {}).get(
+                "api_base", ""
+            )
+            if _deployment_api_base is not None:
+                _latency_per_deployment[_deployment_api_base] = item_latency
+            _deployment_tpm, _deployment_rpm = self._get_deployment_limits(
+                _deployment
+            )
+            if (
+                item_tpm + input_tokens > _deployment_tpm
+                or item_rpm + 1 > _deployment_rpm
+            ):
+                continue
+            potential_deployments.append((_deployment, item_latency))
+
+        deployment = self._pick_deployment(potential_deployments)
         metadata_field = self._select_metadata_field(request_kwargs)
         if request_kwargs is not None and metadata_field in request_kwargs:
             request_kwargs[metadata_field][
@@ -561,6 +753,10 @@ class LowestLatencyLoggingHandler(CustomLogger):
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
     ):
+        if self.routing_args.latency_stats == "ewma":
+            return self._get_available_deployments_from_latency_stats(
+                model_group, healthy_deployments, messages, input, request_kwargs
+            )
         # get list of potential deployments
         latency_key = f"{model_group}_map"
 
@@ -594,6 +790,10 @@ class LowestLatencyLoggingHandler(CustomLogger):
         """
         Returns a deployment with the lowest latency
         """
+        if self.routing_args.latency_stats == "ewma":
+            return self._get_available_deployments_from_latency_stats(
+                model_group, healthy_deployments, messages, input, request_kwargs
+            )
         # get list of potential deployments
         latency_key = f"{model_group}_map"
 
@@ -13,10 +13,12 @@ from litellm.types.router import RouterErrors
 
 if TYPE_CHECKING:
     from litellm.router import Router as _Router
+    from litellm.router_utils.deployment_snapshot import ModelGroupSnapshot
 
     LitellmRouter = _Router
 else:
     LitellmRouter = Any
+    ModelGroupSnapshot = Any
 
 
 def is_valid_deployment_tag(
@@ -120,6 +122,35 @@ async def get_deployments_for_tag(
     return healthy_deployments
 
 
+def get_deployment_mask_for_tag(
+    llm_router_instance: LitellmRouter,
+    model: str,  # used to raise the correct error
+    snapshot: ModelGroupSnapshot,
+    mask: int,
+    request_kwargs: Optional[Dict[Any, Any]] = None,
+    metadata_variable_name: Literal["metadata", "litellm_metadata"] = "metadata",
+) -> int:
+    """
+    Same as `get_deployments_for_tag`, on a bitmask of the deployments in a model group snapshot
+    """
+    if llm_router_instance.enable_tag_filtering is not True or request_kwargs is None:
+        return mask
+
+    if metadata_variable_name in request_kwargs:
+        request_tags = (request_kwargs[metadata_variable_name] or {}).get("tags")
+        if request_tags:
+            tagged_mask = mask & snapshot.get_tag_mask(request_tags)
+            default_mask = mask & snapshot.default_tag_mask
+            if tagged_mask == 0 and default_mask == 0:
+                raise ValueError(
+                    f"{RouterErrors.no_deployments_with_tag_routing.value}. Passed model={model} and tags={request_tags}"
+                )
+            return tagged_mask or default_mask
+
+    # for Untagged requests use default deployments if set
+    return (mask & snapshot.default_tag_mask) or mask
+
+
 def _get_tags_from_request_kwargs(
     request_kwargs: Optional[Dict[Any, Any]] = None,
     metadata_variable_name: Literal["metadata", "litellm_metadata"] = "metadata",
@@ -1,6 +1,6 @@
 import hashlib
 import json
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 if TYPE_CHECKING:
     from litellm.types.llms.openai import OpenAIFileObject
@@ -95,6 +95,18 @@ def _deployment_supports_web_search(deployment: Dict) -> bool:
     return True
 
 
+def is_web_search_request(request_kwargs: Dict) -> bool:
+    """
+    Check if the request uses a web search tool
+    """
+    tools = request_kwargs.get("tools") or []
+    for tool in tools:
+        # These are the two websearch tools for OpenAI / Azure. 
+        if tool.get("type") == "web_search" or tool.get("type") == "web_search_preview":
+            return True
+    return False
+
+
 def filter_web_search_deployments(
     healthy_deployments: Union[List[Dict], Dict],
     request_kwargs: Optional[Dict] = None,
@@ -109,15 +121,7 @@ def filter_web_search_deployments(
     if isinstance(healthy_deployments, dict):
         return healthy_deployments
 
-    is_web_search_request = False
-    tools = request_kwargs.get("tools") or []
-    for tool in tools:
-        # These are the two websearch tools for OpenAI / Azure. 
-        if tool.get("type") == "web_search" or tool.get("type") == "web_search_preview":
-            is_web_search_request = True
-            break
-
-    if not is_web_search_request:
+    if not is_web_search_request(request_kwargs):
         return healthy_deployments
 
     # Filter out deployments that don't support web search
@@ -126,3 +130,38 @@ def filter_web_search_deployments(
         verbose_logger.warning("No deployments support web search for request")
     return final_deployments
 
+
+def get_request_input_tokens(
+    messages: Optional[List[Any]],
+    input: Optional[Union[str, List]] = None,
+    request_kwargs: Optional[Dict] = None,
+) -> int:
+    """
+    Prompt token count of a request, memoized in the private `_input_tokens_memo` request kwarg
+
+    Pre-call checks and routing strategies count the prompt on every attempt - retries and fallbacks
+    of the same request reuse the first count. Per-message counts are also cached by `token_counter`,
+    so a conversation that grew by one message only tokenizes the new message.
+    """
+    import litellm
+
+    num_messages = len(messages) if messages else 0
+    memo = request_kwargs.get("_input_tokens_memo") if request_kwargs else None
+    # the memo holds the prompt objects themselves - unlike an id(), they can't be reused by another prompt
+    if (
+        isinstance(memo, tuple)
+        and memo[0] is messages
+        and memo[1] is input
+        and memo[2] == num_messages
+    ):
+        return memo[3]
+
+    input_tokens = litellm.token_counter(messages=messages, text=input)
+    if request_kwargs is not None:
+        request_kwargs["_input_tokens_memo"] = (
+            messages,
+            input,
+            num_messages,
+            input_tokens,
+        )
+    return input_tokens
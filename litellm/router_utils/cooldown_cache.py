@@ -4,7 +4,7 @@ Wrapper around router cache. Meant to handle model cooldown logic
 
 import functools
 import time
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
 
 from typing_extensions import TypedDict
 
@@ -39,6 +39,8 @@ class CooldownCache:
             visible_suffix=0,  # Show last 0 characters
             mask_char="*",  # Use * for masking
         )
+        # called with (model_id, time the cooldown ends) when a deployment enters cooldown
+        self.cooldown_listeners: List[Callable[[str, float], None]] = []
 
     def _common_add_cooldown_logic(
         self, model_id: str, original_exception, exception_status, cooldown_time: float
@@ -96,6 +98,8 @@ class CooldownCache:
                 key=cooldown_key,
                 ttl=_cooldown_time,
             )
+            for listener in self.cooldown_listeners:
+                listener(model_id, cooldown_data["timestamp"] + _cooldown_time)
         except Exception as e:
             verbose_logger.error(
                 "CooldownCache::add_deployment_to_cooldown - Exception occurred - {}".format(
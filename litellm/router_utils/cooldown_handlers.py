@@ -294,7 +294,10 @@ def _set_cooldown_deployments(
     exception_status_int = cast_exception_status_to_int(exception_status)
     verbose_router_logger.debug(f"Attempting to add {deployment} to cooldown list")
 
-    if _should_cooldown_deployment(
+    # a failed probe request puts a half-open deployment straight back in cooldown
+    if litellm_router_instance.cooldown_manager.is_half_open(
+        deployment
+    ) or _should_cooldown_deployment(
         litellm_router_instance=litellm_router_instance,
         deployment=deployment,
         exception_status=exception_status,
@@ -323,29 +326,26 @@ def _set_cooldown_deployments(
 async def _async_get_cooldown_deployments(
     litellm_router_instance: LitellmRouter,
     parent_otel_span: Optional[Span],
+    model_ids: Optional[List[str]] = None,
+    acquire_probes: bool = False,
 ) -> List[str]:
     """
     Async implementation of '_get_cooldown_deployments'
     """
-    model_ids = litellm_router_instance.get_model_ids()
-    cooldown_models = (
-        await litellm_router_instance.cooldown_cache.async_get_active_cooldowns(
-            model_ids=model_ids,
-            parent_otel_span=parent_otel_span,
+    cooldown_manager = litellm_router_instance.cooldown_manager
+    cooldown_manager.start()
+    if model_ids is None:
+        model_ids = litellm_router_instance.get_model_ids()
+    if cooldown_manager.should_read_cooldown_cache():
+        await cooldown_manager.async_read_cooldown_cache(
+            model_ids=model_ids, parent_otel_span=parent_otel_span
         )
+    cooldown_deployment_ids = cooldown_manager.get_cooldown_deployments(
+        model_ids=model_ids, acquire_probes=acquire_probes
     )
 
-    cached_value_deployment_ids = []
-    if (
-        cooldown_models is not None
-        and isinstance(cooldown_models, list)
-        and len(cooldown_models) > 0
-        and isinstance(cooldown_models[0], tuple)
-    ):
-        cached_value_deployment_ids = [cv[0] for cv in cooldown_models]
-
-    verbose_router_logger.debug(f"retrieve cooldown models: {cooldown_models}")
-    return cached_value_deployment_ids
+    verbose_router_logger.debug(f"retrieve cooldown models: {cooldown_deployment_ids}")
+    return cooldown_deployment_ids
 
 
 async def _async_get_cooldown_deployments_with_debug_info(
@@ -367,33 +367,28 @@ async def _async_get_cooldown_deployments_with_debug_info(
 
 
 def _get_cooldown_deployments(
-    litellm_router_instance: LitellmRouter, parent_otel_span: Optional[Span]
+    litellm_router_instance: LitellmRouter,
+    parent_otel_span: Optional[Span],
+    model_ids: Optional[List[str]] = None,
+    acquire_probes: bool = False,
 ) -> List[str]:
     """
-    Get the list of models being cooled down for this minute
-    """
-    # get the current cooldown list for that minute
-
-    # ----------------------
-    # Return cooldown models
-    # ----------------------
-    model_ids = litellm_router_instance.get_model_ids()
+    Get the list of models being cooled down
 
-    cooldown_models = litellm_router_instance.cooldown_cache.get_active_cooldowns(
-        model_ids=model_ids, parent_otel_span=parent_otel_span
+    - `model_ids`: deployments to check (e.g. of 1 model group). Defaults to all deployments.
+    - `acquire_probes`: half-open deployments use up their due probe request. Only set by the routing path, which sends the request to one of the returned healthy deployments.
+    """
+    cooldown_manager = litellm_router_instance.cooldown_manager
+    if model_ids is None:
+        model_ids = litellm_router_instance.get_model_ids()
+    if cooldown_manager.should_read_cooldown_cache():
+        cooldown_manager.read_cooldown_cache(
+            model_ids=model_ids, parent_otel_span=parent_otel_span
+        )
+    return cooldown_manager.get_cooldown_deployments(
+        model_ids=model_ids, acquire_probes=acquire_probes
     )
 
-    cached_value_deployment_ids = []
-    if (
-        cooldown_models is not None
-        and isinstance(cooldown_models, list)
-        and len(cooldown_models) > 0
-        and isinstance(cooldown_models[0], tuple)
-    ):
-        cached_value_deployment_ids = [cv[0] for cv in cooldown_models]
-
-    return cached_value_deployment_ids
-
 
 def should_cooldown_based_on_allowed_fails_policy(
     litellm_router_instance: LitellmRouter,
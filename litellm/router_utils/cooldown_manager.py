@@ -0,0 +1,349 @@
+"""
+In-memory deployment cooldown state machine
+
+    closed --(cooldown enter)--> open --(cooldown ends)--> half_open --(probe succeeds)--> closed
+                                   ^                           |
+                                   +------(probe fails)--------+
+
+- Cooldowns entered on this instance arrive as `CooldownCache` enter events, so routing reads this state
+  instead of every deployment's cooldown key per request
+- Expiry timers move `open` deployments on when their cooldown ends
+- With `enable_pubsub`, enter / exit events are published on a redis channel - other instances apply them
+  as they arrive, instead of polling the cooldown keys in redis
+- With `half_open_probe_interval`, a deployment whose cooldown ended gets 1 request every
+  `half_open_probe_interval` seconds until `half_open_success_threshold` of them succeed - instead of all traffic at once
+
+Without `half_open_probe_interval`, a deployment goes from `open` straight back to `closed`.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Union
+
+from litellm._logging import verbose_router_logger
+from litellm.constants import (
+    COOLDOWN_HALF_OPEN_SUCCESS_THRESHOLD,
+    COOLDOWN_PUBSUB_CHANNEL,
+    COOLDOWN_PUBSUB_RECONNECT_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span as _Span
+
+    from litellm.caching.redis_cache import RedisCache
+    from litellm.router_utils.cooldown_cache import CooldownCache
+
+    Span = Union[_Span, Any]
+else:
+    Span = Any
+    RedisCache = Any
+    CooldownCache = Any
+
+CooldownState = Literal["closed", "open", "half_open"]
+
+
+class CooldownManager:
+    def __init__(
+        self,
+        cooldown_cache: CooldownCache,
+        half_open_probe_interval: Optional[float] = None,
+        half_open_success_threshold: int = COOLDOWN_HALF_OPEN_SUCCESS_THRESHOLD,
+        enable_pubsub: bool = False,
+        pubsub_channel: str = COOLDOWN_PUBSUB_CHANNEL,
+        get_model_ids: Optional[Callable[[], List[str]]] = None,
+    ):
+        """
+        - `get_model_ids`: all deployment ids - their cooldowns are re-read from redis after each (re)subscribe,
+          for the events missed while not subscribed
+        """
+        self.cooldown_cache = cooldown_cache
+        self.half_open_probe_interval = half_open_probe_interval
+        self.half_open_success_threshold = half_open_success_threshold
+        self.enable_pubsub = enable_pubsub
+        self.pubsub_channel = pubsub_channel
+        self.get_model_ids = get_model_ids
+        # published with each event, so an instance skips its own events
+        self.instance_id = str(uuid.uuid4())
+        # deployment id -> time its cooldown ends
+        self._open_until: Dict[str, float] = {}
+        # deployment id -> [time the next probe request may be sent, successful probe requests]
+        self._half_open: Dict[str, List[float]] = {}
+        # bumped on every state change - lets callers cache views of the state
+        self.version = 0
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscriber_task: Optional[asyncio.Task] = None
+        # True while subscribed - other instances' cooldowns are then pushed, not read from redis
+        self.pubsub_active = False
+        cooldown_cache.cooldown_listeners.append(self.on_cooldown)
+
+    ### STATE ###
+
+    def get_state(self, model_id: str, now: Optional[float] = None) -> CooldownState:
+        cooldown_until = self._open_until.get(model_id)
+        if cooldown_until is not None:
+            if cooldown_until > (now or time.time()):
+                return "open"
+            # no expiry timer ran (e.g. outside an event loop) - apply the exit now
+            self._exit_open(model_id, cooldown_until)
+        return "half_open" if model_id in self._half_open else "closed"
+
+    def get_cooldown_until(self, model_id: str) -> Optional[float]:
+        return self._open_until.get(model_id)
+
+    def is_half_open(self, model_id: str) -> bool:
+        return self.get_state(model_id) == "half_open"
+
+    def try_acquire_probe(self, model_id: str, now: Optional[float] = None) -> bool:
+        """
+        Whether a request may be sent to the deployment - half-open deployments admit 1 request per `half_open_probe_interval`
+        """
+        probe = self._half_open.get(model_id)
+        if probe is None:
+            return True
+        now = now or time.time()
+        if now < probe[0]:
+            return False
+        probe[0] = now + (self.half_open_probe_interval or 0.0)
+        return True
+
+    def is_probe_due(self, model_id: str, now: Optional[float] = None) -> bool:
+        """
+        Like `try_acquire_probe`, without using up the probe request
+        """
+        probe = self._half_open.get(model_id)
+        return probe is None or (now or time.time()) >= probe[0]
+
+    def get_cooldown_deployments(
+        self, model_ids: List[str], acquire_probes: bool = False
+    ) -> List[str]:
+        """
+        Deployments requests can't be sent to - open, and half-open ones without a due probe request
+
+        `acquire_probes=True` uses up the due probe requests - only for the routing path that sends the request
+        """
+        if not self._open_until and not self._half_open:
+            return []
+        now = time.time()
+        cooldown_deployments = []
+        for model_id in model_ids:
+            state = self.get_state(model_id, now)
+            if state == "open":
+                cooldown_deployments.append(model_id)
+            elif state == "half_open":
+                if acquire_probes:
+                    if not self.try_acquire_probe(model_id, now):
+                        cooldown_deployments.append(model_id)
+                elif not self.is_probe_due(model_id, now):
+                    cooldown_deployments.append(model_id)
+        return cooldown_deployments
+
+    ### TRANSITIONS ###
+
+    def on_cooldown(self, model_id: str, cooldown_until: float) -> None:
+        """Cooldown enter event of the `CooldownCache`"""
+        if self._enter(model_id, cooldown_until):
+            self._publish(event="enter", model_id=model_id, cooldown_until=cooldown_until)
+
+    def record_success(self, model_id: str) -> None:
+        """Successful request - closes a half-open deployment after `half_open_success_threshold` of them"""
+        probe = self._half_open.get(model_id)
+        if probe is None:
+            return
+        probe[1] += 1
+        if probe[1] >= self.half_open_success_threshold:
+            self._close(model_id)
+            self._publish(event="exit", model_id=model_id)
+
+    def clear(self) -> None:
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._open_until.clear()
+        self._half_open.clear()
+        self.version += 1
+
+    def _enter(self, model_id: str, cooldown_until: float) -> bool:
+        if cooldown_until <= max(time.time(), self._open_until.get(model_id, 0.0)):
+            return False
+        self._open_until[model_id] = cooldown_until
+        self._half_open.pop(model_id, None)
+        self.version += 1
+        self._call_in_loop(self._schedule_expiry, model_id, cooldown_until)
+        return True
+
+    def _exit_open(self, model_id: str, cooldown_until: float) -> None:
+        if self._open_until.get(model_id) != cooldown_until:
+            return  # cooldown was extended / cleared since
+        del self._open_until[model_id]
+        self._timers.pop(model_id, None)
+        if self.half_open_probe_interval is not None:
+            self._half_open[model_id] = [cooldown_until, 0]
+        self.version += 1
+
+    def _close(self, model_id: str) -> None:
+        was_open = self._open_until.pop(model_id, None) is not None
+        was_half_open = self._half_open.pop(model_id, None) is not None
+        timer = self._timers.pop(model_id, None)
+        if timer is not None:
+            timer.cancel()
+        if was_open or was_half_open:
+            self.version += 1
+
+    ### EVENT LOOP ###
+
+    def start(self) -> None:
+        """
+        Bind to the running event loop - called from the router's async paths
+
+        Expiry timers + published events of cooldowns entered on logging worker threads run on this loop.
+        Subscribes to other instances' cooldown events, with `enable_pubsub`.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._subscriber_task = None
+        if (
+            self.enable_pubsub
+            and self._subscriber_task is None
+            and self.cooldown_cache.cache.redis_cache is not None
+        ):
+            self._subscriber_task = loop.create_task(
+                self._async_subscribe(self.cooldown_cache.cache.redis_cache)
+            )
+
+    def _call_in_loop(self, callback: Callable[..., None], *args: Any) -> None:
+        """Run `callback` on the event loop - cooldowns can be entered from logging worker threads"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(callback, *args)
+            return
+        callback(*args)
+
+    def _schedule_expiry(self, model_id: str, cooldown_until: float) -> None:
+        timer = self._timers.pop(model_id, None)
+        if timer is not None:
+            timer.cancel()
+        if self._open_until.get(model_id) != cooldown_until:
+            return
+        self._timers[model_id] = asyncio.get_running_loop().call_later(
+            max(cooldown_until - time.time(), 0.0),
+            self._exit_open,
+            model_id,
+            cooldown_until,
+        )
+
+    ### OTHER INSTANCES ###
+
+    def should_read_cooldown_cache(self) -> bool:
+        """Other instances' cooldowns have to be read from redis, unless they are pushed over pub/sub"""
+        return self.cooldown_cache.cache.redis_cache is not None and not self.pubsub_active
+
+    async def async_read_cooldown_cache(
+        self, model_ids: List[str], parent_otel_span: Optional[Span] = None
+    ) -> None:
+        """Apply the cooldowns in the cooldown cache - i.e. ones entered by other instances"""
+        active_cooldowns = await self.cooldown_cache.async_get_active_cooldowns(
+            model_ids=model_ids, parent_otel_span=parent_otel_span
+        )
+        self._apply_active_cooldowns(active_cooldowns)
+
+    def read_cooldown_cache(
+        self, model_ids: List[str], parent_otel_span: Optional[Span] = None
+    ) -> None:
+        active_cooldowns = self.cooldown_cache.get_active_cooldowns(
+            model_ids=model_ids, parent_otel_span=parent_otel_span
+        )
+        self._apply_active_cooldowns(active_cooldowns)
+
+    def _apply_active_cooldowns(self, active_cooldowns: List[tuple]) -> None:
+        for model_id, cooldown in active_cooldowns:
+            self._enter(
+                model_id,
+                float(cooldown["timestamp"]) + float(cooldown["cooldown_time"]),
+            )
+
+    def _publish(
+        self, event: str, model_id: str, cooldown_until: Optional[float] = None
+    ) -> None:
+        if not self.enable_pubsub or self.cooldown_cache.cache.redis_cache is None:
+            return
+        message = json.dumps(
+            {
+                "instance_id": self.instance_id,
+                "event": event,
+                "model_id": model_id,
+                "cooldown_until": cooldown_until,
+            }
+        )
+        self._call_in_loop(self._create_publish_task, message)
+
+    def _create_publish_task(self, message: str) -> None:
+        asyncio.get_running_loop().create_task(self._async_publish(message))
+
+    async def _async_publish(self, message: str) -> None:
+        redis_cache = self.cooldown_cache.cache.redis_cache
+        if redis_cache is None:
+            return
+        try:
+            await redis_cache.init_async_client().publish(self.pubsub_channel, message)
+        except Exception as e:
+            verbose_router_logger.debug(
+                "CooldownManager: failed to publish cooldown event - %s", str(e)
+            )
+
+    def _on_pubsub_message(self, data: Union[str, bytes]) -> None:
+        try:
+            message = json.loads(data)
+            if message["instance_id"] == self.instance_id:
+                return
+            if message["event"] == "enter":
+                self._enter(message["model_id"], float(message["cooldown_until"]))
+            elif message["event"] == "exit":
+                self._close(message["model_id"])
+        except Exception as e:
+            verbose_router_logger.debug(
+                "CooldownManager: invalid cooldown event %s - %s", data, str(e)
+            )
+
+    async def _async_resync(self) -> None:
+        if self.get_model_ids is None:
+            return
+        try:
+            await self.async_read_cooldown_cache(model_ids=self.get_model_ids())
+        except Exception as e:
+            verbose_router_logger.debug(
+                "CooldownManager: failed to re-read cooldowns from redis - %s", str(e)
+            )
+
+    async def _async_subscribe(self, redis_cache: RedisCache) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = redis_cache.init_async_client().pubsub()  # type: ignore
+                await pubsub.subscribe(self.pubsub_channel)
+                # events published before the subscribe (or while disconnected) were missed
+                await self._async_resync()
+                self.pubsub_active = True
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._on_pubsub_message(message["data"])
+            except asyncio.CancelledError:
+                self.pubsub_active = False
+                raise
+            except Exception as e:
+                verbose_router_logger.warning(
+                    "CooldownManager: cooldown event subscription failed, reading cooldowns from redis until re-subscribed - %s",
+                    str(e),
+                )
+            self.pubsub_active = False
+            if pubsub is not None:
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+            await asyncio.sleep(COOLDOWN_PUBSUB_RECONNECT_SECONDS)
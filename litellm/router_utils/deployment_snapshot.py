@@ -0,0 +1,226 @@
+"""
+Precomputed per-model-group deployment snapshots for `Router.async_get_healthy_deployments`
+
+A snapshot is built once per model group - and rebuilt only when deployments are added / removed.
+It holds the group's deployments plus bitmasks (bit i = i-th deployment) for the per-request filters:
+
+- team: deployments without a team_id + deployments of each team
+- web search support
+- region (`allowed_model_region`)
+- tags (tag based routing)
+
+Cooldowns are tracked as a bitmask per model group too - rebuilt when the `CooldownManager` state changes
+and when the earliest cooldown expires, instead of reading every deployment's cooldown key per request.
+
+So a request is a dict lookup + a few integer AND / OR operations, instead of rebuilding lists per filter.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from litellm._logging import verbose_router_logger
+from litellm.router_utils.common_utils import _deployment_supports_web_search
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span as _Span
+
+    from litellm.router_utils.cooldown_manager import CooldownManager
+
+    Span = Union[_Span, Any]
+else:
+    Span = Any
+    CooldownManager = Any
+
+
+class ModelGroupSnapshot:
+    """
+    Immutable view of a model group's deployments, with the bitmasks of the per-request filters
+    """
+
+    def __init__(self, deployments: List[Dict]):
+        self.deployments: Tuple[Dict, ...] = tuple(deployments)
+        self.ids: Tuple[str, ...] = tuple(
+            str(deployment["model_info"]["id"]) for deployment in deployments
+        )
+        self.all_mask = (1 << len(self.deployments)) - 1
+        self.no_team_mask = 0
+        self.team_masks: Dict[str, int] = {}
+        self.web_search_mask = 0
+        self.region_masks: Dict[str, int] = {}
+        self.tag_masks: Dict[str, int] = {}
+        for position, deployment in enumerate(self.deployments):
+            bit = 1 << position
+            model_info = deployment.get("model_info") or {}
+            litellm_params = deployment.get("litellm_params") or {}
+            team_id = model_info.get("team_id")
+            if team_id is None:
+                self.no_team_mask |= bit
+            else:
+                self.team_masks[team_id] = self.team_masks.get(team_id, 0) | bit
+            if _deployment_supports_web_search(deployment):
+                self.web_search_mask |= bit
+            region_name = litellm_params.get("region_name")
+            if region_name is not None:
+                self.region_masks[region_name] = (
+                    self.region_masks.get(region_name, 0) | bit
+                )
+            for tag in litellm_params.get("tags") or []:
+                self.tag_masks[tag] = self.tag_masks.get(tag, 0) | bit
+        self.default_tag_mask = self.tag_masks.get("default", 0)
+
+    def get_team_mask(self, team_id: Optional[str]) -> int:
+        """Deployments a request from `team_id` may use - team deployments are only used by their team"""
+        if team_id is None:
+            return self.no_team_mask
+        return self.no_team_mask | self.team_masks.get(team_id, 0)
+
+    def get_region_mask(self, allowed_model_region: str) -> int:
+        return self.region_masks.get(allowed_model_region, 0)
+
+    def get_tag_mask(self, request_tags: List[str]) -> int:
+        """Deployments with any of the request's tags"""
+        mask = 0
+        for tag in request_tags:
+            mask |= self.tag_masks.get(tag, 0)
+        return mask
+
+    def select(self, mask: int) -> List[Dict]:
+        """Deployments in `mask`, in model list order"""
+        if mask == self.all_mask:
+            return list(self.deployments)
+        deployments = []
+        while mask:
+            lowest_bit = mask & -mask
+            deployments.append(self.deployments[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return deployments
+
+
+class DeploymentSnapshotStore:
+    """
+    Model group -> snapshot, and the cooldown bitmask of each snapshot
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, ModelGroupSnapshot] = {}
+        # model group -> (cooldown manager version, time the earliest cooldown ends, open mask, half-open mask)
+        self._cooldown_masks: Dict[str, Tuple[int, float, int, int]] = {}
+        self._last_remote_cooldown_sync: Dict[str, float] = {}
+
+    def invalidate(self) -> None:
+        """Drop all snapshots - called when deployments are added / removed"""
+        self._snapshots.clear()
+        self._cooldown_masks.clear()
+
+    def get(
+        self, model_group: str, build_deployments: Callable[[], List[Dict]]
+    ) -> Optional[ModelGroupSnapshot]:
+        snapshot = self._snapshots.get(model_group)
+        if snapshot is None:
+            deployments = build_deployments()
+            if len(deployments) == 0:
+                return None
+            snapshot = self._snapshots[model_group] = ModelGroupSnapshot(deployments)
+        return snapshot
+
+    ### COOLDOWNS ###
+
+    def clear_cooldowns(self) -> None:
+        self._cooldown_masks.clear()
+        self._last_remote_cooldown_sync.clear()
+
+    def _build_cooldown_masks(
+        self,
+        snapshot: ModelGroupSnapshot,
+        cooldown_manager: CooldownManager,
+        now: float,
+    ) -> Tuple[float, int, int]:
+        """Returns (time the earliest active cooldown ends, open mask, half-open mask)"""
+        open_mask = 0
+        half_open_mask = 0
+        next_expiry = float("inf")
+        for position, model_id in enumerate(snapshot.ids):
+            state = cooldown_manager.get_state(model_id, now)
+            if state == "open":
+                open_mask |= 1 << position
+                next_expiry = min(
+                    next_expiry, cooldown_manager.get_cooldown_until(model_id) or now
+                )
+            elif state == "half_open":
+                half_open_mask |= 1 << position
+        return next_expiry, open_mask, half_open_mask
+
+    async def _async_sync_remote_cooldowns(
+        self,
+        model_group: str,
+        snapshot: ModelGroupSnapshot,
+        cooldown_manager: CooldownManager,
+        parent_otel_span: Optional[Span],
+        now: float,
+    ) -> None:
+        """
+        Without pub/sub, cooldowns set by other instances are only visible in redis - read them at the rate the cache already throttles redis batch reads at
+        """
+        if not cooldown_manager.should_read_cooldown_cache():
+            return
+        if (
+            now - self._last_remote_cooldown_sync.get(model_group, 0.0)
+            < cooldown_manager.cooldown_cache.cache.redis_batch_cache_expiry
+        ):
+            return
+        self._last_remote_cooldown_sync[model_group] = now
+        try:
+            await cooldown_manager.async_read_cooldown_cache(
+                model_ids=list(snapshot.ids), parent_otel_span=parent_otel_span
+            )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "DeploymentSnapshotStore: failed to read cooldowns - %s", str(e)
+            )
+
+    async def async_get_cooldown_mask(
+        self,
+        model_group: str,
+        snapshot: ModelGroupSnapshot,
+        cooldown_manager: CooldownManager,
+        parent_otel_span: Optional[Span] = None,
+        acquire_probes: bool = False,
+    ) -> int:
+        """
+        Deployments requests can't be sent to - open, and half-open ones without a due probe request
+
+        `acquire_probes=True` uses up the due probe requests - only for the routing path that sends the request
+        """
+        now = time.time()
+        cooldown_manager.start()
+        await self._async_sync_remote_cooldowns(
+            model_group=model_group,
+            snapshot=snapshot,
+            cooldown_manager=cooldown_manager,
+            parent_otel_span=parent_otel_span,
+            now=now,
+        )
+        cached = self._cooldown_masks.get(model_group)
+        if cached is None or cached[0] != cooldown_manager.version or now >= cached[1]:
+            next_expiry, open_mask, half_open_mask = self._build_cooldown_masks(
+                snapshot, cooldown_manager, now
+            )
+            cached = (
+                cooldown_manager.version,
+                next_expiry,
+                open_mask,
+                half_open_mask,
+            )
+            self._cooldown_masks[model_group] = cached
+        mask, half_open_mask = cached[2], cached[3]
+        while half_open_mask:
+            lowest_bit = half_open_mask & -half_open_mask
+            model_id = snapshot.ids[lowest_bit.bit_length() - 1]
+            if acquire_probes:
+                probe_due = cooldown_manager.try_acquire_probe(model_id, now)
+            else:
+                probe_due = cooldown_manager.is_probe_due(model_id, now)
+            if not probe_due:
+                mask |= lowest_bit
+            half_open_mask ^= lowest_bit
+        return mask
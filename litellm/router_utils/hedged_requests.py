@@ -0,0 +1,322 @@
+"""
+Hedged requests for the router
+
+The first attempt of an `acompletion` request is sent as usual. If it has no first token (first stream chunk,
+or the response for non-streaming requests) after the model group's `percentile` time to first token, a 2nd
+request is sent to another healthy deployment of the group. Whichever returns its first token first is used,
+the other one is cancelled.
+
+Times to first token are measured here, over the last `HEDGING_TTFT_WINDOW_SIZE` requests of each model group -
+a group is only hedged once it has `min_samples` of them.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from litellm._logging import verbose_router_logger
+from litellm._uuid import uuid
+from litellm.constants import (
+    HEDGING_DELAY_REFRESH_SAMPLES,
+    HEDGING_TTFT_WINDOW_SIZE,
+)
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.router_utils.cooldown_callbacks import (
+    _get_prometheus_logger_from_callbacks,
+)
+from litellm.types.router import HedgingPolicy
+
+if TYPE_CHECKING:
+    from litellm.router import Router as _Router
+
+    LitellmRouter = _Router
+else:
+    LitellmRouter = Any
+
+
+class PrefetchedStreamWrapper(CustomStreamWrapper):
+    """
+    Stream whose first chunk was already read - to time the first token
+    """
+
+    def __init__(self, stream: CustomStreamWrapper, prefetched_chunks: List[Any]):
+        super().__init__(
+            completion_stream=stream,
+            model=stream.model,
+            custom_llm_provider=stream.custom_llm_provider,
+            logging_obj=stream.logging_obj,
+        )
+        self._hidden_params = stream._hidden_params
+        self._stream = stream
+        self._prefetched_chunks = prefetched_chunks
+        self._exhausted = len(prefetched_chunks) == 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._prefetched_chunks:
+            return self._prefetched_chunks.pop(0)
+        if self._exhausted:
+            raise StopAsyncIteration
+        return await self._stream.__anext__()
+
+
+async def _async_close_stream(response: Any) -> None:
+    """Close the losing request's stream, so its connection is released"""
+    stream = getattr(response, "completion_stream", None)
+    if isinstance(response, PrefetchedStreamWrapper):
+        stream = response._stream.completion_stream
+    aclose = getattr(stream, "aclose", None)
+    if aclose is None:
+        return
+    try:
+        await aclose()
+    except Exception as e:
+        verbose_router_logger.debug(
+            "HedgedRequests: failed to close the cancelled stream - %s", str(e)
+        )
+
+
+class HedgedRequests:
+    def __init__(self, policy: HedgingPolicy):
+        self.policy = policy
+        # model group -> recent times to first token (seconds)
+        self._ttft_samples: Dict[str, Deque[float]] = {}
+        # model group -> (samples recorded, hedge delay computed after them)
+        self._hedge_delays: Dict[str, Tuple[int, float]] = {}
+        self._num_samples: Dict[str, int] = {}
+
+    def is_enabled(self, model_group: Optional[str]) -> bool:
+        if model_group is None:
+            return False
+        return (
+            self.policy.model_groups is None or model_group in self.policy.model_groups
+        )
+
+    def record_ttft(self, model_group: str, ttft: float) -> None:
+        samples = self._ttft_samples.get(model_group)
+        if samples is None:
+            samples = self._ttft_samples[model_group] = deque(
+                maxlen=HEDGING_TTFT_WINDOW_SIZE
+            )
+        samples.append(ttft)
+        self._num_samples[model_group] = self._num_samples.get(model_group, 0) + 1
+
+    def get_hedge_delay(self, model_group: str) -> Optional[float]:
+        """The model group's `percentile` time to first token - None until it has `min_samples`"""
+        samples = self._ttft_samples.get(model_group)
+        if samples is None or len(samples) < self.policy.min_samples:
+            return None
+        num_samples = self._num_samples[model_group]
+        cached = self._hedge_delays.get(model_group)
+        if (
+            cached is not None
+            and num_samples - cached[0] < HEDGING_DELAY_REFRESH_SAMPLES
+        ):
+            return cached[1]
+        sorted_samples = sorted(samples)
+        index = min(
+            int(len(sorted_samples) * self.policy.percentile), len(sorted_samples) - 1
+        )
+        self._hedge_delays[model_group] = (num_samples, sorted_samples[index])
+        return sorted_samples[index]
+
+    async def _async_first_token(self, response_coro: Awaitable[Any]) -> Any:
+        """Await the response - and the first chunk of streams"""
+        response = await response_coro
+        if not isinstance(response, CustomStreamWrapper):
+            return response
+        try:
+            first_chunk = await response.__anext__()
+        except StopAsyncIteration:
+            return PrefetchedStreamWrapper(stream=response, prefetched_chunks=[])
+        except asyncio.CancelledError:
+            await _async_close_stream(response)
+            raise
+        return PrefetchedStreamWrapper(
+            stream=response, prefetched_chunks=[first_chunk]
+        )
+
+    async def _async_get_hedge_kwargs(
+        self, litellm_router_instance: LitellmRouter, kwargs: dict
+    ) -> Optional[dict]:
+        """
+        kwargs for the hedged request - to a healthy deployment other than the first request's
+
+        None if there is no such deployment, or the retry budget is exhausted
+        """
+        model_group: str = kwargs["model"]
+        metadata: dict = kwargs.get("metadata") or {}
+        # the first request's deployment - `_update_kwargs_with_deployment` sets it on the shared metadata
+        primary_id = (metadata.get("model_info") or {}).get("id")
+        if primary_id is None:
+            # the first request hasn't picked its deployment yet - a hedge could go to the same one
+            return None
+        (
+            healthy_deployments,
+            _,
+        ) = await litellm_router_instance._async_get_healthy_deployments(
+            model=model_group, parent_otel_span=None
+        )
+        candidates = [
+            deployment
+            for deployment in healthy_deployments
+            if deployment["model_info"]["id"] != primary_id
+        ]
+        if len(candidates) == 0:
+            return None
+        retry_budget = litellm_router_instance.retry_budget
+        if retry_budget is not None and not retry_budget.try_acquire(
+            model_group, request_type="hedge"
+        ):
+            return None
+        hedge_kwargs = kwargs.copy()
+        # own metadata + call id - the first request keeps logging under its own
+        hedge_kwargs["metadata"] = metadata.copy()
+        hedge_kwargs["litellm_call_id"] = str(uuid.uuid4())
+        hedge_kwargs.pop("litellm_logging_obj", None)
+        # a model id routes to that deployment
+        hedge_kwargs["model"] = random.choice(candidates)["model_info"]["id"]
+        return hedge_kwargs
+
+    async def _async_race(
+        self, primary: "asyncio.Future[Any]", hedge: "asyncio.Future[Any]"
+    ) -> Tuple[Any, bool]:
+        """
+        Returns (first successful response, whether it's the hedged request's) - the other request is cancelled
+
+        Raises the first request's error if both fail
+        """
+        pending = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            winner = next((task for task in done if task.exception() is None), None)
+            if winner is None:
+                continue
+            for task in (primary, hedge):
+                if task is winner:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif task.exception() is None:
+                    await _async_close_stream(task.result())
+            return winner.result(), winner is hedge
+        raise primary.exception()  # type: ignore
+
+    def _get_litellm_call_id(self, kwargs: dict) -> str:
+        logging_obj = kwargs.get("litellm_logging_obj")
+        litellm_call_id = getattr(logging_obj, "litellm_call_id", None)
+        if litellm_call_id is not None:
+            return litellm_call_id
+        # set here, so the request logs under an id that's known to this class
+        return kwargs.setdefault("litellm_call_id", str(uuid.uuid4()))
+
+    def _start_request(
+        self,
+        litellm_router_instance: LitellmRouter,
+        make_call: Callable[[dict], Awaitable[Any]],
+        kwargs: dict,
+    ) -> "asyncio.Future[Any]":
+        litellm_call_id = self._get_litellm_call_id(kwargs)
+        task = asyncio.ensure_future(self._async_first_token(make_call(kwargs)))
+        task.add_done_callback(
+            lambda t: self._release_if_cancelled(
+                litellm_router_instance, litellm_call_id, t
+            )
+        )
+        return task
+
+    def _release_if_cancelled(
+        self,
+        litellm_router_instance: LitellmRouter,
+        litellm_call_id: str,
+        task: "asyncio.Future[Any]",
+    ) -> None:
+        """
+        A cancelled request (the race's loser) fires no success / failure callbacks - release its in-flight entry
+        """
+        if not task.cancelled():
+            return
+        handler = litellm_router_instance.leastoutstanding_logger
+        if handler is not None:
+            handler.release_request(litellm_call_id)
+
+    def _increment_hedged_request_metric(self, model_group: str, winner: str) -> None:
+        prometheus_logger = _get_prometheus_logger_from_callbacks()
+        if prometheus_logger is not None:
+            prometheus_logger.increment_hedged_request(
+                model_group=model_group, winner=winner
+            )
+
+    async def async_call(
+        self,
+        litellm_router_instance: LitellmRouter,
+        make_call: Callable[[dict], Awaitable[Any]],
+        kwargs: dict,
+    ) -> Any:
+        """
+        Run `make_call(kwargs)` - with a hedged request once it's slower than the model group's hedge delay
+        """
+        model_group: str = kwargs["model"]
+        # shared with the first request - its deployment is read from here before hedging
+        kwargs.setdefault("metadata", {})
+        start_time = time.time()
+        primary = self._start_request(litellm_router_instance, make_call, kwargs)
+        hedge: Optional["asyncio.Future[Any]"] = None
+        hedge_start_time = start_time
+        try:
+            hedge_delay = self.get_hedge_delay(model_group)
+            hedge_kwargs = None
+            # no hedge delay until the model group has `min_samples` - only the first request is sent
+            if hedge_delay is not None:
+                await asyncio.wait({primary}, timeout=hedge_delay)
+                if not primary.done():
+                    hedge_kwargs = await self._async_get_hedge_kwargs(
+                        litellm_router_instance=litellm_router_instance,
+                        kwargs=kwargs,
+                    )
+            if hedge_kwargs is None:
+                response = await primary
+                self.record_ttft(model_group, time.time() - start_time)
+                return response
+
+            verbose_router_logger.debug(
+                "HedgedRequests: no first token after %ss for model_group=%s, hedging to deployment=%s",
+                hedge_delay,
+                model_group,
+                hedge_kwargs["model"],
+            )
+            hedge_start_time = time.time()
+            hedge = self._start_request(
+                litellm_router_instance, make_call, hedge_kwargs
+            )
+            response, hedge_won = await self._async_race(primary, hedge)
+        except asyncio.CancelledError:
+            # the caller went away - don't leave the requests running
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+            raise
+        self.record_ttft(
+            model_group,
+            time.time() - (hedge_start_time if hedge_won else start_time),
+        )
+        self._increment_hedged_request_metric(
+            model_group=model_group, winner="hedge" if hedge_won else "primary"
+        )
+        return response
@@ -2,14 +2,19 @@
 Class to handle llm wildcard routing and regex pattern matching
 """
 
-import copy
 import re
+import threading
+from collections import OrderedDict
 from re import Match
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
+from litellm.constants import PATTERN_MATCH_ROUTER_CACHE_SIZE
 from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
 from litellm._logging import verbose_router_logger
 
+# deployments of the matched pattern, with their resolved litellm_params.model
+_ResolvedDeployments = List[Tuple[Dict, str]]
+
 
 class PatternUtils:
     @staticmethod
@@ -49,6 +54,68 @@ class PatternUtils:
         )
 
 
+class _CompiledPatternIndex:
+    """
+    Compiled form of `PatternMatchRouter.patterns` - finds the most specific pattern matching a request
+    without trying every pattern:
+
+    - a trie of the literal prefixes of the patterns (the part before the first `*`). Walking the
+      request through it yields the only patterns that can match.
+    - patterns with no literal prefix (e.g. `*meta.llama3*`) can't be narrowed down by the trie, they're
+      tried at once through a single alternation regex, ordered by specificity.
+    """
+
+    def __init__(
+        self, sorted_patterns: List[Tuple[str, List[Dict]]], literal_prefixes: Dict
+    ):
+        self.patterns: List[Tuple[Pattern, List[Dict]]] = []
+        self.trie: Dict[str, Any] = {}  # char -> child node, "" -> ranks ending here
+        unprefixed: List[str] = []
+        self.unprefixed_ranks: List[int] = []
+        for rank, (regex, deployments) in enumerate(sorted_patterns):
+            self.patterns.append((re.compile(regex), deployments))
+            prefix = literal_prefixes.get(regex, "")
+            if prefix == "":
+                unprefixed.append(f"(?P<_{rank}>{regex})")
+                self.unprefixed_ranks.append(rank)
+                continue
+            node = self.trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node.setdefault("", []).append(rank)
+        self.unprefixed_regex: Optional[Pattern] = (
+            re.compile("|".join(unprefixed)) if unprefixed else None
+        )
+
+    def match(self, request: str) -> Optional[Tuple[Match, List[Dict]]]:
+        best_rank = len(self.patterns)
+        if self.unprefixed_regex is not None:
+            unprefixed_match = self.unprefixed_regex.match(request)
+            if unprefixed_match is not None and unprefixed_match.lastgroup:
+                best_rank = int(unprefixed_match.lastgroup[1:])
+
+        candidate_ranks: List[int] = []
+        node = self.trie
+        for char in request:
+            node = node.get(char)
+            if node is None:
+                break
+            candidate_ranks.extend(
+                rank for rank in node.get("", ()) if rank < best_rank
+            )
+        for rank in sorted(candidate_ranks):
+            pattern_match = self.patterns[rank][0].match(request)
+            if pattern_match is not None:
+                return pattern_match, self.patterns[rank][1]
+
+        if best_rank < len(self.patterns):
+            compiled, deployments = self.patterns[best_rank]
+            pattern_match = compiled.match(request)
+            if pattern_match is not None:
+                return pattern_match, deployments
+        return None
+
+
 class PatternMatchRouter:
     """
     Class to handle llm wildcard routing and regex pattern matching
@@ -60,6 +127,15 @@ class PatternMatchRouter:
 
     def __init__(self):
         self.patterns: Dict[str, List] = {}
+        # regex -> literal prefix of its wildcard pattern
+        self._literal_prefixes: Dict[str, str] = {}
+        self._index: Optional[_CompiledPatternIndex] = None
+        self._indexed_patterns: Optional[Dict[str, List]] = None
+        # request -> resolved deployments (None = no match)
+        self._route_cache: "OrderedDict[str, Optional[_ResolvedDeployments]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
 
     def add_pattern(self, pattern: str, llm_deployment: Dict):
         """
@@ -74,6 +150,29 @@ class PatternMatchRouter:
         if regex not in self.patterns:
             self.patterns[regex] = []
         self.patterns[regex].append(llm_deployment)
+        self._literal_prefixes[regex] = pattern.split("*", 1)[0]
+        self._invalidate_index()
+
+    def _invalidate_index(self) -> None:
+        with self._lock:
+            self._index = None
+            self._indexed_patterns = None
+            self._route_cache.clear()
+
+    def _get_index(self) -> _CompiledPatternIndex:
+        index = self._index
+        if index is None or self._indexed_patterns is not self.patterns:
+            # built lazily, and rebuilt if `patterns` was replaced
+            patterns = self.patterns
+            index = _CompiledPatternIndex(
+                sorted_patterns=PatternUtils.sorted_patterns(patterns),
+                literal_prefixes=self._literal_prefixes,
+            )
+            with self._lock:
+                self._index = index
+                self._indexed_patterns = patterns
+                self._route_cache.clear()
+        return index
 
     def _pattern_to_regex(self, pattern: str) -> str:
         """
@@ -102,18 +201,46 @@ class PatternMatchRouter:
     def _return_pattern_matched_deployments(
         self, matched_pattern: Match, deployments: List[Dict]
     ) -> List[Dict]:
-        new_deployments = []
-        for deployment in deployments:
-            new_deployment = copy.deepcopy(deployment)
-            new_deployment["litellm_params"][
-                "model"
-            ] = PatternMatchRouter.set_deployment_model_name(
-                matched_pattern=matched_pattern,
-                litellm_deployment_litellm_model=deployment["litellm_params"]["model"],
+        return self._copy_resolved_deployments(
+            self._resolve_deployments(matched_pattern, deployments)
+        )
+
+    @staticmethod
+    def _resolve_deployments(
+        matched_pattern: Match, deployments: List[Dict]
+    ) -> _ResolvedDeployments:
+        return [
+            (
+                deployment,
+                PatternMatchRouter.set_deployment_model_name(
+                    matched_pattern=matched_pattern,
+                    litellm_deployment_litellm_model=deployment["litellm_params"][
+                        "model"
+                    ],
+                ),
             )
-            new_deployments.append(new_deployment)
+            for deployment in deployments
+        ]
 
-        return new_deployments
+    @staticmethod
+    def _copy_resolved_deployments(resolved: _ResolvedDeployments) -> List[Dict]:
+        """
+        Copy-on-write - only the deployment dict and its litellm_params (which gets the resolved model)
+        are copied, everything else is shared with the registered deployment.
+        """
+        return [
+            {
+                **deployment,
+                "litellm_params": {**deployment["litellm_params"], "model": model},
+            }
+            for deployment, model in resolved
+        ]
+
+    def _route_uncached(self, request: str) -> Optional[_ResolvedDeployments]:
+        matched = self._get_index().match(request)
+        if matched is None:
+            return None
+        return self._resolve_deployments(*matched)
 
     def route(
         self, request: Optional[str], filtered_model_names: Optional[List[str]] = None
@@ -135,6 +262,26 @@ class PatternMatchRouter:
             if request is None:
                 return None
 
+            if filtered_model_names is None:
+                self._get_index()  # drops memoized routes if `patterns` was replaced
+                with self._lock:
+                    cached = self._route_cache.get(request, False)
+                    if cached is not False:
+                        self._route_cache.move_to_end(request)
+                if cached is False:
+                    cached = self._route_uncached(request)
+                    if PATTERN_MATCH_ROUTER_CACHE_SIZE > 0:
+                        with self._lock:
+                            self._route_cache[request] = cached
+                            while (
+                                len(self._route_cache)
+                                > PATTERN_MATCH_ROUTER_CACHE_SIZE
+                            ):
+                                self._route_cache.popitem(last=False)
+                if cached is None:
+                    return None
+                return self._copy_resolved_deployments(cached)
+
             sorted_patterns = PatternUtils.sorted_patterns(self.patterns)
             regex_filtered_model_names = (
                 [self._pattern_to_regex(m) for m in filtered_model_names]
@@ -0,0 +1,79 @@
+"""
+Retry budget for the router - a token bucket per model group
+
+- each request of a model group adds `retry_ratio` tokens (e.g. 0.1 -> retries <= 10% of requests)
+- each retry / hedged request takes 1 token - it is not sent when the bucket has less than 1
+- `min_retries_per_second` tokens are added over time, so model groups with low traffic can still retry
+
+Budgets are kept per instance - the ratio holds across instances as long as traffic is spread evenly over them.
+"""
+
+import time
+from typing import Dict, List, Literal
+
+from litellm._logging import verbose_router_logger
+from litellm.types.router import RetryBudgetPolicy
+
+
+class RetryBudget:
+    def __init__(self, policy: RetryBudgetPolicy):
+        self.policy = policy
+        # model group -> [tokens, time the bucket was last refilled]
+        self._buckets: Dict[str, List[float]] = {}
+
+    def _get_bucket(self, model_group: str) -> List[float]:
+        now = time.time()
+        bucket = self._buckets.get(model_group)
+        if bucket is None:
+            # start with 1 second of the minimum rate - not a full bucket, which would allow a retry storm right after startup
+            bucket = self._buckets[model_group] = [
+                self.policy.min_retries_per_second,
+                now,
+            ]
+            return bucket
+        bucket[0] = min(
+            bucket[0] + (now - bucket[1]) * self.policy.min_retries_per_second,
+            self.policy.max_burst_retries,
+        )
+        bucket[1] = now
+        return bucket
+
+    def get_tokens(self, model_group: str) -> float:
+        return self._get_bucket(model_group)[0]
+
+    def record_request(self, model_group: str) -> None:
+        bucket = self._get_bucket(model_group)
+        bucket[0] = min(
+            bucket[0] + self.policy.retry_ratio, self.policy.max_burst_retries
+        )
+
+    def try_acquire(
+        self, model_group: str, request_type: Literal["retry", "hedge"] = "retry"
+    ) -> bool:
+        """
+        Take a token for a retry / hedged request - False if the budget is exhausted
+        """
+        bucket = self._get_bucket(model_group)
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return True
+        verbose_router_logger.info(
+            "Retry budget exhausted for model_group=%s - not sending %s",
+            model_group,
+            request_type,
+        )
+        self._increment_budget_exhausted_metric(model_group, request_type)
+        return False
+
+    def _increment_budget_exhausted_metric(
+        self, model_group: str, request_type: str
+    ) -> None:
+        from litellm.router_utils.cooldown_callbacks import (
+            _get_prometheus_logger_from_callbacks,
+        )
+
+        prometheus_logger = _get_prometheus_logger_from_callbacks()
+        if prometheus_logger is not None:
+            prometheus_logger.increment_retry_budget_exhausted(
+                model_group=model_group, request_type=request_type
+            )
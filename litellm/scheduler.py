@@ -1,16 +1,50 @@
+import asyncio
+import bisect
 import enum
 import heapq
-from typing import Optional
+import itertools
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from pydantic import BaseModel
 
 from litellm import print_verbose
+from litellm._logging import verbose_router_logger
+from litellm._uuid import uuid
 from litellm.caching.caching import DualCache, RedisCache
-from litellm.constants import DEFAULT_IN_MEMORY_TTL, DEFAULT_POLLING_INTERVAL
+from litellm.constants import (
+    DEFAULT_IN_MEMORY_TTL,
+    DEFAULT_POLLING_INTERVAL,
+    SCHEDULER_MAX_WAKE_INTERVAL_SECONDS,
+    SCHEDULER_REDIS_BLOCKING_POP_TIMEOUT_SECONDS,
+    SCHEDULER_REDIS_WAKE_KEY_TTL_SECONDS,
+    SCHEDULER_RELEASE_INTERVAL_EWMA_ALPHA,
+    SCHEDULER_RELEASE_INTERVAL_MAX_AGE_SECONDS,
+)
+
+# returns (has capacity, seconds until capacity is expected back - e.g. the next cooldown expiry - or None)
+CapacityCheck = Callable[[], Awaitable[Tuple[bool, Optional[float]]]]
+
+# "priority" - strict priority, first come first served within a priority
+# "wfq" - weighted fair queueing between (priority, flow) classes, earliest deadline first within a class
+SchedulerPolicy = Literal["priority", "wfq"]
 
 
 class SchedulerCacheKeys(enum.Enum):
     queue = "scheduler:queue"
+    redis_queue = "scheduler:zqueue"
+    redis_wake = "scheduler:wake"
     default_in_memory_ttl = (
         DEFAULT_IN_MEMORY_TTL  # cache queue in-memory for 5s when redis cache available
     )
@@ -20,6 +54,273 @@ class FlowItem(BaseModel):
     priority: int  # Priority between 0 and 255
     request_id: str
     model_name: str
+    flow_id: Optional[str] = None  # e.g. team id - "wfq" shares capacity fairly between flows
+    deadline: Optional[float] = None  # time.monotonic() by which the request must be released
+
+
+class _Waiter:
+    __slots__ = ("request", "future", "deadline", "sequence", "enqueued_at")
+
+    def __init__(
+        self, request: FlowItem, future: asyncio.Future, deadline: float, sequence: int
+    ):
+        self.request = request
+        self.future = future
+        self.deadline = deadline
+        self.sequence = sequence
+        self.enqueued_at = time.monotonic()
+
+
+class _PriorityWaitQueue:
+    """Strict priority - lowest `priority` first, first come first served within a priority"""
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, _Waiter]] = []
+        self._num_waiting = 0
+        # priority -> number of waiting requests
+        self._num_waiting_by_priority: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return self._num_waiting
+
+    def _count(self, priority: int, delta: int) -> None:
+        num_waiting = self._num_waiting_by_priority.get(priority, 0) + delta
+        if num_waiting > 0:
+            self._num_waiting_by_priority[priority] = num_waiting
+        else:
+            self._num_waiting_by_priority.pop(priority, None)
+        self._num_waiting += delta
+
+    def push(self, waiter: _Waiter) -> None:
+        heapq.heappush(self._heap, (waiter.request.priority, waiter.sequence, waiter))
+        self._count(waiter.request.priority, 1)
+
+    def pop(self) -> Optional[_Waiter]:
+        while self._heap:
+            waiter = heapq.heappop(self._heap)[2]
+            if not waiter.future.done():
+                self._count(waiter.request.priority, -1)
+                return waiter
+        return None
+
+    def discard(self, waiter: _Waiter) -> None:
+        """`waiter` left the queue (timed out) - its entry is dropped lazily"""
+        self._count(waiter.request.priority, -1)
+        while self._heap and self._heap[0][2].future.done():
+            heapq.heappop(self._heap)
+
+    def num_released_before(self, waiter: _Waiter) -> float:
+        """Requests released before the most recently pushed `waiter` - every waiting one of the same or a higher priority"""
+        priority = waiter.request.priority
+        return (
+            sum(
+                num_waiting
+                for other_priority, num_waiting in self._num_waiting_by_priority.items()
+                if other_priority <= priority
+            )
+            - 1
+        )
+
+
+class _WFQFlow:
+    __slots__ = ("key", "weight", "waiters", "finish_tag")
+
+    def __init__(self, key: Tuple[int, Optional[str]], weight: float):
+        self.key = key
+        self.weight = weight
+        # (deadline, sequence, waiter), sorted - earliest deadline first
+        self.waiters: List[Tuple[float, int, _Waiter]] = []
+        self.finish_tag = 0.0
+
+
+class _WFQWaitQueue:
+    """
+    Weighted fair queueing between classes - a class is a (priority, flow_id) pair - earliest deadline first within a class.
+
+    Every class gets a share of the releases proportional to its weight, so low priority traffic is
+    slowed down, never starved. A class that becomes backlogged gets the virtual finish tag
+    max(virtual time, its previous finish tag) + 1 / weight, the class with the smallest tag is released next.
+
+    Backlogged classes are kept in a heap by finish tag, idle ones in a heap by finish tag until their credit
+    runs out - a release is O(log classes), not a scan of every class.
+    """
+
+    def __init__(self, get_weight: Callable[[int], float]):
+        self._get_weight = get_weight
+        self._flows: Dict[Tuple[int, Optional[str]], _WFQFlow] = {}
+        # (finish tag, sequence, flow) - entries whose tag is no longer the flow's are stale, dropped when popped
+        self._backlogged: List[Tuple[float, int, _WFQFlow]] = []
+        self._idle: List[Tuple[float, int, _WFQFlow]] = []
+        self._sequence = itertools.count()
+        self._backlogged_weight = 0.0
+        self._virtual_time = 0.0
+        self._num_waiting = 0
+
+    def __len__(self) -> int:
+        return self._num_waiting
+
+    def _set_backlogged(self, flow: _WFQFlow) -> None:
+        heapq.heappush(self._backlogged, (flow.finish_tag, next(self._sequence), flow))
+
+    def _set_idle(self, flow: _WFQFlow) -> None:
+        self._backlogged_weight -= flow.weight
+        if self._num_waiting == 0:
+            self._backlogged_weight = 0.0  # no float drift across backlogs
+        heapq.heappush(self._idle, (flow.finish_tag, next(self._sequence), flow))
+
+    def push(self, waiter: _Waiter) -> None:
+        key = (waiter.request.priority, waiter.request.flow_id)
+        flow = self._flows.get(key)
+        if flow is None:
+            flow = self._flows[key] = _WFQFlow(
+                key=key, weight=self._get_weight(waiter.request.priority)
+            )
+        bisect.insort(flow.waiters, (waiter.deadline, waiter.sequence, waiter))
+        self._num_waiting += 1
+        if len(flow.waiters) == 1:
+            flow.finish_tag = max(self._virtual_time, flow.finish_tag) + 1 / flow.weight
+            self._backlogged_weight += flow.weight
+            self._set_backlogged(flow)
+
+    def pop(self) -> Optional[_Waiter]:
+        while self._backlogged:
+            finish_tag, _, flow = heapq.heappop(self._backlogged)
+            if flow.waiters and flow.finish_tag == finish_tag:
+                break
+        else:
+            return None
+        waiter = flow.waiters.pop(0)[2]
+        self._num_waiting -= 1
+        self._virtual_time = flow.finish_tag
+        if flow.waiters:
+            flow.finish_tag += 1 / flow.weight
+            self._set_backlogged(flow)
+        else:
+            self._set_idle(flow)
+        # idle classes with no credit left are forgotten
+        while self._idle and self._idle[0][0] <= self._virtual_time:
+            idle = heapq.heappop(self._idle)[2]
+            if not idle.waiters and self._flows.get(idle.key) is idle:
+                del self._flows[idle.key]
+        return waiter
+
+    def discard(self, waiter: _Waiter) -> None:
+        """`waiter` left the queue (timed out)"""
+        flow = self._flows[(waiter.request.priority, waiter.request.flow_id)]
+        index = bisect.bisect_left(flow.waiters, (waiter.deadline, waiter.sequence))
+        if index < len(flow.waiters) and flow.waiters[index][2] is waiter:
+            del flow.waiters[index]
+            self._num_waiting -= 1
+            if not flow.waiters:
+                self._set_idle(flow)
+
+    def num_released_before(self, waiter: _Waiter) -> float:
+        """
+        Expected number of releases before `waiter` - its class is served at weight / total backlogged weight of the releases
+        """
+        flow = self._flows[(waiter.request.priority, waiter.request.flow_id)]
+        ahead_in_class = bisect.bisect_left(
+            flow.waiters, (waiter.deadline, waiter.sequence)
+        )
+        return (ahead_in_class + 1) * self._backlogged_weight / flow.weight - 1
+
+
+_WaitQueue = Union[_PriorityWaitQueue, _WFQWaitQueue]
+
+
+# pops the highest priority request of a model group and hands its id to the instance waiting on it
+_RELEASE_HEAD_SCRIPT = """
+local popped = redis.call('ZPOPMIN', KEYS[1])
+if #popped == 0 then
+    return nil
+end
+local member = popped[1]
+local first = string.find(member, ':', 1, true)
+local second = string.find(member, ':', first + 1, true)
+local instance_id = string.sub(member, first + 1, second - 1)
+local request_id = string.sub(member, second + 1)
+local wake_key = ARGV[1] .. instance_id
+redis.call('RPUSH', wake_key, request_id)
+redis.call('EXPIRE', wake_key, ARGV[2])
+return member
+"""
+
+
+class RedisSchedulerQueue:
+    """
+    Priority queue shared by every instance, for `Scheduler(use_redis_queue=True)`
+
+    - one sorted set per model group, score = priority, members `<enqueued at ns>:<instance id>:<request id>`
+      (equal scores are ordered by member, so requests of the same priority are FIFO)
+    - releasing a request pops the head of the sorted set and pushes its id onto the owning instance's
+      wake-up list, where a single blocking pop (BLPOP) per instance hands it to the waiting request
+    """
+
+    def __init__(self, redis_cache: RedisCache):
+        self.redis_cache = redis_cache
+        self.instance_id = uuid.uuid4().hex
+        self.wake_key = "{}:{}".format(
+            SchedulerCacheKeys.redis_wake.value, self.instance_id
+        )
+        self._release_head_script: Any = None
+
+    def _queue_key(self, model_name: str) -> str:
+        return "{}:{}".format(SchedulerCacheKeys.redis_queue.value, model_name)
+
+    def _member(self, request: FlowItem, enqueued_at_ns: int) -> str:
+        return "{:020d}:{}:{}".format(
+            enqueued_at_ns, self.instance_id, request.request_id
+        )
+
+    async def enqueue(self, request: FlowItem, enqueued_at_ns: int) -> None:
+        _redis_client: Any = self.redis_cache.init_async_client()
+        await _redis_client.zadd(
+            self._queue_key(request.model_name),
+            {self._member(request, enqueued_at_ns): request.priority},
+        )
+
+    async def remove(self, request: FlowItem, enqueued_at_ns: int) -> None:
+        _redis_client: Any = self.redis_cache.init_async_client()
+        await _redis_client.zrem(
+            self._queue_key(request.model_name),
+            self._member(request, enqueued_at_ns),
+        )
+
+    async def size(self, model_name: str) -> int:
+        _redis_client: Any = self.redis_cache.init_async_client()
+        return await _redis_client.zcard(self._queue_key(model_name))
+
+    async def release_head(self, model_name: str) -> bool:
+        """
+        Release the highest priority request of the model group, on whichever instance it waits.
+
+        Returns False if the queue is empty.
+        """
+        if self._release_head_script is None:
+            self._release_head_script = self.redis_cache.async_register_script(
+                _RELEASE_HEAD_SCRIPT
+            )
+        released = await self._release_head_script(
+            keys=[self._queue_key(model_name)],
+            args=[
+                "{}:".format(SchedulerCacheKeys.redis_wake.value),
+                SCHEDULER_REDIS_WAKE_KEY_TTL_SECONDS,
+            ],
+        )
+        return released is not None
+
+    async def pop_released(self) -> Optional[str]:
+        """
+        Blocks until a request of this instance is released - returns its id, or None on timeout
+        """
+        _redis_client: Any = self.redis_cache.init_async_client()
+        result = await _redis_client.blpop(
+            [self.wake_key], timeout=SCHEDULER_REDIS_BLOCKING_POP_TIMEOUT_SECONDS
+        )
+        if result is None:
+            return None
+        request_id = result[1]
+        return request_id.decode() if isinstance(request_id, bytes) else request_id
 
 
 class Scheduler:
@@ -29,10 +330,24 @@ class Scheduler:
         self,
         polling_interval: Optional[float] = None,
         redis_cache: Optional[RedisCache] = None,
+        use_redis_queue: bool = False,
+        policy: SchedulerPolicy = "priority",
+        priority_weights: Optional[Dict[int, float]] = None,
     ):
         """
-        polling_interval: float or null - frequency of polling queue. Default is 3ms.
+        polling_interval: float or null - frequency of polling queue. Default is 3ms. Only used by `poll()`.
+        use_redis_queue: bool - share the priority queue of `acquire()` across instances through redis. Requires redis_cache.
+        policy: "priority" or "wfq" - order of the `acquire()` queue. "wfq" = weighted fair queueing between (priority, flow_id) classes, earliest deadline first within a class, and early rejection of requests that would miss their deadline.
+        priority_weights: dict or null - "wfq" weight per priority. Default is 1 / (1 + priority).
         """
+        if policy not in ("priority", "wfq"):
+            raise ValueError(
+                f"Invalid scheduler policy={policy}. Supported policies: 'priority', 'wfq'"
+            )
+        if policy == "wfq" and use_redis_queue:
+            raise ValueError(
+                "Scheduler policy='wfq' is not supported with use_redis_queue=True"
+            )
         self.queue: list = []
         default_in_memory_ttl: Optional[float] = None
         if redis_cache is not None:
@@ -45,6 +360,315 @@ class Scheduler:
             polling_interval or DEFAULT_POLLING_INTERVAL
         )  # default to 3ms
 
+        # event-driven queue - see `acquire()`
+        self.policy: SchedulerPolicy = policy
+        self.priority_weights: Dict[int, float] = priority_weights or {}
+        self._waiters: Dict[str, _WaitQueue] = {}
+        # model group -> EWMA of the seconds between releases while requests are queued
+        self._release_intervals: Dict[str, float] = {}
+        self._release_interval_updated_at: Dict[str, float] = {}
+        self._last_release_at: Dict[str, float] = {}
+        self._sequence = itertools.count()
+        self._capacity_checks: Dict[str, CapacityCheck] = {}
+        self._dispatching: Set[str] = set()
+        # running `_dispatch` tasks - the event loop only keeps weak references to tasks
+        self._dispatch_tasks: Set[asyncio.Future] = set()
+        self._renotify: Set[str] = set()
+        self._wake_handles: Dict[str, asyncio.TimerHandle] = {}
+        self.redis_queue: Optional[RedisSchedulerQueue] = (
+            RedisSchedulerQueue(redis_cache=redis_cache)
+            if use_redis_queue and redis_cache is not None
+            else None
+        )
+        self._redis_waiters: Dict[str, asyncio.Future] = {}
+        self._redis_listener: Optional[asyncio.Task] = None
+
+    ### EVENT-DRIVEN QUEUE ###
+
+    async def acquire(
+        self, request: FlowItem, check_capacity: CapacityCheck, timeout: float
+    ) -> bool:
+        """
+        Wait until `request` may be sent. Returns False if it timed out in the queue, or - with the
+        "wfq" policy - was rejected because it would not be released before its deadline.
+
+        A request goes straight through if nothing is queued for its model group and there's capacity.
+        Otherwise it waits - without polling - until `notify()` (a request completed, a deployment came
+        back) or the expected end of the capacity shortage (e.g. the next cooldown expiry) wakes the queue.
+        Waiters are then released in `policy` order, one capacity check each.
+
+        Unlike the legacy `poll()`, the head of the queue does not go through while there's no capacity
+        (e.g. 0 healthy deployments) - it waits for capacity to come back, until `timeout`.
+        """
+        model_name = request.model_name
+        self._capacity_checks[model_name] = check_capacity
+        if not await self._has_queued_requests(model_name):
+            has_capacity, _ = await check_capacity()
+            if has_capacity:
+                self._observe_queue_wait(request, 0.0, "released")
+                return True
+
+        deadline = time.monotonic() + timeout
+        if self.policy == "wfq" and request.deadline is not None:
+            deadline = min(deadline, request.deadline)
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            request=request,
+            future=loop.create_future(),
+            deadline=deadline,
+            sequence=next(self._sequence),
+        )
+        queue = self._waiters.get(model_name)
+        if queue is None:
+            queue = self._waiters[model_name] = (
+                _WFQWaitQueue(get_weight=self._get_priority_weight)
+                if self.policy == "wfq"
+                else _PriorityWaitQueue()
+            )
+        queue.push(waiter)
+        if self.policy == "wfq" and self._would_miss_deadline(queue, waiter):
+            waiter.future.cancel()
+            self._leave_queue(model_name, waiter)
+            self._observe_queue_wait(request, 0.0, "rejected")
+            return False
+
+        enqueued_at_ns = time.time_ns()
+        released = False
+        try:
+            if self.redis_queue is not None:
+                self._redis_waiters[request.request_id] = waiter.future
+                await self.redis_queue.enqueue(request, enqueued_at_ns)
+                self._ensure_redis_listener()
+            # capacity may have come back while we were queueing
+            self.notify(model_name)
+
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(waiter.future),
+                    timeout=max(0.0, deadline - time.monotonic()),
+                )
+            except asyncio.TimeoutError:
+                pass
+            released = waiter.future.done() and not waiter.future.cancelled()
+        finally:
+            # also runs if the waiting request is cancelled
+            self._redis_waiters.pop(request.request_id, None)
+            if released:
+                if self.redis_queue is not None:
+                    # requests released through redis never left the local queue
+                    self._leave_queue(model_name, waiter)
+            else:
+                await self._abandon_waiter(waiter, enqueued_at_ns)
+        self._observe_queue_wait(
+            request,
+            time.monotonic() - waiter.enqueued_at,
+            "released" if released else "timed_out",
+        )
+        return released
+
+    def notify(self, model_name: str) -> None:
+        """
+        Wake the queue of a model group - call when capacity may be available again
+        """
+        if model_name in self._dispatching:
+            self._renotify.add(model_name)
+            return
+        if not self._waiters.get(model_name):
+            return
+        self._dispatching.add(model_name)
+        task = asyncio.ensure_future(self._dispatch(model_name))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    def get_num_waiting(self, model_name: str) -> int:
+        """Number of requests of this instance waiting in the queue of a model group"""
+        queue = self._waiters.get(model_name)
+        return len(queue) if queue is not None else 0
+
+    def get_release_interval(self, model_name: str) -> Optional[float]:
+        """
+        Smoothed seconds between releases of a backlogged model group queue - None until measured, or once
+        nothing was released for `SCHEDULER_RELEASE_INTERVAL_MAX_AGE_SECONDS`.
+
+        While the queue is stalled, the time since the last release is used if it's longer.
+        """
+        release_interval = self._release_intervals.get(model_name)
+        if release_interval is None:
+            return None
+        now = time.monotonic()
+        updated_at = self._release_interval_updated_at.get(model_name, now)
+        if now - updated_at > SCHEDULER_RELEASE_INTERVAL_MAX_AGE_SECONDS:
+            self._release_intervals.pop(model_name, None)
+            self._release_interval_updated_at.pop(model_name, None)
+            return None
+        last_release_at = self._last_release_at.get(model_name)
+        if last_release_at is not None:
+            release_interval = max(release_interval, now - last_release_at)
+        return release_interval
+
+    def _get_priority_weight(self, priority: int) -> float:
+        weight = self.priority_weights.get(priority)
+        return weight if weight is not None else 1 / (1 + priority)
+
+    def _would_miss_deadline(self, queue: _WaitQueue, waiter: _Waiter) -> bool:
+        release_interval = self.get_release_interval(waiter.request.model_name)
+        if release_interval is None:
+            return False
+        expected_wait = (queue.num_released_before(waiter) + 1) * release_interval
+        return time.monotonic() + expected_wait > waiter.deadline
+
+    def _leave_queue(self, model_name: str, waiter: _Waiter) -> None:
+        queue = self._waiters.get(model_name)
+        if queue is None:
+            return
+        queue.discard(waiter)
+        if not queue:
+            self._waiters.pop(model_name, None)
+            self._last_release_at.pop(model_name, None)
+
+    async def _abandon_waiter(self, waiter: _Waiter, enqueued_at_ns: int) -> None:
+        """
+        Remove a request that timed out / was cancelled in the queue. A release it was handed, but
+        didn't use, is passed on to the next waiter.
+        """
+        request = waiter.request
+        model_name = request.model_name
+        was_released = waiter.future.done() and not waiter.future.cancelled()
+        waiter.future.cancel()
+        if not was_released or self.redis_queue is not None:
+            # locally released waiters were already popped off the local queue
+            self._leave_queue(model_name, waiter)
+        if was_released:
+            self.notify(model_name)
+        if self.redis_queue is not None:
+            try:
+                await self.redis_queue.remove(request, enqueued_at_ns)
+            except Exception as e:
+                verbose_router_logger.debug(
+                    "Scheduler: error removing %s from the redis queue - %s",
+                    request.request_id,
+                    str(e),
+                )
+
+    def _record_release(self, model_name: str) -> None:
+        """Track the release rate of a backlogged queue - used to reject requests that would miss their deadline"""
+        now = time.monotonic()
+        last_release_at = self._last_release_at.get(model_name)
+        if last_release_at is not None:
+            interval = now - last_release_at
+            previous = self._release_intervals.get(model_name)
+            self._release_intervals[model_name] = (
+                interval
+                if previous is None
+                else previous
+                + SCHEDULER_RELEASE_INTERVAL_EWMA_ALPHA * (interval - previous)
+            )
+            self._release_interval_updated_at[model_name] = now
+        if self._waiters.get(model_name):
+            self._last_release_at[model_name] = now
+        else:  # queue drained - the next backlog starts a new measurement
+            self._waiters.pop(model_name, None)
+            self._last_release_at.pop(model_name, None)
+
+    def _observe_queue_wait(
+        self, request: FlowItem, wait_seconds: float, outcome: str
+    ) -> None:
+        from litellm.router_utils.cooldown_callbacks import (
+            _get_prometheus_logger_from_callbacks,
+        )
+
+        prometheus_logger = _get_prometheus_logger_from_callbacks()
+        if prometheus_logger is not None:
+            prometheus_logger.observe_request_queue_wait(
+                model_group=request.model_name,
+                priority=request.priority,
+                outcome=outcome,
+                wait_seconds=wait_seconds,
+            )
+
+    async def _has_queued_requests(self, model_name: str) -> bool:
+        if self.redis_queue is not None:
+            return await self.redis_queue.size(model_name) > 0
+        return self.get_num_waiting(model_name) > 0
+
+    async def _dispatch(self, model_name: str) -> None:
+        try:
+            while True:
+                self._renotify.discard(model_name)
+                await self._release_waiters(model_name)
+                if model_name not in self._renotify:
+                    break
+        except Exception as e:
+            verbose_router_logger.debug(
+                "Scheduler: error releasing queued requests for %s - %s",
+                model_name,
+                str(e),
+            )
+            self._schedule_wake(model_name, retry_after=None)
+        finally:
+            self._dispatching.discard(model_name)
+
+    async def _release_waiters(self, model_name: str) -> None:
+        check_capacity = self._capacity_checks[model_name]
+        while self._waiters.get(model_name):
+            has_capacity, retry_after = await check_capacity()
+            if not has_capacity:
+                self._schedule_wake(model_name, retry_after=retry_after)
+                return
+            if self.redis_queue is not None:
+                # releases the global head - which may be waiting on another instance
+                if not await self.redis_queue.release_head(model_name):
+                    return
+            else:
+                queue = self._waiters.get(model_name)
+                waiter = queue.pop() if queue is not None else None
+                if waiter is None:
+                    return
+                waiter.future.set_result(True)
+                self._record_release(model_name)
+
+    def _schedule_wake(self, model_name: str, retry_after: Optional[float]) -> None:
+        if not self._waiters.get(model_name):
+            return
+        delay = SCHEDULER_MAX_WAKE_INTERVAL_SECONDS
+        if retry_after is not None:
+            delay = max(0.0, min(delay, retry_after))
+        loop = asyncio.get_running_loop()
+        handle = self._wake_handles.get(model_name)
+        if handle is not None and not handle.cancelled():
+            if handle.when() <= loop.time() + delay:
+                return
+            handle.cancel()
+        self._wake_handles[model_name] = loop.call_later(
+            delay, self._on_wake, model_name
+        )
+
+    def _on_wake(self, model_name: str) -> None:
+        self._wake_handles.pop(model_name, None)
+        self.notify(model_name)
+
+    def _ensure_redis_listener(self) -> None:
+        if self._redis_listener is None or self._redis_listener.done():
+            self._redis_listener = asyncio.ensure_future(self._listen_for_releases())
+
+    async def _listen_for_releases(self) -> None:
+        """Hands requests released by any instance to the waiters of this instance"""
+        assert self.redis_queue is not None
+        while self._redis_waiters:
+            try:
+                request_id = await self.redis_queue.pop_released()
+            except Exception as e:
+                verbose_router_logger.debug(
+                    "Scheduler: redis queue listener error - %s", str(e)
+                )
+                await asyncio.sleep(SCHEDULER_MAX_WAKE_INTERVAL_SECONDS)
+                continue
+            if request_id is None:
+                continue
+            future = self._redis_waiters.pop(request_id, None)
+            if future is not None and not future.done():
+                future.set_result(True)
+
     async def add_request(self, request: FlowItem):
         # We use the priority directly, as lower values indicate higher priority
         # get the queue
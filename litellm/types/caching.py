@@ -11,6 +11,8 @@ class LiteLLMCacheType(str, Enum):
     REDIS_SEMANTIC = "redis-semantic"
     S3 = "s3"
     DISK = "disk"
+    SEGMENT_DISK = "segment-disk"
+    LOCAL_SEMANTIC = "local-semantic"
     QDRANT_SEMANTIC = "qdrant-semantic"
     AZURE_BLOB = "azure-blob"
     GCS = "gcs"
@@ -30,6 +32,43 @@ CachingSupportedCallTypes = Literal[
 ]
 
 
+InMemoryCacheEvictionPolicy = Literal["ttl", "lru", "tinylfu"]
+
+CacheKeyHashAlgorithm = Literal["sha256", "blake2b", "xxhash"]
+
+RedisCacheCodecSerializer = Literal["json", "orjson", "msgpack"]
+
+RedisCacheCodecCompression = Literal["zstd", "lz4", "zlib"]
+
+
+class RedisCacheCodecParams(TypedDict, total=False):
+    """
+    Params for RedisCacheCodec - set as `redis_cache_codec` in cache_params
+    """
+
+    serializer: RedisCacheCodecSerializer
+    compression: Optional[RedisCacheCodecCompression]
+    compression_threshold_bytes: int
+    pack_float_arrays: bool
+
+
+LocalSemanticCacheDtype = Literal["float32", "float16"]
+LocalSemanticCacheIndexType = Literal["ivf", "hnsw"]
+
+
+class InMemoryCacheStats(TypedDict):
+    """
+    Runtime counters for an InMemoryCache
+    """
+
+    hits: int
+    misses: int
+    evictions: int  # entries removed to stay within the item / byte budget
+    expirations: int  # entries removed because their ttl passed
+    current_size: int
+    current_size_in_bytes: int
+
+
 class RedisPipelineIncrementOperation(TypedDict):
     """
     TypeDict for 1 Redis Pipeline Increment Operation
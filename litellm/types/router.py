@@ -12,6 +12,13 @@ from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import Required, TypedDict
 
 from litellm._uuid import uuid
+from litellm.constants import (
+    DEFAULT_HEDGING_MIN_SAMPLES,
+    DEFAULT_HEDGING_PERCENTILE,
+    DEFAULT_RETRY_BUDGET_MAX_BURST_RETRIES,
+    DEFAULT_RETRY_BUDGET_MIN_RETRIES_PER_SECOND,
+    DEFAULT_RETRY_BUDGET_RATIO,
+)
 
 from .completion import CompletionRequest
 from .embedding import EmbeddingRequest
@@ -545,6 +552,32 @@ class RetryPolicy(BaseModel):
     InternalServerErrorRetries: Optional[int] = None
 
 
+class RetryBudgetPolicy(BaseModel):
+    """
+    Caps the retries of each model group to a share of its requests - so retries don't multiply the load on a failing provider
+
+    Token bucket per model group: each request adds `retry_ratio` tokens, each retry / hedged request takes 1.
+    `min_retries_per_second` tokens are added over time, so model groups with low traffic can still retry.
+    """
+
+    retry_ratio: float = DEFAULT_RETRY_BUDGET_RATIO
+    min_retries_per_second: float = DEFAULT_RETRY_BUDGET_MIN_RETRIES_PER_SECOND
+    max_burst_retries: float = DEFAULT_RETRY_BUDGET_MAX_BURST_RETRIES
+
+
+class HedgingPolicy(BaseModel):
+    """
+    Send a 2nd request to another deployment of the model group when the first has no first token after
+    the group's `percentile` time to first token. The slower request is cancelled.
+
+    Only for `acompletion` requests. Hedged requests count against the `RetryBudgetPolicy`, if set.
+    """
+
+    model_groups: Optional[List[str]] = None  # model groups to hedge - None = all
+    percentile: float = DEFAULT_HEDGING_PERCENTILE
+    min_samples: int = DEFAULT_HEDGING_MIN_SAMPLES
+
+
 class AlertingConfig(BaseModel):
     """
     Use this configure alerting for the router. Receive alerts on the following events
@@ -767,6 +800,7 @@ VALID_LITELLM_ENVIRONMENTS = [
 
 class RoutingStrategy(enum.Enum):
     LEAST_BUSY = "least-busy"
+    LEAST_OUTSTANDING_REQUESTS = "least-outstanding-requests"
     LATENCY_BASED = "latency-based-routing"
     COST_BASED = "cost-based-routing"
     USAGE_BASED_ROUTING_V2 = "usage-based-routing-v2"
@@ -1142,46 +1142,10 @@ class Delta(OpenAIObject):
         annotations: Optional[List[ChatCompletionAnnotation]] = None,
         **params,
     ):
-        super(Delta, self).__init__(**params)
-        add_provider_specific_fields(self, params.get("provider_specific_fields", {}))
-        self.content = content
-        self.role = role
-        # Set default values and correct types
-        self.function_call: Optional[Union[FunctionCall, Any]] = None
-        self.tool_calls: Optional[List[Union[ChatCompletionDeltaToolCall, Any]]] = None
-        self.audio: Optional[ChatCompletionAudioResponse] = None
-        self.images: Optional[List[ImageURLListItem]] = None
-        self.annotations: Optional[List[ChatCompletionAnnotation]] = None
-
-        if reasoning_content is not None:
-            self.reasoning_content = reasoning_content
-        else:
-            # ensure default response matches OpenAI spec
-            del self.reasoning_content
-
-        if thinking_blocks is not None:
-            self.thinking_blocks = thinking_blocks
-        else:
-            # ensure default response matches OpenAI spec
-            del self.thinking_blocks
-
-        # Add annotations to the delta, ensure they are only on Delta if they exist (Match OpenAI spec)
-        if annotations is not None:
-            self.annotations = annotations
-        else:
-            del self.annotations
-
-        if images is not None and len(images) > 0:
-            self.images = images
-        else:
-            del self.images
-
         if function_call is not None and isinstance(function_call, dict):
-            self.function_call = FunctionCall(**function_call)
-        else:
-            self.function_call = function_call
+            function_call = FunctionCall(**function_call)
         if tool_calls is not None and isinstance(tool_calls, list):
-            self.tool_calls = []
+            _tool_calls: List[ChatCompletionDeltaToolCall] = []
             current_index = 0
             for tool_call in tool_calls:
                 if isinstance(tool_call, dict):
@@ -1190,13 +1154,39 @@ class Delta(OpenAIObject):
                         current_index += 1
                     if tool_call.get("type", None) is None:
                         tool_call["type"] = "function"
-                    self.tool_calls.append(ChatCompletionDeltaToolCall(**tool_call))
+                    _tool_calls.append(ChatCompletionDeltaToolCall(**tool_call))
                 elif isinstance(tool_call, ChatCompletionDeltaToolCall):
-                    self.tool_calls.append(tool_call)
+                    _tool_calls.append(tool_call)
+            tool_calls = _tool_calls
+
+        # content, role, etc. are extra fields - passed to __init__ in 1 go, setting them 1 by 1 is slow
+        # (built for every streaming chunk)
+        extra_fields: Dict[str, Any] = {
+            "content": content,
+            "role": role,
+            "function_call": function_call,
+            "tool_calls": tool_calls,
+            "audio": audio,
+        }
+        if images is not None and len(images) > 0:
+            extra_fields["images"] = images
+        # Add annotations to the delta, ensure they are only on Delta if they exist (Match OpenAI spec)
+        if annotations is not None:
+            extra_fields["annotations"] = annotations
+        super(Delta, self).__init__(**params, **extra_fields)
+        add_provider_specific_fields(self, params.get("provider_specific_fields", {}))
+
+        if reasoning_content is not None:
+            self.reasoning_content = reasoning_content
         else:
-            self.tool_calls = tool_calls
+            # ensure default response matches OpenAI spec
+            del self.reasoning_content
 
-        self.audio = audio
+        if thinking_blocks is not None:
+            self.thinking_blocks = thinking_blocks
+        else:
+            # ensure default response matches OpenAI spec
+            del self.thinking_blocks
 
     def __contains__(self, key):
         # Define custom behavior for the 'in' operator
@@ -1537,26 +1527,26 @@ class StreamingChoices(OpenAIObject):
         # Fix Perplexity return both delta and message cause OpenWebUI repect text
         # https://github.com/BerriAI/litellm/issues/8455
         params.pop("message", None)
-        super(StreamingChoices, self).__init__(**params)
-        if finish_reason:
-            self.finish_reason = map_finish_reason(finish_reason)
-        else:
-            self.finish_reason = None
-        self.index = index
+        # extra fields - passed to __init__ in 1 go, setting them 1 by 1 is slow (built for every streaming chunk)
+        extra_fields: Dict[str, Any] = {
+            "finish_reason": map_finish_reason(finish_reason) if finish_reason else None,
+            "index": index,
+        }
         if delta is not None:
             if isinstance(delta, Delta):
-                self.delta = delta
+                extra_fields["delta"] = delta
             elif isinstance(delta, dict):
-                self.delta = Delta(**delta)
+                extra_fields["delta"] = Delta(**delta)
         else:
-            self.delta = Delta()
+            extra_fields["delta"] = Delta()
         if enhancements is not None:
-            self.enhancements = enhancements
+            extra_fields["enhancements"] = enhancements
 
         if logprobs is not None and isinstance(logprobs, dict):
-            self.logprobs = ChoiceLogprobs(**logprobs)
+            extra_fields["logprobs"] = ChoiceLogprobs(**logprobs)
         else:
-            self.logprobs = logprobs  # type: ignore
+            extra_fields["logprobs"] = logprobs
+        super(StreamingChoices, self).__init__(**params, **extra_fields)
 
     def __contains__(self, key):
         # Define custom behavior for the 'in' operator
@@ -2857,6 +2847,7 @@ all_litellm_params = (
         "shared_session",
         "search_tool_name",
         "order",
+        "_input_tokens_memo",
     ]
     + list(StandardCallbackDynamicParams.__annotations__.keys())
     + list(CustomPricingLiteLLMParams.model_fields.keys())
@@ -1852,6 +1852,7 @@ def client(original_function):  # noqa: PLR0915
 
             return result
         except Exception as e:
+            _llm_caching_handler.release_in_flight_cache_miss()
             traceback_exception = traceback.format_exc()
             end_time = datetime.datetime.now()
             if logging_obj:
@@ -1915,6 +1916,9 @@ def client(original_function):  # noqa: PLR0915
             timeout = _get_wrapper_timeout(kwargs=kwargs, exception=e)
             setattr(e, "timeout", timeout)
             raise e
+        finally:
+            # no-op if already released - covers cancellation (BaseException), so waiters don't block until timeout
+            _llm_caching_handler.release_in_flight_cache_miss()
 
     get_coroutine_checker = getattr(sys.modules[__name__], 'get_coroutine_checker')
     is_coroutine = get_coroutine_checker().is_async_callable(original_function)
@@ -1993,15 +1997,24 @@ def _select_tokenizer(
     model: str, custom_tokenizer: Optional[CustomHuggingfaceTokenizer] = None
 ):
     if custom_tokenizer is not None:
-        _tokenizer = create_pretrained_tokenizer(
+        return _select_custom_tokenizer_helper(
             identifier=custom_tokenizer["identifier"],
             revision=custom_tokenizer["revision"],
             auth_token=custom_tokenizer["auth_token"],
         )
-        return _tokenizer
     return _select_tokenizer_helper(model=model)
 
 
+@lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)
+def _select_custom_tokenizer_helper(
+    identifier: str, revision: str, auth_token: Optional[str]
+) -> SelectTokenizerResponse:
+    """Load a deployment's custom tokenizer once - not from the HuggingFace Hub on every count"""
+    return create_pretrained_tokenizer(
+        identifier=identifier, revision=revision, auth_token=auth_token
+    )
+
+
 @lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)
 def _select_tokenizer_helper(model: str) -> SelectTokenizerResponse:
     if litellm.disable_hf_tokenizer_download is True:
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark Cache.get_cache_key: legacy string concatenation vs streaming canonical hasher.
+
+USAGE:
+   python scripts/benchmark_cache_key.py
+   python scripts/benchmark_cache_key.py --prompt-tokens 100000 --messages 50 --iterations 50
+
+Reports mean time per key and peak memory allocated while building one key (tracemalloc).
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.caching.caching import Cache  # noqa: E402
+
+
+def build_kwargs(prompt_tokens: int, num_messages: int) -> dict:
+    # ~4 characters per token
+    chars_per_message = prompt_tokens * 4 // num_messages
+    messages = [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": ("lorem ipsum " * (chars_per_message // 12 + 1))[
+                :chars_per_message
+            ],
+        }
+        for i in range(num_messages)
+    ]
+    return {
+        "model": "gpt-4o",
+        "messages": messages,
+        "temperature": 0.2,
+        "max_tokens": 1024,
+        "tools": [
+            {
+                "type": "function",
+                "function": {
+                    "name": f"tool_{i}",
+                    "parameters": {"type": "object", "properties": {}},
+                },
+            }
+            for i in range(10)
+        ],
+    }
+
+
+def run(cache: Cache, kwargs: dict, iterations: int):
+    cache.get_cache_key(**kwargs)  # warm up
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        cache.get_cache_key(**kwargs)
+    mean_ms = (time.perf_counter() - start) / iterations * 1000
+
+    tracemalloc.start()
+    cache.get_cache_key(**kwargs)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return mean_ms, peak_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prompt-tokens", type=int, default=100_000)
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    kwargs = build_kwargs(args.prompt_tokens, args.messages)
+    variants = {
+        "legacy (sha256)": Cache(),
+        "canonical (sha256)": Cache(canonical_cache_key=True),
+        "canonical (blake2b)": Cache(
+            canonical_cache_key=True, cache_key_hash_algorithm="blake2b"
+        ),
+    }
+    try:
+        import xxhash  # noqa: F401
+
+        variants["canonical (xxhash)"] = Cache(
+            canonical_cache_key=True, cache_key_hash_algorithm="xxhash"
+        )
+    except ImportError:
+        print("xxhash not installed - skipping the xxhash variant")
+
+    print(
+        f"prompt_tokens={args.prompt_tokens} messages={args.messages} iterations={args.iterations}\n"
+    )
+    print(f"{'variant':<24}{'mean ms/key':>14}{'peak alloc KB':>16}")
+    for name, cache in variants.items():
+        mean_ms, peak_bytes = run(cache, kwargs, args.iterations)
+        print(f"{name:<24}{mean_ms:>14.3f}{peak_bytes / 1024:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark finding the dimensions of a base64 image - decoding all of it vs only its header.
+
+USAGE:
+   python scripts/benchmark_image_dimensions.py
+   python scripts/benchmark_image_dimensions.py --megabytes 8 --runs 5
+
+Builds a `--megabytes` MB png data url, and reports the best of `--runs` runs and the peak memory allocated
+(tracemalloc) for a full `base64.b64decode` + header parse, and for `get_image_dimensions`.
+"""
+
+import argparse
+import base64
+import os
+import struct
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.litellm_core_utils.token_counter import (  # noqa: E402
+    _parse_image_dimensions,
+    get_image_dimensions,
+)
+
+
+def build_data_url(num_bytes: int) -> str:
+    header = (
+        b"\x89PNG\r\n\x1a\n"
+        + b"\x00\x00\x00\rIHDR"
+        + struct.pack(">LL", 4096, 3072)
+        + b"\x08\x06\x00\x00\x00"
+    )
+    image = header + os.urandom(num_bytes - len(header))
+    return "data:image/png;base64," + base64.b64encode(image).decode("utf-8")
+
+
+def full_decode(data_url: str):
+    _header, encoded = data_url.split(",", 1)
+    return _parse_image_dimensions(base64.b64decode(encoded))
+
+
+def header_decode(data_url: str):
+    return get_image_dimensions(data=data_url)
+
+
+def measure(fn, data_url: str, runs: int):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(data_url)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn(data_url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--megabytes", type=float, default=4)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    data_url = build_data_url(int(args.megabytes * 1024 * 1024))
+    assert full_decode(data_url) == header_decode(data_url) == (4096, 3072)
+    print(f"{args.megabytes} MB png, best of {args.runs} runs")
+    for name, fn in (("full decode", full_decode), ("header only", header_decode)):
+        ms, peak_mb = measure(fn, data_url, args.runs)
+        print(f"{name}: {ms:.3f} ms, peak {peak_mb:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
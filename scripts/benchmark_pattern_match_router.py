@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark PatternMatchRouter.route: linear regex scan + deepcopy vs compiled index + memo.
+
+USAGE:
+   python scripts/benchmark_pattern_match_router.py
+   python scripts/benchmark_pattern_match_router.py --patterns 1000 --requests 5000
+
+Registers `--patterns` wildcard routes (provider/*, provider/family-*, team patterns, a few
+prefix-less patterns), then routes a mix of matching and non-matching model names.
+Reports mean time per route() call.
+"""
+
+import argparse
+import copy
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.router_utils.pattern_match_deployments import (  # noqa: E402
+    PatternMatchRouter,
+    PatternUtils,
+)
+
+
+def build_router(num_patterns: int) -> PatternMatchRouter:
+    router = PatternMatchRouter()
+    for i in range(num_patterns):
+        if i % 50 == 0:
+            pattern = f"*family-{i}*"
+        elif i % 3 == 0:
+            pattern = f"team-{i}/*"
+        else:
+            pattern = f"provider-{i % 100}/family-{i}-*"
+        router.add_pattern(
+            pattern,
+            {
+                "model_name": pattern,
+                "litellm_params": {"model": f"openai/{pattern}", "api_key": "fake"},
+                "model_info": {"id": str(i), "metadata": {"tags": ["a", "b"]}},
+            },
+        )
+    return router
+
+
+def legacy_route(router: PatternMatchRouter, request: str):
+    """PatternMatchRouter.route before the compiled index"""
+    for pattern, deployments in PatternUtils.sorted_patterns(router.patterns):
+        pattern_match = re.match(pattern, request)
+        if pattern_match:
+            new_deployments = []
+            for deployment in deployments:
+                new_deployment = copy.deepcopy(deployment)
+                new_deployment["litellm_params"][
+                    "model"
+                ] = PatternMatchRouter.set_deployment_model_name(
+                    pattern_match, deployment["litellm_params"]["model"]
+                )
+                new_deployments.append(new_deployment)
+            return new_deployments
+    return None
+
+
+def build_requests(num_patterns: int, num_requests: int, num_distinct: int) -> list:
+    rng = random.Random(0)
+    distinct = []
+    for _ in range(num_distinct):
+        i = rng.randrange(num_patterns)
+        kind = rng.random()
+        if kind < 0.6:
+            distinct.append(f"provider-{i % 100}/family-{i}-v{rng.randrange(10)}")
+        elif kind < 0.8:
+            distinct.append(f"team-{i - i % 3}/model-{rng.randrange(10)}")
+        else:
+            distinct.append(f"unknown-{i}/model")
+    return [rng.choice(distinct) for _ in range(num_requests)]
+
+
+def time_route(route, requests: list) -> float:
+    start = time.perf_counter()
+    for request in requests:
+        route(request)
+    return (time.perf_counter() - start) / len(requests) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--patterns", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--distinct-models", type=int, default=200)
+    args = parser.parse_args()
+
+    router = build_router(args.patterns)
+    requests = build_requests(args.patterns, args.requests, args.distinct_models)
+
+    legacy_us = time_route(lambda r: legacy_route(router, r), requests)
+
+    cold_router = build_router(args.patterns)
+    cold_router._get_index()
+
+    def route_without_memo(request):
+        cold_router._route_cache.clear()
+        return cold_router.route(request)
+
+    index_us = time_route(route_without_memo, requests)
+    router.route(requests[0])  # build the index outside the timed loop
+    memo_us = time_route(router.route, requests)
+
+    for request in set(requests):  # sanity check - same deployments as the linear scan
+        expected = legacy_route(router, request)
+        assert router.route(request) == expected, request
+
+    print(f"{args.patterns} patterns, {args.requests} requests")
+    print(f"{'variant':<32}{'us / route':>12}{'speedup':>10}")
+    for name, value in [
+        ("linear scan + deepcopy", legacy_us),
+        ("compiled index", index_us),
+        ("compiled index + memo", memo_us),
+    ]:
+        print(f"{name:<32}{value:>12.2f}{legacy_us / value:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark RedisCacheCodec: bytes on the wire and decode time vs the legacy json.dumps format.
+
+USAGE:
+   python scripts/benchmark_redis_codec.py
+   python scripts/benchmark_redis_codec.py --completion-tokens 4000 --embedding-dims 3072 --iterations 500
+
+Variants whose optional dependency (msgpack / zstandard / lz4) isn't installed are skipped.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.caching.redis_codec import RedisCacheCodec  # noqa: E402
+
+
+def build_values(completion_tokens: int, embedding_dims: int) -> dict:
+    # shaped like the dicts Cache stores: {"timestamp", "response"}
+    content = ("The quick brown fox jumps over the lazy dog. " * completion_tokens)[
+        : completion_tokens * 4
+    ]
+    completion = {
+        "id": "chatcmpl-123",
+        "object": "chat.completion",
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+        "usage": {"prompt_tokens": 100, "completion_tokens": completion_tokens},
+    }
+    embedding = [((i * 7919) % 1000) / 1000 - 0.5 for i in range(embedding_dims)]
+    return {
+        "completion": {"timestamp": time.time(), "response": json.dumps(completion)},
+        "embedding": {
+            "timestamp": time.time(),
+            "response": {"embedding": embedding, "index": 0, "object": "embedding"},
+        },
+    }
+
+
+def legacy_decode(data: bytes):
+    return json.loads(data.decode("utf-8"))
+
+
+def time_decode(decode, data: bytes, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode(data)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def get_codecs() -> dict:
+    candidates = {
+        "orjson": {"serializer": "orjson"},
+        "orjson+zlib": {"serializer": "orjson", "compression": "zlib"},
+        "orjson+zstd": {"serializer": "orjson", "compression": "zstd"},
+        "orjson+lz4": {"serializer": "orjson", "compression": "lz4"},
+        "msgpack": {"serializer": "msgpack"},
+        "msgpack+zstd": {"serializer": "msgpack", "compression": "zstd"},
+    }
+    codecs = {}
+    for name, params in candidates.items():
+        try:
+            codec = RedisCacheCodec(**params)  # type: ignore[arg-type]
+            codec.encode({"probe": "x" * 4096})
+            codecs[name] = codec
+        except ImportError as e:
+            print(f"skipping {name}: {e}")
+    return codecs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--completion-tokens", type=int, default=2000)
+    parser.add_argument("--embedding-dims", type=int, default=1536)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    values = build_values(args.completion_tokens, args.embedding_dims)
+    codecs = get_codecs()
+
+    for value_name, value in values.items():
+        print(f"\n{value_name}")
+        print(f"{'variant':<16}{'bytes':>10}{'ratio':>8}{'decode us':>12}")
+        legacy = json.dumps(value).encode("utf-8")
+        legacy_decode_us = time_decode(legacy_decode, legacy, args.iterations)
+        print(f"{'legacy json':<16}{len(legacy):>10}{1.0:>8.2f}{legacy_decode_us:>12.1f}")
+        for name, codec in codecs.items():
+            encoded = codec.encode(value)
+            decode_us = time_decode(RedisCacheCodec.decode, encoded, args.iterations)
+            print(
+                f"{name:<16}{len(encoded):>10}{len(encoded) / len(legacy):>8.2f}{decode_us:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
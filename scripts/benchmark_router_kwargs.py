@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-request kwargs assembly of the router: Router._update_kwargs_before_fallbacks +
+_update_kwargs_with_deployment + the merge of the deployment's litellm_params into the call kwargs.
+
+USAGE:
+   python scripts/benchmark_router_kwargs.py
+   python scripts/benchmark_router_kwargs.py --deployments 5000 --requests 20000
+
+Builds a router with `--deployments` deployments and default_litellm_params, then assembles the
+kwargs of `--requests` requests to random deployments - with the copying version of these helpers
+(`CopyingRouter`) and with the current one. Reports time and peak memory allocated (tracemalloc) per request.
+
+Also times a layered `collections.ChainMap` view of the same layers - it is unpacked into the
+`litellm.<call>(**kwargs)` call right away, so resolving it lazily doesn't save the merge.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import ChainMap
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm import Router  # noqa: E402
+from litellm._uuid import uuid  # noqa: E402
+
+
+class CopyingRouter(Router):
+    """The kwargs helpers before this change - copying the defaults on every request"""
+
+    def _update_kwargs_before_fallbacks(
+        self, model: str, kwargs: dict, metadata_variable_name="metadata"
+    ) -> None:
+        kwargs["num_retries"] = kwargs.get("num_retries", self.num_retries)
+        kwargs.setdefault("litellm_trace_id", str(uuid.uuid4()))
+        model_group_alias = None
+        if self._get_model_from_alias(model=model):
+            model_group_alias = model
+        kwargs.setdefault(metadata_variable_name, {}).update(
+            {"model_group": model, "model_group_alias": model_group_alias}
+        )
+
+    def _update_kwargs_with_default_litellm_params(
+        self, kwargs: dict, metadata_variable_name="metadata"
+    ) -> None:
+        defaults = self.default_litellm_params.copy()
+        metadata_defaults = defaults.pop("metadata", {}) or {}
+        for key, value in defaults.items():
+            if value is None:
+                continue
+            kwargs.setdefault(key, value)
+        kwargs.setdefault(metadata_variable_name, {}).update(metadata_defaults)
+
+
+def build_router(num_deployments: int, router_cls=Router) -> Router:
+    model_list = []
+    for i in range(num_deployments):
+        model_list.append(
+            {
+                "model_name": f"model-group-{i % 100}",
+                "litellm_params": {
+                    "model": f"openai/gpt-4o-{i}",
+                    "api_key": "fake",
+                    "api_base": f"https://api-{i}.example.com/v1",
+                    "rpm": 1000,
+                    "tpm": 1000000,
+                    "timeout": 30,
+                    "stream_timeout": 10,
+                    "max_retries": 0,
+                },
+                "model_info": {
+                    "id": str(i),
+                    "base_model": "gpt-4o",
+                    "input_cost_per_token": 0.0000025,
+                    "output_cost_per_token": 0.00001,
+                },
+            }
+        )
+    return router_cls(
+        model_list=model_list,
+        default_litellm_params={
+            "drop_params": True,
+            "metadata": {"environment": "benchmark"},
+        },
+    )
+
+
+def copying_update_kwargs(router: Router, model: str, deployment: dict, kwargs: dict):
+    router._update_kwargs_before_fallbacks(model=model, kwargs=kwargs)
+    router._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
+    data = deployment["litellm_params"].copy()
+    return {**data, "messages": kwargs.pop("messages"), "caching": False, **kwargs}
+
+
+def current_update_kwargs(router: Router, model: str, deployment: dict, kwargs: dict):
+    router._update_kwargs_before_fallbacks(model=model, kwargs=kwargs)
+    router._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
+    data = deployment["litellm_params"]
+    return {**data, "messages": kwargs.pop("messages"), "caching": False, **kwargs}
+
+
+def chainmap_update_kwargs(router: Router, model: str, deployment: dict, kwargs: dict):
+    router._update_kwargs_before_fallbacks(model=model, kwargs=kwargs)
+    router._update_kwargs_with_deployment(deployment=deployment, kwargs=kwargs)
+    view = ChainMap(
+        {},
+        kwargs,
+        {"messages": kwargs.pop("messages"), "caching": False},
+        deployment["litellm_params"],
+    )
+    return dict(**view)
+
+
+def build_requests(router: Router, num_requests: int) -> list:
+    rng = random.Random(0)
+    deployments = router.get_model_list() or []
+    return [rng.choice(deployments) for _ in range(num_requests)]
+
+
+def run(update_kwargs, router: Router, requests: list):
+    for deployment in requests:
+        update_kwargs(
+            router,
+            deployment["model_name"],
+            deployment,
+            {
+                "messages": [{"role": "user", "content": "hi"}],
+                "metadata": {"user_api_key": "sk-..."},
+                "temperature": 0.2,
+            },
+        )
+
+
+def measure(update_kwargs, router: Router, requests: list, num_measured: int = 1000):
+    start = time.perf_counter()
+    run(update_kwargs, router, requests)
+    us_per_request = (time.perf_counter() - start) / len(requests) * 1_000_000
+
+    # memory allocated while assembling the kwargs - the request dicts are built before it
+    allocated_bytes = 0
+    tracemalloc.start()
+    for deployment in requests[:num_measured]:
+        kwargs = {
+            "messages": [{"role": "user", "content": "hi"}],
+            "metadata": {"user_api_key": "sk-..."},
+            "temperature": 0.2,
+        }
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        update_kwargs(router, deployment["model_name"], deployment, kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated_bytes += peak - before
+    tracemalloc.stop()
+    return us_per_request, allocated_bytes / min(len(requests), num_measured)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--deployments", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    router = build_router(args.deployments)
+    copying_router = build_router(args.deployments, router_cls=CopyingRouter)
+    requests = build_requests(router, args.requests)
+
+    print(f"{args.deployments} deployments, {args.requests} requests")
+    print(f"{'variant':<24}{'us / request':>14}{'peak bytes / request':>22}")
+    for name, variant_router, update_kwargs in [
+        ("copying (before)", copying_router, copying_update_kwargs),
+        ("in place (current)", router, current_update_kwargs),
+        ("ChainMap view", router, chainmap_update_kwargs),
+    ]:
+        us, allocated_bytes = measure(update_kwargs, variant_router, requests)
+        print(f"{name:<24}{us:>14.2f}{allocated_bytes:>22.0f}")
+
+
+if __name__ == "__main__":
+    main()
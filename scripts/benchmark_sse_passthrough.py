@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark the proxy's streaming paths for an OpenAI-compatible upstream: parsing every chunk into a
+ModelResponseStream and serializing it again, vs forwarding the raw SSE bytes (`litellm.enable_sse_passthrough`).
+
+USAGE:
+   python scripts/benchmark_sse_passthrough.py
+   python scripts/benchmark_sse_passthrough.py --chunks 50000 --runs 5
+
+Streams `--chunks` SSE events from an in-memory httpx response through an `openai.AsyncStream` and a
+CustomStreamWrapper with a real Logging object. Reports the best of `--runs` runs in chunks / second.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from openai import AsyncOpenAI, AsyncStream  # noqa: E402
+from openai.types.chat import ChatCompletionChunk  # noqa: E402
+
+from litellm.litellm_core_utils.litellm_logging import Logging  # noqa: E402
+from litellm.litellm_core_utils.streaming_handler import (  # noqa: E402
+    CustomStreamWrapper,
+)
+
+
+def build_sse_body(num_chunks: int) -> bytes:
+    events = []
+    for i in range(num_chunks + 1):
+        events.append(
+            {
+                "id": "chatcmpl-benchmark",
+                "object": "chat.completion.chunk",
+                "created": 1,
+                "model": "gpt-4o",
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"content": f"tok{i} "} if i < num_chunks else {},
+                        "finish_reason": None if i < num_chunks else "stop",
+                    }
+                ],
+            }
+        )
+    body = "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+    return (body + "data: [DONE]\n\n").encode()
+
+
+def build_stream(sse_body: bytes) -> CustomStreamWrapper:
+    logging_obj = Logging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        stream=True,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="benchmark",
+        function_id="benchmark",
+    )
+    logging_obj.update_environment_variables(
+        model="gpt-4o",
+        user=None,
+        optional_params={},
+        litellm_params={"litellm_call_id": "benchmark"},
+        custom_llm_provider="openai",
+    )
+    async def network_chunks():
+        for i in range(0, len(sse_body), 4096):
+            yield sse_body[i : i + 4096]
+
+    completion_stream = AsyncStream(
+        cast_to=ChatCompletionChunk,
+        response=httpx.Response(200, content=network_chunks()),
+        client=AsyncOpenAI(api_key="fake"),
+    )
+    return CustomStreamWrapper(
+        completion_stream=completion_stream,
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+
+
+async def parse_and_serialize(stream: CustomStreamWrapper) -> None:
+    """What the proxy's async_data_generator does per chunk"""
+    async for chunk in stream:
+        chunk.model_dump_json(exclude_none=True, exclude_unset=True)
+
+
+async def passthrough(stream: CustomStreamWrapper) -> None:
+    async for _ in stream.aiter_raw_sse():
+        pass
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    sse_body = build_sse_body(args.chunks)
+    print(f"{args.chunks} chunks, best of {args.runs} runs")
+    for name, consume in [
+        ("parse + serialize", parse_and_serialize),
+        ("raw SSE passthrough", passthrough),
+    ]:
+        results = []
+        for _ in range(args.runs):
+            stream = build_stream(sse_body)
+            start = time.perf_counter()
+            await consume(stream)
+            results.append(args.chunks / (time.perf_counter() - start))
+        print(f"{name:<24}{max(results):>10.0f} chunks / second")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
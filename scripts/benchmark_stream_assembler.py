@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory held by CustomStreamWrapper while a long stream is consumed.
+
+USAGE:
+   python scripts/benchmark_stream_assembler.py
+   python scripts/benchmark_stream_assembler.py --chunks 50000 --runs 3
+
+Streams `--chunks` ChatCompletionChunks through a CustomStreamWrapper with a real Logging object, and
+reports the peak memory allocated while streaming (tracemalloc) and the time to build the complete
+response at the end of the stream.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from openai.types.chat import ChatCompletionChunk  # noqa: E402
+
+from litellm.litellm_core_utils.litellm_logging import Logging  # noqa: E402
+from litellm.litellm_core_utils.streaming_handler import (  # noqa: E402
+    CustomStreamWrapper,
+)
+
+
+async def stream_chunks(num_chunks: int):
+    # chunks are created as they're streamed - only what the wrapper keeps stays allocated
+    for i in range(num_chunks):
+        yield ChatCompletionChunk(
+            id="chatcmpl-benchmark",
+            created=1,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+            choices=[
+                {"index": 0, "delta": {"content": f"tok{i} "}, "finish_reason": None}
+            ],
+        )
+    yield ChatCompletionChunk(
+        id="chatcmpl-benchmark",
+        created=1,
+        model="gpt-4o",
+        object="chat.completion.chunk",
+        choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}],
+    )
+
+
+def build_logging_obj() -> Logging:
+    logging_obj = Logging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        stream=True,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="benchmark",
+        function_id="benchmark",
+    )
+    logging_obj.update_environment_variables(
+        model="gpt-4o",
+        user=None,
+        optional_params={},
+        litellm_params={"litellm_call_id": "benchmark"},
+        custom_llm_provider="openai",
+    )
+    return logging_obj
+
+
+async def run(num_chunks: int):
+    """Returns (peak MB while streaming, seconds to build the complete response)"""
+    stream = CustomStreamWrapper(
+        completion_stream=stream_chunks(num_chunks),
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=build_logging_obj(),
+    )
+    tracemalloc.start()
+    async for _ in stream:
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    if hasattr(stream, "stream_assembler"):
+        stream.stream_assembler.build_response()
+    else:
+        from litellm.main import stream_chunk_builder
+
+        stream_chunk_builder(chunks=stream.chunks, messages=stream.messages)
+    return peak / 1024 / 1024, time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=20000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    results = [await run(args.chunks) for _ in range(args.runs)]
+    print(f"{args.chunks} chunks, best of {args.runs} runs")
+    print(f"peak memory while streaming: {min(r[0] for r in results):.1f} MB")
+    print(f"complete response build: {min(r[1] for r in results) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark counting the tokens of many prompts - one token_counter call per prompt vs token_counter_many.
+
+USAGE:
+   python scripts/benchmark_token_counter.py
+   python scripts/benchmark_token_counter.py --prompts 500 --words 2000 --runs 3
+
+Builds `--prompts` distinct conversations (a system message and a `--words` word user message) and counts
+them with `--model`. The per-message count cache is cleared before every run, so every string is encoded.
+Reports the best of `--runs` runs in prompts / second.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.litellm_core_utils.token_counter import (  # noqa: E402
+    message_token_count_cache,
+    token_counter,
+    token_counter_many,
+)
+
+WORDS = "the quick brown fox jumps over lazy dog while seven wizards box jovial quartz".split()
+
+
+def build_prompts(num_prompts: int, num_words: int) -> list:
+    rng = random.Random(0)
+    return [
+        [
+            {"role": "system", "content": f"You are assistant number {i}."},
+            {
+                "role": "user",
+                "content": " ".join(rng.choice(WORDS) for _ in range(num_words)),
+            },
+        ]
+        for i in range(num_prompts)
+    ]
+
+
+def run_single(model: str, prompts: list) -> float:
+    message_token_count_cache.clear()
+    start = time.perf_counter()
+    for messages in prompts:
+        token_counter(model=model, messages=messages)
+    return len(prompts) / (time.perf_counter() - start)
+
+
+def run_many(model: str, prompts: list) -> float:
+    message_token_count_cache.clear()
+    start = time.perf_counter()
+    token_counter_many(model=model, messages_list=prompts)
+    return len(prompts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default="gpt-4o")
+    parser.add_argument("--prompts", type=int, default=500)
+    parser.add_argument("--words", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    prompts = build_prompts(args.prompts, args.words)
+    assert token_counter_many(model=args.model, messages_list=prompts[:5]) == [
+        token_counter(model=args.model, messages=messages) for messages in prompts[:5]
+    ]
+    single = max(run_single(args.model, prompts) for _ in range(args.runs))
+    many = max(run_many(args.model, prompts) for _ in range(args.runs))
+    print(f"{args.prompts} prompts of {args.words} words, best of {args.runs} runs")
+    print(f"token_counter per prompt: {single:.0f} prompts / second")
+    print(f"token_counter_many:       {many:.0f} prompts / second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.cache_key_hasher import CacheKeyHasher, hash_cache_key_string
+from litellm.caching.caching import Cache
+
+
+def _chat_kwargs(**overrides):
+    kwargs = {
+        "model": "gpt-4o",
+        "messages": [
+            {"role": "system", "content": "you are a helpful assistant"},
+            {"role": "user", "content": "hello " * 1000},
+        ],
+        "temperature": 0.2,
+        "litellm_call_id": "ffe75e7e-8a07-431f-9a74-71a5b9f35f0b",
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+def test_legacy_cache_key_unchanged():
+    """
+    The default cache key must stay byte-for-byte compatible with existing caches
+    """
+    cache = Cache()
+    cache_key = cache.get_cache_key(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "hi"}],
+        max_tokens=40,
+    )
+    expected = hashlib.sha256(
+        "model: gpt-3.5-turbomessages: [{'role': 'user', 'content': 'hi'}]max_tokens: 40".encode()
+    ).hexdigest()
+    assert cache_key == expected
+
+
+def test_canonical_cache_key_is_order_independent():
+    cache = Cache(canonical_cache_key=True)
+
+    key_1 = cache.get_cache_key(**_chat_kwargs())
+    key_2 = cache.get_cache_key(
+        temperature=0.2,
+        messages=[
+            {"content": "you are a helpful assistant", "role": "system"},
+            {"content": "hello " * 1000, "role": "user"},
+        ],
+        model="gpt-4o",
+    )
+    assert key_1 == key_2
+
+    # litellm internal params don't change the key, llm api params do
+    assert cache.get_cache_key(**_chat_kwargs(litellm_call_id="other")) == key_1
+    assert cache.get_cache_key(**_chat_kwargs(temperature=0.3)) != key_1
+
+
+def test_canonical_cache_key_distinguishes_item_boundaries():
+    hasher_1 = CacheKeyHasher()
+    hasher_1.update_param("input", ["ab", "c"])
+    hasher_2 = CacheKeyHasher()
+    hasher_2.update_param("input", ["a", "bc"])
+    assert hasher_1.hexdigest() != hasher_2.hexdigest()
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "blake2b"])
+def test_cache_key_hash_algorithm(algorithm):
+    cache = Cache(cache_key_hash_algorithm=algorithm)
+    cache_key = cache.get_cache_key(**_chat_kwargs())
+    assert len(cache_key) == 64
+
+    canonical_cache = Cache(canonical_cache_key=True, cache_key_hash_algorithm=algorithm)
+    assert canonical_cache.get_cache_key(**_chat_kwargs()) != cache_key
+
+
+def test_invalid_cache_key_hash_algorithm():
+    with pytest.raises(ValueError):
+        hash_cache_key_string("key", algorithm="md5")  # type: ignore
+
+
+def test_canonical_cache_key_with_pydantic_values():
+    from litellm.types.utils import Message
+
+    cache = Cache(canonical_cache_key=True)
+    key_1 = cache.get_cache_key(
+        model="gpt-4o", messages=[Message(role="user", content="hi")]
+    )
+    key_2 = cache.get_cache_key(
+        model="gpt-4o", messages=[Message(role="user", content="hi")]
+    )
+    assert key_1 == key_2
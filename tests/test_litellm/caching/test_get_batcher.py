@@ -0,0 +1,95 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.get_batcher import GetBatcher
+from litellm.caching.redis_cache import RedisCache
+
+
+@pytest.mark.asyncio
+async def test_gets_in_same_tick_are_batched():
+    batch_get_fn = AsyncMock(side_effect=lambda keys: {k: f"value-{k}" for k in keys})
+    batcher = GetBatcher(batch_get_fn=batch_get_fn)
+
+    results = await asyncio.gather(
+        batcher.get("a"), batcher.get("b"), batcher.get("a"), batcher.get("c")
+    )
+
+    assert results == ["value-a", "value-b", "value-a", "value-c"]
+    batch_get_fn.assert_awaited_once()
+    assert batch_get_fn.call_args.args[0] == ["a", "b", "c"]
+    assert batcher.num_gets == 4
+    assert batcher.num_batches == 1
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_and_missing_keys_are_none():
+    batch_get_fn = AsyncMock(return_value={"a": 1})
+    batcher = GetBatcher(batch_get_fn=batch_get_fn, max_batch_size=2)
+
+    results = await asyncio.gather(*[batcher.get(k) for k in ["a", "b", "c"]])
+
+    assert results == [1, None, None]
+    assert batch_get_fn.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_running_batches_are_referenced_until_done():
+    release = asyncio.Event()
+
+    async def batch_get_fn(keys):
+        await release.wait()
+        return {k: k for k in keys}
+
+    batcher = GetBatcher(batch_get_fn=batch_get_fn)
+    get = asyncio.ensure_future(batcher.get("a"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert len(batcher._running_tasks) == 1
+
+    release.set()
+    assert await get == "a"
+    await asyncio.sleep(0)
+    assert batcher._running_tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_are_raised_to_every_caller():
+    batcher = GetBatcher(batch_get_fn=AsyncMock(side_effect=ValueError("down")))
+
+    results = await asyncio.gather(
+        batcher.get("a"), batcher.get("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_batches_redis_gets_and_serves_local_hits_first():
+    redis_cache = MagicMock(spec=RedisCache)
+    redis_cache.async_batch_get_cache = AsyncMock(
+        side_effect=lambda key_list: {k: f"redis-{k}" for k in key_list}
+    )
+    redis_cache.async_get_cache = AsyncMock()
+    dual_cache = DualCache(redis_cache=redis_cache, batch_redis_gets=True)
+    await dual_cache.in_memory_cache.async_set_cache("local", "local-value")
+
+    results = await asyncio.gather(
+        dual_cache.async_get_cache("local"),
+        dual_cache.async_get_cache("k1"),
+        dual_cache.async_get_cache("k2"),
+    )
+
+    assert results == ["local-value", "redis-k1", "redis-k2"]
+    redis_cache.async_batch_get_cache.assert_awaited_once_with(key_list=["k1", "k2"])
+    redis_cache.async_get_cache.assert_not_awaited()
+    # redis results are written to the in-memory cache
+    assert dual_cache.in_memory_cache.get_cache("k1") == "redis-k1"
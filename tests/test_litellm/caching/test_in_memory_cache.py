@@ -199,3 +199,110 @@ def test_in_memory_cache_heap_size_staus_bounded():
 
     # Expiration heap should only have 1 entry
     assert len(in_memory_cache.expiration_heap) == 1
+
+
+def test_in_memory_cache_lru_eviction_policy():
+    """
+    With the lru policy, the least recently used key is evicted - not the one closest to expiry
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=2, eviction_policy="lru")
+
+    in_memory_cache.set_cache(key="a", value="value_a", ttl=300)
+    in_memory_cache.set_cache(key="b", value="value_b", ttl=100)
+
+    # touch b so a becomes the least recently used key
+    assert in_memory_cache.get_cache(key="b") == "value_b"
+    in_memory_cache.get_cache(key="a")
+    in_memory_cache.get_cache(key="b")
+
+    in_memory_cache.set_cache(key="c", value="value_c")
+
+    assert "a" not in in_memory_cache.cache_dict
+    assert "b" in in_memory_cache.cache_dict
+    assert "c" in in_memory_cache.cache_dict
+    # lru policy does not use the expiration heap
+    assert len(in_memory_cache.expiration_heap) == 0
+
+
+def test_in_memory_cache_tinylfu_keeps_hot_keys():
+    """
+    A scan of one-off keys should not flush frequently used keys out of a tinylfu cache
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=10, eviction_policy="tinylfu")
+
+    hot_keys = [f"hot_{i}" for i in range(5)]
+    for key in hot_keys:
+        in_memory_cache.set_cache(key=key, value=key)
+    for _ in range(5):
+        for key in hot_keys:
+            in_memory_cache.get_cache(key=key)
+
+    for i in range(1_000):
+        in_memory_cache.set_cache(key=f"scan_{i}", value=i)
+
+    assert len(in_memory_cache.cache_dict) <= 10
+    for key in hot_keys:
+        assert in_memory_cache.get_cache(key=key) == key
+
+
+def test_in_memory_cache_invalid_eviction_policy():
+    with pytest.raises(ValueError):
+        InMemoryCache(eviction_policy="fifo")  # type: ignore
+
+
+@pytest.mark.parametrize("eviction_policy", ["ttl", "lru", "tinylfu"])
+def test_in_memory_cache_max_size_in_bytes(eviction_policy):
+    """
+    The byte budget is respected regardless of the item count limit
+    """
+    value = "a" * 1000
+    item_size = sys.getsizeof(value)
+    in_memory_cache = InMemoryCache(
+        max_size_in_memory=1_000,
+        max_size_in_bytes=item_size * 3,
+        eviction_policy=eviction_policy,
+    )
+
+    for i in range(10):
+        in_memory_cache.set_cache(key=f"key_{i}", value=value)
+
+    stats = in_memory_cache.get_cache_stats()
+    assert stats["current_size"] == 3
+    assert stats["current_size_in_bytes"] <= item_size * 3
+    assert stats["evictions"] == 7
+
+    # a single item larger than the whole budget is never stored
+    in_memory_cache.set_cache(key="too_big", value="a" * 10_000)
+    assert "too_big" not in in_memory_cache.cache_dict
+
+
+def test_in_memory_cache_stats():
+    in_memory_cache = InMemoryCache()
+
+    in_memory_cache.set_cache(key="a", value="value_a")
+    in_memory_cache.get_cache(key="a")
+    in_memory_cache.get_cache(key="a")
+    in_memory_cache.get_cache(key="missing")
+
+    stats = in_memory_cache.get_cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 0
+    assert stats["current_size"] == 1
+
+    in_memory_cache.delete_cache(key="a")
+    assert in_memory_cache.get_cache_stats()["current_size_in_bytes"] == 0
+
+
+def test_in_memory_cache_heap_compacted_on_ttl_override():
+    """
+    Outdated heap entries from ttl overrides are compacted away
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=10)
+
+    for i in range(100):
+        in_memory_cache.set_cache(key="hot_key", value=f"value_{i}", ttl=60)
+        # force the ttl to be overridable on the next write
+        in_memory_cache.ttl_dict["hot_key"] = time.time() - 1
+
+    assert len(in_memory_cache.expiration_heap) <= 3
@@ -0,0 +1,288 @@
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.caching import Cache, LiteLLMCacheType
+from litellm.caching.local_semantic_cache import LocalSemanticCache
+
+DIM = 8
+
+
+def _embedding(seed: int, noise: float = 0.0) -> list:
+    rng = np.random.default_rng(seed)
+    vector = rng.normal(size=DIM)
+    if noise:
+        vector = vector + np.random.default_rng(seed + 1000).normal(size=DIM) * noise
+    return vector.tolist()
+
+
+def _messages(prompt: str) -> list:
+    return [{"role": "user", "content": prompt}]
+
+
+def test_local_semantic_cache_requires_similarity_threshold():
+    with pytest.raises(Exception, match="similarity_threshold must be provided"):
+        LocalSemanticCache()
+    with pytest.raises(ValueError, match="Invalid dtype"):
+        LocalSemanticCache(similarity_threshold=0.9, dtype="int8")  # type: ignore
+
+
+def test_local_semantic_cache_search_batch():
+    cache = LocalSemanticCache(similarity_threshold=0.95)
+    for i in range(20):
+        cache.add(key=f"k{i}", prompt=f"p{i}", embedding=_embedding(i), value=f"v{i}")
+
+    results = cache.search([_embedding(3, noise=0.01), _embedding(7), _embedding(99)])
+
+    assert results[0][:2] == ("p3", "v3")
+    assert results[0][2] > 0.95
+    assert results[1][:2] == ("p7", "v7")
+    assert results[2][:2] == (None, None)  # below threshold
+
+
+def test_local_semantic_cache_float16():
+    cache = LocalSemanticCache(similarity_threshold=0.95, dtype="float16")
+    cache.add(key="k", prompt="p", embedding=_embedding(1), value="v")
+    assert cache._vectors.dtype == np.float16
+    prompt, value, similarity = cache.search([_embedding(1)])[0]
+    assert value == "v"
+    assert similarity == pytest.approx(1.0, abs=1e-3)
+
+
+def test_local_semantic_cache_lru_eviction_and_growth():
+    with patch(
+        "litellm.caching.local_semantic_cache.LOCAL_SEMANTIC_CACHE_INITIAL_CAPACITY", 2
+    ):
+        cache = LocalSemanticCache(similarity_threshold=0.99, max_entries=3)
+        for i in range(3):
+            cache.add(key=f"k{i}", prompt=f"p{i}", embedding=_embedding(i), value=f"v{i}")
+        assert cache.get_stats()["capacity"] == 3
+
+        # touch k0, so k1 is the least recently used entry
+        assert cache.search([_embedding(0)])[0][1] == "v0"
+        cache.add(key="k3", prompt="p3", embedding=_embedding(3), value="v3")
+
+    assert len(cache) == 3
+    assert cache.search([_embedding(1)])[0][1] is None
+    assert cache.search([_embedding(0)])[0][1] == "v0"
+    assert cache.search([_embedding(3)])[0][1] == "v3"
+
+
+def test_local_semantic_cache_ttl():
+    cache = LocalSemanticCache(similarity_threshold=0.99, max_entries=1)
+    cache.add(key="k0", prompt="p0", embedding=_embedding(0), value="v0", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.search([_embedding(0)])[0][1] is None
+    assert cache._get_by_key("k0") is None
+
+    # expired entry is reclaimed before anything live would be evicted
+    cache.add(key="k1", prompt="p1", embedding=_embedding(1), value="v1")
+    assert len(cache) == 1
+    assert cache._num_rows == 1
+
+
+def test_local_semantic_cache_ivf_index():
+    cache = LocalSemanticCache(
+        similarity_threshold=0.99, index_type="ivf", index_min_entries=200
+    )
+    for i in range(400):
+        cache.add(key=f"k{i}", prompt=f"p{i}", embedding=_embedding(i), value=f"v{i}")
+    cache._wait_for_index_build()
+
+    assert cache._index is not None
+    assert cache.get_stats()["index_type"] == "ivf"
+    for i in (0, 150, 399):
+        assert cache.search([_embedding(i)])[0][1] == f"v{i}"
+
+
+def test_local_semantic_cache_ivf_index_evict_and_reinsert():
+    cache = LocalSemanticCache(
+        similarity_threshold=0.99,
+        max_entries=300,
+        index_type="ivf",
+        index_min_entries=200,
+    )
+    for i in range(600):  # evicts the oldest 300 entries
+        cache.add(key=f"k{i}", prompt=f"p{i}", embedding=_embedding(i), value=f"v{i}")
+    # re-insert an entry into a row freed by eviction
+    cache.add(key="k0", prompt="p0", embedding=_embedding(0), value="v0")
+    cache._wait_for_index_build()
+
+    index = cache._index
+    assert sum(len(rows) for rows in index.lists) == len(cache) == 300
+    assert set(index.row_lists) == set(cache._lru)
+    assert cache.search([_embedding(0)])[0][1] == "v0"
+    assert cache.search([_embedding(1)])[0][1] is None
+    assert cache.search([_embedding(599)])[0][1] == "v599"
+
+
+def test_local_semantic_cache_hnsw_index_evict_and_reinsert():
+    pytest.importorskip("hnswlib")
+    cache = LocalSemanticCache(
+        similarity_threshold=0.99,
+        max_entries=300,
+        index_type="hnsw",
+        index_min_entries=200,
+    )
+    for i in range(600):  # evicts the oldest 300 entries, freed rows are reused
+        cache.add(key=f"k{i}", prompt=f"p{i}", embedding=_embedding(i), value=f"v{i}")
+    cache.add(key="k0", prompt="p0", embedding=_embedding(0), value="v0")
+    cache._wait_for_index_build()
+
+    assert cache.get_stats()["index_type"] == "hnsw"
+    assert cache._index.deleted_rows.isdisjoint(cache._lru)
+    for i in (0, 450, 599):
+        assert cache.search([_embedding(i)])[0][1] == f"v{i}"
+    assert cache.search([_embedding(1)])[0][1] is None
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_async_search_runs_in_executor():
+    import threading
+
+    cache = LocalSemanticCache(similarity_threshold=0.99)
+    cache.add(key="k0", prompt="p0", embedding=_embedding(0), value='"v0"')
+    search_threads = []
+    search = cache.search
+
+    def _search(embeddings):
+        search_threads.append(threading.current_thread())
+        return search(embeddings)
+
+    async def mock_embedding(prompt, **kwargs):
+        return _embedding(0)
+
+    with patch.object(
+        cache, "_get_async_embedding", side_effect=mock_embedding
+    ), patch.object(cache, "search", side_effect=_search):
+        assert await cache.async_get_cache("other", messages=_messages("p0")) == "v0"
+        with patch(
+            "litellm.caching.local_semantic_cache.LOCAL_SEMANTIC_CACHE_EXECUTOR_MIN_ENTRIES",
+            1,
+        ):
+            assert (
+                await cache.async_get_cache("other", messages=_messages("p0")) == "v0"
+            )
+
+    assert search_threads[0] is threading.main_thread()
+    assert search_threads[1] is not threading.main_thread()
+
+
+def test_local_semantic_cache_index_is_built_in_the_background():
+    import threading
+
+    cache = LocalSemanticCache(
+        similarity_threshold=0.99, index_type="ivf", index_min_entries=200
+    )
+    build_started, finish_build = threading.Event(), threading.Event()
+    build_index = cache._build_index
+
+    def slow_build_index(*args):
+        build_started.set()
+        finish_build.wait(5)
+        build_index(*args)
+
+    with patch.object(cache, "_build_index", side_effect=slow_build_index):
+        for i in range(200):
+            cache.add(key=f"k{i}", prompt=f"p{i}", embedding=_embedding(i), value=f"v{i}")
+        assert build_started.wait(5)
+        # writes and lookups go on while the index is built - brute force until it's swapped in
+        for i in range(200, 250):
+            cache.add(key=f"k{i}", prompt=f"p{i}", embedding=_embedding(i), value=f"v{i}")
+        cache.add(key="k0", prompt="p0", embedding=_embedding(0), value="v0-new")
+        assert cache._index is None
+        assert cache.search([_embedding(240)])[0][1] == "v240"
+        finish_build.set()
+        cache._wait_for_index_build()
+
+    # changes made during the build were replayed on the new index
+    assert cache._index is not None
+    assert set(cache._index.row_lists) == set(cache._lru)
+    assert cache.search([_embedding(0)])[0][1] == "v0-new"
+    assert cache.search([_embedding(240)])[0][1] == "v240"
+
+
+def test_local_semantic_cache_key_lookup_does_not_wait_for_the_lock():
+    import threading
+
+    cache = LocalSemanticCache(similarity_threshold=0.99)
+    cache.add(key="k0", prompt="p0", embedding=_embedding(0), value="v0")
+    lock_held, release = threading.Event(), threading.Event()
+
+    def hold_lock():  # e.g. a large search on the executor
+        with cache._lock:
+            lock_held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    assert lock_held.wait(5)
+    start = time.monotonic()
+    assert cache._get_by_key("k0") == "v0"
+    assert cache._get_by_key("missing") is None
+    assert time.monotonic() - start < 1
+    release.set()
+    holder.join()
+
+
+def test_local_semantic_cache_snapshot(tmp_path):
+    path = str(tmp_path / "semantic_cache.npz")
+    cache = LocalSemanticCache(similarity_threshold=0.99, snapshot_path=path)
+    cache.add(key="k0", prompt="p0", embedding=_embedding(0), value="v0")
+    cache.add(key="k1", prompt="p1", embedding=_embedding(1), value="v1", ttl=0.01)
+    time.sleep(0.02)
+    cache.save_snapshot()
+
+    restored = LocalSemanticCache(similarity_threshold=0.99, snapshot_path=path)
+    assert len(restored) == 1
+    assert restored._get_by_key("k0") == "v0"
+    assert restored.search([_embedding(0)])[0][1] == "v0"
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_async_get_set():
+    cache = Cache(type=LiteLLMCacheType.LOCAL_SEMANTIC, similarity_threshold=0.9)
+    assert isinstance(cache.cache, LocalSemanticCache)
+    embeddings = {
+        "what is the capital of france": _embedding(1),
+        "what's the capital of france?": _embedding(1, noise=0.05),
+        "tell me a joke": _embedding(2),
+    }
+
+    async def mock_embedding(prompt, **kwargs):
+        return embeddings[prompt]
+
+    with patch.object(cache.cache, "_get_async_embedding", side_effect=mock_embedding):
+        await cache.cache.async_set_cache(
+            "key1",
+            {"response": "Paris"},
+            messages=_messages("what is the capital of france"),
+        )
+
+        kwargs: dict = {
+            "messages": _messages("what's the capital of france?"),
+            "metadata": {},
+        }
+        assert await cache.cache.async_get_cache("key2", **kwargs) == {
+            "response": "Paris"
+        }
+        assert kwargs["metadata"]["semantic-similarity"] > 0.9
+
+        kwargs = {"messages": _messages("tell me a joke")}
+        assert await cache.cache.async_get_cache("key3", **kwargs) is None
+
+        # exact key hit skips the embedding call
+        with patch.object(
+            cache.cache, "_get_async_embedding", side_effect=AssertionError
+        ):
+            assert await cache.cache.async_get_cache(
+                "key1", messages=_messages("unused")
+            ) == {"response": "Paris"}
@@ -0,0 +1,164 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.llm_caching_handler import LLMClientCache
+from litellm.caching.memory_budget import (
+    estimate_size_in_bytes,
+    in_memory_cache_memory_budget,
+)
+from litellm.types.utils import Message, ModelResponse
+
+
+def test_estimate_size_in_bytes_recurses_into_containers():
+    flat = estimate_size_in_bytes([])
+    nested = estimate_size_in_bytes([{"content": "a" * 10_000}])
+    assert nested > flat + 10_000
+
+
+def test_estimate_size_in_bytes_model_response_without_model_dump():
+    """
+    pydantic values are sized from their field storage, without serializing them
+    """
+    response = ModelResponse(
+        choices=[{"message": Message(content="a" * 50_000), "index": 0}]
+    )
+    with patch.object(
+        ModelResponse, "model_dump", side_effect=Exception("should not be called")
+    ):
+        size = estimate_size_in_bytes(response)
+    assert size > 50_000
+
+
+def test_estimate_size_in_bytes_handles_cycles():
+    cyclic: dict = {"a": "b"}
+    cyclic["self"] = cyclic
+    assert estimate_size_in_bytes(cyclic) > 0
+
+
+def test_in_memory_cache_size_computed_once():
+    in_memory_cache = InMemoryCache()
+    with patch(
+        "litellm.caching.in_memory_cache.estimate_size_in_bytes", return_value=100
+    ) as mock_estimate:
+        in_memory_cache.set_cache(key="a", value={"b": "c"})
+    assert mock_estimate.call_count == 1
+    assert in_memory_cache._item_size_dict["a"] == 100
+    assert in_memory_cache.get_cache_stats()["current_size_in_bytes"] == 100
+
+
+def test_memory_usage_tracked_per_namespace():
+    in_memory_cache = InMemoryCache(namespace="test-namespace-usage")
+    in_memory_cache.set_cache(key="a", value="a" * 1_000)
+
+    usage = in_memory_cache_memory_budget.get_memory_usage_by_namespace()
+    assert usage["test-namespace-usage"] == in_memory_cache._current_size_in_bytes
+
+    in_memory_cache.flush_cache()
+    usage = in_memory_cache_memory_budget.get_memory_usage_by_namespace()
+    assert usage["test-namespace-usage"] == 0
+
+
+def test_memory_usage_released_when_cache_is_garbage_collected():
+    in_memory_cache = InMemoryCache(namespace="test-namespace-gc")
+    in_memory_cache.set_cache(key="a", value="a" * 1_000)
+    assert in_memory_cache_memory_budget.get_memory_usage_by_namespace()[
+        "test-namespace-gc"
+    ] > 0
+
+    del in_memory_cache
+    assert (
+        in_memory_cache_memory_budget.get_memory_usage_by_namespace()[
+            "test-namespace-gc"
+        ]
+        == 0
+    )
+
+
+def test_global_memory_ceiling_shared_across_caches(monkeypatch):
+    value = "a" * 10_000
+    item_size = estimate_size_in_bytes(value)
+    monkeypatch.setattr(
+        litellm,
+        "in_memory_cache_max_size_in_bytes",
+        in_memory_cache_memory_budget.total_size_in_bytes + item_size * 3,
+    )
+
+    cache_1 = InMemoryCache(namespace="test-ceiling-1")
+    client_cache = LLMClientCache()
+
+    cache_1.set_cache(key="a", value=value)
+    cache_1.set_cache(key="b", value=value)
+    client_cache.set_cache(key="c", value=value)
+
+    # the global ceiling is reached - cache_1 evicts its own entries to make room
+    cache_1.set_cache(key="d", value=value)
+    assert len(cache_1.cache_dict) == 2
+    assert cache_1.get_cache_stats()["evictions"] == 1
+
+    client_cache.flush_cache()
+    cache_1.flush_cache()
+    assert not in_memory_cache_memory_budget.is_over_budget(item_size * 3)
+
+
+def test_global_memory_ceiling_evicts_other_caches_to_make_room(monkeypatch):
+    value = "a" * 10_000
+    item_size = estimate_size_in_bytes(value)
+    monkeypatch.setattr(
+        litellm,
+        "in_memory_cache_max_size_in_bytes",
+        in_memory_cache_memory_budget.total_size_in_bytes + item_size * 3,
+    )
+
+    small_cache = InMemoryCache(namespace="test-ceiling-small")
+    large_cache = InMemoryCache(namespace="test-ceiling-large")
+    small_cache.set_cache(key="a", value=value)
+    large_cache.set_cache(key="b", value=value)
+    large_cache.set_cache(key="c", value=value)
+
+    # empty cache - the largest other cache evicts an entry to make room
+    empty_cache = InMemoryCache(namespace="test-ceiling-empty")
+    empty_cache.set_cache(key="d", value=value)
+    assert empty_cache.get_cache(key="d") == value
+    assert len(large_cache.cache_dict) == 1
+    assert len(small_cache.cache_dict) == 1
+
+    for cache in (small_cache, large_cache, empty_cache):
+        cache.flush_cache()
+
+
+def test_global_memory_ceiling_exempts_llm_client_cache(monkeypatch):
+    value = "a" * 10_000
+    item_size = estimate_size_in_bytes(value)
+    monkeypatch.setattr(
+        litellm,
+        "in_memory_cache_max_size_in_bytes",
+        in_memory_cache_memory_budget.total_size_in_bytes + item_size,
+    )
+
+    client_cache = LLMClientCache()
+    client_cache.set_cache(key="client-1", value=value)
+    # over the ceiling - clients are still cached, not re-created per request
+    client_cache.set_cache(key="client-2", value=value)
+    assert client_cache.get_cache(key="client-1") == value
+    assert client_cache.get_cache(key="client-2") == value
+
+    # nothing left to evict for other caches - the write is refused, and logged
+    in_memory_cache = InMemoryCache(namespace="test-ceiling-refused")
+    with patch(
+        "litellm.caching.in_memory_cache.verbose_logger.warning"
+    ) as mock_warning:
+        in_memory_cache.set_cache(key="a", value=value)
+    assert in_memory_cache.get_cache(key="a") is None
+    mock_warning.assert_called_once()
+    assert client_cache.get_cache(key="client-1") == value
+
+    client_cache.flush_cache()
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.near_cache import NearCacheInvalidator
+from litellm.caching.redis_cache import RedisCache
+
+
+def _mock_redis_cache():
+    redis_cache = MagicMock(spec=RedisCache)
+    redis_cache.async_publish = AsyncMock()
+    redis_cache.async_set_cache = AsyncMock()
+    redis_cache.async_get_cache = AsyncMock()
+    return redis_cache
+
+
+def test_handle_message_deletes_keys_from_other_instances():
+    in_memory_cache = InMemoryCache()
+    invalidator = NearCacheInvalidator(
+        redis_cache=_mock_redis_cache(), in_memory_cache=in_memory_cache
+    )
+    in_memory_cache.set_cache("a", 1)
+    in_memory_cache.set_cache("b", 2)
+
+    invalidator.handle_message(json.dumps({"origin": "other", "keys": ["a"]}))
+
+    assert in_memory_cache.get_cache("a") is None
+    assert in_memory_cache.get_cache("b") == 2
+    assert invalidator.invalidations_received == 1
+
+
+def test_handle_message_ignores_own_messages_and_flushes():
+    in_memory_cache = InMemoryCache()
+    invalidator = NearCacheInvalidator(
+        redis_cache=_mock_redis_cache(), in_memory_cache=in_memory_cache
+    )
+    in_memory_cache.set_cache("a", 1)
+
+    invalidator.handle_message(invalidator._build_message(["a"]))
+    assert in_memory_cache.get_cache("a") == 1
+
+    invalidator.handle_message(
+        json.dumps({"origin": "other", "flush": True}).encode("utf-8")
+    )
+    assert in_memory_cache.get_cache("a") is None
+
+    # malformed messages are ignored
+    invalidator.handle_message(b"not-json")
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_publishes_invalidation_on_write():
+    redis_cache = _mock_redis_cache()
+    dual_cache = DualCache(redis_cache=redis_cache, near_cache=True)
+    dual_cache.near_cache_invalidator.ensure_listener_started = MagicMock()
+
+    await dual_cache.async_set_cache("key", "value")
+    redis_cache.async_publish.assert_awaited_once()
+    channel, message = redis_cache.async_publish.call_args.args
+    assert channel == dual_cache.near_cache_invalidator.channel
+    assert json.loads(message)["keys"] == ["key"]
+
+    # local-only writes are not published
+    await dual_cache.async_set_cache("key", "value", local_only=True)
+    assert redis_cache.async_publish.await_count == 1
+
+    dual_cache.set_cache("sync_key", "value")
+    redis_cache.publish.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_uses_near_cache_ttl_only_while_subscribed():
+    redis_cache = _mock_redis_cache()
+    redis_cache.async_get_cache.return_value = "redis_value"
+    dual_cache = DualCache(
+        redis_cache=redis_cache,
+        near_cache=True,
+        near_cache_ttl=600,
+        default_in_memory_ttl=5,
+    )
+    dual_cache.near_cache_invalidator.ensure_listener_started = MagicMock()
+    dual_cache.in_memory_cache.async_set_cache = AsyncMock()
+
+    await dual_cache.async_get_cache("key")
+    assert "ttl" not in dual_cache.in_memory_cache.async_set_cache.call_args.kwargs
+
+    dual_cache.near_cache_invalidator.is_subscribed = True
+    await dual_cache.async_get_cache("key")
+    assert dual_cache.in_memory_cache.async_set_cache.call_args.kwargs["ttl"] == 600
+
+
+def test_dual_cache_without_near_cache_has_no_invalidator():
+    dual_cache = DualCache(redis_cache=_mock_redis_cache())
+    assert dual_cache.near_cache_invalidator is None
+    assert DualCache(near_cache=True).near_cache_invalidator is None
+
+
+@pytest.mark.asyncio
+async def test_listener_subscribes_and_applies_invalidations():
+    in_memory_cache = InMemoryCache()
+    in_memory_cache.set_cache("stale", 1)
+    redis_cache = _mock_redis_cache()
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.aclose = AsyncMock()
+    messages = [{"data": json.dumps({"origin": "other", "keys": ["a"]})}]
+
+    async def get_message(**kwargs):
+        if messages:
+            return messages.pop()
+        await asyncio.sleep(0.01)
+        return None
+
+    pubsub.get_message = get_message
+    redis_cache.get_async_pubsub.return_value = pubsub
+    invalidator = NearCacheInvalidator(
+        redis_cache=redis_cache, in_memory_cache=in_memory_cache
+    )
+
+    invalidator.ensure_listener_started()
+    await asyncio.sleep(0.05)
+    in_memory_cache.set_cache("a", 1)  # set after the message was handled
+    assert invalidator.is_subscribed is True
+    assert in_memory_cache.get_cache("stale") is None  # flushed on subscribe
+    assert invalidator.invalidations_received == 1
+
+    await invalidator.stop()
+    assert invalidator.is_subscribed is False
+    pubsub.aclose.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_skips_in_memory_write_if_invalidated_during_redis_read():
+    """
+    An invalidation that arrives while the Redis read is in flight must win - the read may have returned
+    the value from before the change
+    """
+    redis_cache = _mock_redis_cache()
+    dual_cache = DualCache(
+        redis_cache=redis_cache,
+        near_cache=True,
+        coalesce_requests=False,
+    )
+    invalidator = dual_cache.near_cache_invalidator
+    invalidator.ensure_listener_started = MagicMock()
+    invalidator.is_subscribed = True
+
+    async def get_stale_value_then_invalidate(key, **kwargs):
+        invalidator.handle_message(json.dumps({"origin": "other", "keys": [key]}))
+        return "stale_value"
+
+    redis_cache.async_get_cache.side_effect = get_stale_value_then_invalidate
+    assert await dual_cache.async_get_cache("key") == "stale_value"
+    assert dual_cache.in_memory_cache.get_cache("key") is None
+
+    # no invalidation during the read - the value is kept in memory
+    redis_cache.async_get_cache.side_effect = None
+    redis_cache.async_get_cache.return_value = "fresh_value"
+    assert await dual_cache.async_get_cache("key") == "fresh_value"
+    assert dual_cache.in_memory_cache.get_cache("key") == "fresh_value"
+
+    # in-flight read tracking is released
+    assert invalidator._reads_in_flight == {}
+    assert invalidator._key_invalidation_generations == {}
+
+
+def test_near_cache_read_generations():
+    invalidator = NearCacheInvalidator(
+        redis_cache=_mock_redis_cache(), in_memory_cache=InMemoryCache()
+    )
+    generation = invalidator.start_read("a")
+    invalidator.handle_message(json.dumps({"origin": "other", "keys": ["b"]}))
+    assert invalidator.finish_read("a", generation) is True
+
+    generation = invalidator.start_read("a")
+    invalidator.handle_message(json.dumps({"origin": "other", "flush": True}))
+    assert invalidator.finish_read("a", generation) is False
+
+    # keys without reads in flight are not tracked
+    assert invalidator._key_invalidation_generations == {}
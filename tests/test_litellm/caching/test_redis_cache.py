@@ -199,3 +199,29 @@ async def test_async_lpop_with_float_redis_version(
             
             # Verify the method completed without error
             assert result is not None
+
+
+@pytest.mark.asyncio
+async def test_async_set_hash_field_and_get_all(monkeypatch, redis_no_ping):
+    monkeypatch.setenv("REDIS_HOST", "https://my-test-host")
+    redis_cache = RedisCache(namespace="ns")
+    mock_pipeline = MagicMock()
+    mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+    mock_pipeline.__aexit__ = AsyncMock(return_value=None)
+    mock_pipeline.execute = AsyncMock(
+        return_value=[1, True, {b"me": b'{"a": 1}', b"other": b'{"b": 2}'}]
+    )
+    mock_redis_instance = MagicMock()
+    mock_redis_instance.pipeline = MagicMock(return_value=mock_pipeline)
+
+    with patch.object(
+        redis_cache, "init_async_client", return_value=mock_redis_instance
+    ):
+        result = await redis_cache.async_set_hash_field_and_get_all(
+            key="summary", field="me", value={"a": 1}, ttl=60
+        )
+
+    assert result == {"me": {"a": 1}, "other": {"b": 2}}
+    mock_pipeline.hset.assert_called_once_with("ns:summary", "me", '{"a": 1}')
+    mock_pipeline.expire.assert_called_once()
+    mock_pipeline.hgetall.assert_called_once_with("ns:summary")
@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.redis_cache import RedisCache
+from litellm.caching.redis_codec import CODEC_MAGIC, RedisCacheCodec
+
+EMBEDDING = [0.1 * i - 0.0123456789 for i in range(64)]
+CACHED_EMBEDDING = {
+    "timestamp": 1700000000.123,
+    "response": {"embedding": EMBEDDING, "index": 0, "object": "embedding"},
+}
+CACHED_COMPLETION = {
+    "timestamp": 1700000000.123,
+    "response": json.dumps(
+        {"choices": [{"message": {"content": "lorem ipsum " * 200}}], "id": "x"}
+    ),
+}
+
+
+@pytest.fixture
+def redis_no_ping():
+    with patch("litellm._redis.get_redis_client"), patch.object(
+        RedisCache, "_setup_health_pings"
+    ):
+        yield
+
+
+@pytest.mark.parametrize("serializer", ["json", "orjson", "msgpack"])
+@pytest.mark.parametrize("compression", [None, "zlib", "zstd", "lz4"])
+def test_codec_round_trip(serializer, compression):
+    if serializer == "msgpack":
+        pytest.importorskip("msgpack")
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    if compression == "lz4":
+        pytest.importorskip("lz4")
+    codec = RedisCacheCodec(
+        serializer=serializer, compression=compression, compression_threshold_bytes=64
+    )
+
+    for value in [CACHED_EMBEDDING, CACHED_COMPLETION, {"a": [1, 2, None]}]:
+        encoded = codec.encode(value)
+        assert RedisCacheCodec.is_encoded(encoded)
+        assert RedisCacheCodec.decode(encoded) == value
+
+
+def test_packed_floats_are_lossless_and_smaller():
+    codec = RedisCacheCodec(serializer="json")
+    encoded = codec.encode(CACHED_EMBEDDING)
+
+    assert len(encoded) < len(json.dumps(CACHED_EMBEDDING))
+    assert RedisCacheCodec.decode(encoded)["response"]["embedding"] == EMBEDDING
+
+
+def test_compression_only_above_threshold():
+    codec = RedisCacheCodec(
+        serializer="json", compression="zlib", compression_threshold_bytes=1024
+    )
+    small = codec.encode({"a": 1})
+    large = codec.encode(CACHED_COMPLETION)
+
+    assert small[5] == 0  # compression id in the header
+    assert large[5] != 0
+    assert len(large) < len(json.dumps(CACHED_COMPLETION))
+
+
+def test_decode_rejects_unknown_version():
+    encoded = bytearray(RedisCacheCodec().encode({"a": 1}))
+    encoded[3] = 99
+    with pytest.raises(ValueError):
+        RedisCacheCodec.decode(bytes(encoded))
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_writes_codec_values_and_reads_legacy(redis_no_ping):
+    redis_cache = RedisCache(
+        host="localhost",
+        redis_cache_codec={"serializer": "orjson", "compression": "zlib"},
+    )
+    mock_redis_instance = AsyncMock()
+    with patch.object(
+        redis_cache, "init_async_client", return_value=mock_redis_instance
+    ):
+        await redis_cache.async_set_cache("key", CACHED_COMPLETION)
+        await redis_cache.async_set_cache("counter", 5)
+
+    stored = mock_redis_instance.set.call_args_list[0].kwargs["value"]
+    assert stored.startswith(CODEC_MAGIC)
+    assert redis_cache._get_cache_logic(stored) == CACHED_COMPLETION
+    # scalars keep the legacy format, so INCR / lua scripts still work
+    assert mock_redis_instance.set.call_args_list[1].kwargs["value"] == "5"
+
+    # values written before the codec was enabled are still readable
+    legacy = json.dumps(CACHED_COMPLETION).encode("utf-8")
+    assert redis_cache._get_cache_logic(legacy) == CACHED_COMPLETION
+    # corrupted codec values are treated as a cache miss
+    assert redis_cache._get_cache_logic(stored[:10]) is None
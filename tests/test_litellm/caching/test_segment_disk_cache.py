@@ -0,0 +1,253 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.segment_disk_cache import SegmentDiskCache
+
+
+def _wait_for_compaction(cache: SegmentDiskCache) -> None:
+    """
+    Compactions run on the writer thread, and re-schedule themselves for segments sealed meanwhile -
+    drain the writer until none is scheduled
+    """
+    while True:
+        cache._writer.submit(lambda: None).result()
+        with cache._lock:
+            if not cache._compaction_scheduled:
+                return
+
+
+def test_set_get_delete_and_reload(tmp_path):
+    cache = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    cache.set_cache("a", {"response": "hello"})
+    cache.set_cache("b", [1, 2, 3])
+    cache.set_cache("a", {"response": "updated"})
+    cache.delete_cache("b")
+
+    assert cache.get_cache("a") == {"response": "updated"}
+    assert cache.get_cache("b") is None
+    cache.close()
+
+    # index is rebuilt from the segments, incl. overwrites and tombstones
+    reloaded = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    assert reloaded.get_cache("a") == {"response": "updated"}
+    assert reloaded.get_cache("b") is None
+    assert reloaded.get_stats()["num_keys"] == 1
+    reloaded.close()
+
+
+def test_ttl_expiry(tmp_path):
+    cache = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    cache.set_cache("short", "x", ttl=0.01)
+    cache.set_cache("long", "y", ttl=60)
+    time.sleep(0.02)
+
+    assert cache.get_cache("short") is None
+    assert cache.get_cache("long") == "y"
+    cache.close()
+
+
+def test_torn_write_is_truncated_on_reload(tmp_path):
+    cache = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    cache.set_cache("a", "complete")
+    cache.close()
+    segment_path = os.path.join(str(tmp_path), os.listdir(str(tmp_path))[0])
+    size = os.path.getsize(segment_path)
+    with open(segment_path, "ab") as f:
+        f.write(b"\x00\x01\x02partial-record")
+
+    reloaded = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    assert reloaded.get_cache("a") == "complete"
+    assert os.path.getsize(segment_path) == size
+    reloaded.set_cache("b", "after-crash")
+    assert reloaded.get_cache("b") == "after-crash"
+    reloaded.close()
+
+
+def test_rollover_and_compaction(tmp_path):
+    cache = SegmentDiskCache(
+        disk_cache_dir=str(tmp_path),
+        max_segment_size_in_bytes=1024,
+        compaction_garbage_ratio=0.5,
+    )
+    for i in range(50):
+        cache.set_cache("hot", {"i": i, "pad": "x" * 100})
+    cache.set_cache("cold", "keep-me")
+    _wait_for_compaction(cache)
+
+    stats = cache.get_stats()
+    assert stats["num_keys"] == 2
+    # overwritten records were reclaimed
+    assert stats["size_in_bytes"] < 50 * 100
+    assert cache.get_cache("hot") == {"i": 49, "pad": "x" * 100}
+    assert cache.get_cache("cold") == "keep-me"
+    cache.close()
+
+    reloaded = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    assert reloaded.get_cache("hot") == {"i": 49, "pad": "x" * 100}
+    reloaded.close()
+
+
+def test_segment_key_sets_track_the_index(tmp_path):
+    cache = SegmentDiskCache(
+        disk_cache_dir=str(tmp_path),
+        max_segment_size_in_bytes=512,
+        compaction_garbage_ratio=0.5,
+    )
+    for i in range(40):
+        cache.set_cache(f"k{i % 7}", {"i": i, "pad": "x" * 50})
+        if i % 5 == 0:
+            cache.delete_cache(f"k{i % 7}")
+    _wait_for_compaction(cache)
+
+    with cache._lock:
+        for segment_id, segment in cache._segments.items():
+            assert segment.keys == {
+                k for k, e in cache._index.items() if e.segment_id == segment_id
+            }
+            assert segment.tombstone_keys == {
+                k for k, t in cache._tombstones.items() if t.segment_id == segment_id
+            }
+    cache.close()
+
+
+def test_reads_do_not_wait_for_writers(tmp_path):
+    cache = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    cache.set_cache("a", "value")
+
+    locked = threading.Event()
+    release = threading.Event()
+
+    def hold_locks():
+        with cache._write_lock, cache._lock:
+            locked.set()
+            release.wait(5)
+
+    writer = threading.Thread(target=hold_locks)
+    writer.start()
+    locked.wait(5)
+    try:
+        assert cache.get_cache("a") == "value"
+    finally:
+        release.set()
+        writer.join()
+    cache.close()
+
+
+def test_fsync_runs_outside_the_write_lock(tmp_path, monkeypatch):
+    cache = SegmentDiskCache(disk_cache_dir=str(tmp_path), fsync=True)
+    lock_free_during_fsync = []
+
+    def fake_fsync(fd):
+        # acquire from another thread - an RLock held by this one would still be re-entrant here
+        def try_acquire():
+            acquired = cache._write_lock.acquire(timeout=1)
+            if acquired:
+                cache._write_lock.release()
+            lock_free_during_fsync.append(acquired)
+
+        t = threading.Thread(target=try_acquire)
+        t.start()
+        t.join()
+
+    monkeypatch.setattr(os, "fsync", fake_fsync)
+    cache.set_cache("a", "value")
+    assert lock_free_during_fsync == [True]
+    assert cache.get_cache("a") == "value"
+    cache.close()
+
+
+def test_compaction_keeps_tombstones_hiding_older_segments(tmp_path):
+    """
+    A deleted key must not come back after its tombstone's segment is compacted, while an older segment
+    still holds a record of the key
+    """
+    cache = SegmentDiskCache(
+        disk_cache_dir=str(tmp_path),
+        max_segment_size_in_bytes=200,
+        compaction_garbage_ratio=0.5,
+    )
+    cache.set_cache("victim", {"v": 1})
+    cache.set_cache("keep", {"v": "x" * 120})  # segment 1 stays mostly live
+    cache.set_cache("churn", {"v": "y" * 120})
+    cache.delete_cache("victim")  # tombstone in segment 2
+    cache.set_cache("churn", {"v": "y" * 120})  # segment 2 is all garbage
+    cache.set_cache("seal", {"v": "z" * 150})
+    _wait_for_compaction(cache)
+
+    assert not os.path.exists(os.path.join(str(tmp_path), "segment-00000002.log"))
+    assert cache.get_cache("victim") is None
+    cache.close()
+
+    reloaded = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    assert reloaded.get_cache("victim") is None
+    assert reloaded.get_cache("keep") == {"v": "x" * 120}
+    reloaded.close()
+
+
+def test_compaction_keeps_expired_records_hiding_older_segments(tmp_path):
+    cache = SegmentDiskCache(
+        disk_cache_dir=str(tmp_path),
+        max_segment_size_in_bytes=200,
+        compaction_garbage_ratio=0.5,
+    )
+    cache.set_cache("key", "no-ttl")
+    cache.set_cache("keep", {"v": "x" * 120})
+    cache.set_cache("key", "short-ttl", ttl=0.01)
+    time.sleep(0.02)
+    cache.set_cache("churn", {"v": "y" * 150})
+    cache.set_cache("churn", {"v": "y" * 150})
+    cache.set_cache("seal", {"v": "z" * 150})
+    _wait_for_compaction(cache)
+    assert cache.get_cache("key") is None
+    cache.close()
+
+    reloaded = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    assert reloaded.get_cache("key") is None
+    reloaded.close()
+
+
+def test_tombstones_in_oldest_segment_are_garbage(tmp_path):
+    cache = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    cache.set_cache("a", "value")
+    cache.delete_cache("a")
+    # single segment - nothing older for the tombstone to hide
+    assert cache.get_stats()["num_tombstones"] == 0
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_async_methods(tmp_path):
+    cache = SegmentDiskCache(disk_cache_dir=str(tmp_path))
+    await asyncio.gather(
+        *[cache.async_set_cache(f"key-{i}", {"value": i}) for i in range(20)]
+    )
+    await cache.async_set_cache_pipeline([("p1", 1), ("p2", 2)], ttl=60)
+
+    assert await cache.async_get_cache("key-7") == {"value": 7}
+    assert await cache.async_batch_get_cache(["p1", "p2", "missing"]) == [1, 2, None]
+    assert await cache.async_increment("counter", 2) == 2
+    assert await cache.async_increment("counter", 3) == 5
+    await cache.async_delete_cache("p1")
+    assert await cache.async_get_cache("p1") is None
+
+    cache.flush_cache()
+    assert await cache.async_get_cache("key-7") is None
+    await cache.disconnect()
+
+
+def test_cache_type_segment_disk(tmp_path):
+    cache = litellm.Cache(type="segment-disk", disk_cache_dir=str(tmp_path))
+    try:
+        assert isinstance(cache.cache, SegmentDiskCache)
+    finally:
+        cache.cache.close()
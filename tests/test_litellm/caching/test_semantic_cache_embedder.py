@@ -0,0 +1,130 @@
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.semantic_cache_embedder import SemanticCacheEmbedder
+
+
+def _fake_embedding(prompt: str) -> list:
+    return [float(len(prompt)), float(ord(prompt[0]))]
+
+
+def _mock_aembedding(calls: list):
+    async def aembedding(model, input, **kwargs):
+        calls.append(input)
+        prompts = input if isinstance(input, list) else [input]
+        return {"data": [{"embedding": _fake_embedding(p)} for p in prompts]}
+
+    return aembedding
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_embedding_request():
+    embedder = SemanticCacheEmbedder(embedding_model="text-embedding-3-small")
+    calls: list = []
+    with patch("litellm.aembedding", side_effect=_mock_aembedding(calls)):
+        results = await asyncio.gather(
+            embedder.aembed("hello"),
+            embedder.aembed("hi there"),
+            embedder.aembed("hello"),
+        )
+
+    assert calls == [["hello", "hi there"]]
+    assert results == [
+        _fake_embedding("hello"),
+        _fake_embedding("hi there"),
+        _fake_embedding("hello"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_repeated_prompts_are_memoized():
+    embedder = SemanticCacheEmbedder(embedding_model="text-embedding-3-small")
+    calls: list = []
+    with patch("litellm.aembedding", side_effect=_mock_aembedding(calls)):
+        await embedder.aembed("hello")
+        assert await embedder.aembed("hello") == _fake_embedding("hello")
+
+    with patch("litellm.embedding", side_effect=AssertionError):
+        assert embedder.embed("hello") == _fake_embedding("hello")
+
+    assert calls == ["hello"]
+    assert embedder.num_cache_hits == 2
+
+
+@pytest.mark.asyncio
+async def test_memoization_lru_eviction():
+    embedder = SemanticCacheEmbedder(
+        embedding_model="text-embedding-3-small", batch_window_ms=0, cache_size=2
+    )
+    calls: list = []
+    with patch("litellm.aembedding", side_effect=_mock_aembedding(calls)):
+        for prompt in ["a", "b", "a", "c", "b"]:
+            await embedder.aembed(prompt)
+
+    # "b" was the least recently used entry when "c" was added
+    assert calls == ["a", "b", "c", "b"]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_immediately_and_batches_are_split_by_key():
+    embedder = SemanticCacheEmbedder(
+        embedding_model="text-embedding-3-small",
+        batch_window_ms=10_000,
+        max_batch_size=2,
+    )
+    calls: list = []
+    with patch("litellm.aembedding", side_effect=_mock_aembedding(calls)):
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                embedder.aembed("a", metadata={"user_api_key": "k1"}),
+                embedder.aembed("b", metadata={"user_api_key": "k2"}),
+                embedder.aembed("c", metadata={"user_api_key": "k1"}),
+            ),
+            timeout=5,
+        )
+
+    assert sorted(map(str, calls)) == sorted(map(str, [["a", "c"], "b"]))
+    assert results[1] == _fake_embedding("b")
+
+
+@pytest.mark.asyncio
+async def test_running_batches_are_referenced_until_done():
+    embedder = SemanticCacheEmbedder(
+        embedding_model="text-embedding-3-small", batch_window_ms=1
+    )
+    release = asyncio.Event()
+    calls: list = []
+    mock_aembedding = _mock_aembedding(calls)
+
+    async def slow_aembedding(*args, **kwargs):
+        await release.wait()
+        return await mock_aembedding(*args, **kwargs)
+
+    with patch("litellm.aembedding", side_effect=slow_aembedding):
+        lookup = asyncio.ensure_future(embedder.aembed("hello"))
+        while not embedder._running_tasks:
+            await asyncio.sleep(0.001)
+        assert len(embedder._running_tasks) == 1
+
+        release.set()
+        assert await lookup == _fake_embedding("hello")
+    await asyncio.sleep(0)
+    assert embedder._running_tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_embedding_errors_are_raised_to_every_caller():
+    embedder = SemanticCacheEmbedder(embedding_model="text-embedding-3-small")
+    with patch("litellm.aembedding", side_effect=Exception("rate limited")):
+        results = await asyncio.gather(
+            embedder.aembed("a"), embedder.aembed("b"), return_exceptions=True
+        )
+    assert all(str(result) == "rate limited" for result in results)
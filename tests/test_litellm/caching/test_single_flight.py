@@ -0,0 +1,170 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.caching import Cache
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.redis_cache import RedisCache
+from litellm.caching.single_flight import (
+    CacheMissCoalescer,
+    SingleFlight,
+    get_coalesced_requests_by_namespace,
+)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    single_flight = SingleFlight(namespace="test_single_flight_shares_one_call")
+    num_calls = 0
+
+    async def fetch():
+        nonlocal num_calls
+        num_calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    results = await asyncio.gather(*[single_flight.do("key", fetch) for _ in range(5)])
+
+    assert num_calls == 1
+    assert all(result == {"value": 1} for result in results)
+    assert (
+        get_coalesced_requests_by_namespace()["test_single_flight_shares_one_call"]
+        == 4
+    )
+
+    # once the call finished, the next one runs again
+    await single_flight.do("key", fetch)
+    assert num_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_and_survives_cancellation():
+    single_flight = SingleFlight(namespace="test_single_flight_errors")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *[single_flight.do("key", fail) for _ in range(3)], return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    leader = asyncio.create_task(single_flight.do("slow", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(single_flight.do("slow", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "done"
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_coalescer_leader_hands_value_to_waiters():
+    coalescer = CacheMissCoalescer(namespace="test_cache_miss_coalescer")
+    is_leader, leader_future = coalescer.acquire("key")
+    assert is_leader is True
+
+    is_leader, future = coalescer.acquire("key")
+    assert is_leader is False
+    waiter = asyncio.create_task(coalescer.wait(key="key", future=future))
+    await asyncio.sleep(0)
+    assert coalescer.has_waiters("key")
+
+    coalescer.release(key="key", future=leader_future, value="result")
+    assert await waiter == "result"
+    assert coalescer.acquire("key")[0] is True
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_coalescer_waiters_time_out():
+    coalescer = CacheMissCoalescer(namespace="test_cache_miss_timeout", timeout=0.01)
+    coalescer.acquire("key")
+    _, future = coalescer.acquire("key")
+
+    assert await coalescer.wait(key="key", future=future) is None
+    # the stale leader no longer blocks the key
+    assert coalescer.acquire("key")[0] is True
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_coalesces_concurrent_redis_gets():
+    redis_cache = MagicMock(spec=RedisCache)
+
+    async def redis_get(key, **kwargs):
+        await asyncio.sleep(0.01)
+        return "redis_value"
+
+    redis_cache.async_get_cache = AsyncMock(side_effect=redis_get)
+    dual_cache = DualCache(redis_cache=redis_cache)
+
+    results = await asyncio.gather(
+        *[dual_cache.async_get_cache("key") for _ in range(10)]
+    )
+
+    assert results == ["redis_value"] * 10
+    assert redis_cache.async_get_cache.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_acompletion_coalesces_cache_misses():
+    litellm.cache = Cache(type="local", coalesce_cache_misses=True)
+    try:
+        responses = await asyncio.gather(
+            *[
+                litellm.acompletion(
+                    model="gpt-4o",
+                    messages=[{"role": "user", "content": "coalesce me"}],
+                    mock_response="hello",
+                    mock_delay=0.05,
+                )
+                for _ in range(5)
+            ]
+        )
+    finally:
+        litellm.cache = None
+
+    assert all(r.choices[0].message.content == "hello" for r in responses)
+    cache_hits = [r._hidden_params.get("cache_hit") is True for r in responses]
+    assert cache_hits.count(False) == 1
+
+
+@pytest.mark.asyncio
+async def test_acompletion_cancelled_leader_releases_waiters():
+    """
+    A cancelled leader (e.g. client disconnect) must release its waiters - they make their own LLM call
+    instead of waiting for CACHE_MISS_COALESCE_TIMEOUT_SECONDS
+    """
+    litellm.cache = Cache(type="local", coalesce_cache_misses=True)
+    messages = [{"role": "user", "content": "cancel the leader"}]
+    try:
+        leader = asyncio.create_task(
+            litellm.acompletion(
+                model="gpt-4o", messages=messages, mock_response="hello", mock_delay=5
+            )
+        )
+        await asyncio.sleep(0.1)
+        waiter = asyncio.create_task(
+            litellm.acompletion(
+                model="gpt-4o", messages=messages, mock_response="hello"
+            )
+        )
+        await asyncio.sleep(0.1)
+        leader.cancel()
+        response = await asyncio.wait_for(waiter, timeout=2)
+    finally:
+        litellm.cache = None
+
+    assert leader.cancelled()
+    assert response.choices[0].message.content == "hello"
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from openai import AsyncOpenAI, AsyncStream
+from openai.types.chat import ChatCompletionChunk
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.litellm_logging import Logging
+from litellm.litellm_core_utils.sse_passthrough import IncrementalSSEParser
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.types.utils import ModelResponse
+
+
+def _sse_event(data: dict) -> bytes:
+    return f"data: {json.dumps(data)}\n\n".encode()
+
+
+def _sse_chunk(delta: dict, finish_reason=None, usage=None) -> dict:
+    return {
+        "id": "chatcmpl-123",
+        "object": "chat.completion.chunk",
+        "created": 1742056047,
+        "model": "gpt-4o-2024-08-06",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        "usage": usage,
+    }
+
+
+SSE_BODY = (
+    _sse_event(_sse_chunk({"role": "assistant", "content": ""}))
+    + _sse_event(_sse_chunk({"content": "Hello"}))
+    + _sse_event(_sse_chunk({"content": " world"}))
+    + _sse_event(_sse_chunk({}, finish_reason="stop"))
+    + _sse_event(
+        {
+            **_sse_chunk({}),
+            "choices": [],
+            "usage": {"prompt_tokens": 8, "completion_tokens": 2, "total_tokens": 10},
+        }
+    )
+    + b"data: [DONE]\n\n"
+)
+
+
+def test_incremental_sse_parser_split_lines():
+    """Test that lines split across network chunks are parsed once complete"""
+    sse_parser = IncrementalSSEParser()
+    for i in range(0, len(SSE_BODY), 7):
+        sse_parser.feed(SSE_BODY[i : i + 7])
+    sse_parser.close()
+
+    assert sse_parser.content_parts == ["Hello", " world"]
+    assert sse_parser.finish_reason == "stop"
+    assert sse_parser.usage == {
+        "prompt_tokens": 8,
+        "completion_tokens": 2,
+        "total_tokens": 10,
+    }
+
+    model_response = sse_parser.build_model_response(model="gpt-4o", messages=[])
+    assert model_response.id == "chatcmpl-123"
+    assert model_response.model == "gpt-4o-2024-08-06"
+    assert model_response.choices[0].message.content == "Hello world"
+    assert model_response.choices[0].finish_reason == "stop"
+    assert model_response.usage.total_tokens == 10
+
+
+def test_incremental_sse_parser_tool_calls_and_counted_usage():
+    """Test that tool call deltas are merged, and usage is counted if the upstream didn't send it"""
+    sse_parser = IncrementalSSEParser()
+    sse_parser.feed(
+        _sse_event(
+            _sse_chunk(
+                {
+                    "tool_calls": [
+                        {
+                            "index": 0,
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "get_weather", "arguments": '{"ci'},
+                        }
+                    ]
+                }
+            )
+        )
+        + _sse_event(
+            _sse_chunk(
+                {"tool_calls": [{"index": 0, "function": {"arguments": 'ty": "SF"}'}}]}
+            )
+        )
+        + b": keep-alive comment\n\n"
+        + _sse_event(_sse_chunk({}, finish_reason="tool_calls"))
+    )
+    sse_parser.close()
+
+    model_response = sse_parser.build_model_response(
+        model="gpt-4o", messages=[{"role": "user", "content": "weather in SF?"}]
+    )
+    tool_calls = model_response.choices[0].message.tool_calls
+    assert len(tool_calls) == 1
+    assert tool_calls[0].id == "call_1"
+    assert tool_calls[0].function.name == "get_weather"
+    assert tool_calls[0].function.arguments == '{"city": "SF"}'
+    assert model_response.choices[0].finish_reason == "tool_calls"
+    assert model_response.usage.prompt_tokens > 0
+    assert model_response.usage.completion_tokens > 0
+
+
+@pytest.mark.asyncio
+async def test_custom_stream_wrapper_aiter_raw_sse():
+    """Test that the raw bytes are forwarded as is, and the complete response is logged"""
+    logging_obj = Logging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    completion_stream = AsyncStream(
+        cast_to=ChatCompletionChunk,
+        response=httpx.Response(200, content=SSE_BODY),
+        client=AsyncOpenAI(api_key="fake"),
+    )
+    stream = CustomStreamWrapper(
+        completion_stream=completion_stream,
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+    assert stream.supports_raw_sse_passthrough() is True
+
+    with patch.object(logging_obj, "async_success_handler") as mock_success_handler:
+        raw_bytes = b""
+        async for chunk in stream.aiter_raw_sse():
+            raw_bytes += chunk
+        await asyncio.sleep(0.1)
+
+    assert raw_bytes == SSE_BODY
+    assert logging_obj.completion_start_time is not None
+    mock_success_handler.assert_called_once()
+    complete_response = mock_success_handler.call_args.args[0]
+    assert isinstance(complete_response, ModelResponse)
+    assert complete_response.choices[0].message.content == "Hello world"
+    assert complete_response.usage.total_tokens == 10
+
+
+def test_supports_raw_sse_passthrough_only_for_unread_openai_streams():
+    stream = CustomStreamWrapper(
+        completion_stream=iter([]),
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=MagicMock(),
+    )
+    assert stream.supports_raw_sse_passthrough() is False
+
+    stream.completion_stream = AsyncStream(
+        cast_to=ChatCompletionChunk,
+        response=httpx.Response(200, content=SSE_BODY),
+        client=AsyncOpenAI(api_key="fake"),
+    )
+    assert stream.supports_raw_sse_passthrough() is True
+
+    stream.sent_first_chunk = True
+    assert stream.supports_raw_sse_passthrough() is False
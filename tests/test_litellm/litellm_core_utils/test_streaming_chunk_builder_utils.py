@@ -405,4 +405,76 @@ def test_stream_chunk_builder_anthropic_web_search():
     assert usage.prompt_tokens == 50
     assert usage.completion_tokens == 27
     assert usage.total_tokens == 77    
-    assert usage.server_tool_use['web_search_requests'] == 2
\ No newline at end of file
+    assert usage.server_tool_use['web_search_requests'] == 2
+
+def test_streaming_response_assembler():
+    """
+    Test that StreamingResponseAssembler folds content, tool call arguments, reasoning and usage
+    as the chunks arrive - the same as building from all the chunks at the end.
+    """
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingResponseAssembler,
+    )
+
+    def _chunk(delta: Delta, finish_reason=None, usage=None) -> ModelResponseStream:
+        chunk = ModelResponseStream(
+            id="chatcmpl-assembler",
+            created=1745513206,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+            choices=[StreamingChoices(finish_reason=finish_reason, index=0, delta=delta)],
+        )
+        if usage is not None:
+            setattr(chunk, "usage", usage)
+        return chunk
+
+    chunks = [
+        _chunk(Delta(role="assistant", reasoning_content="Think")),
+        _chunk(Delta(reasoning_content="ing")),
+        _chunk(Delta(content="Hello")),
+        _chunk(Delta(content=" world")),
+        _chunk(
+            Delta(
+                tool_calls=[
+                    ChatCompletionDeltaToolCall(
+                        id="call_1",
+                        function=Function(arguments='{"ci', name="get_weather"),
+                        type="function",
+                        index=0,
+                    )
+                ]
+            )
+        ),
+        _chunk(
+            Delta(
+                tool_calls=[
+                    ChatCompletionDeltaToolCall(
+                        function=Function(arguments='ty": "SF"}'), index=0
+                    )
+                ]
+            )
+        ),
+        _chunk(
+            Delta(),
+            finish_reason="tool_calls",
+            usage=Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        ),
+    ]
+
+    stream_assembler = StreamingResponseAssembler(messages=[])
+    for chunk in chunks:
+        stream_assembler.add_chunk(chunk)
+    response = stream_assembler.build_response()
+
+    processor = ChunkProcessor(chunks=chunks)
+    assert response.id == "chatcmpl-assembler"
+    assert response.choices[0].finish_reason == "tool_calls"
+    message = response.choices[0].message
+    assert message.content == processor.get_combined_content(chunks) == "Hello world"
+    assert message.reasoning_content == "Thinking"
+    assert message.tool_calls[0].id == "call_1"
+    assert message.tool_calls[0].function.name == "get_weather"
+    assert message.tool_calls[0].function.arguments == '{"city": "SF"}'
+    assert response.usage.prompt_tokens == 10
+    assert response.usage.completion_tokens == 5
+    assert stream_assembler.num_chunks == len(chunks)
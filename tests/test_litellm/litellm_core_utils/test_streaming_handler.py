@@ -1162,3 +1162,109 @@ def test_is_chunk_non_empty_with_valid_tool_calls(
         )
         is True
     )
+
+
+def _content_chunks(contents: list) -> list:
+    return [
+        ModelResponseStream(
+            id="chatcmpl-1",
+            created=1742056047,
+            model=None,
+            object="chat.completion.chunk",
+            choices=[
+                StreamingChoices(
+                    finish_reason=None, index=0, delta=Delta(content=content)
+                )
+            ],
+        )
+        for content in contents
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_handler_tracks_response_uptil_now(logging_obj: Logging):
+    """Test that the response so far is accumulated and post-call rules see it on every chunk"""
+    seen_by_rules = []
+
+    def my_post_call_rule(input: str):
+        seen_by_rules.append(input)
+        return True
+
+    with patch.object(litellm, "post_call_rules", [my_post_call_rule]):
+        response = CustomStreamWrapper(
+            completion_stream=ModelResponseListIterator(
+                model_responses=_content_chunks(["Hello", " world", "!"])
+            ),
+            model="gpt-4o",
+            custom_llm_provider="cached_response",
+            logging_obj=logging_obj,
+        )
+        async for _ in response:
+            pass
+
+    assert response.response_uptil_now == "Hello world!"
+    assert seen_by_rules[:3] == ["Hello", "Hello world", "Hello world!"]
+
+    response.response_uptil_now = ""
+    assert response.response_uptil_now == ""
+
+
+def test_safety_checker_repeated_chunks(
+    initialized_custom_stream_wrapper: CustomStreamWrapper,
+):
+    """Test that the safety checker raises only when the last n chunks have the same content"""
+    limit = litellm.REPEATED_STREAMING_CHUNK_LIMIT
+    initialized_custom_stream_wrapper.chunks = _content_chunks(
+        ["different"] + ["repeat"] * (limit - 1)
+    )
+    initialized_custom_stream_wrapper.safety_checker()
+
+    # short content is ignored
+    initialized_custom_stream_wrapper.chunks = _content_chunks(["ok"] * limit)
+    initialized_custom_stream_wrapper.safety_checker()
+
+    initialized_custom_stream_wrapper.chunks = _content_chunks(
+        ["different"] + ["repeat"] * limit
+    )
+    with pytest.raises(litellm.InternalServerError, match="repeat"):
+        initialized_custom_stream_wrapper.safety_checker()
+
+
+def test_print_verbose_formats_lazily(capsys):
+    """Test that print_verbose only formats its args when verbose logging is on"""
+    from litellm.litellm_core_utils.streaming_handler import print_verbose
+
+    formatted = MagicMock()
+    formatted.__str__ = Mock(return_value="chunk")
+    with patch.object(litellm, "set_verbose", False):
+        print_verbose("Raw chunk: %s", formatted)
+    formatted.__str__.assert_not_called()
+
+    with patch.object(litellm, "set_verbose", True):
+        print_verbose("Raw chunk: %s", formatted)
+    assert "Raw chunk: chunk" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_streaming_handler_keeps_only_recent_chunks(logging_obj: Logging):
+    """Test that a long stream doesn't keep every chunk, and the complete response is still built"""
+    contents = [f"word{i} " for i in range(litellm.REPEATED_STREAMING_CHUNK_LIMIT * 10)]
+    with patch.object(logging_obj, "async_success_handler") as mock_success_handler:
+        response = CustomStreamWrapper(
+            completion_stream=ModelResponseListIterator(
+                model_responses=_content_chunks(contents)
+            ),
+            model="gpt-4o",
+            custom_llm_provider="cached_response",
+            logging_obj=logging_obj,
+        )
+        async for _ in response:
+            assert len(response.chunks) <= litellm.REPEATED_STREAMING_CHUNK_LIMIT
+        await asyncio.sleep(0.1)
+
+    assert response.stream_assembler.num_chunks >= len(contents)
+    mock_success_handler.assert_called_once()
+    complete_response = mock_success_handler.call_args.kwargs.get(
+        "result", mock_success_handler.call_args.args[0]
+    )
+    assert complete_response.choices[0].message.content == "".join(contents)
@@ -897,3 +897,240 @@ def test_token_counter_with_image_url():
     except ValueError as e:
         assert "Invalid detail value" in str(e), f"Expected detail validation error, got: {e}"
 
+
+
+def test_token_counter_caches_per_message_counts():
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    token_counter_module.message_token_count_cache.clear()
+    conversation = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "What is the capital of France?"},
+    ]
+    expected = token_counter_new(model="gpt-4o", messages=conversation)
+
+    with patch.object(
+        token_counter_module,
+        "_count_message",
+        wraps=token_counter_module._count_message,
+    ) as mock_count_message:
+        # same prompt - nothing is re-tokenized
+        assert token_counter_new(model="gpt-4o", messages=conversation) == expected
+        assert mock_count_message.call_count == 0
+
+        # conversation grew by one message - only the new message is tokenized
+        conversation = conversation + [{"role": "assistant", "content": "Paris."}]
+        num_tokens = token_counter_new(model="gpt-4o", messages=conversation)
+        assert mock_count_message.call_count == 1
+
+    token_counter_module.message_token_count_cache.clear()
+    assert num_tokens == token_counter_new(model="gpt-4o", messages=conversation)
+
+
+def test_token_counter_many():
+    """token_counter_many returns what token_counter returns for each text / message list"""
+    from litellm.litellm_core_utils.token_counter import token_counter_many
+
+    messages_list = [[pair["message"]] for pair in MESSAGES_TEXT]
+    assert token_counter_many(model="gpt-35-turbo", messages_list=messages_list) == [
+        pair["count"] for pair in MESSAGES_TEXT
+    ]
+
+    tools_pair = MESSAGES_WITH_TOOLS[0]
+    tool_kwargs = {"tools": tools_pair["tools"], "tool_choice": tools_pair["tool_choice"]}
+    assert token_counter_many(
+        model="gpt-35-turbo",
+        messages_list=[[tools_pair["system_message"]]],
+        **tool_kwargs,
+    ) == [
+        token_counter_new(
+            model="gpt-35-turbo", messages=[tools_pair["system_message"]], **tool_kwargs
+        )
+    ]
+
+    texts = ["Hello, how are you?", "á", "", "Hello, how are you?"]
+    assert token_counter_many(model="gpt-4o", texts=texts) == [
+        token_counter_new(model="gpt-4o", text=text) for text in texts
+    ]
+
+    with pytest.raises(ValueError):
+        token_counter_many(model="gpt-4o", texts=texts, messages_list=messages_list)
+
+
+@pytest.mark.asyncio
+async def test_atoken_counter_many():
+    from litellm.litellm_core_utils.token_counter import (
+        atoken_counter,
+        atoken_counter_many,
+    )
+
+    messages = [{"role": "user", "content": "Hello, how are you?"}]
+    expected = token_counter_new(model="gpt-4o", messages=messages)
+    assert await atoken_counter(model="gpt-4o", messages=messages) == expected
+    assert await atoken_counter_many(
+        model="gpt-4o", messages_list=[messages, messages]
+    ) == [expected, expected]
+
+
+def test_select_tokenizer_loads_custom_tokenizer_once():
+    from litellm.utils import _select_custom_tokenizer_helper, _select_tokenizer
+
+    _select_custom_tokenizer_helper.cache_clear()
+    custom_tokenizer = {
+        "identifier": "my-org/my-tokenizer",
+        "revision": "main",
+        "auth_token": None,
+    }
+    with patch(
+        "litellm.utils.create_pretrained_tokenizer",
+        return_value={"type": "huggingface_tokenizer", "tokenizer": MagicMock()},
+    ) as mock_create_pretrained_tokenizer:
+        first = _select_tokenizer(model="my-model", custom_tokenizer=custom_tokenizer)
+        second = _select_tokenizer(model="my-model", custom_tokenizer=custom_tokenizer)
+
+    assert first is second
+    mock_create_pretrained_tokenizer.assert_called_once()
+    _select_custom_tokenizer_helper.cache_clear()
+
+
+def _png_image(width: int, height: int, num_bytes: int) -> bytes:
+    import struct
+
+    header = (
+        b"\x89PNG\r\n\x1a\n"
+        + b"\x00\x00\x00\rIHDR"
+        + struct.pack(">LL", width, height)
+        + b"\x08\x06\x00\x00\x00"
+    )
+    return header + b"\x00" * (num_bytes - len(header))
+
+
+def test_get_image_dimensions_decodes_only_base64_header():
+    import base64
+
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    data = "data:image/png;base64," + base64.b64encode(
+        _png_image(width=1024, height=768, num_bytes=1024 * 1024)
+    ).decode("utf-8")
+
+    with patch.object(
+        token_counter_module.base64,
+        "b64decode",
+        wraps=token_counter_module.base64.b64decode,
+    ) as mock_b64decode:
+        assert token_counter_module.get_image_dimensions(data=data) == (1024, 768)
+        # the first slice of the base64 has the dimensions - the rest isn't decoded
+        assert mock_b64decode.call_count == 1
+        assert (
+            len(mock_b64decode.call_args.args[0])
+            < 2 * token_counter_module.IMAGE_DIMENSION_PROBE_BYTES
+        )
+
+
+@pytest.mark.parametrize(
+    "img_data, expected",
+    [
+        (b"GIF89a" + bytes([0x40, 0x01, 0xF0, 0x00]) + b"\x00" * 10, (320, 240)),
+        (
+            b"\xff\xd8"
+            + b"\xff\xe0\x00\x10"
+            + b"\x00" * 14
+            + b"\xff\xc0\x00\x11\x08\x01\xe0\x02\x80"
+            + b"\x00" * 12,
+            (640, 480),
+        ),
+        (
+            b"RIFF\x00\x00\x00\x00WEBPVP8X"
+            + b"\x00" * 8
+            + (99).to_bytes(3, "little")
+            + (49).to_bytes(3, "little"),
+            (100, 50),
+        ),
+    ],
+)
+def test_image_header_reader(img_data, expected):
+    from litellm.litellm_core_utils.token_counter import (
+        _ImageHeaderReader,
+        _parse_image_dimensions,
+    )
+
+    # cut off header - dimensions not found yet
+    assert _parse_image_dimensions(img_data[:8]) is None
+
+    image_header_reader = _ImageHeaderReader()
+    for i in range(0, len(img_data), 5):
+        image_header_reader.feed(img_data[i : i + 5])
+    image_header_reader.close()
+    assert image_header_reader.dimensions == expected
+
+
+def test_get_image_dimensions_url_uses_range_request():
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    token_counter_module.image_dimensions_cache.clear()
+    image_url = "https://example.com/image.png"
+    image = _png_image(width=512, height=256, num_bytes=64 * 1024)
+
+    mock_response = MagicMock()
+    mock_response.iter_bytes.return_value = iter(
+        [image[i : i + 1024] for i in range(0, len(image), 1024)]
+    )
+    mock_client = MagicMock()
+    mock_client.client.stream.return_value.__enter__.return_value = mock_response
+
+    with patch.object(
+        token_counter_module, "_get_httpx_client", return_value=mock_client
+    ):
+        assert token_counter_module.get_image_dimensions(data=image_url) == (512, 256)
+        assert token_counter_module.get_image_dimensions(data=image_url) == (512, 256)
+
+    mock_client.client.stream.assert_called_once()
+    assert mock_client.client.stream.call_args.kwargs["headers"] == {
+        "Range": f"bytes=0-{token_counter_module.IMAGE_DIMENSION_PROBE_MAX_BYTES - 1}"
+    }
+    # stopped reading once the dimensions were found
+    assert next(mock_response.iter_bytes.return_value, None) is not None
+    token_counter_module.image_dimensions_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_atoken_counter_prefetches_image_dimensions():
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    token_counter_module.image_dimensions_cache.clear()
+    token_counter_module.message_token_count_cache.clear()
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"https://example.com/image_{i}.png",
+                        "detail": "high",
+                    },
+                }
+                for i in range(3)
+            ],
+        }
+    ]
+
+    with patch.object(
+        token_counter_module,
+        "_aread_image_url_dimensions",
+        new=AsyncMock(return_value=(1024, 1024)),
+    ) as mock_aread_image_url_dimensions, patch.object(
+        token_counter_module, "_read_image_url_dimensions"
+    ) as mock_read_image_url_dimensions:
+        num_tokens = await token_counter_module.atoken_counter(
+            model="gpt-4o", messages=messages
+        )
+
+    assert mock_aread_image_url_dimensions.await_count == 3
+    # counting the messages found the dimensions in the cache
+    mock_read_image_url_dimensions.assert_not_called()
+    token_counter_module.message_token_count_cache.clear()
+    assert num_tokens == token_counter_new(model="gpt-4o", messages=messages)
+    token_counter_module.image_dimensions_cache.clear()
+    token_counter_module.message_token_count_cache.clear()
@@ -3036,3 +3036,46 @@ def test_get_image_root_case_uses_current_dir(monkeypatch):
 
         # Verify FileResponse was called
         assert mock_file_response.called, "FileResponse should be called"
+
+
+@pytest.mark.asyncio
+async def test_async_data_generator_raw_sse_passthrough(monkeypatch):
+    """
+    Test async_data_generator forwards the upstream's raw SSE bytes when litellm.enable_sse_passthrough is set
+    """
+    from litellm.proxy._types import UserAPIKeyAuth
+    from litellm.proxy.proxy_server import async_data_generator
+    from litellm.proxy.utils import ProxyLogging
+
+    raw_chunks = [b'data: {"id": "1", "choices": []}\n\n', b"data: [DONE]\n\n"]
+
+    async def mock_aiter_raw_sse():
+        for chunk in raw_chunks:
+            yield chunk
+
+    mock_response = MagicMock(spec=litellm.CustomStreamWrapper)
+    mock_response.supports_raw_sse_passthrough.return_value = True
+    mock_response.aiter_raw_sse = mock_aiter_raw_sse
+    mock_proxy_logging_obj = MagicMock(spec=ProxyLogging)
+    mock_proxy_logging_obj.has_streaming_hooks.return_value = False
+
+    monkeypatch.setattr(litellm, "enable_sse_passthrough", True)
+    with patch("litellm.proxy.proxy_server.proxy_logging_obj", mock_proxy_logging_obj):
+        yielded_data = [
+            data
+            async for data in async_data_generator(
+                mock_response, MagicMock(spec=UserAPIKeyAuth), {"model": "gpt-4o"}
+            )
+        ]
+
+        assert yielded_data == raw_chunks
+        streaming_iterator_hook = (
+            mock_proxy_logging_obj.async_post_call_streaming_iterator_hook
+        )
+        streaming_iterator_hook.assert_not_called()
+
+        # a streaming hook needs the chunk objects
+        mock_proxy_logging_obj.has_streaming_hooks.return_value = True
+        from litellm.proxy.proxy_server import _should_passthrough_raw_sse
+
+        assert _should_passthrough_raw_sse(mock_response) is False
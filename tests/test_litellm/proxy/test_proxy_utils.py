@@ -132,3 +132,34 @@ def test_join_paths_nested_path():
     """Test path joining with nested paths"""
     result = join_paths(base_path="http://0.0.0.0:4000/v1", route="chat/completions")
     assert result == "http://0.0.0.0:4000/v1/chat/completions"
+
+
+def test_has_streaming_hooks(monkeypatch):
+    """Test that only callbacks reading / modifying stream chunks disable raw SSE passthrough"""
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy.hooks.responses_id_security import ResponsesIDSecurity
+
+    class LoggingOnlyCallback(CustomLogger):
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            pass
+
+    class ChunkModifyingCallback(CustomLogger):
+        async def async_post_call_streaming_iterator_hook(
+            self, user_api_key_dict, response, request_data
+        ):
+            async for chunk in response:
+                yield chunk
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    monkeypatch.setattr(
+        litellm, "callbacks", [LoggingOnlyCallback(), ResponsesIDSecurity()]
+    )
+    assert proxy_logging_obj.has_streaming_hooks() is False
+
+    monkeypatch.setattr(
+        litellm, "callbacks", [LoggingOnlyCallback(), ChunkModifyingCallback()]
+    )
+    assert proxy_logging_obj.has_streaming_hooks() is True
@@ -0,0 +1,227 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.caching import DualCache
+from litellm.router_strategy.least_outstanding_requests import (
+    LeastOutstandingRequestsLoggingHandler,
+)
+
+
+def _deployment(deployment_id: str) -> dict:
+    return {
+        "model_name": "gpt-4o",
+        "litellm_params": {"model": "gpt-4o"},
+        "model_info": {"id": deployment_id},
+    }
+
+
+def _kwargs(deployment_id: str, call_id: str) -> dict:
+    return {
+        "litellm_call_id": call_id,
+        "litellm_params": {
+            "metadata": {"model_group": "gpt-4o"},
+            "model_info": {"id": deployment_id},
+        },
+    }
+
+
+def _log_success(handler, deployment_id: str, call_id: str, seconds: float):
+    start_time = datetime.now()
+    handler.log_success_event(
+        kwargs=_kwargs(deployment_id, call_id),
+        response_obj=None,
+        start_time=start_time,
+        end_time=start_time + timedelta(seconds=seconds),
+    )
+
+
+@pytest.mark.asyncio
+async def test_in_flight_requests_are_counted_once_per_call():
+    handler = LeastOutstandingRequestsLoggingHandler(router_cache=DualCache())
+    handler.log_pre_api_call(model=None, messages=None, kwargs=_kwargs("a", "1"))
+    handler.log_pre_api_call(model=None, messages=None, kwargs=_kwargs("a", "1"))
+    handler.log_pre_api_call(model=None, messages=None, kwargs=_kwargs("a", "2"))
+    assert handler.get_outstanding_requests("a") == 2
+
+    # sync + async success events for the same call
+    _log_success(handler, "a", "1", seconds=2)
+    start_time = datetime.now()
+    await handler.async_log_success_event(
+        kwargs=_kwargs("a", "1"),
+        response_obj=None,
+        start_time=start_time,
+        end_time=start_time + timedelta(seconds=2),
+    )
+    assert handler.get_outstanding_requests("a") == 1
+
+    await handler.async_log_failure_event(
+        kwargs=_kwargs("a", "2"),
+        response_obj=None,
+        start_time=start_time,
+        end_time=start_time,
+    )
+    assert handler.get_outstanding_requests("a") == 0
+    assert handler.latency["a"] == pytest.approx(2.0)  # failures don't update latency
+
+
+def test_stale_in_flight_requests_are_dropped():
+    handler = LeastOutstandingRequestsLoggingHandler(
+        router_cache=DualCache(), routing_args={"stale_request_seconds": 10}
+    )
+    handler.log_pre_api_call(model=None, messages=None, kwargs=_kwargs("a", "1"))
+    handler.in_flight["a"]["1"] = (handler.in_flight["a"]["1"][0] - 60, False)
+    handler._last_stale_sweep -= 60
+    handler.log_pre_api_call(model=None, messages=None, kwargs=_kwargs("a", "2"))
+    assert list(handler.in_flight["a"]) == ["2"]
+
+
+@pytest.mark.asyncio
+async def test_stale_in_flight_requests_are_decremented_in_redis():
+    redis_cache = MagicMock()
+    redis_cache.async_increment_pipeline = AsyncMock()
+    router_cache = DualCache()
+    router_cache.redis_cache = redis_cache
+    handler = LeastOutstandingRequestsLoggingHandler(
+        router_cache=router_cache, routing_args={"stale_request_seconds": 10}
+    )
+    for call_id in ("1", "2"):
+        handler.log_pre_api_call(
+            model=None, messages=None, kwargs=_kwargs("a", call_id)
+        )
+    for call_id, (started_at, counted_in_redis) in handler.in_flight["a"].items():
+        handler.in_flight["a"][call_id] = (started_at - 60, counted_in_redis)
+    handler._last_stale_sweep -= 60
+
+    handler.log_pre_api_call(model=None, messages=None, kwargs=_kwargs("a", "3"))
+    await asyncio.sleep(0)
+    assert list(handler.in_flight["a"]) == ["3"]
+    redis_cache.async_increment_pipeline.assert_any_await(
+        increment_list=[
+            {"key": "a_outstanding_requests", "increment_value": -2, "ttl": 10}
+        ]
+    )
+
+
+def test_picks_better_of_two_by_latency_weighted_outstanding_requests():
+    handler = LeastOutstandingRequestsLoggingHandler(router_cache=DualCache())
+    fast, slow = _deployment("fast"), _deployment("slow")
+    _log_success(handler, "fast", "0", seconds=1)
+    _log_success(handler, "slow", "0", seconds=4)
+    for i in range(2):
+        handler.log_pre_api_call(
+            model=None, messages=None, kwargs=_kwargs("fast", f"{i + 1}")
+        )
+
+    with patch(
+        "litellm.router_strategy.least_outstanding_requests.random.sample",
+        return_value=[fast, slow],
+    ):
+        # (2 + 1) * 1s < (0 + 1) * 4s
+        assert handler.get_available_deployments("gpt-4o", [fast, slow]) is fast
+        for i in range(2):
+            handler.log_pre_api_call(
+                model=None, messages=None, kwargs=_kwargs("fast", f"{i + 3}")
+            )
+        # (4 + 1) * 1s > (0 + 1) * 4s
+        assert handler.get_available_deployments("gpt-4o", [fast, slow]) is slow
+
+    # deployments without a latency are compared by in-flight requests only
+    new = _deployment("new")
+    with patch(
+        "litellm.router_strategy.least_outstanding_requests.random.sample",
+        return_value=[fast, new],
+    ):
+        assert handler.get_available_deployments("gpt-4o", [fast, new]) is new
+    assert handler.get_available_deployments("gpt-4o", [new]) is new
+    assert handler.get_available_deployments("gpt-4o", []) is None
+
+
+@pytest.mark.asyncio
+async def test_in_flight_counts_are_shared_through_redis():
+    redis_cache = MagicMock()
+    redis_cache.async_increment_pipeline = AsyncMock()
+    redis_cache.async_batch_get_cache = AsyncMock(
+        return_value={"a_outstanding_requests": "5", "b_outstanding_requests": None}
+    )
+    router_cache = DualCache()
+    router_cache.redis_cache = redis_cache
+    handler = LeastOutstandingRequestsLoggingHandler(router_cache=router_cache)
+
+    handler.log_pre_api_call(model=None, messages=None, kwargs=_kwargs("a", "1"))
+    # the background increment is referenced until it's done
+    assert len(handler._running_tasks) == 1
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)  # done callbacks run on the next loop iteration
+    assert handler._running_tasks == set()
+    # every update refreshes the ttl
+    redis_cache.async_increment_pipeline.assert_awaited_once_with(
+        increment_list=[
+            {"key": "a_outstanding_requests", "increment_value": 1, "ttl": 600}
+        ]
+    )
+
+    deployments = [_deployment("a"), _deployment("b")]
+    await handler.async_get_available_deployments("gpt-4o", deployments)
+    await handler.async_get_available_deployments("gpt-4o", deployments)
+    redis_cache.async_batch_get_cache.assert_awaited_once()  # within sync_interval
+    assert handler.get_outstanding_requests("a") == 5
+    assert handler.get_outstanding_requests("b") == 0
+
+    start_time = datetime.now()
+    await handler.async_log_success_event(
+        kwargs=_kwargs("a", "1"),
+        response_obj=None,
+        start_time=start_time,
+        end_time=start_time + timedelta(seconds=1),
+    )
+    redis_cache.async_increment_pipeline.assert_awaited_with(
+        increment_list=[
+            {"key": "a_outstanding_requests", "increment_value": -1, "ttl": 600}
+        ]
+    )
+    # other instances' requests are still counted until the next sync
+    assert handler.get_outstanding_requests("a") == 4
+
+
+@pytest.mark.asyncio
+async def test_router_least_outstanding_requests_routing():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "gpt-4o", "api_key": "fake-key"},
+                "model_info": {"id": deployment_id},
+            }
+            for deployment_id in ["1", "2"]
+        ],
+        routing_strategy="least-outstanding-requests",
+    )
+    handler = router.leastoutstanding_logger
+    assert isinstance(handler, LeastOutstandingRequestsLoggingHandler)
+    assert handler in litellm.input_callback
+
+    try:
+        for _ in range(4):
+            await router.acompletion(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "hi"}],
+                mock_response="hello",
+            )
+        await asyncio.sleep(0.1)
+        assert len(handler.latency) > 0 and set(handler.latency) <= {"1", "2"}
+        assert all(
+            handler.get_outstanding_requests(deployment_id) == 0
+            for deployment_id in ["1", "2"]
+        )
+    finally:
+        litellm.input_callback.remove(handler)
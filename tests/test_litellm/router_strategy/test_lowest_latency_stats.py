@@ -0,0 +1,224 @@
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.caching import DualCache
+from litellm.router_strategy.latency_stats import ModelGroupLatencyStats
+from litellm.router_strategy.lowest_latency import LowestLatencyLoggingHandler
+
+
+def _deployment(deployment_id: str, **litellm_params) -> dict:
+    return {
+        "model_name": "gpt-4o",
+        "litellm_params": {"model": "gpt-4o", "api_base": deployment_id, **litellm_params},
+        "model_info": {"id": deployment_id},
+    }
+
+
+def _success_kwargs(deployment_id: str, stream: bool = False) -> dict:
+    start_time = datetime.now()
+    return {
+        "litellm_params": {
+            "metadata": {"model_group": "gpt-4o"},
+            "model_info": {"id": deployment_id},
+        },
+        "stream": stream,
+        "completion_start_time": start_time + timedelta(seconds=0.5),
+    }
+
+
+def _response(completion_tokens: int = 10) -> litellm.ModelResponse:
+    return litellm.ModelResponse(
+        usage=litellm.Usage(
+            prompt_tokens=5,
+            completion_tokens=completion_tokens,
+            total_tokens=5 + completion_tokens,
+        )
+    )
+
+
+def test_latency_stats_ewma_and_ttft_tracked_separately():
+    stats = ModelGroupLatencyStats(alpha=0.5, max_samples=10)
+    stats.record("a", latency=1.0, time_to_first_token=None, total_tokens=10, minute="m1")
+    stats.record("a", latency=3.0, time_to_first_token=0.2, total_tokens=10, minute="m1")
+
+    now = time.time()
+    assert stats.get("a", stream=False, ttl=60, now=now) == (2.0, 20, 2)
+    assert stats.get("a", stream=True, ttl=60, now=now)[0] == 0.2
+    # unknown / stale deployments have latency 0, so they are tried
+    assert stats.get("b", stream=False, ttl=60, now=now) == (0.0, 0, 0)
+    assert stats.get("a", stream=False, ttl=60, now=now + 120)[0] == 0.0
+
+    stats.roll_minute("m2")
+    assert stats.get("a", stream=False, ttl=60, now=now)[1:] == (0, 0)
+
+
+def test_latency_stats_remote_summaries():
+    local = ModelGroupLatencyStats(alpha=0.5, max_samples=10)
+    local.record("a", latency=1.0, time_to_first_token=None, total_tokens=0, minute="m")
+
+    remote = ModelGroupLatencyStats(alpha=0.5, max_samples=10)
+    for _ in range(3):
+        remote.record("a", latency=5.0, time_to_first_token=0.5, total_tokens=0, minute="m")
+    remote.record("b", latency=2.0, time_to_first_token=None, total_tokens=0, minute="m")
+
+    local.set_remote_summaries([remote.to_summary()], ttl=60)
+    now = time.time()
+    # weighted by sample counts: (1 * 1.0 + 3 * 5.0) / 4
+    assert local.get("a", stream=False, ttl=60, now=now)[0] == pytest.approx(4.0)
+    assert local.get("a", stream=True, ttl=60, now=now)[0] == pytest.approx(0.5)
+    assert local.get("b", stream=False, ttl=60, now=now)[0] == pytest.approx(2.0)
+    # combined at read time - the local stats / published summary stay local
+    assert set(local.to_summary()) == {"a"}
+    assert local.to_summary()["a"][0] == pytest.approx(1.0)
+
+    # replaced, not accumulated, on the next sync
+    for _ in range(2):
+        local.set_remote_summaries([remote.to_summary()], ttl=60)
+    assert local.get("a", stream=False, ttl=60, now=now)[0] == pytest.approx(4.0)
+    local.set_remote_summaries([], ttl=60)
+    assert local.get("a", stream=False, ttl=60, now=now)[0] == pytest.approx(1.0)
+    assert local.get("b", stream=False, ttl=60, now=now)[0] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_ewma_latency_routing_picks_lowest_latency():
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(), routing_args={"latency_stats": "ewma"}
+    )
+    deployments = [_deployment("fast"), _deployment("slow"), _deployment("new")]
+    start_time = datetime.now()
+    for deployment_id, seconds in [("fast", 1), ("slow", 5)]:
+        await handler.async_log_success_event(
+            kwargs=_success_kwargs(deployment_id),
+            response_obj=_response(),
+            start_time=start_time,
+            end_time=start_time + timedelta(seconds=seconds),
+        )
+    assert handler.router_cache.get_cache(key="gpt-4o_map") is None  # no raw lists
+
+    # a deployment without stats is tried first
+    picked = await handler.async_get_available_deployments(
+        model_group="gpt-4o", healthy_deployments=deployments
+    )
+    assert picked["model_info"]["id"] == "new"
+
+    request_kwargs: dict = {"metadata": {}}
+    picked = handler.get_available_deployments(
+        model_group="gpt-4o",
+        healthy_deployments=deployments[:2],
+        request_kwargs=request_kwargs,
+    )
+    assert picked["model_info"]["id"] == "fast"
+    assert request_kwargs["metadata"]["_latency_per_deployment"] == {
+        "fast": pytest.approx(0.1),
+        "slow": pytest.approx(0.5),
+    }
+
+
+@pytest.mark.asyncio
+async def test_ewma_latency_routing_respects_rpm_and_timeouts():
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(), routing_args={"latency_stats": "ewma"}
+    )
+    deployments = [_deployment("a", rpm=1), _deployment("b")]
+    start_time = datetime.now()
+    for deployment_id in ["a", "b"]:
+        await handler.async_log_success_event(
+            kwargs=_success_kwargs(deployment_id),
+            response_obj=_response(),
+            start_time=start_time,
+            end_time=start_time + timedelta(seconds=1),
+        )
+    # "a" is at its rpm limit
+    picked = await handler.async_get_available_deployments(
+        model_group="gpt-4o", healthy_deployments=deployments
+    )
+    assert picked["model_info"]["id"] == "b"
+
+    await handler.async_log_failure_event(
+        kwargs={
+            **_success_kwargs("b"),
+            "exception": litellm.Timeout(
+                message="timeout", model="gpt-4o", llm_provider="openai"
+            ),
+        },
+        response_obj=None,
+        start_time=start_time,
+        end_time=start_time,
+    )
+    latency, _, _ = handler.latency_stats["gpt-4o"].get(
+        "b", stream=False, ttl=60, now=time.time()
+    )
+    assert latency > 100
+
+
+def test_power_of_two_choices_selection():
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(), routing_args={"selection": "power_of_two"}
+    )
+    candidates = [
+        (_deployment("a"), 3.0),
+        (_deployment("b"), 1.0),
+        (_deployment("c"), 2.0),
+    ]
+    with patch(
+        "litellm.router_strategy.lowest_latency.random.sample",
+        return_value=[candidates[0], candidates[2]],
+    ):
+        # the lower latency of the two sampled deployments - not the global minimum
+        assert handler._pick_deployment(candidates)["model_info"]["id"] == "c"
+    assert handler._pick_deployment([]) is None
+
+
+@pytest.mark.asyncio
+async def test_latency_summary_is_synced_through_redis():
+    redis_cache = MagicMock()
+    remote = ModelGroupLatencyStats(alpha=0.5, max_samples=10)
+    remote.record("other", latency=0.2, time_to_first_token=None, total_tokens=0, minute="m")
+    router_cache = DualCache()
+    router_cache.redis_cache = redis_cache
+
+    handler = LowestLatencyLoggingHandler(
+        router_cache=router_cache, routing_args={"latency_stats": "ewma"}
+    )
+    stale_own = ModelGroupLatencyStats(alpha=0.5, max_samples=10)
+    stale_own.record("local", latency=30.0, time_to_first_token=None, total_tokens=0, minute="m")
+    redis_cache.async_set_hash_field_and_get_all = AsyncMock(
+        return_value={
+            handler.instance_id: stale_own.to_summary(),
+            "other-instance": remote.to_summary(),
+        }
+    )
+    start_time = datetime.now()
+    for _ in range(2):  # second sync is skipped - within summary_sync_interval
+        await handler.async_log_success_event(
+            kwargs=_success_kwargs("local"),
+            response_obj=_response(),
+            start_time=start_time,
+            end_time=start_time + timedelta(seconds=1),
+        )
+
+    redis_cache.async_set_hash_field_and_get_all.assert_awaited_once()
+    call_kwargs = redis_cache.async_set_hash_field_and_get_all.call_args.kwargs
+    assert call_kwargs["key"] == "gpt-4o_latency_summary"
+    assert call_kwargs["field"] == handler.instance_id
+    # only this instance's own stats are published
+    assert set(call_kwargs["value"]) == {"local"}
+
+    stats = handler.latency_stats["gpt-4o"]
+    now = time.time()
+    assert stats.get("other", stream=False, ttl=60, now=now)[0] == pytest.approx(0.2)
+    # this instance's own (stale) entry in redis is skipped
+    assert stats.get("local", stream=False, ttl=60, now=now)[0] == pytest.approx(
+        stats.to_summary()["local"][0]
+    )
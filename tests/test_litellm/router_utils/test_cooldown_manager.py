@@ -0,0 +1,250 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm import Router
+from litellm.router_utils.cooldown_handlers import (
+    _async_get_cooldown_deployments,
+    _set_cooldown_deployments,
+)
+from litellm.router_utils.cooldown_manager import CooldownManager
+
+
+def _cooldown_cache(redis_cache=None) -> MagicMock:
+    cooldown_cache = MagicMock()
+    cooldown_cache.cache.redis_cache = redis_cache
+    cooldown_cache.cooldown_listeners = []
+    return cooldown_cache
+
+
+@pytest.mark.asyncio
+async def test_expiry_timer_closes_cooldown():
+    cooldown_manager = CooldownManager(cooldown_cache=_cooldown_cache())
+    cooldown_manager.start()
+
+    cooldown_manager.on_cooldown("a", time.time() + 0.05)
+    assert cooldown_manager.get_cooldown_deployments(["a", "b"]) == ["a"]
+    version = cooldown_manager.version
+
+    await asyncio.sleep(0.1)
+    # the timer applied the exit - not the read
+    assert cooldown_manager.version > version
+    assert cooldown_manager._open_until == {}
+    assert cooldown_manager.get_state("a") == "closed"
+
+
+def test_half_open_probe_requests():
+    cooldown_manager = CooldownManager(
+        cooldown_cache=_cooldown_cache(),
+        half_open_probe_interval=0.05,
+        half_open_success_threshold=2,
+    )
+    cooldown_manager.on_cooldown("a", time.time() + 0.01)
+    assert cooldown_manager.get_state("a") == "open"
+    time.sleep(0.02)
+
+    assert cooldown_manager.get_state("a") == "half_open"
+    # reporting all cooldowns doesn't use up the probe request
+    assert cooldown_manager.get_cooldown_deployments(["a"]) == []
+    assert cooldown_manager.get_cooldown_deployments(["a"]) == []
+    assert cooldown_manager.get_cooldown_deployments(["a"], acquire_probes=True) == []
+    assert cooldown_manager.get_cooldown_deployments(["a"], acquire_probes=True) == [
+        "a"
+    ]
+    assert cooldown_manager.get_cooldown_deployments(["a"]) == ["a"]
+    time.sleep(0.06)
+    assert cooldown_manager.get_cooldown_deployments(["a"], acquire_probes=True) == []
+
+    cooldown_manager.record_success("a")
+    assert cooldown_manager.get_state("a") == "half_open"
+    cooldown_manager.record_success("a")
+    assert cooldown_manager.get_state("a") == "closed"
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_request_reopens_cooldown():
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o", "api_key": "fake"},
+                "model_info": {"id": "a"},
+            }
+        ],
+        allowed_fails=100,
+        cooldown_half_open_probe_interval=60,
+    )
+    router.cooldown_manager.on_cooldown("a", time.time() + 0.01)
+    time.sleep(0.02)
+    assert router.cooldown_manager.get_state("a") == "half_open"
+
+    # below allowed_fails - but a failing half-open deployment goes back in cooldown
+    assert _set_cooldown_deployments(
+        litellm_router_instance=router,
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        deployment="a",
+        time_to_cooldown=60,
+    )
+    assert router.cooldown_manager.get_state("a") == "open"
+
+
+@pytest.mark.asyncio
+async def test_only_routing_uses_up_probe_requests():
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o", "api_key": "fake"},
+                "model_info": {"id": "a"},
+            }
+        ],
+        cooldown_half_open_probe_interval=60,
+    )
+    router.cooldown_manager.on_cooldown("a", time.time() + 0.01)
+    time.sleep(0.02)
+    assert router.cooldown_manager.get_state("a") == "half_open"
+
+    # health / capacity checks don't send the request - the probe stays due
+    for _ in range(3):
+        healthy, _ = await router._async_get_healthy_deployments(
+            model="gpt-4o", parent_otel_span=None
+        )
+        assert [d["model_info"]["id"] for d in healthy] == ["a"]
+        healthy = await router.async_get_healthy_deployments(
+            model="gpt-4o", request_kwargs={}
+        )
+        assert [d["model_info"]["id"] for d in healthy] == ["a"]
+    assert router._get_healthy_deployments(model="gpt-4o", parent_otel_span=None)
+
+    deployment = await router.async_get_available_deployment(
+        model="gpt-4o", request_kwargs={}
+    )
+    assert deployment["model_info"]["id"] == "a"
+    assert not router.cooldown_manager.is_probe_due("a")
+    healthy, _ = await router._async_get_healthy_deployments(
+        model="gpt-4o", parent_otel_span=None
+    )
+    assert healthy == []
+
+
+@pytest.mark.asyncio
+async def test_cooldowns_are_not_read_from_cache_without_redis():
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o", "api_key": "fake"},
+                "model_info": {"id": "a"},
+            }
+        ],
+    )
+    router.cooldown_cache.async_get_active_cooldowns = AsyncMock(return_value=[])
+    router.cooldown_cache.add_deployment_to_cooldown(
+        model_id="a",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=60,
+    )
+
+    assert await _async_get_cooldown_deployments(
+        litellm_router_instance=router, parent_otel_span=None
+    ) == ["a"]
+    router.cooldown_cache.async_get_active_cooldowns.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cooldown_events_over_pubsub():
+    redis_client = MagicMock()
+    redis_client.publish = AsyncMock()
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = redis_client
+    publisher = CooldownManager(
+        cooldown_cache=_cooldown_cache(redis_cache),
+        half_open_probe_interval=60,
+        enable_pubsub=True,
+    )
+    subscriber = CooldownManager(
+        cooldown_cache=_cooldown_cache(redis_cache), enable_pubsub=True
+    )
+
+    cooldown_until = time.time() + 60
+    publisher.on_cooldown("a", cooldown_until)
+    await asyncio.sleep(0)
+    channel, message = redis_client.publish.await_args.args
+    assert channel == publisher.pubsub_channel
+    assert json.loads(message)["event"] == "enter"
+
+    # instances skip their own events
+    publisher._on_pubsub_message(message)
+    subscriber._on_pubsub_message(message)
+    assert subscriber.get_cooldown_until("a") == cooldown_until
+
+    publisher._open_until["a"] = time.time()  # cooldown ended
+    assert publisher.get_state("a") == "half_open"
+    publisher.record_success("a")
+    await asyncio.sleep(0)
+    exit_message = redis_client.publish.await_args.args[1]
+    assert json.loads(exit_message)["event"] == "exit"
+    subscriber._on_pubsub_message(exit_message)
+    assert subscriber.get_state("a") == "closed"
+
+
+@pytest.mark.asyncio
+async def test_cooldowns_are_resynced_after_each_subscribe():
+    class _PubSub:
+        def __init__(self):
+            self.num_subscribes = 0
+
+        async def subscribe(self, channel):
+            self.num_subscribes += 1
+
+        async def listen(self):
+            if pubsub.num_subscribes == 1:
+                raise ConnectionError("connection lost")
+            await asyncio.Event().wait()
+            yield  # pragma: no cover
+
+        async def reset(self):
+            pass
+
+    pubsub = _PubSub()
+    redis_client = MagicMock()
+    redis_client.pubsub.return_value = pubsub
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = redis_client
+    cooldown_cache = _cooldown_cache(redis_cache)
+    cooldown_until = time.time() + 60
+    cooldown_cache.async_get_active_cooldowns = AsyncMock(
+        return_value=[("a", {"timestamp": cooldown_until - 60, "cooldown_time": 60})]
+    )
+    cooldown_manager = CooldownManager(
+        cooldown_cache=cooldown_cache,
+        enable_pubsub=True,
+        get_model_ids=lambda: ["a", "b"],
+    )
+
+    with patch(
+        "litellm.router_utils.cooldown_manager.COOLDOWN_PUBSUB_RECONNECT_SECONDS", 0
+    ):
+        cooldown_manager.start()
+        while pubsub.num_subscribes < 2 or not cooldown_manager.pubsub_active:
+            await asyncio.sleep(0.01)
+
+    # a full read after the subscribe and after the re-subscribe
+    assert cooldown_cache.async_get_active_cooldowns.await_count == 2
+    assert cooldown_cache.async_get_active_cooldowns.await_args.kwargs[
+        "model_ids"
+    ] == ["a", "b"]
+    assert cooldown_manager.get_cooldown_until("a") == pytest.approx(cooldown_until)
+    assert not cooldown_manager.should_read_cooldown_cache()
+    cooldown_manager._subscriber_task.cancel()
@@ -0,0 +1,239 @@
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm import Router
+from litellm.router_utils.cooldown_manager import CooldownManager
+from litellm.router_utils.deployment_snapshot import (
+    DeploymentSnapshotStore,
+    ModelGroupSnapshot,
+)
+from litellm.types.router import Deployment, LiteLLM_Params, ModelInfo
+
+
+def _deployment(deployment_id: str, model_name: str = "gpt-4o", **kwargs) -> dict:
+    model_info = {"id": deployment_id, **kwargs.pop("model_info", {})}
+    return {
+        "model_name": model_name,
+        "litellm_params": {"model": "openai/gpt-4o", "api_key": "fake", **kwargs},
+        "model_info": model_info,
+    }
+
+
+def _ids(deployments) -> list:
+    return [d["model_info"]["id"] for d in deployments]
+
+
+def test_snapshot_masks():
+    snapshot = ModelGroupSnapshot(
+        [
+            _deployment("a", tags=["default"]),
+            _deployment("b", region_name="eu", model_info={"team_id": "t1"}),
+            _deployment(
+                "c", tags=["paid"], model_info={"supports_web_search": False}
+            ),
+        ]
+    )
+    assert snapshot.all_mask == 0b111
+    assert _ids(snapshot.select(snapshot.get_team_mask(None))) == ["a", "c"]
+    assert _ids(snapshot.select(snapshot.get_team_mask("t1"))) == ["a", "b", "c"]
+    assert _ids(snapshot.select(snapshot.web_search_mask)) == ["a", "b"]
+    assert _ids(snapshot.select(snapshot.get_region_mask("eu"))) == ["b"]
+    assert snapshot.get_region_mask("us") == 0
+    assert _ids(snapshot.select(snapshot.get_tag_mask(["paid", "free"]))) == ["c"]
+    assert _ids(snapshot.select(snapshot.default_tag_mask)) == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_cooldown_mask_follows_cooldown_enter_and_exit():
+    store = DeploymentSnapshotStore()
+    snapshot = store.get("gpt-4o", lambda: [_deployment("a"), _deployment("b")])
+    cooldown_cache = MagicMock()
+    cooldown_cache.cache.redis_cache = None
+    cooldown_manager = CooldownManager(cooldown_cache=cooldown_cache)
+
+    assert await store.async_get_cooldown_mask("gpt-4o", snapshot, cooldown_manager) == 0
+    cooldown_manager.on_cooldown("b", time.time() + 0.05)
+    assert (
+        await store.async_get_cooldown_mask("gpt-4o", snapshot, cooldown_manager)
+        == 0b10
+    )
+    time.sleep(0.06)
+    assert await store.async_get_cooldown_mask("gpt-4o", snapshot, cooldown_manager) == 0
+    assert store.get("missing", lambda: []) is None
+
+
+@pytest.mark.asyncio
+async def test_cooldown_mask_admits_half_open_probe_requests():
+    store = DeploymentSnapshotStore()
+    snapshot = store.get("gpt-4o", lambda: [_deployment("a"), _deployment("b")])
+    cooldown_cache = MagicMock()
+    cooldown_cache.cache.redis_cache = None
+    cooldown_manager = CooldownManager(
+        cooldown_cache=cooldown_cache, half_open_probe_interval=60
+    )
+
+    cooldown_manager.on_cooldown("a", time.time() + 0.01)
+    time.sleep(0.02)
+    # checking doesn't use up the probe request
+    for _ in range(2):
+        assert (
+            await store.async_get_cooldown_mask("gpt-4o", snapshot, cooldown_manager)
+            == 0
+        )
+    # 1 probe request, then held back until the next probe is due
+    for expected_mask in (0, 0b01):
+        assert (
+            await store.async_get_cooldown_mask(
+                "gpt-4o", snapshot, cooldown_manager, acquire_probes=True
+            )
+            == expected_mask
+        )
+    cooldown_manager.record_success("a")
+    assert await store.async_get_cooldown_mask("gpt-4o", snapshot, cooldown_manager) == 0
+
+
+@pytest.mark.asyncio
+async def test_remote_cooldowns_are_read_at_redis_batch_rate():
+    store = DeploymentSnapshotStore()
+    snapshot = store.get("gpt-4o", lambda: [_deployment("a"), _deployment("b")])
+    cooldown_cache = MagicMock()
+    cooldown_cache.cache.redis_batch_cache_expiry = 10
+    cooldown_cache.async_get_active_cooldowns = AsyncMock(
+        return_value=[("a", {"timestamp": time.time(), "cooldown_time": 60})]
+    )
+    cooldown_manager = CooldownManager(cooldown_cache=cooldown_cache)
+
+    for _ in range(2):
+        assert (
+            await store.async_get_cooldown_mask("gpt-4o", snapshot, cooldown_manager)
+            == 0b01
+        )
+    cooldown_cache.async_get_active_cooldowns.assert_awaited_once()
+
+
+def _router(**kwargs) -> Router:
+    return Router(
+        model_list=[
+            _deployment("a", tags=["default"]),
+            _deployment("b", tags=["paid"], model_info={"team_id": "t1"}),
+            _deployment("c", model_info={"supports_web_search": False}),
+        ],
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_router_healthy_deployments_from_snapshot():
+    router = _router()
+
+    async def healthy_ids(**request_kwargs):
+        return _ids(
+            await router.async_get_healthy_deployments(
+                model="gpt-4o", request_kwargs=request_kwargs
+            )
+        )
+
+    assert await healthy_ids() == ["a", "c"]
+    assert await healthy_ids(metadata={"user_api_key_team_id": "t1"}) == ["a", "b", "c"]
+    assert await healthy_ids(tools=[{"type": "web_search"}]) == ["a"]
+
+    router.cooldown_cache.add_deployment_to_cooldown(
+        model_id="c",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=60,
+    )
+    assert await healthy_ids() == ["a"]
+    router.flush_cache()
+    assert await healthy_ids() == ["a", "c"]
+
+    # snapshots are rebuilt when deployments change
+    router.add_deployment(
+        Deployment(
+            model_name="gpt-4o",
+            litellm_params=LiteLLM_Params(model="openai/gpt-4o", api_key="fake"),
+            model_info=ModelInfo(id="d"),
+        )
+    )
+    assert await healthy_ids() == ["a", "c", "d"]
+    router.delete_deployment(id="a")
+    assert await healthy_ids() == ["c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_router_snapshot_tag_filtering_matches_full_chain():
+    router = _router(enable_tag_filtering=True)
+    for metadata in [
+        {"tags": ["paid"], "user_api_key_team_id": "t1"},
+        {"tags": ["unknown"]},
+        {},
+    ]:
+        fast = await router._async_get_healthy_deployments_from_snapshot(
+            model="gpt-4o", request_kwargs={"metadata": metadata}
+        )
+        with patch.object(
+            router,
+            "_async_get_healthy_deployments_from_snapshot",
+            AsyncMock(return_value=None),
+        ):
+            full = await router.async_get_healthy_deployments(
+                model="gpt-4o", request_kwargs={"metadata": metadata}
+            )
+        assert _ids(fast) == _ids(full)
+
+
+@pytest.mark.asyncio
+async def test_router_snapshot_skipped_for_specific_deployments_and_aliases():
+    router = _router(model_group_alias={"alias": "gpt-4o"})
+    for model, specific_deployment in [
+        ("gpt-4o", True),
+        ("a", False),
+        ("alias", False),
+        ("unknown-model", False),
+    ]:
+        assert (
+            await router._async_get_healthy_deployments_from_snapshot(
+                model=model,
+                request_kwargs={},
+                specific_deployment=specific_deployment,
+            )
+            is None
+        )
+
+
+@pytest.mark.asyncio
+async def test_router_snapshot_request_mask_region_filter():
+    router = Router(
+        model_list=[
+            _deployment("eu-1", region_name="eu"),
+            _deployment("us-1", region_name="us"),
+        ],
+        enable_pre_call_checks=True,
+    )
+    snapshot = router.deployment_snapshots.get(
+        "gpt-4o", lambda: router._get_all_deployments(model_name="gpt-4o")
+    )
+    request_kwargs = {"allowed_model_region": "eu"}
+    mask = await router._async_get_snapshot_request_mask(
+        model="gpt-4o",
+        snapshot=snapshot,
+        request_kwargs=request_kwargs,
+        run_pre_call_checks=True,
+    )
+    assert _ids(snapshot.select(mask)) == ["eu-1"]
+    # region is a pre-call check - not applied without them
+    mask = await router._async_get_snapshot_request_mask(
+        model="gpt-4o",
+        snapshot=snapshot,
+        request_kwargs=request_kwargs,
+        run_pre_call_checks=False,
+    )
+    assert _ids(snapshot.select(mask)) == ["eu-1", "us-1"]
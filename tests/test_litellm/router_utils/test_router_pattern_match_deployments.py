@@ -0,0 +1,119 @@
+import os
+import re
+import sys
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.router_utils.pattern_match_deployments import (
+    PatternMatchRouter,
+    PatternUtils,
+)
+
+
+def _deployment(model_name: str, model: str) -> dict:
+    return {
+        "model_name": model_name,
+        "litellm_params": {"model": model, "api_key": "fake"},
+        "model_info": {"id": model_name},
+    }
+
+
+def _linear_scan_route(router: PatternMatchRouter, request: str):
+    """The matching PatternMatchRouter.route did before the compiled index"""
+    for pattern, deployments in PatternUtils.sorted_patterns(router.patterns):
+        pattern_match = re.match(pattern, request)
+        if pattern_match:
+            return [
+                PatternMatchRouter.set_deployment_model_name(
+                    pattern_match, d["litellm_params"]["model"]
+                )
+                for d in deployments
+            ]
+    return None
+
+
+def test_compiled_index_matches_linear_scan():
+    router = PatternMatchRouter()
+    patterns = [
+        ("openai/*", "openai/*"),
+        ("openai/gpt-4*", "azure/gpt-4*"),
+        ("openai/gpt-4o-mini", "openai/gpt-4o-mini"),
+        ("bedrock/*", "bedrock/*"),
+        ("*meta.llama3*", "bedrock/meta.llama3*"),
+        ("*", "openai/*"),
+        ("llmengine/fo::*::static::*", "openai/fo::*::static::*"),
+        ("team-a/*", "anthropic/*"),
+    ]
+    for pattern, model in patterns:
+        router.add_pattern(pattern, _deployment(pattern, model))
+
+    for request in [
+        "openai/gpt-4o",
+        "openai/gpt-4o-mini",
+        "openai/gpt-4o-mini-2024",
+        "openai/o1",
+        "bedrock/meta.llama3-70b",
+        "hello-world-meta.llama3-70b",
+        "llmengine/foo::bar::static::baz",
+        "team-a/claude-3",
+        "something-else",
+        "",
+    ]:
+        routed = router.route(request)
+        expected = _linear_scan_route(router, request)
+        assert (
+            [d["litellm_params"]["model"] for d in routed] if routed else None
+        ) == expected, request
+
+
+def test_route_is_memoized_and_copy_on_write():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*", "openai/*"))
+
+    first = router.route("openai/gpt-4o")
+    assert first[0]["litellm_params"]["model"] == "openai/gpt-4o"
+    assert "openai/gpt-4o" in router._route_cache
+
+    # callers may modify what they get back, without affecting the registered / memoized deployment
+    first[0]["litellm_params"]["api_key"] = "changed"
+    first[0]["model_name"] = "changed"
+    second = router.route("openai/gpt-4o")
+    assert second[0]["litellm_params"] == {"model": "openai/gpt-4o", "api_key": "fake"}
+    assert second[0]["model_name"] == "openai/*"
+    assert router.patterns["openai/(.*)"][0]["litellm_params"]["model"] == "openai/*"
+
+    # adding a pattern drops memoized routes
+    router.add_pattern("openai/gpt-4o", _deployment("openai/gpt-4o", "azure/gpt-4o"))
+    assert router.route("openai/gpt-4o")[0]["litellm_params"]["model"] == "azure/gpt-4o"
+
+
+def test_route_memoizes_misses():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*", "openai/*"))
+    assert router.route("anthropic/claude-3") is None
+    assert router._route_cache["anthropic/claude-3"] is None
+
+
+def test_index_is_rebuilt_when_patterns_change():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*", "openai/*"))
+    index = router._get_index()
+    assert router._get_index() is index
+
+    resolved = router._route_uncached("openai/gpt-4o")
+    assert [model for _, model in resolved] == ["openai/gpt-4o"]
+    copies = router._copy_resolved_deployments(resolved)
+    assert copies[0]["litellm_params"] is not resolved[0][0]["litellm_params"]
+
+    pattern_match = re.match("openai/(.*)", "openai/o1")
+    resolved = router._resolve_deployments(
+        pattern_match, router.patterns["openai/(.*)"]
+    )
+    assert resolved[0][1] == "openai/o1"
+
+    router._invalidate_index()
+    assert router._get_index() is not index
+    router.patterns = {}
+    assert router.route("openai/gpt-4o") is None
@@ -0,0 +1,265 @@
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm import Router
+from litellm.caching.caching import DualCache
+from litellm.router_strategy.least_outstanding_requests import (
+    LeastOutstandingRequestsLoggingHandler,
+)
+from litellm.router_utils.hedged_requests import HedgedRequests
+from litellm.router_utils.retry_budget import RetryBudget
+from litellm.types.router import HedgingPolicy, RetryBudgetPolicy
+
+
+def _model_list(slow_deployment_delay: float = 0.0) -> list:
+    return [
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {
+                "model": "openai/gpt-4o",
+                "api_key": "fake",
+                "mock_response": "slow",
+                "mock_delay": slow_deployment_delay,
+            },
+            "model_info": {"id": "slow"},
+        },
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {
+                "model": "openai/gpt-4o",
+                "api_key": "fake",
+                "mock_response": "fast",
+            },
+            "model_info": {"id": "fast"},
+        },
+    ]
+
+
+def test_retry_budget_token_bucket():
+    retry_budget = RetryBudget(
+        policy=RetryBudgetPolicy(
+            retry_ratio=0.5, min_retries_per_second=0, max_burst_retries=2
+        )
+    )
+    assert retry_budget.try_acquire("gpt-4o") is False
+
+    retry_budget.record_request("gpt-4o")
+    assert retry_budget.try_acquire("gpt-4o") is False
+    retry_budget.record_request("gpt-4o")
+    assert retry_budget.try_acquire("gpt-4o") is True
+
+    for _ in range(10):
+        retry_budget.record_request("gpt-4o")
+    # capped at max_burst_retries
+    assert retry_budget.get_tokens("gpt-4o") == 2
+    # budgets are per model group
+    assert retry_budget.try_acquire("gpt-4o-mini") is False
+
+
+def test_retry_budget_refills_over_time():
+    retry_budget = RetryBudget(
+        policy=RetryBudgetPolicy(retry_ratio=0, min_retries_per_second=50)
+    )
+    # starts with 1 second of the minimum rate
+    while retry_budget.try_acquire("gpt-4o"):
+        pass
+    assert retry_budget.get_tokens("gpt-4o") < 1
+    time.sleep(0.05)
+    assert retry_budget.try_acquire("gpt-4o") is True
+
+
+@pytest.mark.asyncio
+async def test_router_skips_retries_when_budget_exhausted():
+    router = Router(
+        model_list=_model_list(),
+        num_retries=3,
+        retry_budget_policy={"retry_ratio": 1, "min_retries_per_second": 0},
+    )
+    router.make_call = AsyncMock(
+        side_effect=litellm.RateLimitError(
+            message="rate limited", llm_provider="openai", model="gpt-4o"
+        )
+    )
+
+    with pytest.raises(litellm.RateLimitError):
+        await router.acompletion(
+            model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+        )
+    # 1 request -> 1 retry
+    assert router.make_call.await_count == 2
+    assert router._acquire_retry_budget("gpt-4o") is False
+    assert router._acquire_retry_budget(None) is True
+
+
+def test_hedge_delay_percentile():
+    hedged_requests = HedgedRequests(
+        policy=HedgingPolicy(percentile=0.9, min_samples=10)
+    )
+    for ttft in range(1, 10):
+        hedged_requests.record_ttft("gpt-4o", ttft)
+    assert hedged_requests.get_hedge_delay("gpt-4o") is None
+
+    hedged_requests.record_ttft("gpt-4o", 10)
+    assert hedged_requests.get_hedge_delay("gpt-4o") == 10
+    assert hedged_requests.is_enabled("gpt-4o") is True
+    assert HedgedRequests(
+        policy=HedgingPolicy(model_groups=["gpt-4o-mini"])
+    ).is_enabled("gpt-4o") is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_router_hedged_request_wins(stream):
+    router = Router(
+        model_list=_model_list(slow_deployment_delay=5),
+        hedging_policy={"min_samples": 1},
+    )
+    router.hedged_requests.record_ttft("gpt-4o", 0.01)
+
+    start_time = time.time()
+    response = await router._make_call_with_hedging(
+        router._acompletion,
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        stream=stream,
+        metadata={},
+    )
+    if stream:
+        content = ""
+        async for chunk in response:
+            content += chunk.choices[0].delta.content or ""
+    else:
+        content = response.choices[0].message.content
+    # whichever deployment the 1st request went to - the fast one answered
+    assert content == "fast"
+    assert time.time() - start_time < 5
+
+
+@pytest.mark.asyncio
+async def test_hedged_requests_cancel_the_slower_request():
+    hedged_requests = HedgedRequests(policy=HedgingPolicy(min_samples=1))
+    hedged_requests.record_ttft("gpt-4o", 0.01)
+    router = MagicMock()
+    router.retry_budget = None
+    router._async_get_healthy_deployments = AsyncMock(
+        return_value=([{"model_info": {"id": "a"}}, {"model_info": {"id": "b"}}], [])
+    )
+    primary_cancelled = asyncio.Event()
+
+    async def make_call(kwargs):
+        if kwargs["model"] == "gpt-4o":
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+        return kwargs["model"]
+
+    response = await hedged_requests.async_call(
+        litellm_router_instance=router,
+        make_call=make_call,
+        kwargs={"model": "gpt-4o", "metadata": {"model_info": {"id": "a"}}},
+    )
+    # the hedged request goes to another deployment
+    assert response == "b"
+    await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_hedged_requests_release_the_cancelled_request():
+    hedged_requests = HedgedRequests(policy=HedgingPolicy(min_samples=1))
+    hedged_requests.record_ttft("gpt-4o", 0.01)
+    router = MagicMock()
+    router.retry_budget = None
+    router._async_get_healthy_deployments = AsyncMock(
+        return_value=([{"model_info": {"id": "a"}}, {"model_info": {"id": "b"}}], [])
+    )
+    router.leastoutstanding_logger = LeastOutstandingRequestsLoggingHandler(
+        router_cache=DualCache()
+    )
+    in_flight = router.leastoutstanding_logger.in_flight
+
+    async def make_call(kwargs):
+        # pre-call logging of the request - the success event is logged by the caller
+        deployment_id = "a" if kwargs["model"] == "gpt-4o" else kwargs["model"]
+        in_flight.setdefault(deployment_id, {})[kwargs["litellm_call_id"]] = (
+            time.time(),
+            False,
+        )
+        if kwargs["model"] == "gpt-4o":
+            await asyncio.sleep(5)
+        return kwargs["model"]
+
+    response = await hedged_requests.async_call(
+        litellm_router_instance=router,
+        make_call=make_call,
+        kwargs={"model": "gpt-4o", "metadata": {"model_info": {"id": "a"}}},
+    )
+    assert response == "b"
+    await asyncio.sleep(0.01)
+    # the cancelled first request is no longer counted as in-flight
+    assert in_flight["a"] == {}
+    assert len(in_flight["b"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_requests_no_hedge_until_min_samples():
+    hedged_requests = HedgedRequests(policy=HedgingPolicy(min_samples=2))
+    router = MagicMock()
+    router.retry_budget = None
+    router._async_get_healthy_deployments = AsyncMock(
+        return_value=([{"model_info": {"id": "a"}}, {"model_info": {"id": "b"}}], [])
+    )
+    calls = []
+
+    async def make_call(kwargs):
+        calls.append(kwargs["model"])
+        await asyncio.sleep(0.05)
+        return kwargs["model"]
+
+    response = await hedged_requests.async_call(
+        litellm_router_instance=router,
+        make_call=make_call,
+        kwargs={"model": "gpt-4o", "metadata": {"model_info": {"id": "a"}}},
+    )
+    assert response == "gpt-4o"
+    assert calls == ["gpt-4o"]
+    router._async_get_healthy_deployments.assert_not_awaited()
+    # the warmup request's time to first token is still recorded
+    assert len(hedged_requests._ttft_samples["gpt-4o"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_requests_no_hedge_before_primary_picks_deployment():
+    hedged_requests = HedgedRequests(policy=HedgingPolicy(min_samples=1))
+    hedged_requests.record_ttft("gpt-4o", 0.01)
+    router = MagicMock()
+    router.retry_budget = None
+    router._async_get_healthy_deployments = AsyncMock(
+        return_value=([{"model_info": {"id": "a"}}, {"model_info": {"id": "b"}}], [])
+    )
+    calls = []
+
+    async def make_call(kwargs):
+        calls.append(kwargs["model"])
+        await asyncio.sleep(0.05)
+        return kwargs["model"]
+
+    # no deployment in the shared metadata - the hedge can't exclude the first request's deployment
+    response = await hedged_requests.async_call(
+        litellm_router_instance=router,
+        make_call=make_call,
+        kwargs={"model": "gpt-4o"},
+    )
+    assert response == "gpt-4o"
+    assert calls == ["gpt-4o"]
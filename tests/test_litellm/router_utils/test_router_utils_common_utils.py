@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional, Union
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -340,3 +340,34 @@ class TestFilterWebSearchDeployments:
         result = filter_web_search_deployments(deployment, request_kwargs)
         # Should return the dict unchanged, not filter it
         assert result == deployment
+
+
+def test_get_request_input_tokens_is_memoized_per_request():
+    from litellm.router_utils.common_utils import get_request_input_tokens
+    from litellm.utils import get_non_default_completion_params
+
+    messages = [{"role": "user", "content": "Hello, how are you?"}]
+    request_kwargs: Dict = {"metadata": {}}
+    with patch("litellm.token_counter", return_value=7) as mock_token_counter:
+        assert get_request_input_tokens(messages, request_kwargs=request_kwargs) == 7
+        # retry / fallback of the same request
+        assert get_request_input_tokens(messages, request_kwargs=request_kwargs) == 7
+        assert mock_token_counter.call_count == 1
+
+        # prompt changed - recounted
+        messages.append({"role": "assistant", "content": "Good!"})
+        get_request_input_tokens(messages=messages, request_kwargs=request_kwargs)
+        assert mock_token_counter.call_count == 2
+
+        # a different prompt object - recounted
+        get_request_input_tokens(messages=list(messages), request_kwargs=request_kwargs)
+        assert mock_token_counter.call_count == 3
+
+        # no request kwargs to memoize in
+        get_request_input_tokens(messages=messages, request_kwargs=None)
+        assert mock_token_counter.call_count == 4
+
+    # the memo is not logged with the request's metadata, or sent to the provider
+    assert request_kwargs["metadata"] == {}
+    assert "_input_tokens_memo" in request_kwargs
+    assert get_non_default_completion_params(kwargs=request_kwargs) == {}
@@ -2,6 +2,7 @@ import copy
 import json
 import os
 import sys
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -56,6 +57,35 @@ def test_update_kwargs_does_not_mutate_defaults_and_merges_metadata():
     assert kwargs["litellm_metadata"] == {"baz": 123}
 
 
+@pytest.mark.asyncio
+async def test_acompletion_does_not_mutate_deployment_litellm_params():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "openai/gpt-4o",
+                    "api_key": "fake",
+                    "mock_response": "hi",
+                },
+            }
+        ],
+        default_litellm_params={"drop_params": True},
+    )
+    deployment = router.get_model_list(model_name="gpt-4o")[0]
+    original = copy.deepcopy(deployment["litellm_params"])
+    original_defaults = copy.deepcopy(router.default_litellm_params)
+
+    # the deployment's litellm_params are merged into the call kwargs without being copied first
+    await router.acompletion(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        temperature=0.2,
+    )
+    assert deployment["litellm_params"] == original
+    assert router.default_litellm_params == original_defaults
+
+
 def test_router_with_model_info_and_model_group():
     """
     Test edge case where user specifies model_group in model_info
@@ -1869,3 +1899,55 @@ async def test_aguardrail():
 
     assert result["result"] == "success"
     assert result["selected_guardrail"]["id"] == "guardrail-1"
+
+
+@pytest.mark.asyncio
+async def test_router_scheduler_capacity_reports_cooldown_end():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "gpt-4o", "api_key": "fake"},
+                "model_info": {"id": "deployment-1"},
+            }
+        ]
+    )
+    assert await router._async_get_scheduler_capacity(
+        model="gpt-4o", parent_otel_span=None
+    ) == (True, None)
+
+    router.cooldown_cache.add_deployment_to_cooldown(
+        model_id="deployment-1",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=30,
+    )
+    has_capacity, cooldown_ends_in = await router._async_get_scheduler_capacity(
+        model="gpt-4o", parent_otel_span=None
+    )
+    assert has_capacity is False
+    assert 0 < cooldown_ends_in <= 30
+
+
+def test_router_scheduler_flow_params():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "gpt-4o", "api_key": "fake"},
+            }
+        ],
+        scheduler_policy="wfq",
+    )
+    assert router.scheduler.policy == "wfq"
+
+    params = router._get_scheduler_flow_params(
+        {"metadata": {"user_api_key_team_id": "team-1"}, "timeout": 10}
+    )
+    assert params["flow_id"] == "team-1"
+    assert 0 < params["deadline"] - time.monotonic() <= 10
+
+    assert router._get_scheduler_flow_params({}) == {
+        "flow_id": None,
+        "deadline": None,
+    }
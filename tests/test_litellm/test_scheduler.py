@@ -0,0 +1,414 @@
+import asyncio
+import os
+import random
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.scheduler import (
+    FlowItem,
+    RedisSchedulerQueue,
+    Scheduler,
+    _PriorityWaitQueue,
+    _Waiter,
+    _WFQWaitQueue,
+)
+
+
+class CapacityCheck:
+    """Fake capacity check - counts calls, `capacity` is how many more requests may go through"""
+
+    def __init__(self, capacity: int = 0, retry_after=None):
+        self.capacity = capacity
+        self.retry_after = retry_after
+        self.num_calls = 0
+
+    async def __call__(self):
+        self.num_calls += 1
+        if self.capacity > 0:
+            self.capacity -= 1
+            return True, None
+        return False, self.retry_after
+
+
+def _item(request_id: str, priority: int = 0, model_name: str = "gpt-4o") -> FlowItem:
+    return FlowItem(priority=priority, request_id=request_id, model_name=model_name)
+
+
+@pytest.mark.asyncio
+async def test_acquire_goes_straight_through_with_capacity():
+    scheduler = Scheduler()
+    check = CapacityCheck(capacity=1)
+    assert await scheduler.acquire(_item("1"), check, timeout=1) is True
+    assert scheduler.get_num_waiting("gpt-4o") == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_do_not_poll_and_release_in_priority_order():
+    scheduler = Scheduler()
+    check = CapacityCheck(capacity=0)
+    released = []
+
+    async def wait(request_id, priority):
+        if await scheduler.acquire(_item(request_id, priority), check, timeout=5):
+            released.append(request_id)
+
+    with patch("litellm.scheduler.SCHEDULER_MAX_WAKE_INTERVAL_SECONDS", 60):
+        tasks = [
+            asyncio.create_task(wait("low", 5)),
+            asyncio.create_task(wait("high", 0)),
+            asyncio.create_task(wait("mid", 2)),
+        ]
+        await asyncio.sleep(0.1)
+        assert scheduler.get_num_waiting("gpt-4o") == 3
+        num_checks_while_waiting = check.num_calls
+        await asyncio.sleep(0.1)
+        assert check.num_calls == num_checks_while_waiting  # zero polling
+
+        check.capacity = 2
+        scheduler.notify("gpt-4o")
+        await asyncio.sleep(0.05)
+        assert released == ["high", "mid"]
+
+        check.capacity = 1
+        scheduler.notify("gpt-4o")
+        await asyncio.gather(*tasks)
+    assert released == ["high", "mid", "low"]
+    assert scheduler.get_num_waiting("gpt-4o") == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_wakes_when_capacity_is_expected_back():
+    scheduler = Scheduler()
+    check = CapacityCheck(capacity=0, retry_after=0.05)
+
+    async def restore_capacity():
+        await asyncio.sleep(0.04)
+        check.capacity = 1
+
+    asyncio.create_task(restore_capacity())
+    start = time.monotonic()
+    assert await scheduler.acquire(_item("1"), check, timeout=5) is True
+    assert time.monotonic() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_acquire_times_out_and_leaves_queue():
+    scheduler = Scheduler()
+    check = CapacityCheck(capacity=0)
+    assert await scheduler.acquire(_item("1"), check, timeout=0.05) is False
+    assert scheduler.get_num_waiting("gpt-4o") == 0
+
+    # a timed out request does not block the next one
+    check.capacity = 1
+    assert await scheduler.acquire(_item("2"), check, timeout=1) is True
+
+
+@pytest.mark.asyncio
+async def test_head_of_queue_waits_while_no_deployment_is_healthy():
+    """
+    Unlike the legacy `poll()`, `acquire()` does not let the head of the queue through while there's no
+    capacity - it waits for capacity (e.g. a cooldown to end) until its timeout
+    """
+    scheduler = Scheduler()
+    check = CapacityCheck(capacity=0, retry_after=0.05)
+    task = asyncio.create_task(scheduler.acquire(_item("head"), check, timeout=5))
+    await asyncio.sleep(0.1)
+    assert not task.done()
+    assert scheduler.get_num_waiting("gpt-4o") == 1
+
+    check.capacity = 1
+    assert await task is True
+
+    # the legacy api still passes the head through with 0 healthy deployments
+    await scheduler.add_request(_item("legacy"))
+    assert (
+        await scheduler.poll(id="legacy", model_name="gpt-4o", health_deployments=[])
+        is True
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_leaves_queue():
+    scheduler = Scheduler()
+    check = CapacityCheck(capacity=0)
+    task = asyncio.create_task(scheduler.acquire(_item("1"), check, timeout=5))
+    await asyncio.sleep(0.05)
+    assert scheduler.get_num_waiting("gpt-4o") == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert scheduler.get_num_waiting("gpt-4o") == 0
+
+    check.capacity = 1
+    assert await scheduler.acquire(_item("2"), check, timeout=1) is True
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_leaves_redis_queue():
+    redis_cache = MagicMock()
+    client = MagicMock()
+    client.zadd = AsyncMock()
+    client.zrem = AsyncMock()
+    client.zcard = AsyncMock(return_value=1)
+
+    async def blpop(keys, timeout):
+        await asyncio.sleep(timeout)
+        return None
+
+    client.blpop = blpop
+    redis_cache.init_async_client.return_value = client
+    scheduler = Scheduler(redis_cache=redis_cache, use_redis_queue=True)
+
+    task = asyncio.create_task(
+        scheduler.acquire(_item("req-1"), CapacityCheck(capacity=0), timeout=5)
+    )
+    await asyncio.sleep(0.05)
+    assert "req-1" in scheduler._redis_waiters
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert scheduler._redis_waiters == {}
+    assert scheduler.get_num_waiting("gpt-4o") == 0
+    client.zrem.assert_awaited_once_with(
+        "scheduler:zqueue:gpt-4o", next(iter(client.zadd.call_args.args[1]))
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_releases_through_wake_list():
+    redis_cache = MagicMock()
+    client = MagicMock()
+    client.zadd = AsyncMock()
+    client.zrem = AsyncMock()
+    client.zcard = AsyncMock(return_value=1)
+    wake_list: asyncio.Queue = asyncio.Queue()
+
+    async def blpop(keys, timeout):
+        try:
+            return keys[0], await asyncio.wait_for(wake_list.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    client.blpop = blpop
+    redis_cache.init_async_client.return_value = client
+
+    async def release_head(keys, args):
+        # what the lua script does: pop the head member, push its request id onto the owner's wake list
+        member = client.zadd.call_args.args[1]
+        request_id = next(iter(member)).split(":")[2]
+        await wake_list.put(request_id.encode())
+        return next(iter(member))
+
+    redis_cache.async_register_script.return_value = release_head
+
+    scheduler = Scheduler(redis_cache=redis_cache, use_redis_queue=True)
+    assert isinstance(scheduler.redis_queue, RedisSchedulerQueue)
+    check = CapacityCheck(capacity=1)
+
+    # queue is not empty (another instance has a queued request) -> request waits its turn
+    assert await scheduler.acquire(_item("req-1", priority=3), check, timeout=5) is True
+    zadd_args = client.zadd.call_args.args
+    assert zadd_args[0] == "scheduler:zqueue:gpt-4o"
+    assert list(zadd_args[1].values()) == [3]
+
+
+@pytest.mark.asyncio
+async def test_wfq_shares_releases_between_classes_and_orders_by_deadline():
+    scheduler = Scheduler(policy="wfq", priority_weights={0: 2, 5: 1})
+    check = CapacityCheck(capacity=0)
+    released = []
+    now = time.monotonic()
+
+    async def wait(request_id, priority, deadline):
+        item = FlowItem(
+            priority=priority,
+            request_id=request_id,
+            model_name="gpt-4o",
+            deadline=now + deadline,
+        )
+        if await scheduler.acquire(item, check, timeout=5):
+            released.append(request_id)
+
+    with patch("litellm.scheduler.SCHEDULER_MAX_WAKE_INTERVAL_SECONDS", 60):
+        tasks = [asyncio.create_task(wait(f"low-{i}", 5, 4)) for i in range(3)]
+        tasks += [asyncio.create_task(wait(f"high-{i}", 0, 4 - i / 10)) for i in range(6)]
+        await asyncio.sleep(0.05)
+        assert scheduler.get_num_waiting("gpt-4o") == 9
+
+        check.capacity = 9
+        scheduler.notify("gpt-4o")
+        await asyncio.gather(*tasks)
+
+    # low priority is not starved - 1 release for every 2 high priority ones
+    assert [r.split("-")[0] for r in released[:6]] == [
+        "high",
+        "low",
+        "high",
+        "high",
+        "low",
+        "high",
+    ]
+    # earliest deadline first within a class
+    assert [r for r in released if r.startswith("high")] == [
+        f"high-{i}" for i in reversed(range(6))
+    ]
+    assert scheduler.get_num_waiting("gpt-4o") == 0
+
+
+@pytest.mark.asyncio
+async def test_wfq_rejects_requests_that_would_miss_their_deadline():
+    scheduler = Scheduler(policy="wfq")
+    check = CapacityCheck(capacity=0)
+    scheduler._release_intervals["gpt-4o"] = 1.0  # one release per second
+
+    with patch("litellm.scheduler.SCHEDULER_MAX_WAKE_INTERVAL_SECONDS", 60):
+        waiting = asyncio.create_task(
+            scheduler.acquire(_item("1"), check, timeout=5)
+        )
+        await asyncio.sleep(0.01)
+
+        # 1 request ahead -> expected wait ~2s, more than the 1s deadline
+        start = time.monotonic()
+        assert await scheduler.acquire(_item("2"), check, timeout=1) is False
+        assert time.monotonic() - start < 0.5
+        assert scheduler.get_num_waiting("gpt-4o") == 1
+
+        check.capacity = 1
+        scheduler.notify("gpt-4o")
+        assert await waiting is True
+
+
+@pytest.mark.parametrize("policy", ["priority", "wfq"])
+def test_wait_queue_bookkeeping_matches_a_full_scan(policy):
+    """Per-class counts / backlogged weight give the same admission estimate as scanning the whole queue"""
+    loop = asyncio.new_event_loop()
+    rng = random.Random(0)
+    weight = lambda priority: 1 / (1 + priority)  # noqa: E731
+    queue = _WFQWaitQueue(get_weight=weight) if policy == "wfq" else _PriorityWaitQueue()
+    waiting: list = []
+    try:
+        for sequence in range(500):
+            action = rng.random()
+            if action < 0.55 or not waiting:
+                request = FlowItem(
+                    priority=rng.randint(0, 3),
+                    request_id=str(sequence),
+                    model_name="gpt-4o",
+                    flow_id=rng.choice([None, "team-a", "team-b"]),
+                )
+                waiter = _Waiter(
+                    request=request,
+                    future=loop.create_future(),
+                    deadline=rng.uniform(0, 100),
+                    sequence=sequence,
+                )
+                queue.push(waiter)
+                waiting.append(waiter)
+                if policy == "wfq":
+                    same_class = [
+                        w
+                        for w in waiting
+                        if (w.request.priority, w.request.flow_id)
+                        == (request.priority, request.flow_id)
+                    ]
+                    ahead = sum(
+                        1
+                        for w in same_class
+                        if (w.deadline, w.sequence) < (waiter.deadline, waiter.sequence)
+                    )
+                    backlogged_weight = sum(
+                        weight(priority)
+                        for priority, _ in {
+                            (w.request.priority, w.request.flow_id) for w in waiting
+                        }
+                    )
+                    expected = (ahead + 1) * backlogged_weight / weight(
+                        request.priority
+                    ) - 1
+                else:
+                    expected = sum(
+                        1 for w in waiting if w.request.priority <= request.priority
+                    ) - 1
+                assert queue.num_released_before(waiter) == pytest.approx(expected)
+            elif action < 0.8:
+                waiter = queue.pop()
+                assert waiter is not None
+                waiting.remove(waiter)
+                waiter.future.set_result(True)
+            else:
+                waiter = rng.choice(waiting)
+                waiting.remove(waiter)
+                waiter.future.cancel()
+                queue.discard(waiter)
+            assert len(queue) == len(waiting)
+    finally:
+        loop.close()
+
+
+def test_release_interval_ages_out():
+    scheduler = Scheduler(policy="wfq")
+    scheduler._release_intervals["gpt-4o"] = 1.0
+    scheduler._release_interval_updated_at["gpt-4o"] = time.monotonic()
+    assert scheduler.get_release_interval("gpt-4o") == 1.0
+
+    # a stalled backlog is slower than the smoothed rate
+    scheduler._last_release_at["gpt-4o"] = time.monotonic() - 5
+    assert scheduler.get_release_interval("gpt-4o") == pytest.approx(5, abs=0.5)
+
+    with patch("litellm.scheduler.SCHEDULER_RELEASE_INTERVAL_MAX_AGE_SECONDS", 0):
+        time.sleep(0.01)
+        assert scheduler.get_release_interval("gpt-4o") is None
+    assert "gpt-4o" not in scheduler._release_intervals
+
+
+@pytest.mark.asyncio
+async def test_dispatch_tasks_are_referenced_until_done():
+    scheduler = Scheduler()
+    check = CapacityCheck(capacity=0)
+
+    with patch("litellm.scheduler.SCHEDULER_MAX_WAKE_INTERVAL_SECONDS", 60):
+        waiting = asyncio.create_task(scheduler.acquire(_item("1"), check, timeout=5))
+        await asyncio.sleep(0.01)
+        check.capacity = 1
+        scheduler.notify("gpt-4o")
+        assert len(scheduler._dispatch_tasks) == 1
+        assert await waiting is True
+    await asyncio.sleep(0)
+    assert scheduler._dispatch_tasks == set()
+
+
+def test_invalid_scheduler_policy():
+    with pytest.raises(ValueError, match="Invalid scheduler policy"):
+        Scheduler(policy="fifo")  # type: ignore
+    with pytest.raises(ValueError, match="not supported with use_redis_queue"):
+        Scheduler(redis_cache=MagicMock(), use_redis_queue=True, policy="wfq")
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_exported_to_prometheus():
+    scheduler = Scheduler()
+    prometheus_logger = MagicMock()
+    with patch(
+        "litellm.router_utils.cooldown_callbacks._get_prometheus_logger_from_callbacks",
+        return_value=prometheus_logger,
+    ):
+        assert (
+            await scheduler.acquire(_item("1", priority=2), CapacityCheck(0), 0.05)
+            is False
+        )
+
+    prometheus_logger.observe_request_queue_wait.assert_called_once()
+    kwargs = prometheus_logger.observe_request_queue_wait.call_args.kwargs
+    assert kwargs["model_group"] == "gpt-4o"
+    assert kwargs["priority"] == 2
+    assert kwargs["outcome"] == "timed_out"
+    assert kwargs["wait_seconds"] >= 0.05